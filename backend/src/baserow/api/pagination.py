@@ -1,6 +1,14 @@
-from typing import Protocol
+import base64
+import hashlib
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, List, Optional, Protocol, Tuple
+from uuid import UUID
 
 from django.core.paginator import Paginator as DjangoPaginator
+from django.db.models import F, Q, QuerySet
+from django.db.models.expressions import OrderBy
 
 from rest_framework.exceptions import APIException
 from rest_framework.pagination import (
@@ -150,3 +158,271 @@ class LimitOffsetPaginationWithoutCount(LimitOffsetPagination):
                 "results": schema,
             },
         }
+
+
+class InvalidCursor(Exception):
+    """Raised when a keyset pagination cursor can't be decoded or doesn't match the
+    ordering of the queryset."""
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return {"d": str(value)}
+    elif isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    elif isinstance(value, date):
+        return {"da": value.isoformat()}
+    elif isinstance(value, time):
+        return {"t": value.isoformat()}
+    elif isinstance(value, UUID):
+        return {"u": str(value)}
+    elif isinstance(value, (list, tuple)):
+        return [_encode_cursor_value(v) for v in value]
+    return value
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        ((kind, raw),) = value.items()
+        return {
+            "d": Decimal,
+            "dt": datetime.fromisoformat,
+            "da": date.fromisoformat,
+            "t": time.fromisoformat,
+            "u": UUID,
+        }[kind](raw)
+    elif isinstance(value, list):
+        return [_decode_cursor_value(v) for v in value]
+    return value
+
+
+def get_keyset_order_bys(queryset: QuerySet) -> List[OrderBy]:
+    """
+    Returns the ordering of the queryset as a list of OrderBy expressions. The primary
+    key is always added as last ordering, if not already present, so that the keyset
+    is guaranteed to be unique.
+
+    :param queryset: The ordered queryset.
+    :return: The list of OrderBy expressions.
+    """
+
+    query = queryset.query
+    order_by = list(query.order_by)
+    if not order_by and query.default_ordering:
+        order_by = list(query.get_meta().ordering)
+
+    order_bys = []
+    for term in order_by:
+        if isinstance(term, str):
+            descending = term.startswith("-")
+            expression = F(term.lstrip("-"))
+            term = expression.desc() if descending else expression.asc()
+        elif not isinstance(term, OrderBy):
+            term = term.asc()
+        order_bys.append(term)
+
+    pk_names = {"pk", "id", query.get_meta().pk.name}
+    if not any(
+        isinstance(order.expression, F) and order.expression.name in pk_names
+        for order in order_bys
+    ):
+        order_bys.append(F("id").asc())
+
+    return order_bys
+
+
+class KeysetPaginator:
+    """
+    Paginates a queryset by filtering on the values of the ordering of the last row of
+    the previous page instead of using an offset. The database can then start reading
+    right after the last row of the previous page, typically using an index, making
+    any page as fast to fetch as the first one.
+
+    The cursor encodes the values of all the ordering expressions of the last row,
+    including the primary key, and a fingerprint of the ordering so that a cursor
+    can't be used with a queryset that's ordered differently.
+    """
+
+    annotation_prefix = "_keyset_"
+
+    def __init__(self, queryset: QuerySet):
+        self.order_bys = get_keyset_order_bys(queryset)
+        self.queryset = queryset.annotate(
+            **{
+                f"{self.annotation_prefix}{index}": order.expression
+                for index, order in enumerate(self.order_bys)
+            }
+        )
+
+    @property
+    def fingerprint(self) -> str:
+        ordering = "|".join(str(order) for order in self.order_bys)
+        return hashlib.sha1(ordering.encode(), usedforsecurity=False).hexdigest()[:12]
+
+    def encode_cursor(self, row) -> str:
+        values = [
+            _encode_cursor_value(getattr(row, f"{self.annotation_prefix}{index}"))
+            for index in range(len(self.order_bys))
+        ]
+        payload = json.dumps({"f": self.fingerprint, "v": values})
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> List[Any]:
+        try:
+            padding = "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(cursor + padding))
+            values = [_decode_cursor_value(v) for v in payload["v"]]
+        except (ValueError, TypeError, KeyError) as exc:
+            raise InvalidCursor("The cursor could not be decoded.") from exc
+
+        if payload.get("f") != self.fingerprint or len(values) != len(self.order_bys):
+            raise InvalidCursor("The cursor doesn't match the ordering of the rows.")
+
+        return values
+
+    @staticmethod
+    def _nulls_first(order: OrderBy) -> bool:
+        if order.nulls_first:
+            return True
+        elif order.nulls_last:
+            return False
+        # PostgreSQL puts nulls last for ascending and first for descending orderings.
+        return order.descending
+
+    def _after_q(self, index: int, order: OrderBy, value: Any) -> Optional[Q]:
+        """
+        Returns the condition matching rows that come strictly after the provided
+        value for the ordering at the given index, or None if no row can.
+        """
+
+        name = f"{self.annotation_prefix}{index}"
+        nulls_first = self._nulls_first(order)
+
+        if value is None:
+            return Q(**{f"{name}__isnull": False}) if nulls_first else None
+
+        q = Q(**{f"{name}__{'lt' if order.descending else 'gt'}": value})
+        if not nulls_first:
+            q |= Q(**{f"{name}__isnull": True})
+        return q
+
+    def _equal_q(self, index: int, value: Any) -> Q:
+        name = f"{self.annotation_prefix}{index}"
+        if value is None:
+            return Q(**{f"{name}__isnull": True})
+        return Q(**{name: value})
+
+    def get_filter(self, values: List[Any]) -> Q:
+        """
+        Builds the lexicographic condition `(a > x) OR (a = x AND b > y) OR ...`
+        matching all the rows after the row having the provided ordering values.
+        """
+
+        condition = None
+        for index in reversed(range(len(self.order_bys))):
+            order, value = self.order_bys[index], values[index]
+            after = self._after_q(index, order, value)
+            if condition is not None:
+                tie = self._equal_q(index, value) & condition
+                after = tie if after is None else after | tie
+            condition = after
+
+        # No row can come after the provided values.
+        return condition if condition is not None else Q(pk__in=[])
+
+    def get_page(self, cursor: Optional[str], limit: int) -> Tuple[List, Optional[str]]:
+        """
+        Returns the rows after the provided cursor and the cursor of the next page.
+
+        :param cursor: The cursor returned with the previous page, or None for the
+            first page.
+        :param limit: The maximum number of rows to return.
+        :raises InvalidCursor: If the cursor is malformed or doesn't match the
+            ordering of the queryset.
+        :return: The rows and the cursor of the next page, which is None if there are
+            no more rows.
+        """
+
+        queryset = self.queryset
+        if cursor:
+            queryset = queryset.filter(self.get_filter(self.decode_cursor(cursor)))
+        queryset = queryset.order_by(*self.order_bys)
+
+        # Fetch one row more to know if there is a next page.
+        rows = list(queryset[: limit + 1])
+        if len(rows) <= limit:
+            return rows, None
+
+        rows = rows[:limit]
+        return rows, self.encode_cursor(rows[-1])
+
+
+class KeysetPagination:
+    """
+    Keyset (cursor) pagination for querysets. It's enabled by providing the `cursor`
+    GET parameter, which must be empty for the first page and then the `next_cursor`
+    value of the previous response. The number of rows is provided with the `size` or
+    `limit` GET parameter.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_params = ("size", "limit")
+    page_size = 100
+
+    def __init__(self, limit_page_size=None):
+        self.limit_page_size = limit_page_size
+        self.next_cursor = None
+
+    @classmethod
+    def is_requested(cls, request) -> bool:
+        return cls.cursor_query_param in request.GET
+
+    def get_page_size(self, request) -> int:
+        for param in self.page_size_query_params:
+            if param in request.GET:
+                try:
+                    page_size = int(request.GET[param])
+                except ValueError:
+                    break
+                if page_size <= 0:
+                    break
+
+                if self.limit_page_size and page_size > self.limit_page_size:
+                    exception = APIException(
+                        {
+                            "error": "ERROR_PAGE_SIZE_LIMIT",
+                            "detail": f"The page size is limited to "
+                            f"{self.limit_page_size}.",
+                        }
+                    )
+                    exception.status_code = HTTP_400_BAD_REQUEST
+                    raise exception
+                return page_size
+        return self.page_size
+
+    def paginate_queryset(self, queryset, request, view=None):
+        cursor = request.GET.get(self.cursor_query_param) or None
+        try:
+            rows, self.next_cursor = KeysetPaginator(queryset).get_page(
+                cursor, self.get_page_size(request)
+            )
+        except InvalidCursor as exc:
+            exception = APIException(
+                {"error": "ERROR_INVALID_CURSOR", "detail": str(exc)}
+            )
+            exception.status_code = HTTP_400_BAD_REQUEST
+            raise exception
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({"next_cursor": self.next_cursor, "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["next_cursor", "results"],
+            "properties": {
+                "next_cursor": {"type": "string", "nullable": True},
+                "results": schema,
+            },
+        }
@@ -35,11 +35,26 @@ class UserFileURLAndThumbnailsSerializerMixin(serializers.Serializer):
 
         name = self.get_instance_attr(instance, "name")
         storage = get_default_storage()
+        handler = UserFileHandler()
+
+        if handler.are_thumbnails_pending(
+            name, self.get_instance_attr(instance, "uploaded_at")
+        ):
+            # The original image is served until the thumbnails have been generated.
+            original_url = storage.url(handler.user_file_path(name))
+            return {
+                thumbnail_name: {
+                    "url": original_url,
+                    "width": size[0],
+                    "height": size[1],
+                }
+                for thumbnail_name, size in settings.USER_THUMBNAILS.items()
+            }
 
         return {
             thumbnail_name: {
                 "url": storage.url(
-                    UserFileHandler().user_file_thumbnail_path(name, thumbnail_name)
+                    handler.user_file_thumbnail_path(name, thumbnail_name)
                 ),
                 "width": size[0],
                 "height": size[1],
@@ -112,8 +127,11 @@ class UserFileField(serializers.Field):
         if not isinstance(data, dict) or not isinstance(data.get("name"), str):
             self.fail("invalid_value")
 
+        request = self.context.get("request")
         try:
-            user_file = UserFile.objects.all().name(data["name"]).get()
+            user_file = UserFileHandler().get_user_file_by_name(
+                data["name"], user=getattr(request, "user", None)
+            )
         except UserFile.DoesNotExist:
             self.fail("invalid_user_file")
 
@@ -216,6 +216,12 @@ CHANNEL_LAYERS = {
         },
     },
 }
+# The realtime row messages of a transaction are merged and sent when it commits. If
+# enabled, they're published to the channel layer right away instead of by one celery
+# task per message, which lowers the latency but makes the commit wait for it.
+BASEROW_WS_BROADCAST_ROWS_DIRECTLY = str_to_bool(
+    os.getenv("BASEROW_WS_BROADCAST_ROWS_DIRECTLY", "false")
+)
 
 # Database
 # https://docs.djangoproject.com/en/2.2/ref/settings/#databases
@@ -298,6 +304,19 @@ BUILDER_DISPATCH_ACTION_CACHE_TTL_SECONDS = int(
     # Default TTL is 5 minutes
     os.getenv("BASEROW_BUILDER_DISPATCH_ACTION_CACHE_TTL_SECONDS") or 300
 )
+# The number of seconds the results of the data sources of published applications
+# are shared between identical requests. Rows changes invalidate them earlier, but
+# changes in related tables only become visible after this delay. `0` disables it.
+BUILDER_DATA_SOURCE_DISPATCH_CACHE_TTL_SECONDS = int(
+    # Default TTL is 10 seconds
+    os.getenv("BASEROW_BUILDER_DATA_SOURCE_DISPATCH_CACHE_TTL_SECONDS", "") or 10
+)
+# The number of threads dispatching the data sources of a page that don't depend on
+# other data sources at the same time. Every thread uses its own database
+# connection. If `1` then the data sources are dispatched one by one.
+BUILDER_DATA_SOURCES_DISPATCH_WORKERS = int(
+    os.getenv("BASEROW_BUILDER_DATA_SOURCES_DISPATCH_WORKERS", "") or 1
+)
 
 
 CELERY_SINGLETON_BACKEND_CLASS = (
@@ -819,6 +838,13 @@ AUTOMATION_WORKFLOW_HISTORY_RATE_LIMIT_CACHE_EXPIRY_SECONDS = int(
 AUTOMATION_WORKFLOW_MAX_CONSECUTIVE_ERRORS = int(
     os.getenv("BASEROW_AUTOMATION_WORKFLOW_MAX_CONSECUTIVE_ERRORS", 5)
 )
+# The default maximum number of HTTP requests sent at the same time when an HTTP
+# request node is dispatched for every iteration of an iterator. Every workflow can
+# override it. The requests are sent in threads that don't access the database. If `1`
+# then the requests are sent one by one.
+AUTOMATION_WORKFLOW_MAX_PARALLEL_NODES = int(
+    os.getenv("BASEROW_AUTOMATION_WORKFLOW_MAX_PARALLEL_NODES", "") or 1
+)
 
 TRASH_PAGE_SIZE_LIMIT = 200  # How many trash entries can be requested at once.
 
@@ -957,6 +983,15 @@ BASEROW_LOGIN_ACTION_LOG_LIMIT = (
 # Configurable thumbnails that are going to be generated when a user uploads an image
 # file.
 USER_THUMBNAILS = {"tiny": [None, 21], "small": [48, 48], "card_cover": [300, 160]}
+# If enabled, the thumbnails of images uploaded to the default storage are generated
+# by a celery task instead of during the upload request. Until they're generated, the
+# original image is served as thumbnail.
+BASEROW_GENERATE_THUMBNAILS_IN_BACKGROUND = str_to_bool(
+    os.getenv("BASEROW_GENERATE_THUMBNAILS_IN_BACKGROUND", "true")
+)
+BASEROW_THUMBNAILS_PENDING_TIMEOUT_SECONDS = int(
+    os.getenv("BASEROW_THUMBNAILS_PENDING_TIMEOUT_SECONDS", "") or 600
+)
 
 # The directory that contains the all the templates in JSON format. When for example
 # the `sync_templates` management command is called, then the templates in the
@@ -1051,6 +1086,24 @@ BASEROW_WEBHOOKS_BATCH_LIMIT = int(os.getenv("BASEROW_WEBHOOKS_BATCH_LIMIT", 5))
 BASEROW_WEBHOOK_ROWS_ENTER_VIEW_BATCH_SIZE = int(
     os.getenv("BASEROW_WEBHOOK_ROWS_ENTER_VIEW_BATCH_SIZE", BATCH_ROWS_SIZE_LIMIT)
 )
+# The number of hosts and the number of connections per host that are kept alive by
+# every webhook worker thread.
+BASEROW_WEBHOOKS_POOL_CONNECTIONS = int(
+    os.getenv("BASEROW_WEBHOOKS_POOL_CONNECTIONS", "") or 10
+)
+BASEROW_WEBHOOKS_POOL_MAXSIZE = int(
+    os.getenv("BASEROW_WEBHOOKS_POOL_MAXSIZE", "") or 10
+)
+# The maximum number of queued calls of the same webhook that are made by one task
+# before the remaining calls are handed over to a new task.
+BASEROW_WEBHOOKS_MAX_CALLS_PER_TASK = int(
+    os.getenv("BASEROW_WEBHOOKS_MAX_CALLS_PER_TASK", "") or 10
+)
+# If set, consecutive queued row events of the same webhook are merged into one call
+# with at most this number of rows. 0 disables merging.
+BASEROW_WEBHOOKS_MERGE_EVENTS_MAX_ITEMS = int(
+    os.getenv("BASEROW_WEBHOOKS_MERGE_EVENTS_MAX_ITEMS", "") or 0
+)
 
 OAUTH_BACKEND_URL = os.getenv("BASEROW_OAUTH_BACKEND_URL") or PUBLIC_BACKEND_URL
 
@@ -1136,6 +1189,20 @@ BASEROW_IMPORT_EXPORT_RESOURCE_REMOVAL_AFTER_DAYS = int(
 BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT = int(
     os.getenv("BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT", 0)
 )
+# The number of threads exporting the rows of the tables of a database at the same
+# time when it's exported or duplicated. Every thread uses its own database
+# connection. If higher than `1`, the rows of an imported table are also read from
+# the zip file in a thread, at most this number of chunks ahead of the inserted ones.
+# If `1` then the rows of the tables are exported and read one by one.
+BASEROW_IMPORT_EXPORT_TABLE_ROWS_WORKERS = int(
+    os.getenv("BASEROW_IMPORT_EXPORT_TABLE_ROWS_WORKERS", "") or 1
+)
+# When duplicating a table of which all the field types support it, the rows are
+# copied in the database directly with `INSERT ... SELECT` statements instead of
+# being exported and imported.
+BASEROW_DUPLICATE_TABLE_ROWS_WITH_SQL = (
+    os.getenv("BASEROW_DUPLICATE_TABLE_ROWS_WITH_SQL", "true") == "true"
+)
 
 PERMISSION_MANAGERS = [
     "view_ownership",
@@ -1221,7 +1288,54 @@ BASEROW_SYNC_TEMPLATES_TIME_LIMIT = int(
 
 APPEND_SLASH = False
 
+# The `fast` row count mode returns the planner estimate instead of counting the rows
+# when the estimate is above this number of rows.
+BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD = int(
+    os.getenv("BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD", "") or 10000
+)
+# The maximum number of seconds a view row count stays cached.
+BASEROW_ROW_COUNT_CACHE_TTL_SECONDS = int(
+    os.getenv("BASEROW_ROW_COUNT_CACHE_TTL_SECONDS", "") or 60 * 60
+)
+# Whether the cached view aggregations are updated with the values of the changed
+# rows instead of being recomputed over all the rows of the view.
+BASEROW_INCREMENTAL_VIEW_AGGREGATIONS = (
+    os.getenv("BASEROW_INCREMENTAL_VIEW_AGGREGATIONS", "true") == "true"
+)
+# Whether the dependant field updates of different tables at the same dependency
+# level are combined into one query.
+BASEROW_COMBINE_DEPENDENT_FIELD_UPDATES = (
+    os.getenv("BASEROW_COMBINE_DEPENDENT_FIELD_UPDATES", "true") == "true"
+)
+# Whether the field dependency graph of every database is cached in memory and in
+# redis, so that the dependants of fields can be found without a recursive query.
+BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_ENABLED = (
+    os.getenv("BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_ENABLED", "true") == "true"
+)
+# The maximum number of database dependency graphs kept in memory per process.
+BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_SIZE = int(
+    os.getenv("BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_SIZE", "") or 256
+)
+# The number of seconds a dependency graph is kept in redis.
+BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_TIMEOUT = int(
+    os.getenv("BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_TIMEOUT", "") or 60 * 60
+)
+# Rows are inserted with `COPY ... FROM STDIN` instead of INSERT statements when at
+# least this many rows are inserted at once and all their fields support it. Set to
+# 0 to always use INSERT statements.
+BASEROW_COPY_INSERT_MIN_ROWS = int(os.getenv("BASEROW_COPY_INSERT_MIN_ROWS", "") or 100)
+
 BASEROW_DISABLE_MODEL_CACHE = bool(os.getenv("BASEROW_DISABLE_MODEL_CACHE", ""))
+# The maximum number of generated table models kept in memory by every process. Set
+# to 0 to disable the process cache of generated models.
+BASEROW_TABLE_MODEL_LRU_CACHE_SIZE = int(
+    os.getenv("BASEROW_TABLE_MODEL_LRU_CACHE_SIZE", "") or 256
+)
+# The maximum total number of fields of all the generated table models kept in memory
+# by every process. This bounds the memory used by the cache for wide tables.
+BASEROW_TABLE_MODEL_LRU_CACHE_MAX_FIELDS = int(
+    os.getenv("BASEROW_TABLE_MODEL_LRU_CACHE_MAX_FIELDS", "") or 20000
+)
 BASEROW_NOWAIT_FOR_LOCKS = not bool(
     os.getenv("BASEROW_WAIT_INSTEAD_OF_409_CONFLICT_ERROR", False)
 )
@@ -1254,6 +1368,18 @@ PG_FULLTEXT_SEARCH_CONFIG = os.getenv("BASEROW_PG_SEARCH_CONFIG", "simple")
 PG_FULLTEXT_SEARCH_UPDATE_DATA_THROTTLE_SECONDS = float(
     os.getenv("BASEROW_PG_FULLTEXT_SEARCH_UPDATE_DATA_THROTTLE_SECONDS", 2)  # seconds
 )
+# The search data of pending row updates is processed in batches. The size of every
+# batch is adapted to how long the previous one took, so that every batch takes
+# roughly this many milliseconds, without going below or above the min and max size.
+PG_FULLTEXT_SEARCH_UPDATE_BATCH_TARGET_MS = int(
+    os.getenv("BASEROW_PG_FULLTEXT_SEARCH_UPDATE_BATCH_TARGET_MS", "") or 1000
+)
+PG_FULLTEXT_SEARCH_UPDATE_MIN_BATCH_SIZE = int(
+    os.getenv("BASEROW_PG_FULLTEXT_SEARCH_UPDATE_MIN_BATCH_SIZE", "") or 20
+)
+PG_FULLTEXT_SEARCH_UPDATE_MAX_BATCH_SIZE = int(
+    os.getenv("BASEROW_PG_FULLTEXT_SEARCH_UPDATE_MAX_BATCH_SIZE", "") or 5000
+)
 
 POSTHOG_PROJECT_API_KEY = os.getenv("POSTHOG_PROJECT_API_KEY", "")
 POSTHOG_HOST = os.getenv("POSTHOG_HOST") or None
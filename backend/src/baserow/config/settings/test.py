@@ -111,8 +111,17 @@ REST_FRAMEWORK["DEFAULT_THROTTLE_CLASSES"] = []
 
 BUILDER_PUBLICLY_USED_PROPERTIES_CACHE_TTL_SECONDS = 10
 BUILDER_DISPATCH_ACTION_CACHE_TTL_SECONDS = 300
+# Most tests change the rows of a data source table without sending signals.
+BUILDER_DATA_SOURCE_DISPATCH_CACHE_TTL_SECONDS = 0
 
 AUTO_INDEX_VIEW_ENABLED = False
+# The cached field dependency graph executes a different number of queries than the
+# recursive query, depending on what's already cached. The dependency tests run both
+# with and without it, see `tests/baserow/contrib/database/field/dependencies`.
+BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_ENABLED = False
+# Many tests create role assignments directly, without invalidating the cache of
+# the computed roles.
+BASEROW_ENTERPRISE_COMPUTED_ROLES_CACHE_TTL_SECONDS = 0
 # For ease of testing tests assume this setting is set to this. Set it explicitly to
 # prevent any dev env config from breaking the tests.
 BASEROW_PERSONAL_VIEW_LOWEST_ROLE_ALLOWED = "VIEWER"
@@ -29,6 +29,7 @@ class AutomationWorkflowSerializer(serializers.ModelSerializer):
             "published_on",
             "state",
             "graph",
+            "max_parallel_nodes",
         )
         extra_kwargs = {
             "id": {"read_only": True},
@@ -65,9 +66,10 @@ class UpdateAutomationWorkflowSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = AutomationWorkflow
-        fields = ("name", "allow_test_run", "state")
+        fields = ("name", "allow_test_run", "state", "max_parallel_nodes")
         extra_kwargs = {
             "name": {"required": False},
+            "max_parallel_nodes": {"required": False},
         }
 
 
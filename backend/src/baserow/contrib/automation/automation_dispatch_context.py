@@ -77,6 +77,9 @@ class AutomationDispatchContext(DispatchContext):
 
         return super().get_timezone_name()
 
+    def get_max_parallel_nodes(self) -> int:
+        return self.workflow.get_max_parallel_nodes()
+
     def _register_node_result(
         self, node: AutomationNode, dispatch_data: Dict[str, Any]
     ):
@@ -0,0 +1,29 @@
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("automation", "0023_slack_write_message_node"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="automationworkflow",
+            name="max_parallel_nodes",
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                help_text=(
+                    "The maximum number of HTTP requests sent at the same time when a "
+                    "node is dispatched for every iteration of an iterator. Defaults "
+                    "to the `AUTOMATION_WORKFLOW_MAX_PARALLEL_NODES` setting when "
+                    "empty."
+                ),
+                null=True,
+                validators=[
+                    django.core.validators.MinValueValidator(1),
+                    django.core.validators.MaxValueValidator(20),
+                ],
+            ),
+        ),
+    ]
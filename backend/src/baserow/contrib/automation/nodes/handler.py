@@ -27,10 +27,12 @@ from baserow.core.cache import local_cache
 from baserow.core.db import specific_iterator
 from baserow.core.registries import ImportExportConfig
 from baserow.core.services.exceptions import (
+    DispatchBatchException,
     ServiceImproperlyConfiguredDispatchException,
 )
 from baserow.core.services.handler import ServiceHandler
 from baserow.core.services.models import Service
+from baserow.core.services.types import DispatchResult
 from baserow.core.storage import ExportZipFile
 from baserow.core.telemetry.utils import baserow_trace_methods
 from baserow.core.utils import ChildProgressBuilder, MirrorDict, extract_allowed
@@ -354,6 +356,7 @@ class AutomationNodeHandler(metaclass=baserow_trace_methods(tracer)):
         node: "AutomationNode",
         dispatch_context: AutomationDispatchContext,
         allowed_nodes=None,
+        dispatch_result: Optional[Union[DispatchResult, Exception]] = None,
     ):
         """
         Dispatch one node and recursively dispatch the next nodes.
@@ -362,6 +365,9 @@ class AutomationNodeHandler(metaclass=baserow_trace_methods(tracer)):
         :param dispatch_context: The context in which the workflow is being dispatched,
             which contains the event payload and other relevant data.
         :param allowed_nodes: if set, only the nodes from the list will be dispatched.
+        :param dispatch_result: if set, the node has already been dispatched with
+            this result, and only the next nodes are dispatched. If it's an error,
+            the dispatch of the node failed and the error is raised.
         """
 
         if dispatch_context.simulate_until_node and allowed_nodes is None:
@@ -376,7 +382,10 @@ class AutomationNodeHandler(metaclass=baserow_trace_methods(tracer)):
 
         node_type: Type[AutomationNodeActionNodeType] = node.get_type()
         try:
-            dispatch_result = node_type.dispatch(node, dispatch_context)
+            if dispatch_result is None:
+                dispatch_result = node_type.dispatch(node, dispatch_context)
+            elif isinstance(dispatch_result, Exception):
+                raise dispatch_result
             dispatch_context.after_dispatch(node, dispatch_result)
 
             # Return early if this is a simulated dispatch
@@ -392,12 +401,34 @@ class AutomationNodeHandler(metaclass=baserow_trace_methods(tracer)):
                 else:
                     iterations = range(len(node_data))
 
+                sub_dispatch_contexts = []
                 for index in iterations:
                     sub_dispatch_context = dispatch_context.clone()
                     sub_dispatch_context.set_current_iteration(node, index)
-
-                    # dispatch context build
-                    for child in children:
+                    sub_dispatch_contexts.append(sub_dispatch_context)
+
+                # When the body of the iterator is a single node, it's dispatched for
+                # every iteration at once if it supports it, e.g. to create all the
+                # rows with a single action. Longer bodies are dispatched iteration
+                # by iteration, so that the nodes of an iteration always run before
+                # the ones of the next iteration.
+                if len(children) == 1 and not self._has_following_nodes(children[0]):
+                    first_child_results = self._dispatch_node_batch(
+                        children[0], sub_dispatch_contexts
+                    )
+                else:
+                    first_child_results = [None] * len(sub_dispatch_contexts)
+
+                for sub_dispatch_context, first_child_result in zip(
+                    sub_dispatch_contexts, first_child_results
+                ):
+                    self.dispatch_node(
+                        children[0],
+                        sub_dispatch_context,
+                        allowed_nodes=allowed_nodes,
+                        dispatch_result=first_child_result,
+                    )
+                    for child in children[1:]:
                         self.dispatch_node(
                             child, sub_dispatch_context, allowed_nodes=allowed_nodes
                         )
@@ -412,3 +443,49 @@ class AutomationNodeHandler(metaclass=baserow_trace_methods(tracer)):
             raise AutomationNodeMisconfiguredService(
                 f"The node {node.id} is misconfigured and cannot be dispatched. {str(e)}"
             ) from e
+
+    def _has_following_nodes(self, node: AutomationNode) -> bool:
+        """
+        Returns whether other nodes are dispatched after the given node, either
+        its next nodes or its children.
+        """
+
+        return bool(node.get_next_nodes() or node.get_children())
+
+    def _dispatch_node_batch(
+        self,
+        node: AutomationNode,
+        dispatch_contexts: List[AutomationDispatchContext],
+    ) -> List[Optional[Union[DispatchResult, Exception]]]:
+        """
+        Dispatches the node once for every context at once if the node type
+        supports it. Simulations are never batched because they update the sample
+        data of the node.
+
+        :param node: The node to dispatch.
+        :param dispatch_contexts: The contexts of the dispatches.
+        :return: The result of every dispatch or `None` for every context if the node
+            must be dispatched one by one. If one of the dispatches failed, the
+            results stop with its error, so that it's raised for its own iteration
+            after the previous ones have been handled.
+        """
+
+        node_type: Type[AutomationNodeActionNodeType] = node.get_type()
+        if (
+            len(dispatch_contexts) <= 1
+            or any(
+                dispatch_context.simulate_until_node or dispatch_context.use_sample_data
+                for dispatch_context in dispatch_contexts
+            )
+            or not node_type.supports_batch_dispatch(node)
+        ):
+            return [None] * len(dispatch_contexts)
+
+        try:
+            return node_type.dispatch_batch(node, dispatch_contexts)
+        except DispatchBatchException as e:
+            return [*e.results, e.error]
+        except ServiceImproperlyConfiguredDispatchException as e:
+            raise AutomationNodeMisconfiguredService(
+                f"The node {node.id} is misconfigured and cannot be dispatched. {str(e)}"
+            ) from e
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from django.contrib.auth.models import AbstractUser
 
@@ -292,6 +292,23 @@ class AutomationNodeType(
             automation_node.service.specific, dispatch_context
         )
 
+    def supports_batch_dispatch(self, automation_node: AutomationNode) -> bool:
+        """
+        Returns whether the given node can be dispatched for several contexts at
+        once with `dispatch_batch`.
+        """
+
+        return automation_node.service.specific.get_type().supports_batch_dispatch
+
+    def dispatch_batch(
+        self,
+        automation_node: AutomationNode,
+        dispatch_contexts: List[AutomationDispatchContext],
+    ) -> List[DispatchResult]:
+        return ServiceHandler().dispatch_service_batch(
+            automation_node.service.specific, dispatch_contexts
+        )
+
 
 class AutomationNodeTypeRegistry(
     Registry,
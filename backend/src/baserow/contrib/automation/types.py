@@ -1,4 +1,4 @@
-from typing import List, TypedDict
+from typing import List, Optional, TypedDict
 
 from baserow.contrib.automation.nodes.types import AutomationNodeDict
 from baserow.contrib.automation.workflows.constants import WorkflowState
@@ -12,6 +12,7 @@ class AutomationWorkflowDict(TypedDict):
     nodes: List[AutomationNodeDict]
     state: WorkflowState
     graph: dict
+    max_parallel_nodes: Optional[int]
 
 
 class AutomationDict(TypedDict):
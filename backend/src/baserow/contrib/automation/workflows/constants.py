@@ -3,6 +3,10 @@ from django.db import models
 # Allows a workflow to triggerable within the next 5 minutes.
 ALLOW_TEST_RUN_MINUTES = 5
 
+# The highest number of nodes of a workflow that can be set to be dispatched at the
+# same time.
+MAX_PARALLEL_NODES_LIMIT = 20
+
 
 class WorkflowState(models.TextChoices):
     DRAFT = "draft"
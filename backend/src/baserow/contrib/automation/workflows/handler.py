@@ -68,7 +68,7 @@ tracer = trace.get_tracer(__name__)
 
 
 class AutomationWorkflowHandler(metaclass=baserow_trace_methods(tracer)):
-    allowed_fields = ["name", "allow_test_run_until", "state"]
+    allowed_fields = ["name", "allow_test_run_until", "state", "max_parallel_nodes"]
 
     def get_workflow(
         self,
@@ -403,6 +403,7 @@ class AutomationWorkflowHandler(metaclass=baserow_trace_methods(tracer)):
             nodes=serialized_nodes,
             state=workflow.state,
             graph=workflow.graph,
+            max_parallel_nodes=workflow.max_parallel_nodes,
         )
 
     def _ops_count_for_import_workflow(
@@ -579,6 +580,7 @@ class AutomationWorkflowHandler(metaclass=baserow_trace_methods(tracer)):
             order=serialized_workflow["order"],
             state=serialized_workflow["state"] or WorkflowState.DRAFT,
             graph=serialized_workflow.get("graph", {}),
+            max_parallel_nodes=serialized_workflow.get("max_parallel_nodes"),
         )
 
         id_mapping["automation_workflows"][serialized_workflow["id"]] = (
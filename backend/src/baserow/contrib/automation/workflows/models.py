@@ -1,9 +1,14 @@
 from typing import TYPE_CHECKING
 
+from django.conf import settings
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
 from baserow.contrib.automation.constants import WORKFLOW_NAME_MAX_LEN
-from baserow.contrib.automation.workflows.constants import WorkflowState
+from baserow.contrib.automation.workflows.constants import (
+    MAX_PARALLEL_NODES_LIMIT,
+    WorkflowState,
+)
 from baserow.core.cache import local_cache
 from baserow.core.jobs.mixins import (
     JobWithUndoRedoIds,
@@ -79,6 +84,20 @@ class AutomationWorkflow(
 
     graph = models.JSONField(default=dict, help_text="Contains the node graph.")
 
+    max_parallel_nodes = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        validators=[
+            MinValueValidator(1),
+            MaxValueValidator(MAX_PARALLEL_NODES_LIMIT),
+        ],
+        help_text=(
+            "The maximum number of HTTP requests sent at the same time when a node "
+            "is dispatched for every iteration of an iterator. Defaults to the "
+            "`AUTOMATION_WORKFLOW_MAX_PARALLEL_NODES` setting when empty."
+        ),
+    )
+
     objects = AutomationWorkflowTrashManager()
     objects_and_trash = models.Manager()
 
@@ -101,6 +120,15 @@ class AutomationWorkflow(
 
         return self.get_graph().get_node_at_position(None, "south", "")
 
+    def get_max_parallel_nodes(self) -> int:
+        """
+        Returns how many nodes of this workflow can be dispatched at the same time.
+        """
+
+        if self.max_parallel_nodes is not None:
+            return self.max_parallel_nodes
+        return settings.AUTOMATION_WORKFLOW_MAX_PARALLEL_NODES
+
     def can_immediately_be_tested(self):
         """
         True of the workflow trigger can immediately be dispatched in test mode.
@@ -166,6 +166,10 @@ class GetRecordIdsSerializer(serializers.Serializer):
     record_ids = CommaSeparatedIntegerValuesField()
 
 
+class DispatchDataSourcesQuerySerializer(serializers.Serializer):
+    data_source_ids = CommaSeparatedIntegerValuesField(required=False)
+
+
 class DynamicMetadataSerializer(serializers.Serializer):
     """
     A base serializer that builds fields dynamically from the registry.
@@ -44,6 +44,7 @@ from baserow.contrib.builder.api.data_sources.serializers import (
     CreateDataSourceSerializer,
     DataSourceSerializer,
     DispatchDataSourceRequestSerializer,
+    DispatchDataSourcesQuerySerializer,
     GetRecordIdsSerializer,
     MoveDataSourceSerializer,
     UpdateDataSourceSerializer,
@@ -532,6 +533,15 @@ class DispatchDataSourcesView(APIView):
                 type=OpenApiTypes.INT,
                 description="The page we want to dispatch the data source for.",
             ),
+            OpenApiParameter(
+                name="data_source_ids",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="A comma separated list of the ids of the data sources of "
+                "the page to dispatch. All the data sources of the page are "
+                "dispatched if not provided.",
+                explode=False,  # This is a single string, not an exploded list
+            ),
             CLIENT_SESSION_ID_SCHEMA_PARAMETER,
         ],
         tags=["Builder data sources"],
@@ -563,8 +573,19 @@ class DispatchDataSourcesView(APIView):
         dispatch_context = BuilderDispatchContext(
             request, page, only_expose_public_allowed_properties=False
         )
+        query = DispatchDataSourcesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        data_source_ids = query.validated_data.get("data_source_ids")
+
         service_contents = DataSourceService().dispatch_page_data_sources(
-            request.user, page, dispatch_context
+            request.user,
+            page,
+            dispatch_context,
+            data_source_ids=(
+                [int(data_source_id) for data_source_id in data_source_ids]
+                if data_source_ids is not None
+                else None
+            ),
         )
 
         responses = {}
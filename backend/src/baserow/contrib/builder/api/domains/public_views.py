@@ -36,6 +36,7 @@ from baserow.contrib.builder.api.data_sources.errors import (
 )
 from baserow.contrib.builder.api.data_sources.serializers import (
     DispatchDataSourceRequestSerializer,
+    DispatchDataSourcesQuerySerializer,
 )
 from baserow.contrib.builder.api.domains.serializers import (
     PublicDataSourceSerializer,
@@ -528,6 +529,15 @@ class PublicDispatchDataSourcesView(APIView):
                 type=OpenApiTypes.INT,
                 description="The page we want to dispatch the data source for.",
             ),
+            OpenApiParameter(
+                name="data_source_ids",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="A comma separated list of the ids of the data sources of "
+                "the page to dispatch. All the data sources of the page are "
+                "dispatched if not provided.",
+                explode=False,  # This is a single string, not an exploded list
+            ),
             CLIENT_SESSION_ID_SCHEMA_PARAMETER,
         ],
         tags=["Builder data sources"],
@@ -558,8 +568,19 @@ class PublicDispatchDataSourcesView(APIView):
         dispatch_context = BuilderDispatchContext(
             request, page, only_expose_public_allowed_properties=True
         )
+        query = DispatchDataSourcesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        data_source_ids = query.validated_data.get("data_source_ids")
+
         service_contents = DataSourceService().dispatch_page_data_sources(
-            request.user, page, dispatch_context
+            request.user,
+            page,
+            dispatch_context,
+            data_source_ids=(
+                [int(data_source_id) for data_source_id in data_source_ids]
+                if data_source_ids is not None
+                else None
+            ),
         )
 
         responses = {}
@@ -1,9 +1,15 @@
-from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Union
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 from zipfile import ZipFile
 
+from django.conf import settings
 from django.core.files.storage import Storage
+from django.db import connection
 from django.db.models import QuerySet
 from django.db.utils import DatabaseError, IntegrityError
+from django.utils.translation import get_language
 
 from baserow.contrib.builder.data_sources.builder_dispatch_context import (
     BuilderDispatchContext,
@@ -16,7 +22,12 @@ from baserow.contrib.builder.data_sources.models import DataSource
 from baserow.contrib.builder.formula_importer import import_formula
 from baserow.contrib.builder.pages.models import Page
 from baserow.contrib.builder.types import DataSourceDict
-from baserow.core.cache import local_cache
+from baserow.contrib.database.db.atomic import (
+    export_transaction_snapshot,
+    read_repeatable_exported_snapshot_transaction,
+)
+from baserow.core.cache import global_cache, local_cache
+from baserow.core.formula.types import BaserowFormulaObject
 from baserow.core.integrations.models import Integration
 from baserow.core.integrations.registries import integration_type_registry
 from baserow.core.services.exceptions import (
@@ -33,6 +44,15 @@ from .types import DataSourceForUpdate
 if TYPE_CHECKING:
     from baserow.contrib.builder.models import Builder
 
+# The query parameters that can change the result of a data source dispatch.
+DISPATCH_CACHE_QUERY_PARAMETERS = [
+    "offset",
+    "count",
+    "search_query",
+    "filters",
+    "order_by",
+]
+
 
 class DataSourceHandler:
     def __init__(self):
@@ -481,7 +501,10 @@ class DataSourceHandler:
         self, data_sources, dispatch_context: BuilderDispatchContext
     ):
         """
-        Dispatch the service related to the data_sources.
+        Dispatch the service related to the data_sources. The data sources that don't
+        reference other data sources are dispatched concurrently if
+        `BUILDER_DATA_SOURCES_DISPATCH_WORKERS` is greater than one, the others are
+        dispatched afterward so that they can reuse the already dispatched results.
 
         :param data_sources: The data sources to be dispatched.
         :param dispatch_context: The context used for the dispatch.
@@ -491,6 +514,7 @@ class DataSourceHandler:
         """
 
         data_sources_dispatch = {}
+        data_sources_to_dispatch = []
         for data_source in data_sources:
             if (
                 dispatch_context.public_allowed_properties is not None
@@ -508,6 +532,19 @@ class DataSourceHandler:
                     data_sources_dispatch[data_source.id] = {}
                 continue
 
+            data_sources_to_dispatch.append(data_source)
+
+        concurrent_dispatches = self._dispatch_data_sources_concurrently(
+            data_sources_to_dispatch, dispatch_context
+        )
+
+        for data_source in data_sources_to_dispatch:
+            if data_source.id in concurrent_dispatches:
+                data_sources_dispatch[data_source.id] = concurrent_dispatches[
+                    data_source.id
+                ]
+                continue
+
             try:
                 data_sources_dispatch[data_source.id] = self.dispatch_data_source(
                     data_source, dispatch_context
@@ -515,7 +552,82 @@ class DataSourceHandler:
             except Exception as e:
                 data_sources_dispatch[data_source.id] = e
 
-        return data_sources_dispatch
+        return {
+            data_source.id: data_sources_dispatch[data_source.id]
+            for data_source in data_sources
+        }
+
+    def _references_other_data_sources(self, data_source: DataSource) -> bool:
+        """
+        Returns whether one of the formulas of the data source reads the result of
+        another data source, in which case it can't be dispatched independently.
+        """
+
+        from baserow.contrib.builder.data_providers.data_provider_types import (
+            DataSourceDataProviderType,
+        )
+
+        prefix = f"{DataSourceDataProviderType.type}."
+        return any(
+            prefix in BaserowFormulaObject.to_formula(formula)["formula"]
+            for formula in data_source.formula_generator(data_source)
+        )
+
+    def _dispatch_data_sources_concurrently(
+        self, data_sources: List[DataSource], dispatch_context: BuilderDispatchContext
+    ) -> Dict[int, Union[Any, Exception]]:
+        """
+        Dispatches the given data sources that don't reference other data sources in
+        a thread pool of `BUILDER_DATA_SOURCES_DISPATCH_WORKERS` threads. Every thread
+        has its own database connection, which reads the snapshot of the current
+        transaction if there is one, so that all the data sources see the same data.
+
+        :param data_sources: The data sources to dispatch.
+        :param dispatch_context: The context shared by all the dispatches.
+        :return: The result, or the raised exception, of the dispatch of the
+            independent data sources mapped by ID. Empty if the data sources must be
+            dispatched sequentially.
+        """
+
+        if settings.BUILDER_DATA_SOURCES_DISPATCH_WORKERS <= 1:
+            return {}
+
+        data_sources = [
+            data_source
+            for data_source in data_sources
+            if not self._references_other_data_sources(data_source)
+        ]
+        workers = min(settings.BUILDER_DATA_SOURCES_DISPATCH_WORKERS, len(data_sources))
+        if workers <= 1:
+            return {}
+
+        snapshot_id = (
+            export_transaction_snapshot() if connection.in_atomic_block else None
+        )
+        # Make sure all the threads store their result in the same dict.
+        dispatch_context.cache.setdefault("data_source_contents", {})
+
+        def dispatch(data_source):
+            # The local cache of the threads is not cleared by the request middleware.
+            with local_cache.context():
+                try:
+                    if snapshot_id is None:
+                        return self.dispatch_data_source(data_source, dispatch_context)
+                    with read_repeatable_exported_snapshot_transaction(snapshot_id):
+                        return self.dispatch_data_source(data_source, dispatch_context)
+                except Exception as e:
+                    return e
+                finally:
+                    connection.close()
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="dispatch-data-sources"
+        ) as executor:
+            results = executor.map(dispatch, data_sources)
+            return {
+                data_source.id: result
+                for data_source, result in zip(data_sources, results)
+            }
 
     def dispatch_data_source(
         self, data_source: DataSource, dispatch_context: BuilderDispatchContext
@@ -556,16 +668,98 @@ class DataSourceHandler:
         cloned_dispatch_context.add_call(data_source.id)
 
         if data_source.id not in cache.setdefault("data_source_contents", {}):
-            service_dispatch = self.service_handler.dispatch_service(
-                data_source.service.specific, cloned_dispatch_context
-            )
-
             # Cache the dispatch in the formula cache if we have formulas that need
             # it later
-            cache["data_source_contents"][data_source.id] = service_dispatch.data
+            cache["data_source_contents"][data_source.id] = (
+                self._dispatch_data_source_with_shared_cache(
+                    data_source, cloned_dispatch_context
+                )
+            )
 
         return cache["data_source_contents"][data_source.id]
 
+    def _dispatch_data_source_with_shared_cache(
+        self, data_source: DataSource, dispatch_context: BuilderDispatchContext
+    ) -> Any:
+        """
+        Dispatches the service of the data source of a published builder through the
+        global cache, so that concurrent and subsequent identical dispatches, for
+        example of anonymous visitors loading the same page, share the same result
+        instead of all querying the database. The cache lock makes sure that only one
+        of the concurrent dispatches executes the service. The results are cached for
+        `BUILDER_DATA_SOURCE_DISPATCH_CACHE_TTL_SECONDS` and invalidated when the rows
+        of the table of the service change.
+
+        Editors and data sources without a table always dispatch the service.
+        """
+
+        service = data_source.service.specific
+        table_id = getattr(service, "table_id", None)
+
+        def dispatch():
+            return self.service_handler.dispatch_service(service, dispatch_context).data
+
+        timeout = settings.BUILDER_DATA_SOURCE_DISPATCH_CACHE_TTL_SECONDS
+        if (
+            not timeout
+            or table_id is None
+            or dispatch_context.page.builder.workspace_id is not None
+        ):
+            return dispatch()
+
+        return global_cache.get(
+            self.get_dispatch_cache_key(data_source, dispatch_context),
+            default=dispatch,
+            invalidate_key=self.get_table_dispatch_cache_invalidate_key(table_id),
+            timeout=timeout,
+        )
+
+    def get_dispatch_cache_key(
+        self, data_source: DataSource, dispatch_context: BuilderDispatchContext
+    ) -> str:
+        """
+        Returns the cache key of the dispatch of the data source. Everything the
+        formulas of the service can resolve to is part of it: the data sent by the
+        frontend, the paging, search, filter and sort parameters, the user of the
+        user source and its role, and the language, because the dispatched data can
+        contain translated values. Anonymous visitors all share the same key.
+        """
+
+        request = dispatch_context.request
+        user = getattr(request, "user_source_user", None)
+        key_data = {
+            "metadata": getattr(request, "data", {}).get("metadata", {}),
+            "query": {
+                name: request.GET.get(name)
+                for name in DISPATCH_CACHE_QUERY_PARAMETERS
+                if name in request.GET
+            },
+            "range": [dispatch_context.offset, dispatch_context.count],
+            "public": dispatch_context.only_expose_public_allowed_properties,
+            "language": get_language(),
+            "user": (
+                [user.user_source_id, user.id, user.role]
+                if user is not None and user.is_authenticated
+                else None
+            ),
+        }
+        digest = hashlib.sha256(
+            json.dumps(key_data, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"builder_data_source_dispatch_{data_source.id}_{digest}"
+
+    def get_table_dispatch_cache_invalidate_key(self, table_id: int) -> str:
+        return f"builder_data_source_dispatch_table_{table_id}"
+
+    def invalidate_table_dispatch_cache(self, table_id: int):
+        """
+        Invalidates the cached dispatches of all the data sources using the table.
+        """
+
+        global_cache.invalidate(
+            invalidate_key=self.get_table_dispatch_cache_invalidate_key(table_id)
+        )
+
     def move_data_source(
         self, data_source: DataSourceForUpdate, before: Optional[DataSource] = None
     ) -> DataSource:
@@ -1,6 +1,13 @@
+from django.db import transaction
 from django.db.models.signals import pre_delete
 
+from baserow.contrib.builder.data_sources.handler import DataSourceHandler
 from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.contrib.database.rows.signals import (
+    rows_created,
+    rows_deleted,
+    rows_updated,
+)
 from baserow.core.services.handler import ServiceHandler
 from baserow.core.services.models import Service
 from baserow.core.services.registries import service_type_registry
@@ -27,3 +34,21 @@ def before_data_source_permanently_deleted(sender, instance, **kwargs):
 
 def connect_to_data_source_pre_delete_signal():
     pre_delete.connect(before_data_source_permanently_deleted, DataSource)
+
+
+def invalidate_data_source_dispatch_cache(sender, table, **kwargs):
+    """
+    Invalidates the cached data source dispatches using the table when its rows
+    change. It's done when the transaction is committed, otherwise a concurrent
+    dispatch could cache the old rows again before the changes are visible.
+    """
+
+    table_id = table.id
+    transaction.on_commit(
+        lambda: DataSourceHandler().invalidate_table_dispatch_cache(table_id)
+    )
+
+
+def connect_to_rows_signals():
+    for signal in [rows_created, rows_updated, rows_deleted]:
+        signal.connect(invalidate_data_source_dispatch_cache)
@@ -338,6 +338,7 @@ class DataSourceService:
         user,
         page: Page,
         dispatch_context: BuilderDispatchContext,
+        data_source_ids: Optional[List[int]] = None,
     ) -> Dict[int, Union[Any, Exception]]:
         """
         Dispatch the service related data_source of the given page if the user
@@ -346,6 +347,8 @@ class DataSourceService:
         :param user: The current user.
         :param page: the page we want to dispatch the data_sources for.
         :param dispatch_context: The context used for the dispatch.
+        :param data_source_ids: If provided, only the data sources of the page with
+            these ids are dispatched.
         :return: The result of dispatching all the data source dispatch mapped by ID.
         """
 
@@ -353,7 +356,12 @@ class DataSourceService:
         data_sources = self.handler.get_data_sources_with_cache(page)
 
         # ...but we want to dispatch only those for this page
-        dispatchable_data_sources = [d for d in data_sources if d.page_id == page.id]
+        dispatchable_data_sources = [
+            d
+            for d in data_sources
+            if d.page_id == page.id
+            and (data_source_ids is None or d.id in data_source_ids)
+        ]
 
         if not dispatchable_data_sources:
             return {}
@@ -91,7 +91,7 @@ from baserow.core.constants import (
 from baserow.core.datetime import FormattedDate, FormattedDateTime
 from baserow.core.formula import (
     BaserowFormulaSyntaxError,
-    get_parse_tree_for_formula,
+    get_cached_parse_tree_for_formula,
     resolve_formula,
 )
 from baserow.core.formula.field import BASEROW_FORMULA_VERSION_INITIAL
@@ -558,7 +558,7 @@ class RecordSelectorElementType(
                 # to populate the formula context with the `data_source_id`
                 # of the element so that we can resolve them.
                 formula_context = kwargs | self.import_context_addition(instance)
-                tree = get_parse_tree_for_formula(
+                tree = get_cached_parse_tree_for_formula(
                     instance.option_name_suffix["formula"]
                 )
                 properties = merge_dicts_no_duplicates(
@@ -1,6 +1,6 @@
 from baserow.contrib.builder.formula_property_extractor import FormulaFieldVisitor
 from baserow.core.formula.parser.exceptions import BaserowFormulaSyntaxError
-from baserow.core.formula.parser.parser import get_parse_tree_for_formula
+from baserow.core.formula.parser.parser import get_cached_parse_tree_for_formula
 from baserow.core.formula.types import BaserowFormulaObject
 from baserow.core.registry import InstanceWithFormulaMixin
 from baserow.core.utils import merge_dicts_no_duplicates
@@ -18,7 +18,7 @@ class BuilderInstanceWithFormulaMixin(InstanceWithFormulaMixin):
                 continue
 
             try:
-                tree = get_parse_tree_for_formula(formula_str)
+                tree = get_cached_parse_tree_for_formula(formula_str)
             except BaserowFormulaSyntaxError:
                 continue
 
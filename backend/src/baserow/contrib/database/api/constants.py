@@ -38,6 +38,21 @@ ONLY_COUNT_API_PARAM = OpenApiParameter(
     description="If provided only the count will be returned.",
 )
 
+COUNT_MODE_API_PARAM = OpenApiParameter(
+    name="count_mode",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.STR,
+    enum=["exact", "estimate", "cached", "fast"],
+    description=(
+        "Defines how the rows are counted. `exact` always counts all the rows, "
+        "`estimate` returns the estimate of the database, `cached` returns an exact "
+        "count that's cached until the rows or filters change and `fast` returns the "
+        "cached count if available, otherwise an estimate for large views and an "
+        "exact count for small ones. If provided, the response contains "
+        "`count_is_exact` indicating whether the count is an estimate."
+    ),
+)
+
 EXCLUDE_COUNT_API_PARAM = OpenApiParameter(
     name="exclude_count",
     location=OpenApiParameter.QUERY,
@@ -248,6 +263,21 @@ PAGINATION_API_PARAMS = (
     ),
 )
 
+CURSOR_PAGINATION_API_PARAM = OpenApiParameter(
+    name="cursor",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.STR,
+    description=(
+        "If provided, the rows are paginated with a cursor instead of a page number or "
+        "offset. Provide an empty value to fetch the first page and then the "
+        "`next_cursor` of the previous response to fetch the next one. The number of "
+        "rows is defined by the `size` or `limit` parameter. The response only "
+        "contains the `next_cursor` and `results` properties. Fetching any page is as "
+        "fast as fetching the first one, which makes this the preferred way to "
+        "iterate over large tables."
+    ),
+)
+
 INCLUDE_FIELDS_API_PARAM = OpenApiParameter(
     name="include_fields",
     location=OpenApiParameter.QUERY,
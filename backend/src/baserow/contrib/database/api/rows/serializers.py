@@ -544,6 +544,7 @@ class ListRowsQueryParamsSerializer(
     exclude = serializers.CharField(required=False)
     filter_type = serializers.CharField(required=False, default="")
     view_id = serializers.IntegerField(required=False)
+    cursor = serializers.CharField(required=False, allow_blank=True)
 
 
 def get_example_batch_rows_serializer_class(
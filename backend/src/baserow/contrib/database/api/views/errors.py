@@ -94,6 +94,11 @@ ERROR_AGGREGATION_TYPE_DOES_NOT_EXIST = (
     HTTP_400_BAD_REQUEST,
     "The specified aggregation type does not exist.",
 )
+ERROR_ROW_COUNT_MODE_DOES_NOT_EXIST = (
+    "ERROR_ROW_COUNT_MODE_DOES_NOT_EXIST",
+    HTTP_400_BAD_REQUEST,
+    "The specified row count mode does not exist.",
+)
 ERROR_VIEW_DECORATION_DOES_NOT_EXIST = (
     "ERROR_VIEW_DECORATION_DOES_NOT_EXIST",
     HTTP_404_NOT_FOUND,
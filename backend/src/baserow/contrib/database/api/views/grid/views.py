@@ -23,6 +23,8 @@ from baserow.contrib.database.api.constants import (
     ADHOC_FILTERS_API_PARAMS_WITH_AGGREGATION,
     ADHOC_FILTERS_API_PARAMS_WITH_AGGREGATION_NO_COMBINE,
     ADHOC_SORTING_API_PARAM,
+    COUNT_MODE_API_PARAM,
+    CURSOR_PAGINATION_API_PARAM,
     EXCLUDE_COUNT_API_PARAM,
     EXCLUDE_FIELDS_API_PARAM,
     INCLUDE_FIELDS_API_PARAM,
@@ -49,6 +51,7 @@ from baserow.contrib.database.api.utils import get_include_exclude_field_ids
 from baserow.contrib.database.api.views.errors import (
     ERROR_AGGREGATION_TYPE_DOES_NOT_EXIST,
     ERROR_NO_AUTHORIZATION_TO_PUBLICLY_SHARED_VIEW,
+    ERROR_ROW_COUNT_MODE_DOES_NOT_EXIST,
     ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST,
     ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD,
 )
@@ -60,6 +63,7 @@ from baserow.contrib.database.api.views.utils import (
     get_public_view_authorization_token,
     get_public_view_filtered_queryset,
     get_view_filtered_queryset,
+    get_view_row_count_from_request,
     paginate_and_serialize_queryset,
     serialize_group_by_fields_metadata,
     serialize_rows_metadata,
@@ -78,6 +82,7 @@ from baserow.contrib.database.table.operations import ListRowsDatabaseTableOpera
 from baserow.contrib.database.views.exceptions import (
     AggregationTypeDoesNotExist,
     NoAuthorizationToPubliclySharedView,
+    RowCountModeDoesNotExist,
     ViewDoesNotExist,
     ViewFilterTypeDoesNotExist,
     ViewFilterTypeNotAllowedForField,
@@ -139,7 +144,9 @@ class GridViewView(APIView):
             ),
             ONLY_COUNT_API_PARAM,
             EXCLUDE_COUNT_API_PARAM,
+            COUNT_MODE_API_PARAM,
             *PAGINATION_API_PARAMS,
+            CURSOR_PAGINATION_API_PARAM,
             *ADHOC_FILTERS_API_PARAMS_NO_COMBINE,
             ADHOC_SORTING_API_PARAM,
             INCLUDE_FIELDS_API_PARAM,
@@ -153,12 +160,12 @@ class GridViewView(APIView):
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`view_id` if the authorized user has access to the database's workspace. "
-            "The response is paginated either by a limit/offset or page/size style. "
-            "The style depends on the provided GET parameters. The properties of the "
-            "returned rows depends on which fields the table has. For a complete "
-            "overview of fields use the **list_database_table_fields** endpoint to "
-            "list them all. In the example all field types are listed, but normally "
-            "the number in field_{id} key is going to be the id of the field. "
+            "The response is paginated either by a limit/offset, page/size or cursor "
+            "style. The style depends on the provided GET parameters. The properties "
+            "of the returned rows depends on which fields the table has. For a "
+            "complete overview of fields use the **list_database_table_fields** "
+            "endpoint to list them all. In the example all field types are listed, but "
+            "normally the number in field_{id} key is going to be the id of the field. "
             "The value is what the user has provided and the format of it depends on "
             "the fields type.\n"
             "\n"
@@ -189,6 +196,8 @@ class GridViewView(APIView):
                     "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
                     "ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD",
                     "ERROR_FILTERS_PARAM_VALIDATION_ERROR",
+                    "ERROR_INVALID_CURSOR",
+                    "ERROR_ROW_COUNT_MODE_DOES_NOT_EXIST",
                 ]
             ),
             404: get_error_schema(
@@ -206,6 +215,7 @@ class GridViewView(APIView):
             ViewFilterTypeDoesNotExist: ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST,
             ViewFilterTypeNotAllowedForField: ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD,
             FieldDoesNotExist: ERROR_FIELD_DOES_NOT_EXIST,
+            RowCountModeDoesNotExist: ERROR_ROW_COUNT_MODE_DOES_NOT_EXIST,
         }
     )
     @allowed_includes("field_options", "row_metadata")
@@ -214,7 +224,8 @@ class GridViewView(APIView):
         """
         Lists all the rows of a grid view, paginated either by a page or offset/limit.
         If the limit get parameter is provided the limit/offset pagination will be used
-        else the page number pagination.
+        else the page number pagination. If the cursor get parameter is provided, the
+        keyset pagination is used instead.
 
         Optionally the field options can also be included in the response if the
         `field_options` are provided in the include GET parameter.
@@ -252,11 +263,23 @@ class GridViewView(APIView):
         )
         model = queryset.model
 
+        row_count = get_view_row_count_from_request(
+            view,
+            queryset,
+            request,
+            cacheable=not adhoc_filters.has_any_filters
+            and not query_params.get("search"),
+        )
+
         if ONLY_COUNT_API_PARAM.name in request.GET:
+            if row_count is not None:
+                return Response(
+                    {"count": row_count.count, "count_is_exact": row_count.exact}
+                )
             return Response({"count": queryset.count()})
 
         response, page, _ = paginate_and_serialize_queryset(
-            queryset, request, field_ids
+            queryset, request, field_ids, row_count=row_count
         )
 
         if view_type.can_group_by and view.viewgroupby_set.all():
@@ -709,7 +732,9 @@ class PublicGridViewRowsView(APIView):
             ),
             ONLY_COUNT_API_PARAM,
             EXCLUDE_COUNT_API_PARAM,
+            COUNT_MODE_API_PARAM,
             *PAGINATION_API_PARAMS,
+            CURSOR_PAGINATION_API_PARAM,
             ADHOC_SORTING_API_PARAM,
             INCLUDE_FIELDS_API_PARAM,
             EXCLUDE_FIELDS_API_PARAM,
@@ -732,12 +757,12 @@ class PublicGridViewRowsView(APIView):
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`slug` if the grid view is public."
-            "The response is paginated either by a limit/offset or page/size style. "
-            "The style depends on the provided GET parameters. The properties of the "
-            "returned rows depends on which fields the table has. For a complete "
-            "overview of fields use the **list_database_table_fields** endpoint to "
-            "list them all. In the example all field types are listed, but normally "
-            "the number in field_{id} key is going to be the id of the field. "
+            "The response is paginated either by a limit/offset, page/size or cursor "
+            "style. The style depends on the provided GET parameters. The properties "
+            "of the returned rows depends on which fields the table has. For a "
+            "complete overview of fields use the **list_database_table_fields** "
+            "endpoint to list them all. In the example all field types are listed, but "
+            "normally the number in field_{id} key is going to be the id of the field. "
             "The value is what the user has provided and the format of it depends on "
             "the fields type.\n"
             "\n"
@@ -763,6 +788,8 @@ class PublicGridViewRowsView(APIView):
                     "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
                     "ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD",
                     "ERROR_FILTERS_PARAM_VALIDATION_ERROR",
+                    "ERROR_INVALID_CURSOR",
+                    "ERROR_ROW_COUNT_MODE_DOES_NOT_EXIST",
                 ]
             ),
             401: get_error_schema(["ERROR_NO_AUTHORIZATION_TO_PUBLICLY_SHARED_VIEW"]),
@@ -782,6 +809,7 @@ class PublicGridViewRowsView(APIView):
             ViewFilterTypeNotAllowedForField: ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD,
             FieldDoesNotExist: ERROR_FIELD_DOES_NOT_EXIST,
             NoAuthorizationToPubliclySharedView: ERROR_NO_AUTHORIZATION_TO_PUBLICLY_SHARED_VIEW,
+            RowCountModeDoesNotExist: ERROR_ROW_COUNT_MODE_DOES_NOT_EXIST,
         }
     )
     @allowed_includes("field_options")
@@ -792,7 +820,8 @@ class PublicGridViewRowsView(APIView):
         """
         Lists all the rows of a grid view, paginated either by a page or offset/limit.
         If the limit get parameter is provided the limit/offset pagination will be used
-        else the page number pagination.
+        else the page number pagination. If the cursor get parameter is provided, the
+        keyset pagination is used instead.
 
         Optionally the field options can also be included in the response if the the
         `field_options` are provided in the include GET parameter.
@@ -813,11 +842,23 @@ class PublicGridViewRowsView(APIView):
         ) = get_public_view_filtered_queryset(view, request, query_params)
         model = queryset.model
 
+        row_count = get_view_row_count_from_request(
+            view,
+            queryset,
+            request,
+            cacheable=not AdHocFilters.from_request(request).has_any_filters
+            and not query_params.get("search"),
+        )
+
         if ONLY_COUNT_API_PARAM.name in request.GET:
+            if row_count is not None:
+                return Response(
+                    {"count": row_count.count, "count_is_exact": row_count.exact}
+                )
             return Response({"count": queryset.count()})
 
         response, page, _ = paginate_and_serialize_queryset(
-            queryset, request, field_ids
+            queryset, request, field_ids, row_count=row_count
         )
 
         if field_options:
@@ -9,6 +9,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from baserow.api.pagination import (
+    KeysetPagination,
     LimitOffsetPagination,
     LimitOffsetPaginationWithoutCount,
     Pageable,
@@ -16,8 +17,10 @@ from baserow.api.pagination import (
     PageNumberPaginationWithoutCount,
 )
 from baserow.contrib.database.api.constants import (
+    COUNT_MODE_API_PARAM,
     EXCLUDE_COUNT_API_PARAM,
     LIMIT_LINKED_ITEMS_API_PARAM,
+    ONLY_COUNT_API_PARAM,
 )
 from baserow.contrib.database.api.rows.serializers import (
     RowSerializer,
@@ -30,6 +33,7 @@ from baserow.contrib.database.views.filters import AdHocFilters
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import View
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.contrib.database.views.utils import RowCount
 
 
 def get_public_view_authorization_token(request: Request) -> Optional[str]:
@@ -166,7 +170,9 @@ def _get_paginator(request: Request) -> Pageable:
     :return: The paginator to use.
     """
 
-    if EXCLUDE_COUNT_API_PARAM.name in request.GET:
+    if KeysetPagination.is_requested(request):
+        paginator = KeysetPagination()
+    elif EXCLUDE_COUNT_API_PARAM.name in request.GET:
         if LimitOffsetPagination.limit_query_param in request.GET:
             paginator = LimitOffsetPaginationWithoutCount()
         else:
@@ -200,10 +206,41 @@ def parse_limit_linked_items_params(request) -> Optional[int]:
     return value if value > 0 else None
 
 
+def get_view_row_count_from_request(
+    view: View, queryset: QuerySet, request: Request, cacheable: bool
+) -> Optional[RowCount]:
+    """
+    Counts the rows of the view with the row count mode provided in the request. Only
+    counts if the mode is provided and the count is going to be part of the response.
+
+    :param view: The view to count the rows for.
+    :param queryset: The filtered queryset of the view rows.
+    :param request: The request containing the count mode query parameter.
+    :param cacheable: Whether the queryset only contains the view filters, so that
+        the count can be cached for the view.
+    :raises RowCountModeDoesNotExist: When the provided mode doesn't exist.
+    :return: The row count or None if no count mode is requested.
+    """
+
+    mode = request.GET.get(COUNT_MODE_API_PARAM.name)
+    if not mode:
+        return None
+
+    count_excluded = (
+        EXCLUDE_COUNT_API_PARAM.name in request.GET
+        or KeysetPagination.is_requested(request)
+    )
+    if count_excluded and ONLY_COUNT_API_PARAM.name not in request.GET:
+        return None
+
+    return ViewHandler().get_view_row_count(view, queryset, mode, cacheable)
+
+
 def paginate_and_serialize_queryset(
     queryset: QuerySet[GeneratedTableModel],
     request: Request,
     field_ids: Optional[Iterable[int]],
+    row_count: Optional[RowCount] = None,
 ) -> PaginatedData:
     """
     Paginate and serialize the data for the provided queryset and view.
@@ -211,10 +248,16 @@ def paginate_and_serialize_queryset(
     :param queryset: The queryset to paginate and serialize.
     :param request: The request containing the pagination query parameters.
     :param field_ids: The (optional) field IDs to restrict the serialized data to.
+    :param row_count: The (optional) already computed row count. If provided, the
+        paginator uses it instead of counting the rows and the response indicates
+        whether the count is exact.
     :return: The paginated data containing the paginator, the page of results, and
         response containing the serialized data.
     """
 
+    if row_count is not None:
+        queryset = queryset.with_known_count(row_count.count)
+
     paginator = _get_paginator(request)
     page = paginator.paginate_queryset(queryset, request)
 
@@ -231,6 +274,8 @@ def paginate_and_serialize_queryset(
     serializer = serializer_class(page, many=True)
 
     response = paginator.get_paginated_response(serializer.data)
+    if row_count is not None:
+        response.data.update(count_is_exact=row_count.exact)
     return PaginatedData(response, page, paginator)
 
 
@@ -1,8 +1,9 @@
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from functools import partial
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from zipfile import ZipFile
 
 from django.conf import settings
@@ -17,6 +18,7 @@ from django.utils import translation
 from django.utils.translation import gettext as _
 
 from baserow.contrib.database.api.serializers import DatabaseSerializer
+from baserow.contrib.database.db.copy import COPY_BATCH_SIZE, bulk_copy_create
 from baserow.contrib.database.db.schema import safe_django_schema_editor
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.registries import field_type_registry
@@ -29,13 +31,19 @@ from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.views.registries import view_type_registry
 from baserow.core.db import specific_queryset
 from baserow.core.handler import CoreHandler
+from baserow.core.import_export.utils import (
+    read_ahead,
+    read_json_lines_from_zip,
+    write_json_lines_to_zip,
+)
 from baserow.core.models import Application, Workspace
+from baserow.core.psycopg import sql
 from baserow.core.registries import (
     ApplicationType,
     ImportExportConfig,
     serialization_processor_registry,
 )
-from baserow.core.storage import ExportZipFile
+from baserow.core.storage import ExportZipFile, LockedExportZipFile
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.utils import ChildProgressBuilder, Progress, grouper
 
@@ -45,7 +53,11 @@ from .constants import (
     IMPORT_SERIALIZED_IMPORTING_TABLE_STRUCTURE,
 )
 from .data_sync.registries import data_sync_type_registry
-from .db.atomic import read_repeatable_single_database_atomic_transaction
+from .db.atomic import (
+    export_transaction_snapshot,
+    read_repeatable_exported_snapshot_transaction,
+    read_repeatable_single_database_atomic_transaction,
+)
 from .export_serialized import DatabaseExportSerializedStructure
 from .field_rules.handlers import FieldRuleHandler
 from .field_rules.models import FieldRule
@@ -53,6 +65,9 @@ from .fields.utils import DeferredFieldImporter, DeferredForeignKeyUpdater
 from .search.handler import SearchHandler
 from .table.models import GeneratedTableModel, Table
 
+# The number of rows fetched at once with a server side cursor when exporting.
+EXPORT_ROWS_CHUNK_SIZE = 2000
+
 
 @dataclass
 class ImportedFields:
@@ -118,101 +133,241 @@ class DatabaseApplicationType(ApplicationType):
 
         serialized_tables: List[Dict[str, Any]] = []
 
-        for table in tables:
-            fields = table.field_set.all()
-            serialized_fields = []
-            for f in fields:
-                field = f.specific
-                field_type = field_type_registry.get_by_model(field)
-                serialized_fields.append(field_type.export_serialized(field))
+        # The rows of the tables are exported in threads while the rest of the tables
+        # are serialized. The threads must be stopped before the zip and the
+        # transaction of the export are closed, also if the export fails.
+        executor = None
+        concurrent_rows_exports = {}
+        workers = min(settings.BASEROW_IMPORT_EXPORT_TABLE_ROWS_WORKERS, len(tables))
+        if (
+            not import_export_config.only_structure
+            and workers > 1
+            and connection.in_atomic_block
+        ):
+            executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="export-table-rows"
+            )
+
+        try:
+            if executor is not None:
+                concurrent_rows_exports = self._export_tables_rows_concurrently(
+                    executor, tables, import_export_config, files_zip, storage
+                )
+
+            for table in tables:
+                fields = table.field_set.all()
+                serialized_fields = []
+                for f in fields:
+                    field = f.specific
+                    field_type = field_type_registry.get_by_model(field)
+                    serialized_fields.append(field_type.export_serialized(field))
+
+                table_cache: Dict[str, Any] = {}
+                workspace = table.get_root()
+                if workspace is not None:
+                    table_cache["workspace_id"] = workspace.id
+                serialized_views = []
+                for v in table.view_set.all():
+                    view = v.specific
+                    view_type = view_type_registry.get_by_model(view)
+                    serialized_views.append(
+                        view_type.export_serialized(
+                            view, import_export_config, table_cache, files_zip, storage
+                        )
+                    )
 
+                serialized_rows = []
+                rows_file, rows_count = None, None
+                if table.id in concurrent_rows_exports:
+                    (
+                        serialized_rows,
+                        rows_file,
+                        rows_count,
+                    ) = concurrent_rows_exports[table.id].result()
+                    progress.increment(
+                        state=EXPORT_SERIALIZED_EXPORTING_TABLE + str(table.name)
+                    )
+                elif not import_export_config.only_structure:
+                    serialized_rows, rows_file, rows_count = self._export_table_rows(
+                        table,
+                        fields,
+                        import_export_config,
+                        table_cache,
+                        files_zip,
+                        storage,
+                        progress.create_child_builder(represents_progress=1),
+                    )
+                else:
+                    progress.increment()
+
+                serialized_data_sync = None
+                serialized_field_rules = []
+                if hasattr(table, "data_sync"):
+                    data_sync = table.data_sync.specific
+                    data_sync_type = data_sync_type_registry.get_by_model(data_sync)
+                    serialized_data_sync = data_sync_type.export_serialized(data_sync)
+
+                if hasattr(table, "field_rules"):
+                    field_rules_handler = FieldRuleHandler(table)
+
+                    for (
+                        rule,
+                        rule_type,
+                    ) in field_rules_handler.applicable_rules_with_types:
+                        exported_field_rule = field_rules_handler.export_rule(rule)
+                        serialized_field_rules.append(exported_field_rule)
+
+                structure = DatabaseExportSerializedStructure.table(
+                    id=table.id,
+                    name=table.name,
+                    order=table.order,
+                    fields=serialized_fields,
+                    views=serialized_views,
+                    rows=serialized_rows,
+                    data_sync=serialized_data_sync,
+                    field_rules=serialized_field_rules,
+                    rows_file=rows_file,
+                    rows_count=rows_count,
+                )
+
+                for serialized_structure in serialization_processor_registry.get_all():
+                    extra_data = serialized_structure.export_serialized(
+                        workspace, table, import_export_config
+                    )
+                    if extra_data is not None:
+                        structure.update(**extra_data)
+                serialized_tables.append(structure)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        return serialized_tables
+
+    def _export_table_rows(
+        self,
+        table: Table,
+        fields: List[Field],
+        import_export_config: ImportExportConfig,
+        table_cache: Dict[str, Any],
+        files_zip: Optional[ExportZipFile],
+        storage: Optional[Storage],
+        progress_builder: Optional[ChildProgressBuilder] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[int]]:
+        """
+        Serializes the rows of the table. If the rows must be streamed, they're
+        written to a separate file in the zip instead of being returned.
+
+        :return: The serialized rows, and the name of the file in the zip and the
+            number of rows written to it if the rows are streamed.
+        """
+
+        row_count_limit = settings.BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT
+        model = table.get_model(fields=fields, add_dependencies=False)
+        row_queryset = model.objects.all()[: row_count_limit or None]
+
+        row_progress = ChildProgressBuilder.build(
+            progress_builder, child_total=row_queryset.count()
+        )
+        if table.created_by_column_added:
+            row_queryset = row_queryset.select_related("created_by")
+        if table.last_modified_by_column_added:
+            row_queryset = row_queryset.select_related("last_modified_by")
+        serialized_rows_iterator = self._serialize_table_rows(
+            table, model, row_queryset, table_cache, files_zip, storage, row_progress
+        )
+        if import_export_config.stream_table_rows and files_zip is not None:
+            rows_file, rows_count = write_json_lines_to_zip(
+                files_zip, f"database_table_{table.id}_rows", serialized_rows_iterator
+            )
+            return [], rows_file, rows_count
+        return list(serialized_rows_iterator), None, None
+
+    def _export_tables_rows_concurrently(
+        self,
+        executor: ThreadPoolExecutor,
+        tables: List[Table],
+        import_export_config: ImportExportConfig,
+        files_zip: Optional[ExportZipFile],
+        storage: Optional[Storage],
+    ) -> Dict[int, Future]:
+        """
+        Starts exporting the rows of the tables in the threads of the executor. Every
+        thread has its own database connection, which imports the snapshot of the
+        current transaction, so that all the rows are read from the same consistent
+        state of the database as the rest of the export. It must therefore only be
+        called in a transaction, and the caller must shut the executor down before
+        the transaction ends.
+
+        :param executor: The executor exporting the rows of the tables.
+        :return: A dict where the key is the table id and the value the future
+            resolving to the result of `_export_table_rows` for that table.
+        """
+
+        snapshot_id = export_transaction_snapshot()
+        # The zip stream is shared by all the threads because files are added to it
+        # while the rows are serialized.
+        if files_zip is not None:
+            files_zip = LockedExportZipFile(files_zip)
+
+        def export_table_rows(table, fields):
             table_cache: Dict[str, Any] = {}
             workspace = table.get_root()
             if workspace is not None:
                 table_cache["workspace_id"] = workspace.id
-            serialized_views = []
-            for v in table.view_set.all():
-                view = v.specific
-                view_type = view_type_registry.get_by_model(view)
-                serialized_views.append(
-                    view_type.export_serialized(
-                        view, import_export_config, table_cache, files_zip, storage
+            try:
+                with read_repeatable_exported_snapshot_transaction(snapshot_id):
+                    return self._export_table_rows(
+                        table,
+                        fields,
+                        import_export_config,
+                        table_cache,
+                        files_zip,
+                        storage,
                     )
-                )
+            finally:
+                connection.close()
 
-            serialized_rows = []
-            row_count_limit = settings.BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT
-            export_all_table_rows = not import_export_config.only_structure
-            if export_all_table_rows:
-                model = table.get_model(fields=fields, add_dependencies=False)
-                row_queryset = model.objects.all()[: row_count_limit or None]
-
-                row_progress = progress.create_child(1, row_queryset.count())
-                if table.created_by_column_added:
-                    row_queryset = row_queryset.select_related("created_by")
-                if table.last_modified_by_column_added:
-                    row_queryset = row_queryset.select_related("last_modified_by")
-                for row in row_queryset:
-                    serialized_row = DatabaseExportSerializedStructure.row(
-                        id=row.id,
-                        order=str(row.order),
-                        created_on=row.created_on.isoformat(),
-                        updated_on=row.updated_on.isoformat(),
-                        created_by=getattr(row, "created_by", None),
-                        last_modified_by=getattr(row, "last_modified_by", None),
-                    )
-                    for field_object in model._field_objects.values():
-                        field_name = field_object["name"]
-                        field_type = field_object["type"]
-                        serialized_row[field_name] = (
-                            field_type.get_export_serialized_value(
-                                row, field_name, table_cache, files_zip, storage
-                            )
-                        )
-                    serialized_rows.append(serialized_row)
-                    row_progress.increment(
-                        state=EXPORT_SERIALIZED_EXPORTING_TABLE + str(table.name)
-                    )
-            else:
-                progress.increment()
-
-            serialized_data_sync = None
-            serialized_field_rules = []
-            if hasattr(table, "data_sync"):
-                data_sync = table.data_sync.specific
-                data_sync_type = data_sync_type_registry.get_by_model(data_sync)
-                serialized_data_sync = data_sync_type.export_serialized(data_sync)
-
-            if hasattr(table, "field_rules"):
-                field_rules_handler = FieldRuleHandler(table)
-
-                for (
-                    rule,
-                    rule_type,
-                ) in field_rules_handler.applicable_rules_with_types:
-                    exported_field_rule = field_rules_handler.export_rule(rule)
-                    serialized_field_rules.append(exported_field_rule)
-
-            structure = DatabaseExportSerializedStructure.table(
-                id=table.id,
-                name=table.name,
-                order=table.order,
-                fields=serialized_fields,
-                views=serialized_views,
-                rows=serialized_rows,
-                data_sync=serialized_data_sync,
-                field_rules=serialized_field_rules,
+        return {
+            table.id: executor.submit(
+                export_table_rows, table, list(table.field_set.all())
             )
+            for table in tables
+        }
 
-            for serialized_structure in serialization_processor_registry.get_all():
-                extra_data = serialized_structure.export_serialized(
-                    workspace, table, import_export_config
-                )
-                if extra_data is not None:
-                    structure.update(**extra_data)
-            serialized_tables.append(structure)
+    def _serialize_table_rows(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        row_queryset: QuerySet,
+        table_cache: Dict[str, Any],
+        files_zip: Optional[ExportZipFile],
+        storage: Optional[Storage],
+        progress: Progress,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily serializes the rows of the queryset. The rows are fetched in chunks
+        with a server side cursor, so that they don't all have to be kept in memory.
+        """
 
-        return serialized_tables
+        for row in row_queryset.iterator(chunk_size=EXPORT_ROWS_CHUNK_SIZE):
+            serialized_row = DatabaseExportSerializedStructure.row(
+                id=row.id,
+                order=str(row.order),
+                created_on=row.created_on.isoformat(),
+                updated_on=row.updated_on.isoformat(),
+                created_by=getattr(row, "created_by", None),
+                last_modified_by=getattr(row, "last_modified_by", None),
+            )
+            for field_object in model._field_objects.values():
+                field_name = field_object["name"]
+                field_type = field_object["type"]
+                serialized_row[field_name] = field_type.get_export_serialized_value(
+                    row, field_name, table_cache, files_zip, storage
+                )
+            yield serialized_row
+            progress.increment(
+                state=EXPORT_SERIALIZED_EXPORTING_TABLE + str(table.name)
+            )
 
     def export_serialized(
         self,
@@ -285,10 +440,10 @@ class DatabaseApplicationType(ApplicationType):
                     len(table["views"])
                     +
                     # Converting every row
-                    len(table["rows"])
+                    self._get_serialized_table_rows_count(table)
                     +
                     # Inserting every row
-                    len(table["rows"])
+                    self._get_serialized_table_rows_count(table)
                     +
                     # After each field
                     len(table["fields"])
@@ -298,6 +453,21 @@ class DatabaseApplicationType(ApplicationType):
             + len(external_table_fields_to_import or [])
         )
 
+    def _get_serialized_table_rows_count(self, serialized_table: Dict[str, Any]) -> int:
+        return serialized_table.get("rows_count", len(serialized_table["rows"]))
+
+    def _get_serialized_table_rows(
+        self, serialized_table: Dict[str, Any], files_zip: Optional[ZipFile]
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Returns the serialized rows of the table. If they've been streamed to a
+        separate file in the zip during the export, they're lazily read from there.
+        """
+
+        if "rows_file" in serialized_table:
+            return read_json_lines_from_zip(files_zip, serialized_table["rows_file"])
+        return serialized_table["rows"]
+
     def init_application(self, user, application: Database) -> None:
         """
         Creates a new minimal table instance and a grid view for the newly
@@ -676,11 +846,6 @@ class DatabaseApplicationType(ApplicationType):
 
         for serialized_table in serialized_tables:
             table_model = serialized_table["_model"]
-            rows_to_be_inserted = []
-            # Holds a mapping where the key is a model, and the value a list of
-            # objects that must be inserted. These objects are returned by the
-            # `set_import_serialized_value`, and will typically hold m2m relationships.
-            additional_objects_to_be_inserted = defaultdict(list)
 
             m2m_fields_to_not_import_as_already_done = set()
             for field in table_model._meta.get_fields():
@@ -692,57 +857,89 @@ class DatabaseApplicationType(ApplicationType):
                     else:
                         already_filled_up_through_table_names.add(db_table)
 
-            for serialized_row in serialized_table["rows"]:
-                (
-                    created_on,
-                    updated_on,
-                    created_by,
-                    last_modified_by,
-                ) = self._prepare_base_row_fields(
-                    serialized_row, now, user_email_mapping
+            # When duplicating a table, the rows can be copied in the database
+            # directly instead of being serialized.
+            if "_copy_rows_from_table" in serialized_table:
+                self._copy_table_rows_with_sql(
+                    serialized_table["_copy_rows_from_table"],
+                    table_model,
+                    id_mapping,
+                    m2m_fields_to_not_import_as_already_done,
                 )
 
-                row_instance = table_model(
-                    id=serialized_row["id"],
-                    order=serialized_row["order"],
-                    created_on=created_on,
-                    updated_on=updated_on,
-                    created_by=created_by,
-                    last_modified_by=last_modified_by,
-                )
+            # The rows are converted and inserted in chunks, so that only a chunk of
+            # them has to be kept in memory, even if the table has hundreds of
+            # thousands of rows. They're copied instead of inserted if the fields
+            # allow it.
+            serialized_rows = self._get_serialized_table_rows(
+                serialized_table, files_zip
+            )
+            serialized_rows_chunks = grouper(COPY_BATCH_SIZE, serialized_rows)
+            # The rows are inserted with the connection of the import, because the
+            # table doesn't exist for other connections until the import is
+            # committed. Reading the rows from the zip doesn't need the database, so
+            # the next chunks are read in a thread while the current one is inserted.
+            workers = settings.BASEROW_IMPORT_EXPORT_TABLE_ROWS_WORKERS
+            if "rows_file" in serialized_table and workers > 1:
+                serialized_rows_chunks = read_ahead(serialized_rows_chunks, workers)
+
+            for serialized_rows_chunk in serialized_rows_chunks:
+                rows_to_be_inserted = []
+                # Holds a mapping where the key is a model, and the value a list of
+                # objects that must be inserted. These objects are returned by the
+                # `set_import_serialized_value`, and will typically hold m2m
+                # relationships.
+                additional_objects_to_be_inserted = defaultdict(list)
+
+                for serialized_row in serialized_rows_chunk:
+                    (
+                        created_on,
+                        updated_on,
+                        created_by,
+                        last_modified_by,
+                    ) = self._prepare_base_row_fields(
+                        serialized_row, now, user_email_mapping
+                    )
 
-                self._import_serialized_fields_values_to_row(
-                    row_instance,
-                    serialized_row,
-                    serialized_table["fields"],
-                    table_cache,
-                    additional_objects_to_be_inserted,
-                    m2m_fields_to_not_import_as_already_done,
-                    id_mapping,
-                    files_zip,
-                    storage,
-                )
+                    row_instance = table_model(
+                        id=serialized_row["id"],
+                        order=serialized_row["order"],
+                        created_on=created_on,
+                        updated_on=updated_on,
+                        created_by=created_by,
+                        last_modified_by=last_modified_by,
+                    )
 
-                rows_to_be_inserted.append(row_instance)
-                progress.increment(
-                    state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE_DATA}{serialized_table['name']}"
-                )
+                    self._import_serialized_fields_values_to_row(
+                        row_instance,
+                        serialized_row,
+                        serialized_table["fields"],
+                        table_cache,
+                        additional_objects_to_be_inserted,
+                        m2m_fields_to_not_import_as_already_done,
+                        id_mapping,
+                        files_zip,
+                        storage,
+                    )
+
+                    rows_to_be_inserted.append(row_instance)
+                    progress.increment(
+                        state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE_DATA}{serialized_table['name']}"
+                    )
 
-            # We want to insert the rows in bulk because there could potentially be
-            # hundreds of thousands of rows in there and this will result in better
-            # performance.
-            for chunk in grouper(512, rows_to_be_inserted):
-                table_model.objects.bulk_create(chunk, batch_size=512)
+                bulk_copy_create(
+                    table_model, rows_to_be_inserted, insert_batch_size=512
+                )
                 progress.increment(
-                    len(chunk),
+                    len(rows_to_be_inserted),
                     state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE_DATA}{serialized_table['name']}",
                 )
 
-            # Every row import can have additional objects that must be inserted,
-            # like for example the m2m relationships. We want to efficiently import
-            # them in bulk here.
-            for model, objects in additional_objects_to_be_inserted.items():
-                model.objects.bulk_create(objects, batch_size=512)
+                # Every row import can have additional objects that must be inserted,
+                # like for example the m2m relationships. We want to efficiently
+                # import them in bulk here.
+                for model, objects in additional_objects_to_be_inserted.items():
+                    bulk_copy_create(model, objects, insert_batch_size=512)
 
             # When the rows are inserted we keep the provide the old ids and because of
             # that the auto increment is still set at `1`. This needs to be set to the
@@ -761,6 +958,114 @@ class DatabaseApplicationType(ApplicationType):
         # total progress of this import.
         self._after_rows_imported(imported_fields, progress)
 
+    def _copy_table_rows_with_sql(
+        self,
+        source_table: Table,
+        target_model: GeneratedTableModel,
+        id_mapping: Dict[str, Any],
+        m2m_fields_to_not_import: Set[str],
+    ):
+        """
+        Copies all the rows of the source table to the newly imported table with
+        `INSERT ... SELECT` statements, one for the table itself and one for every many
+        to many relationship. The row ids are kept, just like when the rows are
+        imported. All the field types of the source table must have
+        `can_copy_rows_with_sql` set.
+
+        :param source_table: The table the rows must be copied from.
+        :param target_model: The model of the imported table.
+        :param id_mapping: The mapping of the source field ids to the imported ones.
+        :param m2m_fields_to_not_import: The names of the many to many fields of the
+            target model whose relationships have already been imported.
+        """
+
+        source_model = source_table.get_model(add_dependencies=False)
+        field_names = {
+            field_object["name"]: f"field_{id_mapping['database_fields'][field_id]}"
+            for field_id, field_object in source_model._field_objects.items()
+        }
+        target_field_names = {
+            field.name for field in target_model._meta.get_fields(include_hidden=False)
+        }
+
+        columns = []
+        m2m_fields = []
+        for source_field in source_model._meta.get_fields():
+            if source_field.name in field_names:
+                target_field = target_model._meta.get_field(
+                    field_names[source_field.name]
+                )
+            elif source_field.name in target_field_names and getattr(
+                source_field, "concrete", False
+            ):
+                # The columns that every row has, like `order` and `created_on`.
+                target_field = target_model._meta.get_field(source_field.name)
+            else:
+                continue
+
+            if isinstance(source_field, models.ManyToManyField):
+                if target_field.name not in m2m_fields_to_not_import:
+                    m2m_fields.append((source_field, target_field))
+            elif source_field.concrete:
+                columns.append((source_field.column, target_field.column))
+
+        source_rows = sql.SQL("SELECT id FROM {table} WHERE NOT trashed").format(
+            table=sql.Identifier(source_model._meta.db_table)
+        )
+        statements = [
+            sql.SQL(
+                "INSERT INTO {target} ({target_columns}) "
+                "SELECT {source_columns} FROM {source} WHERE NOT trashed"
+            ).format(
+                target=sql.Identifier(target_model._meta.db_table),
+                target_columns=sql.SQL(", ").join(
+                    sql.Identifier(target) for _, target in columns
+                ),
+                source_columns=sql.SQL(", ").join(
+                    sql.Identifier(source) for source, _ in columns
+                ),
+                source=sql.Identifier(source_model._meta.db_table),
+            )
+        ]
+        for source_field, target_field in m2m_fields:
+            source_through = source_field.remote_field.through._meta
+            target_through = target_field.remote_field.through._meta
+            # Relationships with trashed rows are not copied because those rows
+            # aren't. Both sides of a relationship of a table with itself are rows of
+            # the source table.
+            condition = sql.SQL("{column} IN ({source_rows})").format(
+                column=sql.Identifier(source_field.m2m_column_name()),
+                source_rows=source_rows,
+            )
+            if source_field.related_model == source_model:
+                condition = sql.SQL(
+                    "{condition} AND {column} IN ({source_rows})"
+                ).format(
+                    condition=condition,
+                    column=sql.Identifier(source_field.m2m_reverse_name()),
+                    source_rows=source_rows,
+                )
+            statements.append(
+                sql.SQL(
+                    "INSERT INTO {target} ({target_column}, {target_reverse_column}) "
+                    "SELECT {column}, {reverse_column} FROM {source} WHERE {condition}"
+                ).format(
+                    target=sql.Identifier(target_through.db_table),
+                    target_column=sql.Identifier(target_field.m2m_column_name()),
+                    target_reverse_column=sql.Identifier(
+                        target_field.m2m_reverse_name()
+                    ),
+                    column=sql.Identifier(source_field.m2m_column_name()),
+                    reverse_column=sql.Identifier(source_field.m2m_reverse_name()),
+                    source=sql.Identifier(source_through.db_table),
+                    condition=condition,
+                )
+            )
+
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
     def _import_serialized_fields_values_to_row(
         self,
         row_instance: GeneratedTableModel,
@@ -176,6 +176,7 @@ class DatabaseConfig(AppConfig):
         from .plugins import DatabasePlugin
         from .views.registries import (
             form_view_mode_registry,
+            row_count_mode_registry,
             view_aggregation_type_registry,
             view_filter_type_registry,
             view_ownership_type_registry,
@@ -551,6 +552,18 @@ class DatabaseConfig(AppConfig):
         view_aggregation_type_registry.register(StdDevViewAggregationType())
         view_aggregation_type_registry.register(DistributionViewAggregationType())
 
+        from .views.row_count_modes import (
+            CachedRowCountModeType,
+            EstimateRowCountModeType,
+            ExactRowCountModeType,
+            FastRowCountModeType,
+        )
+
+        row_count_mode_registry.register(ExactRowCountModeType())
+        row_count_mode_registry.register(EstimateRowCountModeType())
+        row_count_mode_registry.register(CachedRowCountModeType())
+        row_count_mode_registry.register(FastRowCountModeType())
+
         from .views.form_view_mode_types import FormViewModeTypeForm
 
         form_view_mode_registry.register(FormViewModeTypeForm())
@@ -1,3 +1,4 @@
+from django.db import connection
 from django.db.transaction import Atomic
 
 from baserow.cachalot_patch import cachalot_disabled
@@ -52,6 +53,41 @@ def read_repeatable_single_database_atomic_transaction(
         )
 
 
+def export_transaction_snapshot() -> str:
+    """
+    Exports the snapshot of the current transaction, so that other connections can
+    see exactly the same data with `read_repeatable_exported_snapshot_transaction`
+    while this transaction is still open.
+
+    :return: The identifier of the exported snapshot.
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_export_snapshot()")
+        return cursor.fetchone()[0]
+
+
+def read_repeatable_exported_snapshot_transaction(snapshot_id: str) -> Atomic:
+    """
+    Starts a REPEATABLE READ transaction that sees the same snapshot of the database
+    as the transaction that exported it with `export_transaction_snapshot`. This
+    makes it possible to read the data of a single snapshot from multiple
+    connections at the same time. Note that changes made by the exporting
+    transaction itself are not visible.
+
+    :param snapshot_id: The identifier of the exported snapshot.
+    :return: An atomic context manager.
+    """
+
+    return transaction_atomic(
+        isolation_level=IsolationLevel.REPEATABLE_READ,
+        first_sql_to_run_in_transaction_with_args=(
+            sql.SQL("SET TRANSACTION SNAPSHOT {0}"),
+            [sql.Literal(snapshot_id)],
+        ),
+    )
+
+
 def read_committed_single_table_transaction(
     table_id: int,
 ) -> Atomic:
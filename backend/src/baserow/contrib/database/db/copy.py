@@ -0,0 +1,285 @@
+"""
+Inserts model instances with PostgreSQL's `COPY ... FROM STDIN` instead of multi row
+INSERT statements, which is a lot faster when inserting many rows at once.
+
+The values are converted to the COPY text format before anything is sent to the
+database. If a value can't be converted, for example because it's an expression that
+must be computed by the database, the rows are inserted with `bulk_create` instead.
+"""
+
+import io
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Type
+from uuid import UUID
+
+from django.conf import settings
+from django.db import connection, router
+from django.db.backends.postgresql.psycopg_any import is_psycopg3
+from django.db.models import Field as DjangoField
+from django.db.models import Model
+from django.db.models.fields import AutoFieldMixin
+
+from loguru import logger
+from opentelemetry import metrics
+
+from baserow.contrib.database.fields.fields import IntegerFieldWithSequence
+from baserow.core.psycopg import sql
+from baserow.core.utils import grouper
+
+COPY_NULL = "\\N"
+COPY_BATCH_SIZE = 10000
+
+CopyEncoder = Callable[[Any], str]
+
+meter = metrics.get_meter(__name__)
+copy_inserted_rows_counter = meter.create_counter(
+    "baserow.copy_insert.rows",
+    unit="1",
+    description="The number of rows inserted with COPY FROM STDIN.",
+)
+copy_fallback_rows_counter = meter.create_counter(
+    "baserow.copy_insert.fallback_rows",
+    unit="1",
+    description="The number of rows that could have been inserted with COPY FROM "
+    "STDIN, but were inserted with INSERT statements instead.",
+)
+
+
+class CannotCopyValue(Exception):
+    """
+    Raised when a value can't be converted to the COPY text format.
+    """
+
+
+def escape_copy_text(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def encode_copy_value(value: Any) -> str:
+    """
+    Converts a value, as returned by the `get_db_prep_save` method of a model field,
+    to its COPY text format representation.
+
+    :param value: The value to convert.
+    :raises CannotCopyValue: If the type of the value is not supported.
+    :return: The escaped text that can be written in a COPY column.
+    """
+
+    if value is None:
+        return COPY_NULL
+    elif isinstance(value, bool):
+        return "t" if value else "f"
+    elif isinstance(value, (int, float, Decimal, UUID)):
+        return str(value)
+    elif isinstance(value, str):
+        return escape_copy_text(value)
+    elif isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    elif isinstance(value, timedelta):
+        return (
+            f"{value.days} days {value.seconds} seconds "
+            f"{value.microseconds} microseconds"
+        )
+
+    raise CannotCopyValue(f"Values of type {type(value)} can't be copied.")
+
+
+def get_model_field_copy_encoder(model_field: DjangoField) -> CopyEncoder:
+    """
+    Returns the default encoder of a model field, which prepares the value for the
+    database like an INSERT statement would, and converts it with
+    `encode_copy_value`.
+
+    :param model_field: The model field to get the encoder for.
+    :return: A function converting a value to its COPY text representation.
+    """
+
+    def encode(value: Any) -> str:
+        return encode_copy_value(model_field.get_db_prep_save(value, connection))
+
+    return encode
+
+
+def get_copy_columns(
+    model: Type[Model],
+) -> Optional[List[Tuple[DjangoField, CopyEncoder]]]:
+    """
+    Returns the model fields that must be written for every object of the model and
+    their encoders. For generated table models, the encoder of every Baserow field is
+    provided by the `get_copy_encoder` method of its field type.
+
+    :param model: The model to get the columns for.
+    :return: The fields and their encoders, or None if any field type doesn't
+        support COPY.
+    """
+
+    field_objects = {
+        field_object["name"]: field_object
+        for field_object in getattr(model, "_field_objects", {}).values()
+    }
+
+    columns = []
+    for model_field in model._meta.concrete_fields:
+        # The values of fields with a sequence are reserved before copying, like the
+        # primary keys, but other values computed by the database can't be known.
+        if (
+            model_field.db_returning
+            and not model_field.primary_key
+            and not isinstance(model_field, IntegerFieldWithSequence)
+        ):
+            return None
+
+        field_object = field_objects.get(model_field.name)
+        if field_object is None:
+            encoder = get_model_field_copy_encoder(model_field)
+        else:
+            encoder = field_object["type"].get_copy_encoder(
+                field_object["field"], model_field
+            )
+            if encoder is None:
+                return None
+
+        columns.append((model_field, encoder))
+    return columns
+
+
+def _reserve_primary_keys(model: Type[Model], objs: List[Model]):
+    """
+    Sets the primary key of all the objects to the next values of the primary key
+    sequence, so that they're known without having to return them from the insert.
+    """
+
+    pk_column = model._meta.pk.column
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, %s)) "
+            "FROM generate_series(1, %s)",
+            [connection.ops.quote_name(model._meta.db_table), pk_column, len(objs)],
+        )
+        for obj, (pk,) in zip(objs, cursor.fetchall()):
+            obj.pk = pk
+
+
+def _reserve_sequence_values(model_field: IntegerFieldWithSequence, objs: List[Model]):
+    """
+    Sets the value of the field of the objects that don't have one yet to the next
+    values of its sequence, exactly like its `pre_save` does in an INSERT statement.
+    """
+
+    objs = [obj for obj in objs if not getattr(obj, model_field.attname)]
+    if not objs:
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(%s::regclass) FROM generate_series(1, %s)",
+            [model_field.sequence_name, len(objs)],
+        )
+        for obj, (value,) in zip(objs, cursor.fetchall()):
+            setattr(obj, model_field.attname, value)
+
+
+def _copy_objects(
+    model: Type[Model],
+    objs: List[Model],
+    columns: List[Tuple[DjangoField, CopyEncoder]],
+):
+    # Convert everything first, so that nothing is sent if a value can't be copied.
+    buffer = io.StringIO()
+    for obj in objs:
+        obj._prepare_related_fields_for_save(operation_name="bulk_create")
+        buffer.write(
+            "\t".join(
+                encoder(model_field.pre_save(obj, True))
+                for model_field, encoder in columns
+            )
+        )
+        buffer.write("\n")
+
+    copy_sql = sql.SQL("COPY {table} ({columns}) FROM STDIN").format(
+        table=sql.Identifier(model._meta.db_table),
+        columns=sql.SQL(", ").join(
+            sql.Identifier(model_field.column) for model_field, _ in columns
+        ),
+    )
+    with connection.cursor() as cursor, connection.wrap_database_errors:
+        if is_psycopg3:
+            with cursor.cursor.copy(copy_sql) as copy:
+                copy.write(buffer.getvalue())
+        else:
+            buffer.seek(0)
+            cursor.cursor.copy_expert(copy_sql, buffer)
+
+    using = router.db_for_write(model)
+    for obj in objs:
+        obj._state.adding = False
+        obj._state.db = using
+
+
+def bulk_copy_create(
+    model: Type[Model],
+    objs: Iterable[Model],
+    batch_size: int = COPY_BATCH_SIZE,
+    insert_batch_size: Optional[int] = None,
+) -> List[Model]:
+    """
+    Inserts the objects like `model.objects.bulk_create` does, but with
+    `COPY ... FROM STDIN` if there are at least `BASEROW_COPY_INSERT_MIN_ROWS`
+    objects and all the fields support it. Objects without a primary key get one
+    from the primary key sequence before they're copied, so that their primary key is
+    set afterwards, just like with `bulk_create`. The same goes for the other fields
+    that have a sequence, like the autonumber field.
+
+    :param model: The model of the objects.
+    :param objs: The objects to insert.
+    :param batch_size: The number of objects inserted per COPY statement.
+    :param insert_batch_size: The batch size passed to `bulk_create` when the
+        objects can't be copied.
+    :return: The inserted objects.
+    """
+
+    objs = list(objs)
+    min_rows = settings.BASEROW_COPY_INSERT_MIN_ROWS
+    if not objs or not min_rows or len(objs) < min_rows:
+        return model.objects.bulk_create(objs, batch_size=insert_batch_size)
+
+    columns = get_copy_columns(model)
+    can_reserve_pks = isinstance(model._meta.pk, AutoFieldMixin)
+    sequence_fields = [
+        model_field
+        for model_field, _ in columns or []
+        if isinstance(model_field, IntegerFieldWithSequence)
+    ]
+    for chunk in grouper(batch_size, objs):
+        chunk = list(chunk)
+        pk_set = [obj.pk is not None for obj in chunk]
+        if (
+            columns is None
+            or (any(pk_set) and not all(pk_set))
+            or (not any(pk_set) and not can_reserve_pks)
+        ):
+            copy_fallback_rows_counter.add(len(chunk))
+            model.objects.bulk_create(chunk, batch_size=insert_batch_size)
+            continue
+
+        if not any(pk_set):
+            _reserve_primary_keys(model, chunk)
+        for model_field in sequence_fields:
+            _reserve_sequence_values(model_field, chunk)
+
+        try:
+            _copy_objects(model, chunk, columns)
+        except CannotCopyValue as exc:
+            logger.debug(f"Falling back to INSERT for {model._meta.db_table}: {exc}")
+            copy_fallback_rows_counter.add(len(chunk))
+            model.objects.bulk_create(chunk, batch_size=insert_batch_size)
+        else:
+            copy_inserted_rows_counter.add(len(chunk))
+
+    return objs
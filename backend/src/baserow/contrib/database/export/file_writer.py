@@ -1,8 +1,8 @@
 import abc
 import time
-from typing import Any, Callable
+from itertools import batched
+from typing import Any, Callable, Iterator, List, Tuple
 
-from django.core.paginator import Paginator
 from django.db.models import QuerySet
 
 import unicodecsv as csv
@@ -61,23 +61,55 @@ class FileWriter(abc.ABC):
             that must use some of the progress.
         """
 
+    def write_row_batches(
+        self,
+        queryset: QuerySet,
+        write_batch: Callable[[List[Any], bool], None],
+        progress_weight: int = 100,
+    ):
+        """
+        Like `write_rows`, but calls `write_batch` with a list of consecutive rows
+        instead of once per row, so that the values can be serialized per column.
+        The default implementation collects the rows provided by `write_rows`.
+
+        :param queryset: The queryset to write to the file.
+        :param write_batch: A callable function which takes a list of rows and
+            whether it's the last batch, and writes them to the file.
+        :param progress_weight: Indicates how much of the progress should count for
+            writing the rows in total.
+        """
+
+        batch = []
+
+        def write_row(row, is_last_row):
+            batch.append(row)
+            if is_last_row:
+                write_batch(list(batch), True)
+                batch.clear()
+
+        self.write_rows(queryset, write_row, progress_weight)
+
     def get_csv_dict_writer(self, headers, **kwargs):
         return csv.DictWriter(self._file, headers, **kwargs)
 
 
 class PaginatedExportJobFileWriter(FileWriter):
     """
-    Uses Django's built-in paginator to write querysets to files in a memory efficient
-    manner. Also updates the provided job as it progresses through any queryset writes
-    every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
+    Streams querysets to files in a memory efficient manner, fetching the rows in
+    batches of EXPORT_BATCH_SIZE using a server-side cursor. This avoids the
+    `OFFSET` queries of a paginator, which become slower with every page. Also
+    updates the provided job as it progresses through any queryset writes every
+    EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
     """
 
     EXPORT_JOB_UPDATE_FREQUENCY_SECONDS = 1
+    EXPORT_BATCH_SIZE = 2000
 
     def __init__(self, file, job):
         super().__init__(file)
         self.job = job
         self.last_check = None
+        self.total_rows = 0
 
     def update_check(self):
         self.last_check = time.perf_counter()
@@ -107,19 +139,65 @@ class PaginatedExportJobFileWriter(FileWriter):
         """
 
         self.update_check()
-        paginator = Paginator(queryset.all(), 2000)
         i = 0
         results = []
-        for page in paginator.page_range:
-            for row in paginator.page(page).object_list:
+        for batch, is_last_batch in self._iterate_row_batches(queryset):
+            for index, row in enumerate(batch):
                 i = i + 1
-                is_last_row = i == paginator.count
+                is_last_row = is_last_batch and index == len(batch) - 1
                 result = write_row(row, is_last_row)
                 if result is not None:
                     results.append(result)
-                self._check_and_update_job(i, paginator.count, progress_weight)
+            self._check_and_update_job(i, i if is_last_batch else None, progress_weight)
         return results
 
+    def write_row_batches(self, queryset, write_batch, progress_weight=100):
+        """
+        Writes the queryset to the file by calling the provided write_batch callback
+        once for every EXPORT_BATCH_SIZE rows. Cancellation and progress are checked
+        after every batch, just like with `write_rows`.
+
+        :param queryset: The queryset to write to the file.
+        :param write_batch: A callable function which takes a list of rows and
+            whether it's the last batch, and writes them to the file.
+        :param progress_weight: Indicates how much of the progress should count for
+            writing the rows in total.
+        """
+
+        self.update_check()
+        i = 0
+        for batch, is_last_batch in self._iterate_row_batches(queryset):
+            write_batch(batch, is_last_batch)
+            i += len(batch)
+            self._check_and_update_job(i, i if is_last_batch else None, progress_weight)
+
+    def _iterate_row_batches(
+        self, queryset: QuerySet
+    ) -> Iterator[Tuple[List[Any], bool]]:
+        """
+        Streams the rows of the queryset using a server-side cursor and yields them
+        in lists of EXPORT_BATCH_SIZE rows, together with whether it's the last
+        batch. The total number of rows is counted once upfront to report the
+        progress.
+
+        :param queryset: The queryset to stream the rows of.
+        :return: An iterator of tuples containing the rows and whether it's the last
+            batch.
+        """
+
+        self.total_rows = queryset.count()
+        if self.total_rows == 0:
+            return
+
+        rows = queryset.all().iterator(chunk_size=self.EXPORT_BATCH_SIZE)
+        previous_batch = None
+        for batch in batched(rows, self.EXPORT_BATCH_SIZE):
+            if previous_batch is not None:
+                yield list(previous_batch), False
+            previous_batch = batch
+        if previous_batch is not None:
+            yield list(previous_batch), True
+
     def _check_and_update_job(self, current_row, total_rows, progress_weight=100):
         """
         Checks if enough time has passed and if so checks the state of the job and
@@ -130,8 +208,13 @@ class PaginatedExportJobFileWriter(FileWriter):
         :param current_row: An int indicating the current row this export job has
             exported upto
         :param total_rows: An int of the total number of rows this job is exporting.
+            If None, the number of rows counted before streaming them is used and
+            the last row hasn't been reached yet.
         """
 
+        if total_rows is None:
+            total_rows = max(self.total_rows, current_row + 1)
+
         current_time = time.perf_counter()
         # We check only every so often as we don't need per row granular updates as the
         # client is only polling every X seconds also.
@@ -235,6 +318,35 @@ class QuerysetSerializer(abc.ABC):
             order_by, only_order_by_field_ids=only_by_field_ids
         )
 
+    def serialize_columns(self, rows: List[Any]) -> List[Tuple[str, str, List[Any]]]:
+        """
+        Serializes a batch of rows per column instead of per cell. Every field type
+        converts all the values of its column with one `get_export_values` call.
+
+        :param rows: The rows to serialize.
+        :return: A list containing a tuple for every column, in the same order as
+            the `field_serializers`, with the fields database column name, the
+            fields human readable name and the list of export values of the rows.
+        """
+
+        columns = [("id", "id", [row.id for row in rows])]
+        for field_object in self.ordered_field_objects:
+            name = field_object["name"]
+            values = [getattr(row, name) for row in rows]
+            not_none = [
+                index for index, value in enumerate(values) if value is not None
+            ]
+            column = [""] * len(values)
+            export_values = field_object["type"].get_export_values(
+                [values[index] for index in not_none],
+                field_object,
+                rich_value=self.can_handle_rich_value,
+            )
+            for index, export_value in zip(not_none, export_values):
+                column[index] = export_value
+            columns.append((name, field_object["field"].name, column))
+        return columns
+
     def _get_field_serializer(self, field_object: FieldObject) -> Callable[[Any], Any]:
         """
         An internal standard method which generates a serializer function for a given
@@ -79,12 +79,15 @@ class CsvQuerysetSerializer(QuerysetSerializer):
         if csv_include_header:
             csv_dict_writer.writerow(self.headers)
 
-        def write_row(row, _):
-            data = {}
-            for field_serializer in self.field_serializers:
-                field_database_name, _, field_human_value = field_serializer(row)
-                data[field_database_name] = escape_csv_cell(str(field_human_value))
-
-            csv_dict_writer.writerow(data)
-
-        file_writer.write_rows(self.queryset, write_row)
+        def write_batch(rows, _):
+            columns = self.serialize_columns(rows)
+            names = [field_database_name for field_database_name, _, _ in columns]
+            escaped_columns = [
+                [escape_csv_cell(str(value)) for value in values]
+                for _, _, values in columns
+            ]
+            csv_dict_writer.writerows(
+                dict(zip(names, row_values)) for row_values in zip(*escaped_columns)
+            )
+
+        file_writer.write_row_batches(self.queryset, write_batch)
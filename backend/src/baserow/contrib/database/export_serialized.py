@@ -4,7 +4,26 @@ class DatabaseExportSerializedStructure:
         return {"tables": tables}
 
     @staticmethod
-    def table(id, name, order, fields, views, rows, data_sync, field_rules):
+    def table(
+        id,
+        name,
+        order,
+        fields,
+        views,
+        rows,
+        data_sync,
+        field_rules,
+        rows_file=None,
+        rows_count=None,
+    ):
+        optional = {}
+
+        # The rows are written to a separate JSON lines file in the zip when the
+        # export is streamed.
+        if rows_file is not None:
+            optional["rows_file"] = rows_file
+            optional["rows_count"] = rows_count
+
         return {
             "id": id,
             "name": name,
@@ -14,6 +33,7 @@ class DatabaseExportSerializedStructure:
             "rows": rows,
             "data_sync": data_sync,
             "field_rules": field_rules,
+            **optional,
         }
 
     @staticmethod
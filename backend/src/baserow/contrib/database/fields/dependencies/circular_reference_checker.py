@@ -30,6 +30,10 @@ from django.db import connection
 from baserow.contrib.database.fields.dependencies.exceptions import (
     CircularFieldDependencyError,
 )
+from baserow.contrib.database.fields.dependencies.graph import (
+    field_dependency_graph_cache,
+    get_cached_database_id,
+)
 from baserow.contrib.database.fields.dependencies.models import FieldDependency
 
 if TYPE_CHECKING:
@@ -48,9 +52,10 @@ def get_all_field_dependencies(field: "Field") -> set[int]:
     turn references a text field, both the intermediate formula and the text field will
     be returned as dependencies.
 
-    This function uses a recursive CTE to traverse the field dependency graph and return
-    all field ids that are reachable from the given field id. If a circular dependency
-    is detected, a CircularFieldDependencyError is raised.
+    This function uses the cached dependency graph of the database if it's available,
+    otherwise a recursive CTE to traverse the field dependency graph and return all
+    field ids that are reachable from the given field id. If a circular dependency is
+    detected, a CircularFieldDependencyError is raised.
 
     :param field: The field to get dependencies for.
     :return: A set of field ids that the given field depends on.
@@ -59,6 +64,14 @@ def get_all_field_dependencies(field: "Field") -> set[int]:
 
     from baserow.contrib.database.fields.models import Field
 
+    database_id = get_cached_database_id(field)
+    if database_id is not None:
+        graph = field_dependency_graph_cache.get(database_id)
+        if graph is not None:
+            return graph.get_all_dependencies(
+                field.pk, settings.MAX_FIELD_REFERENCE_DEPTH
+            )
+
     filtered_field_dependencies = FieldDependency.objects.filter(
         dependant_id__table__database_id=Field.objects_and_trash.filter(pk=field.pk)
         .order_by()
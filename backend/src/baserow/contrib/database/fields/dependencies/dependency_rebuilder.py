@@ -12,6 +12,10 @@ from baserow.contrib.database.fields.dependencies.circular_reference_checker imp
 from baserow.contrib.database.fields.dependencies.exceptions import (
     CircularFieldDependencyError,
 )
+from baserow.contrib.database.fields.dependencies.graph import (
+    FieldDependencyGraphChanges,
+    get_cached_database_id,
+)
 from baserow.contrib.database.fields.dependencies.models import FieldDependency
 from baserow.contrib.database.fields.field_cache import FieldCache
 
@@ -31,6 +35,10 @@ def break_dependencies_for_field(field):
     if isinstance(field, LinkRowField):
         field.vias.all().delete()
 
+    graph_changes = FieldDependencyGraphChanges(get_cached_database_id(field))
+    graph_changes.break_dependencies(field.id, field.name)
+    graph_changes.register()
+
 
 def update_fields_with_broken_references(fields: List["field_models.Field"]):
     """
@@ -69,6 +77,7 @@ def update_fields_with_broken_references(fields: List["field_models.Field"]):
         "dependant", "via"
     )
     updated_deps = []
+    broken_reference_field_names = []
     for dep in broken_dependencies:
         key = (dep.dependant.table_id, dep.broken_reference_field_name)
         field = table_field_map.get(key)
@@ -80,6 +89,7 @@ def update_fields_with_broken_references(fields: List["field_models.Field"]):
         # Unfortunately, the `will_cause_circular_dep` still causes N number of
         # queries, but that's only if broken dependencies have been found.
         if not will_cause_circular_dep(dep.dependant, field):
+            broken_reference_field_names.append(dep.broken_reference_field_name)
             dep.dependency = field
             dep.broken_reference_field_name = None
             updated_deps.append(dep)
@@ -89,6 +99,20 @@ def update_fields_with_broken_references(fields: List["field_models.Field"]):
             updated_deps, ["dependency", "broken_reference_field_name"]
         )
 
+        graph_changes = FieldDependencyGraphChanges(get_cached_database_id(fields[0]))
+        for dep, broken_reference_field_name in zip(
+            updated_deps, broken_reference_field_names
+        ):
+            graph_changes.remove_dependency(
+                FieldDependency(
+                    dependant_id=dep.dependant_id,
+                    via_id=dep.via_id,
+                    broken_reference_field_name=broken_reference_field_name,
+                )
+            )
+            graph_changes.add_dependency(dep)
+        graph_changes.register()
+
     return len(updated_deps) > 0
 
 
@@ -111,6 +135,7 @@ def rebuild_fields_dependencies(
 
     all_new_dependencies_to_create = []
     all_deleted_dependency_ids = []
+    all_deleted_dependencies = []
     all_current_dependencies = FieldDependency.objects.filter(
         dependant_id__in=[f.id for f in field_instances]
     )
@@ -156,6 +181,7 @@ def rebuild_fields_dependencies(
         # any remaining ones are old dependencies which should no longer exist.
         # Delete them.
         all_deleted_dependency_ids += [dep.id for dep in current_deps_by_str.values()]
+        all_deleted_dependencies += current_deps_by_str.values()
 
     if all_new_dependencies_to_create:
         new_dependencies = FieldDependency.objects.bulk_create(
@@ -165,4 +191,14 @@ def rebuild_fields_dependencies(
     if len(all_deleted_dependency_ids) > 0:
         FieldDependency.objects.filter(pk__in=all_deleted_dependency_ids).delete()
 
+    if all_new_dependencies_to_create or all_deleted_dependencies:
+        graph_changes = FieldDependencyGraphChanges(
+            get_cached_database_id(field_instances[0])
+        )
+        for dep in all_deleted_dependencies:
+            graph_changes.remove_dependency(dep)
+        for dep in all_new_dependencies_to_create:
+            graph_changes.add_dependency(dep)
+        graph_changes.register()
+
     return new_dependencies
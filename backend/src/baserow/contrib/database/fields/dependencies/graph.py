@@ -0,0 +1,601 @@
+"""
+Keeps an in memory representation of the `FieldDependency` rows of a database, so
+that the dependants and dependencies of fields can be found without executing a
+recursive CTE query for every field or row change.
+
+Every database has a version stamp in the default cache. Every process keeps the
+graphs it has loaded together with the version they belong to, and the graph of every
+version is also stored in the default cache, so that other processes don't have to
+load it from the database.
+
+Changes made by the `FieldDependencyHandler` are recorded as operations and applied
+to the graph when the transaction commits. Until then, the graph of the database
+doesn't reflect the changes of the current transaction, so it's not used and the
+callers must fall back to querying the database.
+"""
+
+import dataclasses
+import random
+import threading
+from collections import OrderedDict, defaultdict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from opentelemetry import metrics
+
+from baserow.contrib.database.fields.dependencies.exceptions import (
+    CircularFieldDependencyError,
+)
+from baserow.contrib.database.fields.dependencies.models import FieldDependency
+
+if TYPE_CHECKING:
+    from baserow.contrib.database.fields.models import LinkRowField
+
+# A dependency is represented by a tuple containing the dependant id, the dependency
+# id, the via id and the broken reference field name, exactly like the
+# `FieldDependency` row it represents.
+FieldDependencyEdge = Tuple[int, Optional[int], Optional[int], Optional[str]]
+
+meter = metrics.get_meter(__name__)
+graph_hits_counter = meter.create_counter(
+    "baserow.field_dependency_graph.hits",
+    unit="1",
+    description="The number of field dependency lookups answered by the in memory "
+    "graph.",
+)
+graph_loads_counter = meter.create_counter(
+    "baserow.field_dependency_graph.loads",
+    unit="1",
+    description="The number of field dependency graphs loaded from the database.",
+)
+
+
+@dataclasses.dataclass
+class DependantPath:
+    """
+    A dependant field reachable from the starting fields, together with the path of
+    link row fields leading back to the starting table. Has the same attributes as
+    the rows returned by the recursive query of the `FieldDependencyHandler`.
+    """
+
+    id: int
+    dependency_ids: List[int]
+    via_ids: List[int]
+    depth: int
+    content_type_id: Optional[int] = None
+    name: Optional[str] = None
+    table_id: Optional[int] = None
+
+
+class FieldDependencyGraph:
+    """
+    The dependencies of all the fields of a database. Besides the dependencies
+    themselves, the graph knows the table of every field involved and the related
+    field of every link row field used as via, because that's needed to find the
+    dependants exactly like the recursive query does.
+    """
+
+    def __init__(
+        self,
+        version: Tuple[int, int],
+        edges: Iterable[FieldDependencyEdge] = (),
+        field_table_ids: Optional[Dict[int, int]] = None,
+        link_row_related_field_ids: Optional[Dict[int, Optional[int]]] = None,
+    ):
+        self.version = version
+        self.edges: Set[FieldDependencyEdge] = set(edges)
+        self.field_table_ids = field_table_ids or {}
+        self.link_row_related_field_ids = link_row_related_field_ids or {}
+        self._indexes = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_indexes"] = None
+        return state
+
+    def copy(self, version: Tuple[int, int]) -> "FieldDependencyGraph":
+        """
+        Returns a copy of the graph with the provided version. The graphs are shared
+        between the threads, so they're never changed in place, but copied, changed
+        and then swapped.
+        """
+
+        return FieldDependencyGraph(
+            version,
+            self.edges,
+            dict(self.field_table_ids),
+            dict(self.link_row_related_field_ids),
+        )
+
+    @classmethod
+    def load(cls, database_id: int, version: Tuple[int, int]) -> "FieldDependencyGraph":
+        """
+        Loads all the dependencies of the fields in the provided database in one
+        query.
+        """
+
+        graph_loads_counter.add(1)
+        graph = cls(version)
+        for (
+            dependant_id,
+            dependency_id,
+            via_id,
+            broken_reference_field_name,
+            dependant_table_id,
+            dependency_table_id,
+            link_row_related_field_id,
+        ) in FieldDependency.objects.filter(
+            dependant__table__database_id=database_id
+        ).values_list(
+            "dependant_id",
+            "dependency_id",
+            "via_id",
+            "broken_reference_field_name",
+            "dependant__table_id",
+            "dependency__table_id",
+            "via__link_row_related_field_id",
+        ):
+            graph.edges.add(
+                (dependant_id, dependency_id, via_id, broken_reference_field_name)
+            )
+            graph.field_table_ids[dependant_id] = dependant_table_id
+            if dependency_id is not None:
+                graph.field_table_ids[dependency_id] = dependency_table_id
+            if via_id is not None:
+                graph.link_row_related_field_ids[via_id] = link_row_related_field_id
+        return graph
+
+    @property
+    def indexes(self) -> Tuple[Dict, Dict, Dict, Dict]:
+        """
+        Returns the edges indexed by dependency, by dependant and by via, and the link
+        row fields indexed by their related field. They're computed lazily after every
+        change because the graph is read much more often than it's changed.
+        """
+
+        if self._indexes is None:
+            by_dependency = defaultdict(list)
+            by_dependant = defaultdict(list)
+            by_via = defaultdict(list)
+            by_related_field = defaultdict(list)
+            for edge in sorted(self.edges, key=lambda e: (e[0], e[1] or 0, e[2] or 0)):
+                dependant_id, dependency_id, via_id, _ = edge
+                by_dependant[dependant_id].append(edge)
+                if dependency_id is not None:
+                    by_dependency[dependency_id].append(edge)
+                if via_id is not None:
+                    by_via[via_id].append(edge)
+            for (
+                link_row_field_id,
+                related_id,
+            ) in self.link_row_related_field_ids.items():
+                if related_id is not None:
+                    by_related_field[related_id].append(link_row_field_id)
+            self._indexes = (by_dependency, by_dependant, by_via, by_related_field)
+        return self._indexes
+
+    def apply(self, operations: List[Tuple]):
+        """
+        Applies the operations recorded by `FieldDependencyGraphChanges`. All the
+        operations are idempotent, so applying them to a graph that already contains
+        the changes leaves it unchanged.
+        """
+
+        for operation, *args in operations:
+            if operation == "add":
+                edge, dependant_table_id, dependency_table_id, related_id = args
+                self.edges.add(edge)
+                self.field_table_ids[edge[0]] = dependant_table_id
+                if edge[1] is not None:
+                    self.field_table_ids[edge[1]] = dependency_table_id
+                if edge[2] is not None:
+                    self.link_row_related_field_ids[edge[2]] = related_id
+            elif operation == "remove":
+                self.edges.discard(args[0])
+            elif operation == "break":
+                field_id, field_name = args
+                for edge in list(self.edges):
+                    dependant_id, dependency_id, via_id, broken_name = edge
+                    if dependant_id == field_id or via_id == field_id:
+                        self.edges.discard(edge)
+                    elif dependency_id == field_id:
+                        self.edges.discard(edge)
+                        self.edges.add((dependant_id, None, via_id, field_name))
+            elif operation == "delete":
+                field_id = args[0]
+                self.edges = {edge for edge in self.edges if field_id not in edge[:3]}
+                self._remove_link_row_related_field(field_id)
+            elif operation == "delete_via":
+                field_id = args[0]
+                self.edges = {edge for edge in self.edges if edge[2] != field_id}
+                self._remove_link_row_related_field(field_id)
+            elif operation == "update_link_row":
+                # The related field of a link row field can be created or deleted,
+                # and the field can be moved to another table, without changing the
+                # dependencies themselves.
+                field_id, table_id, related_id = args
+                if field_id in self.field_table_ids:
+                    self.field_table_ids[field_id] = table_id
+                if field_id in self.link_row_related_field_ids:
+                    self.link_row_related_field_ids[field_id] = related_id
+        self._indexes = None
+
+    def _remove_link_row_related_field(self, field_id: int):
+        self.link_row_related_field_ids.pop(field_id, None)
+        for link_row_field_id, related_id in self.link_row_related_field_ids.items():
+            if related_id == field_id:
+                self.link_row_related_field_ids[link_row_field_id] = None
+
+    def get_all_dependants(
+        self,
+        table_id: int,
+        field_ids: Iterable[int],
+        associated_relations_changed: bool,
+        max_depth: int,
+    ) -> List[DependantPath]:
+        """
+        Finds the dependants of the provided fields recursively. The result is the
+        same as the one of the recursive query in
+        `FieldDependencyHandler._get_all_dependent_fields`, except that the
+        traversal stops at `max_depth`, so it can't loop forever.
+
+        :param table_id: The table that the provided field_ids are all part of.
+        :param field_ids: The field ids for which the dependants must be found.
+        :param associated_relations_changed: If true any relations associated with
+            any provided field ids will be treated as having changed also.
+        :param max_depth: The maximum depth of the dependants.
+        :return: The dependants ordered by their depth.
+        """
+
+        by_dependency, _, by_via, by_related_field = self.indexes
+        field_ids = set(field_ids)
+
+        starting_edges = []
+        for field_id in field_ids:
+            starting_edges.extend(by_dependency.get(field_id, []))
+            if associated_relations_changed:
+                via_ids = [field_id] + by_related_field.get(field_id, [])
+                for via_id in via_ids:
+                    starting_edges.extend(
+                        edge
+                        for edge in by_via.get(via_id, [])
+                        if edge[0] not in field_ids
+                    )
+
+        level = []
+        seen = set()
+        for dependant_id, dependency_id, via_id, _ in starting_edges:
+            # Only the via's that are valid joins to get from the dependant cell to the
+            # dependency are added to the path.
+            if via_id is not None and (
+                self.field_table_ids.get(dependant_id) != table_id
+                or self.field_table_ids.get(dependency_id) == table_id
+            ):
+                via_path = (via_id,)
+            else:
+                via_path = ()
+            dependency_path = (dependency_id,) if dependency_id is not None else ()
+            row = (dependant_id, dependency_path, via_path, 1)
+            if row not in seen:
+                seen.add(row)
+                level.append(row)
+
+        depth = 1
+        while level and depth < max_depth:
+            next_level = []
+            for field_id, dependency_path, via_path, _ in level:
+                for dependant_id, _, via_id, _ in by_dependency.get(field_id, []):
+                    row = (
+                        dependant_id,
+                        dependency_path + (field_id,),
+                        via_path + ((via_id,) if via_id is not None else ()),
+                        depth + 1,
+                    )
+                    if row not in seen:
+                        seen.add(row)
+                        next_level.append(row)
+            level = next_level
+            depth += 1
+
+        grouped: Dict[Tuple[int, Tuple[int, ...]], DependantPath] = {}
+        for field_id, dependency_path, via_path, row_depth in seen:
+            path = grouped.get((field_id, via_path))
+            if path is None:
+                path = grouped[(field_id, via_path)] = DependantPath(
+                    id=field_id,
+                    dependency_ids=[],
+                    via_ids=list(via_path),
+                    depth=row_depth,
+                )
+            path.dependency_ids.extend(dependency_path)
+            path.depth = max(path.depth, row_depth)
+
+        for path in grouped.values():
+            path.dependency_ids = sorted(set(path.dependency_ids))
+        return sorted(grouped.values(), key=lambda p: (p.depth, p.id, p.via_ids))
+
+    def get_all_dependencies(self, field_id: int, max_depth: int) -> Set[int]:
+        """
+        Returns all the fields that the provided field depends on, directly or
+        indirectly, like `circular_reference_checker.get_all_field_dependencies`.
+
+        :param field_id: The field to get the dependencies for.
+        :param max_depth: The maximum depth of the dependencies.
+        :return: A set of field ids that the given field depends on.
+        :raises CircularFieldDependencyError: If a circular dependency is found.
+        """
+
+        _, by_dependant, _, _ = self.indexes
+
+        def dependencies_of(node_id):
+            return [
+                edge[1] for edge in by_dependant.get(node_id, []) if edge[1] is not None
+            ]
+
+        # Depth first search to detect any cycle reachable from the field.
+        visiting, visited = {field_id}, set()
+        stack = [(field_id, iter(dependencies_of(field_id)))]
+        while stack:
+            node_id, children = stack[-1]
+            child_id = next(children, None)
+            if child_id is None:
+                stack.pop()
+                visiting.discard(node_id)
+                visited.add(node_id)
+            elif child_id in visiting:
+                raise CircularFieldDependencyError()
+            elif child_id not in visited:
+                visiting.add(child_id)
+                stack.append((child_id, iter(dependencies_of(child_id))))
+
+        dependency_ids, level = set(), {field_id}
+        for _ in range(max_depth):
+            level = {
+                dependency_id
+                for node_id in level
+                for dependency_id in dependencies_of(node_id)
+                if dependency_id not in dependency_ids
+            }
+            if not level:
+                break
+            dependency_ids.update(level)
+        return dependency_ids
+
+
+def get_cached_database_id(field) -> Optional[int]:
+    """
+    Returns the database id of the field if its table has already been fetched, so
+    that no query is needed to find it, or None otherwise.
+    """
+
+    if field._meta.get_field("table").is_cached(field):
+        return field.table.database_id
+    return None
+
+
+class FieldDependencyGraphChanges:
+    """
+    Records the changes made to the dependencies of a database in the current
+    transaction. An instance is registered as `transaction.on_commit` callback, so
+    while it's pending, the graph of the database is out of date for the current
+    transaction. If the transaction, or the savepoint it was registered in, is rolled
+    back, Django discards the callback together with the changes.
+
+    If the database isn't known, all the graphs are invalidated on commit. If a change
+    can't be recorded without executing queries, the graph of the database is
+    reloaded instead of updated incrementally.
+    """
+
+    def __init__(self, database_id: Optional[int]):
+        self.database_id = database_id
+        self.operations = []
+        self.incremental = True
+
+    def add_dependency(self, dependency: FieldDependency):
+        related_fields = {}
+        for name in ["dependant", "dependency", "via"]:
+            if getattr(dependency, f"{name}_id") is None:
+                related_fields[name] = None
+            elif FieldDependency._meta.get_field(name).is_cached(dependency):
+                related_fields[name] = getattr(dependency, name)
+            else:
+                # Fetching the related field would cost a query, so the graph is
+                # reloaded instead of being updated incrementally.
+                self.incremental = False
+                return
+
+        dependency_field, via = related_fields["dependency"], related_fields["via"]
+        self.operations.append(
+            (
+                "add",
+                self._get_edge(dependency),
+                related_fields["dependant"].table_id,
+                dependency_field.table_id if dependency_field is not None else None,
+                via.link_row_related_field_id if via is not None else None,
+            )
+        )
+
+    def remove_dependency(self, dependency: FieldDependency):
+        self.operations.append(("remove", self._get_edge(dependency)))
+
+    def break_dependencies(self, field_id: int, field_name: str):
+        self.operations.append(("break", field_id, field_name))
+
+    def delete_field(self, field_id: int):
+        self.operations.append(("delete", field_id))
+
+    def delete_link_row_field(self, field_id: int):
+        self.operations.append(("delete_via", field_id))
+
+    def update_link_row_field(self, field: "LinkRowField"):
+        self.operations.append(
+            (
+                "update_link_row",
+                field.id,
+                field.table_id,
+                field.link_row_related_field_id,
+            )
+        )
+
+    @staticmethod
+    def _get_edge(dependency: FieldDependency) -> FieldDependencyEdge:
+        return (
+            dependency.dependant_id,
+            dependency.dependency_id,
+            dependency.via_id,
+            dependency.broken_reference_field_name,
+        )
+
+    def register(self):
+        if settings.BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_ENABLED:
+            transaction.on_commit(self)
+
+    def __call__(self):
+        field_dependency_graph_cache.apply_changes(self)
+
+
+class FieldDependencyGraphCache:
+    """
+    A thread-safe, process-local LRU of the dependency graphs of the databases,
+    backed by the default cache. The version of a graph is a tuple of the global
+    epoch, which is bumped when the database of a change isn't known, and the
+    version of the database.
+    """
+
+    EPOCH_KEY = "field_dependency_graph_epoch"
+
+    def __init__(self):
+        self._graphs: OrderedDict[int, FieldDependencyGraph] = OrderedDict()
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _version_key(database_id: int) -> str:
+        return f"field_dependency_graph_version_{database_id}"
+
+    @staticmethod
+    def _graph_key(database_id: int, version: Tuple[int, int]) -> str:
+        return f"field_dependency_graph_{database_id}_{version[0]}_{version[1]}"
+
+    @staticmethod
+    def _initial_version() -> int:
+        # A random start makes sure that a version key evicted from the cache can't
+        # be recreated with a version of which an outdated graph is still cached.
+        return random.randint(0, 2**48)  # nosec
+
+    def get_version(self, database_id: int) -> Tuple[int, int]:
+        version_key = self._version_key(database_id)
+        versions = cache.get_many([self.EPOCH_KEY, version_key])
+        if len(versions) < 2:
+            cache.add(self.EPOCH_KEY, self._initial_version(), timeout=None)
+            cache.add(version_key, self._initial_version(), timeout=None)
+            versions = cache.get_many([self.EPOCH_KEY, version_key])
+        return versions[self.EPOCH_KEY], versions[version_key]
+
+    @staticmethod
+    def has_pending_changes(database_id: int) -> bool:
+        """
+        Returns True if the dependencies of the database have been changed in the
+        current transaction, which means that the graph is out of date.
+        """
+
+        return any(
+            isinstance(callback, FieldDependencyGraphChanges)
+            and callback.database_id in (database_id, None)
+            for _, callback, _ in connection.run_on_commit
+        )
+
+    def get(self, database_id: int) -> Optional[FieldDependencyGraph]:
+        """
+        Returns the up to date dependency graph of the database or None if it can't
+        be used, in which case the database must be queried instead.
+        """
+
+        if not settings.BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_ENABLED:
+            return None
+        if self.has_pending_changes(database_id):
+            return None
+
+        version = self.get_version(database_id)
+        with self._lock:
+            graph = self._graphs.get(database_id)
+            if graph is not None and graph.version == version:
+                self._graphs.move_to_end(database_id)
+                graph_hits_counter.add(1)
+                return graph
+
+        graph_key = self._graph_key(database_id, version)
+        graph = cache.get(graph_key)
+        if graph is None:
+            graph = FieldDependencyGraph.load(database_id, version)
+            cache.set(
+                graph_key,
+                graph,
+                timeout=settings.BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_TIMEOUT,
+            )
+        else:
+            graph_hits_counter.add(1)
+        self._store(database_id, graph)
+        return graph
+
+    def _store(self, database_id: int, graph: FieldDependencyGraph):
+        with self._lock:
+            self._graphs[database_id] = graph
+            self._graphs.move_to_end(database_id)
+            while (
+                len(self._graphs) > settings.BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_SIZE
+            ):
+                self._graphs.popitem(last=False)
+
+    def apply_changes(self, changes: FieldDependencyGraphChanges):
+        """
+        Bumps the version of the changed database. If this process has the graph of
+        the previous version, the changes are applied incrementally to a copy of it
+        and the new graph is stored, so that it doesn't have to be loaded again. The
+        graph of the previous version isn't changed because other threads could be
+        reading it.
+        """
+
+        if changes.database_id is None:
+            self.invalidate_all()
+            return
+
+        version_key = self._version_key(changes.database_id)
+        with self._lock:
+            graph = self._graphs.get(changes.database_id)
+        try:
+            new_version = cache.incr(version_key)
+        except ValueError:
+            # The version doesn't exist yet, so no graph has been cached either.
+            cache.add(version_key, self._initial_version(), timeout=None)
+            return
+
+        epoch = cache.get(self.EPOCH_KEY)
+        if (
+            not changes.incremental
+            or graph is None
+            or graph.version != (epoch, new_version - 1)
+        ):
+            return
+
+        new_graph = graph.copy((epoch, new_version))
+        new_graph.apply(changes.operations)
+        cache.set(
+            self._graph_key(changes.database_id, new_graph.version),
+            new_graph,
+            timeout=settings.BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_TIMEOUT,
+        )
+        self._store(changes.database_id, new_graph)
+
+    def invalidate_all(self):
+        try:
+            cache.incr(self.EPOCH_KEY)
+        except ValueError:
+            cache.add(self.EPOCH_KEY, self._initial_version(), timeout=None)
+        with self._lock:
+            self._graphs.clear()
+
+
+field_dependency_graph_cache = FieldDependencyGraphCache()
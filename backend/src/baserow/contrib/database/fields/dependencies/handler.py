@@ -15,6 +15,10 @@ from baserow.contrib.database.fields.dependencies.dependency_rebuilder import (
 from baserow.contrib.database.fields.dependencies.exceptions import (
     CircularFieldDependencyError,
 )
+from baserow.contrib.database.fields.dependencies.graph import (
+    DependantPath,
+    field_dependency_graph_cache,
+)
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.fields.registries import FieldType, field_type_registry
@@ -81,10 +85,12 @@ class FieldDependencyHandler:
         field_cache: FieldCache,
         associated_relations_changed: bool,
         database_id_prefilter=None,
-    ) -> Tuple[QuerySet[FieldDependency], Dict[int, Field]]:
+    ) -> Tuple[Iterable[FieldDependency | DependantPath], Dict[int, Field]]:
         """
         Recursively fetches field dependants and retrieves specific field types in a
-        query-efficient and performant manner.
+        query-efficient and performant manner. If the database is provided and its
+        dependency graph is cached, the dependants are found in memory instead of
+        with a recursive query.
 
         :param table_id: The table that the provided field_ids are all part of.
         :param field_ids: The field ids for which we need to find the dependent fields,
@@ -98,13 +104,102 @@ class FieldDependencyHandler:
             specific database. Providing it brings a significant performance
             improvement but limits dependencies to the database. This can only be done
             if all the provided fields are in the same database.
-        :return: A tuple containing the queryset of the dependencies and a dictionary of
-            the specific fields.
+        :return: A tuple containing the dependencies and a dictionary of the specific
+            fields.
         """
 
         if len(field_ids) == 0:
             return []
 
+        dependencies = None
+        if database_id_prefilter:
+            dependencies = cls._get_all_dependent_fields_from_graph(
+                table_id,
+                field_ids,
+                associated_relations_changed,
+                database_id_prefilter,
+            )
+        if dependencies is None:
+            dependencies = cls._get_all_dependent_fields_from_database(
+                table_id, field_ids, associated_relations_changed, database_id_prefilter
+            )
+
+        link_row_field_content_type = ContentType.objects.get_for_model(LinkRowField)
+        fields_to_fetch = set()
+        fields_in_cache = {}
+
+        # Adds the dependant field id and the link row via fields to the
+        # `fields_to_fetch` list, so that we can later query efficiently fetch the
+        # specific objects.
+        for dependency in dependencies:
+            field = Field(
+                id=dependency.id,
+                content_type_id=dependency.content_type_id,
+                table_id=dependency.table_id,
+                name=dependency.name,
+            )
+
+            if field not in fields_to_fetch:
+                cached_field = field_cache.lookup_specific(
+                    field, fetch_if_missing=False
+                )
+                if cached_field is not None:
+                    fields_in_cache[cached_field.id] = cached_field
+                else:
+                    fields_to_fetch.add(field)
+
+            for via_id in dependency.via_ids:
+                link_row_field = Field(
+                    id=via_id, content_type_id=link_row_field_content_type.id
+                )
+                if link_row_field not in fields_to_fetch:
+                    fields_to_fetch.add(link_row_field)
+
+        # This hook is called for every unique field type in the specific_iterator of
+        # the fields. The `table` and `link_row_table` references are later needed,
+        # so we're prefetching them here based on the type.
+        from baserow.contrib.database.fields.field_types import LinkRowFieldType
+
+        link_row_field_model = field_type_registry.get(
+            LinkRowFieldType.type
+        ).model_class
+
+        def queryset_hook(model, queryset):
+            queryset = queryset.select_related("table")
+            if model == link_row_field_model:
+                queryset = queryset.select_related("link_row_table")
+            return queryset
+
+        # Creates an object of specific field types, so that we don't have to execute
+        # unnecessary queries later on.
+        specific_fields = {}
+        if fields_to_fetch:
+            specific_fields = {
+                field.id: field
+                for field in specific_iterator(
+                    fields_to_fetch,
+                    base_model=Field,
+                    per_content_type_queryset_hook=queryset_hook,
+                )
+            }
+
+        return dependencies, {**specific_fields, **fields_in_cache}
+
+    @classmethod
+    def _get_all_dependent_fields_from_database(
+        cls,
+        table_id: int,
+        field_ids: Iterable[int],
+        associated_relations_changed: bool,
+        database_id_prefilter=None,
+    ) -> QuerySet[FieldDependency]:
+        """
+        Executes the recursive query that finds the dependants of the provided fields.
+
+        :return: A raw queryset containing a row for every dependant and path to the
+            starting table.
+        """
+
         query_parameters = {
             "pks": list(field_ids),
             "max_depth": settings.MAX_FIELD_REFERENCE_DEPTH,
@@ -223,13 +318,9 @@ class FieldDependencyHandler:
         """  # noqa: S608
 
         queryset = FieldDependency.objects.raw(raw_query, query_parameters)
-        link_row_field_content_type = ContentType.objects.get_for_model(LinkRowField)
-        fields_to_fetch = set()
-        fields_in_cache = {}
 
-        # Unpacks the dependant field id, the link row via fields, and adds them to the
-        # `fields_to_fetch` list, so that we can later query efficiently fetch the
-        # specific objects.
+        # Unpacks the link row via fields and the dependency ids, so that the rows
+        # have the same attributes as the ones found in the dependency graph.
         for dependency in queryset:
             if dependency.via_ids:
                 dependency.via_ids = [
@@ -244,59 +335,55 @@ class FieldDependencyHandler:
                 ]
             else:
                 dependency.dependency_ids = []
+        return queryset
 
-            field = Field(
-                id=dependency.id,
-                content_type_id=dependency.content_type_id,
-                table_id=dependency.table_id,
-                name=dependency.name,
-            )
-
-            if field not in fields_to_fetch:
-                cached_field = field_cache.lookup_specific(
-                    field, fetch_if_missing=False
-                )
-                if cached_field is not None:
-                    fields_in_cache[cached_field.id] = cached_field
-                else:
-                    fields_to_fetch.add(field)
-
-            for via_id in dependency.via_ids:
-                link_row_field = Field(
-                    id=via_id, content_type_id=link_row_field_content_type.id
-                )
-                if link_row_field not in fields_to_fetch:
-                    fields_to_fetch.add(link_row_field)
-
-        # This hook is called for every unique field type in the specific_iterator of
-        # the fields. The `table` and `link_row_table` references are later needed,
-        # so we're prefetching them here based on the type.
-        from baserow.contrib.database.fields.field_types import LinkRowFieldType
+    @classmethod
+    def _get_all_dependent_fields_from_graph(
+        cls,
+        table_id: int,
+        field_ids: Iterable[int],
+        associated_relations_changed: bool,
+        database_id: int,
+    ) -> Optional[List[DependantPath]]:
+        """
+        Finds the dependants of the provided fields in the cached dependency graph of
+        the database, instead of executing the recursive query. The fields found are
+        then fetched in one query to get their content type, name and table.
 
-        link_row_field_model = field_type_registry.get(
-            LinkRowFieldType.type
-        ).model_class
+        :return: The dependants in the same format as the recursive query or None if
+            the dependency graph of the database can't be used.
+        """
 
-        def queryset_hook(model, queryset):
-            queryset = queryset.select_related("table")
-            if model == link_row_field_model:
-                queryset = queryset.select_related("link_row_table")
-            return queryset
+        graph = field_dependency_graph_cache.get(database_id)
+        if graph is None:
+            return None
 
-        # Creates an object of specific field types, so that we don't have to execute
-        # unnecessary queries later on.
-        specific_fields = {}
-        if fields_to_fetch:
-            specific_fields = {
-                field.id: field
-                for field in specific_iterator(
-                    fields_to_fetch,
-                    base_model=Field,
-                    per_content_type_queryset_hook=queryset_hook,
-                )
-            }
+        dependant_paths = graph.get_all_dependants(
+            table_id,
+            field_ids,
+            associated_relations_changed,
+            settings.MAX_FIELD_REFERENCE_DEPTH,
+        )
+        if not dependant_paths:
+            return []
 
-        return queryset, {**specific_fields, **fields_in_cache}
+        fields = {
+            field_id: (content_type_id, name, field_table_id)
+            for field_id, content_type_id, name, field_table_id in (
+                Field.objects_and_trash.filter(
+                    id__in={path.id for path in dependant_paths}
+                ).values_list("id", "content_type_id", "name", "table_id")
+            )
+        }
+        result = []
+        for path in dependant_paths:
+            # The field can already be deleted if the graph of the other process
+            # didn't receive the change yet.
+            if path.id not in fields:
+                continue
+            path.content_type_id, path.name, path.table_id = fields[path.id]
+            result.append(path)
+        return result
 
     @classmethod
     def group_dependencies_by_level(
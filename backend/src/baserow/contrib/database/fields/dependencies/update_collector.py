@@ -1,8 +1,13 @@
 import dataclasses
+import time
 from collections import defaultdict
 from typing import Dict, List, Optional, Set, Tuple, cast
 
-from django.db.models import Expression, Q, Value
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.db.models import Expression, Q, QuerySet, Value
+
+from opentelemetry import metrics, trace
 
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field, LinkRowField
@@ -12,10 +17,35 @@ from baserow.contrib.database.table.constants import (
     ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME,
 )
 from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.table.queryset import (
+    update_returning_ids_in_one_statement,
+)
 from baserow.contrib.database.table.signals import table_updated
+from baserow.core.telemetry.utils import add_baserow_trace_attrs
 
 StartingRowIdsType = Optional[List[int]]
 
+tracer = trace.get_tracer(__name__)
+meter = metrics.get_meter(__name__)
+update_statements_counter = meter.create_counter(
+    "baserow.dependent_field_updates.statements",
+    unit="1",
+    description="The number of dependant field update statements executed per "
+    "dependency level.",
+)
+update_round_trips_counter = meter.create_counter(
+    "baserow.dependent_field_updates.round_trips",
+    unit="1",
+    description="The number of queries executed to run the dependant field update "
+    "statements per dependency level.",
+)
+update_level_duration_histogram = meter.create_histogram(
+    "baserow.dependent_field_updates.level_duration",
+    unit="ms",
+    description="The time it took to execute the dependant field update statements "
+    "of one dependency level.",
+)
+
 
 @dataclasses.dataclass
 class DependencyContext:
@@ -173,31 +203,151 @@ class PathBasedUpdateStatementCollector:
         path_to_starting_table = path_to_starting_table or []
         if self.connection_here is not None:
             path_to_starting_table = [self.connection_here] + path_to_starting_table
-        updated_row_ids = self._execute_pending_update_statements(
-            field_cache,
-            path_to_starting_table,
-            starting_row_ids,
-            deleted_m2m_rels_per_link_field,
-        )
-        result[self.table.id].update(updated_row_ids)
-
-        for sub_path in self.sub_paths.values():
-            result = sub_path.execute_all(
-                starting_row_ids=starting_row_ids,
-                path_to_starting_table=path_to_starting_table,
-                field_cache=field_cache,
-                deleted_m2m_rels_per_link_field=deleted_m2m_rels_per_link_field,
-                result=result,
+
+        # The collectors are executed level by level, where a level contains all the
+        # collectors at the same depth of the path tree. A collector only depends on
+        # the collectors on its path back to the starting table, so all the
+        # collectors of a level can be executed at the same time.
+        level = [(self, path_to_starting_table)]
+        depth = 0
+        while level:
+            self._execute_level(
+                depth,
+                level,
+                field_cache,
+                starting_row_ids,
+                deleted_m2m_rels_per_link_field,
+                result,
             )
+            level = [
+                (
+                    sub_path,
+                    [sub_path.connection_here] + path
+                    if sub_path.connection_here is not None
+                    else path,
+                )
+                for collector, path in level
+                for sub_path in collector.sub_paths.values()
+            ]
+            depth += 1
         return result
 
-    def _execute_pending_update_statements(
+    @classmethod
+    def _execute_level(
+        cls,
+        depth: int,
+        level: List[Tuple["PathBasedUpdateStatementCollector", List[LinkRowField]]],
+        field_cache: FieldCache,
+        starting_row_ids: StartingRowIdsType,
+        deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]],
+        result: Dict[int, Set[int]],
+    ):
+        """
+        Executes the pending update statements of all the collectors of the same
+        dependency level. The updates of different tables are combined into one
+        query, unless `BASEROW_COMBINE_DEPENDENT_FIELD_UPDATES` is disabled. If
+        multiple collectors of the level update the same table, these are executed
+        in consecutive queries, in the original order.
+
+        :param depth: The depth of the level, used for the instrumentation.
+        :param level: A list of tuples containing the collector and its path to the
+            starting table.
+        :param field_cache: The field cache to use to get the models and fields.
+        :param starting_row_ids: See `execute_all`.
+        :param deleted_m2m_rels_per_link_field: See `execute_all`.
+        :param result: The dict containing the updated row ids per table id, which
+            is updated in place.
+        """
+
+        with tracer.start_as_current_span(f"{cls.__name__}._execute_level"):
+            start = time.perf_counter()
+
+            # Group the updates in batches where every table appears at most once.
+            batches: List[List[Tuple[int, QuerySet, Dict[str, Expression]]]] = []
+            statements = 0
+            for collector, path in level:
+                result[collector.table.id].update([])
+                queryset = collector._get_pending_update_queryset(
+                    field_cache,
+                    path,
+                    starting_row_ids,
+                    deleted_m2m_rels_per_link_field,
+                )
+                if queryset is None:
+                    continue
+                statements += 1
+                update = (collector.table.id, queryset, collector.update_statements)
+                for batch in batches:
+                    if all(table_id != update[0] for table_id, _, _ in batch):
+                        batch.append(update)
+                        break
+                else:
+                    batches.append([update])
+
+            round_trips = 0
+            for batch in batches:
+                if len(batch) > 1 and settings.BASEROW_COMBINE_DEPENDENT_FIELD_UPDATES:
+                    round_trips += 1
+                    cls._execute_combined_updates(batch, result)
+                else:
+                    for table_id, queryset, update_statements in batch:
+                        round_trips += 1
+                        result[table_id].update(
+                            queryset.update_returning_ids(**update_statements)
+                        )
+
+            duration = (time.perf_counter() - start) * 1000
+            attributes = {"depth": depth}
+            update_statements_counter.add(statements, attributes)
+            update_round_trips_counter.add(round_trips, attributes)
+            update_level_duration_histogram.record(duration, attributes)
+            add_baserow_trace_attrs(
+                depth=depth,
+                statements=statements,
+                round_trips=round_trips,
+                duration_ms=duration,
+            )
+
+    @classmethod
+    def _execute_combined_updates(
+        cls,
+        batch: List[Tuple[int, QuerySet, Dict[str, Expression]]],
+        result: Dict[int, Set[int]],
+    ):
+        """
+        Executes the updates of different tables in a single query. Updates that
+        can't match any row are skipped.
+        """
+
+        updates, table_ids = [], []
+        for table_id, queryset, update_statements in batch:
+            try:
+                queryset.update_returning_ids_sql(**update_statements)
+            except EmptyResultSet:
+                continue
+            updates.append((queryset, update_statements))
+            table_ids.append(table_id)
+
+        if not updates:
+            return
+
+        for table_id, row_ids in zip(
+            table_ids, update_returning_ids_in_one_statement(updates)
+        ):
+            result[table_id].update(row_ids)
+
+    def _get_pending_update_queryset(
         self,
         field_cache: FieldCache,
         path_to_starting_table: List[LinkRowField],
         starting_row_ids: StartingRowIdsType,
         deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]],
-    ) -> list[int]:
+    ) -> Optional[QuerySet]:
+        """
+        Returns the queryset of the rows that must be updated with the pending
+        update statements, or None if there are no pending update statements.
+        """
+
         model = field_cache.get_model(self.table)
         qs = model.objects_and_trash
         # If the connection is broken back to the starting table then there is no
@@ -234,40 +384,36 @@ class PathBasedUpdateStatementCollector:
             # set this per row attribute.
             self.update_statements.pop(ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME, None)
 
-        updated_row_ids = []
-        if self.update_statements:
-            annotations, filters = {}, Q()
-
-            # If we are only updating changes, we need to filter out rows that don't
-            # need to be updated. Because of how postgres works, this could save a lot
-            # of disk space and IO, at the cost of a more complex query and a longer
-            # execution time, but if we're updating an entire field or only certain
-            # rows, it's better to skip this optimization.
-            if self.update_changes_only:
-                for field, expr in self.update_statements.items():
-                    if expr is None or not field.startswith("field_"):
-                        continue
-
-                    annotated_field = f"{field}_expr"
-                    annotations[annotated_field] = expr
-                    # Because the expression can evaluate to null and because of how the
-                    # comparison with null should be handle in SQL
-                    # (https://www.postgresql.org/docs/15/functions-comparison.html), we
-                    # need to properly filter rows to correctly update only the ones
-                    # that need to be updated.
-                    filters |= Q(
-                        **{
-                            f"{field}__isnull": False,
-                            f"{annotated_field}__isnull": True,
-                        }
-                    ) | ~Q(**{field: expr})
-
-            updated_row_ids = (
-                qs.annotate(**annotations)
-                .filter(filters)
-                .update_returning_ids(**self.update_statements)
-            )
-        return updated_row_ids
+        if not self.update_statements:
+            return None
+
+        annotations, filters = {}, Q()
+
+        # If we are only updating changes, we need to filter out rows that don't
+        # need to be updated. Because of how postgres works, this could save a lot
+        # of disk space and IO, at the cost of a more complex query and a longer
+        # execution time, but if we're updating an entire field or only certain
+        # rows, it's better to skip this optimization.
+        if self.update_changes_only:
+            for field, expr in self.update_statements.items():
+                if expr is None or not field.startswith("field_"):
+                    continue
+
+                annotated_field = f"{field}_expr"
+                annotations[annotated_field] = expr
+                # Because the expression can evaluate to null and because of how the
+                # comparison with null should be handle in SQL
+                # (https://www.postgresql.org/docs/15/functions-comparison.html), we
+                # need to properly filter rows to correctly update only the ones
+                # that need to be updated.
+                filters |= Q(
+                    **{
+                        f"{field}__isnull": False,
+                        f"{annotated_field}__isnull": True,
+                    }
+                ) | ~Q(**{field: expr})
+
+        return qs.annotate(**annotations).filter(filters)
 
     def _include_rows_connected_to_deleted_m2m_relationships(
         self,
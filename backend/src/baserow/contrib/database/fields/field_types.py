@@ -96,6 +96,10 @@ from baserow.contrib.database.api.views.errors import (
     ERROR_VIEW_DOES_NOT_EXIST,
     ERROR_VIEW_NOT_IN_TABLE,
 )
+from baserow.contrib.database.db.copy import (
+    escape_copy_text,
+    get_model_field_copy_encoder,
+)
 from baserow.contrib.database.db.functions import RandomUUID
 from baserow.contrib.database.fields.exceptions import SelectOptionDoesNotBelongToField
 from baserow.contrib.database.fields.filter_support.formula import (
@@ -301,6 +305,7 @@ class TextFieldMatchingRegexFieldType(FieldType, ABC):
     """
 
     _can_have_db_index = True
+    can_copy_rows_with_sql = True
 
     @property
     @abstractmethod
@@ -342,6 +347,9 @@ class TextFieldMatchingRegexFieldType(FieldType, ABC):
             **kwargs,
         )
 
+    def get_copy_encoder(self, instance, model_field):
+        return get_model_field_copy_encoder(model_field)
+
     def get_alter_column_prepare_new_value(self, connection, from_field, to_field):
         if connection.vendor == "postgresql":
             return f"""p_in = (
@@ -421,6 +429,7 @@ class ManyToManyFieldTypeSerializeToInputValueMixin:
 class TextFieldType(CollationSortMixin, FieldType):
     type = "text"
     model_class = TextField
+    can_copy_rows_with_sql = True
     allowed_fields = ["text_default"]
     serializer_field_names = ["text_default"]
     _can_group_by = True
@@ -449,6 +458,9 @@ class TextFieldType(CollationSortMixin, FieldType):
             **kwargs,
         )
 
+    def get_copy_encoder(self, instance, model_field):
+        return get_model_field_copy_encoder(model_field)
+
     def random_value(self, instance, fake, cache):
         return fake.name()
 
@@ -474,6 +486,7 @@ class TextFieldType(CollationSortMixin, FieldType):
 class LongTextFieldType(CollationSortMixin, FieldType):
     type = "long_text"
     model_class = LongTextField
+    can_copy_rows_with_sql = True
     allowed_fields = ["long_text_enable_rich_text"]
     serializer_field_names = ["long_text_enable_rich_text"]
     _can_have_db_index = True
@@ -519,6 +532,9 @@ class LongTextFieldType(CollationSortMixin, FieldType):
             blank=True, null=True, db_index=instance.db_index, **kwargs
         )
 
+    def get_copy_encoder(self, instance, model_field):
+        return get_model_field_copy_encoder(model_field)
+
     def random_value(self, instance, fake, cache):
         return fake.text()
 
@@ -570,6 +586,7 @@ class NumberFieldType(FieldType):
 
     type = "number"
     model_class = NumberField
+    can_copy_rows_with_sql = True
     allowed_fields = [
         "number_decimal_places",
         "number_negative",
@@ -674,7 +691,20 @@ class NumberFieldType(FieldType):
             return value if rich_value else ""
 
         instance = field_object["field"]
+        return self._get_export_value(
+            value, instance, self.get_serializer_field(instance)
+        )
 
+    def get_export_values(self, values, field_object, rich_value=False):
+        # The serializer field is only constructed once for the whole batch.
+        instance = field_object["field"]
+        serializer_field = self.get_serializer_field(instance)
+        return [
+            self._get_export_value(value, instance, serializer_field)
+            for value in values
+        ]
+
+    def _get_export_value(self, value, instance, serializer_field):
         apply_formatting = (
             instance.number_prefix
             or instance.number_suffix
@@ -686,7 +716,6 @@ class NumberFieldType(FieldType):
             # If the number is an integer we want it to be a literal json number and so
             # don't convert it to a string. However, if a decimal to preserve any
             # precision we keep it as a string.
-            instance = field_object["field"]
             if instance.number_decimal_places == 0:
                 try:
                     return int(value)
@@ -695,9 +724,9 @@ class NumberFieldType(FieldType):
 
             # DRF's Decimal Serializer knows how to quantize and format the decimal
             # correctly so lets use it instead of trying to do it ourselves.
-            return self.get_serializer_field(instance).to_representation(value)
+            return serializer_field.to_representation(value)
 
-        formatted_value = self.get_serializer_field(instance).to_representation(value)
+        formatted_value = serializer_field.to_representation(value)
 
         if formatted_value == "NaN":
             return "NaN"
@@ -749,6 +778,9 @@ class NumberFieldType(FieldType):
             **kwargs,
         )
 
+    def get_copy_encoder(self, instance, model_field):
+        return get_model_field_copy_encoder(model_field)
+
     def random_value(self, instance: NumberField, fake, cache):
         if instance.number_decimal_places == 0:
             return fake.pyint(
@@ -885,6 +917,7 @@ class NumberFieldType(FieldType):
 class RatingFieldType(FieldType):
     type = "rating"
     model_class = RatingField
+    can_copy_rows_with_sql = True
     allowed_fields = ["max_value", "color", "style"]
     serializer_field_names = ["max_value", "color", "style"]
     _can_group_by = True
@@ -989,6 +1022,9 @@ class RatingFieldType(FieldType):
             **kwargs,
         )
 
+    def get_copy_encoder(self, instance, model_field):
+        return get_model_field_copy_encoder(model_field)
+
     def random_value(self, instance, fake, cache):
         return fake.random_int(0, instance.max_value)
 
@@ -1022,6 +1058,7 @@ class RatingFieldType(FieldType):
 class BooleanFieldType(FieldType):
     type = "boolean"
     model_class = BooleanField
+    can_copy_rows_with_sql = True
     allowed_fields = ["boolean_default"]
     serializer_field_names = ["boolean_default"]
     _can_group_by = True
@@ -1055,6 +1092,9 @@ class BooleanFieldType(FieldType):
             default=instance.boolean_default, db_index=instance.db_index, **kwargs
         )
 
+    def get_copy_encoder(self, instance, model_field):
+        return get_model_field_copy_encoder(model_field)
+
     def random_value(self, instance, fake, cache):
         return fake.pybool()
 
@@ -1089,6 +1129,7 @@ class BooleanFieldType(FieldType):
 class DateFieldType(FieldType):
     type = "date"
     model_class = DateField
+    can_copy_rows_with_sql = True
     allowed_fields = [
         "date_format",
         "date_include_time",
@@ -1275,6 +1316,23 @@ class DateFieldType(FieldType):
 
         return value.strftime(field.get_python_format())
 
+    def get_export_values(self, values, field_object, rich_value=False):
+        # The format and the timezone are only computed once for the whole batch.
+        field = field_object["field"]
+        python_format = field.get_python_format()
+        force_timezone = (
+            ZoneInfo(field.date_force_timezone)
+            if field.date_force_timezone is not None
+            else None
+        )
+
+        export_values = []
+        for value in values:
+            if force_timezone is not None and isinstance(value, datetime):
+                value = value.astimezone(force_timezone)
+            export_values.append(value.strftime(python_format))
+        return export_values
+
     def get_serializer_field(self, instance, **kwargs):
         required = kwargs.get("required", False)
 
@@ -1296,6 +1354,9 @@ class DateFieldType(FieldType):
         else:
             return models.DateField(**kwargs)
 
+    def get_copy_encoder(self, instance, model_field):
+        return get_model_field_copy_encoder(model_field)
+
     def random_value(self, instance, fake, cache):
         if instance.date_include_time:
             return fake.date_time().replace(tzinfo=timezone.utc)
@@ -1654,6 +1715,9 @@ class LastModifiedByFieldType(ReadOnlyFieldType):
             **kwargs,
         )
 
+    def get_copy_encoder(self, instance, model_field):
+        return get_model_field_copy_encoder(model_field)
+
     def get_serializer_field(self, instance, **kwargs):
         return CollaboratorSerializer(required=False, **kwargs)
 
@@ -1880,6 +1944,9 @@ class CreatedByFieldType(ReadOnlyFieldType):
             **kwargs,
         )
 
+    def get_copy_encoder(self, instance, model_field):
+        return get_model_field_copy_encoder(model_field)
+
     def get_serializer_field(self, instance, **kwargs):
         return CollaboratorSerializer(required=False, **kwargs)
 
@@ -2078,6 +2145,7 @@ class CreatedByFieldType(ReadOnlyFieldType):
 class DurationFieldType(FieldType):
     type = "duration"
     model_class = DurationField
+    can_copy_rows_with_sql = True
     allowed_fields = ["duration_format"]
     serializer_field_names = ["duration_format"]
     _can_group_by = True
@@ -2087,6 +2155,9 @@ class DurationFieldType(FieldType):
     def get_model_field(self, instance: DurationField, **kwargs):
         return DurationModelField(instance.duration_format, null=True, **kwargs)
 
+    def get_copy_encoder(self, instance, model_field):
+        return get_model_field_copy_encoder(model_field)
+
     def get_serializer_field(self, instance: DurationField, **kwargs):
         return DurationFieldSerializer(
             **{
@@ -2260,6 +2331,7 @@ class LinkRowFieldType(
 
     type = "link_row"
     model_class = LinkRowField
+    can_copy_rows_with_sql = True
     allowed_fields = [
         "link_row_table_id",
         "link_row_related_field",
@@ -3734,6 +3806,7 @@ class EmailFieldType(CollationSortMixin, CharFieldMatchingRegexFieldType):
 class FileFieldType(FieldType):
     type = "file"
     model_class = FileField
+    can_copy_rows_with_sql = True
     can_be_in_form_view = True
     can_get_unique_values = False
     _can_order_by_types = []
@@ -3788,20 +3861,18 @@ class FileFieldType(FieldType):
         # Create a list of the serialized UserFiles in the originally provided order
         # because that is also the order we need to store the serialized versions in.
         user_files = []
-        queryset = UserFile.objects.all().name(*[f["name"] for f in provided_files])
+        user_files_by_name = UserFileHandler().get_user_files_by_name(
+            *[f["name"] for f in provided_files]
+        )
         for file in provided_files:
             try:
-                user_file = next(
-                    user_file
-                    for user_file in queryset
-                    if user_file.name == file["name"]
-                )
-                serialized = user_file.serialize()
-                serialized["visible_name"] = (
-                    file.get("visible_name") or user_file.original_name
-                )
-            except StopIteration:
+                user_file = user_files_by_name[file["name"]]
+            except KeyError:
                 raise UserFileDoesNotExist(file["name"])
+            serialized = user_file.serialize()
+            serialized["visible_name"] = (
+                file.get("visible_name") or user_file.original_name or user_file.name
+            )
 
             user_files.append(serialized)
 
@@ -3831,11 +3902,10 @@ class FileFieldType(FieldType):
         unique_names = set(name_map.keys())
 
         # Query the database for existing files
-        files = UserFile.objects.all().name(*unique_names)
-        if len(files) != len(unique_names):
-            invalid_names = sorted(
-                list(unique_names - set((file.name) for file in files))
-            )
+        user_files_by_name = UserFileHandler().get_user_files_by_name(*unique_names)
+
+        if len(user_files_by_name) != len(unique_names):
+            invalid_names = sorted(list(unique_names - set(user_files_by_name)))
             if continue_on_error:
                 for invalid_name in invalid_names:
                     for row_index in name_map[invalid_name]:
@@ -3844,7 +3914,6 @@ class FileFieldType(FieldType):
                 raise UserFileDoesNotExist(invalid_names)
 
         # Replacing file names by the actual file field dict
-        user_files_by_name = {file.name: file for file in files}
         for row_index, value in values_by_row.items():
             # Ignore already raised exceptions
             if isinstance(value, Exception):
@@ -3854,7 +3923,9 @@ class FileFieldType(FieldType):
                 user_file = user_files_by_name[file_names.get("name")]
                 serialized = user_file.serialize()
                 serialized["visible_name"] = (
-                    file_names.get("visible_name") or user_file.original_name
+                    file_names.get("visible_name")
+                    or user_file.original_name
+                    or user_file.name
                 )
                 serialized_files.append(serialized)
             values_by_row[row_index] = serialized_files
@@ -3916,6 +3987,12 @@ class FileFieldType(FieldType):
     def get_model_field(self, instance, **kwargs):
         return JSONField(default=list, **kwargs)
 
+    def get_copy_encoder(self, instance, model_field):
+        def encode(value):
+            return escape_copy_text(json.dumps(value, cls=model_field.encoder))
+
+        return encode
+
     def random_value(self, instance, fake, cache):
         """
         Selects between 0 and 3 random user files and returns those serialized in a
@@ -4528,6 +4605,9 @@ class SingleSelectFieldType(CollationSortMixin, SelectOptionBaseFieldType):
             **kwargs,
         )
 
+    def get_copy_encoder(self, instance, model_field):
+        return get_model_field_copy_encoder(model_field)
+
     def get_alter_column_prepare_old_value(self, connection, from_field, to_field):
         """
         If the new field type isn't a single select field we can convert the plain
@@ -5355,6 +5435,7 @@ class PhoneNumberFieldType(CollationSortMixin, CharFieldMatchingRegexFieldType):
 class FormulaFieldType(FormulaFieldTypeArrayFilterSupport, ReadOnlyFieldType):
     type = "formula"
     model_class = FormulaField
+    can_copy_rows_with_sql = True
     _db_column_fields = []
 
     can_be_in_form_view = False
@@ -5547,6 +5628,26 @@ class FormulaFieldType(FormulaFieldTypeArrayFilterSupport, ReadOnlyFieldType):
     def get_export_value(
         self, value, field_object, rich_value=False
     ) -> BaserowFormulaType:
+        field_type, formula_field_object = self._get_formula_type_field_object(
+            field_object
+        )
+        return field_type.get_export_value(
+            value, formula_field_object, rich_value=rich_value
+        )
+
+    def get_export_values(self, values, field_object, rich_value=False):
+        # The formula type is only resolved once for the whole batch, and its field
+        # type can convert all the values at once.
+        field_type, formula_field_object = self._get_formula_type_field_object(
+            field_object
+        )
+        return field_type.get_export_values(
+            values, formula_field_object, rich_value=rich_value
+        )
+
+    def _get_formula_type_field_object(
+        self, field_object: "FieldObject"
+    ) -> Tuple[FieldType, "FieldObject"]:
         instance = field_object["field"]
         (
             field_instance,
@@ -5554,16 +5655,12 @@ class FormulaFieldType(FormulaFieldTypeArrayFilterSupport, ReadOnlyFieldType):
         ) = self.get_field_instance_and_type_from_formula_field(instance)
         # Add the formula_field instance to provide a reference to the source table,
         # which might be needed for the export value (i.e. multiple collaborators field)
-        return field_type.get_export_value(
-            value,
-            {
-                "field": field_instance,
-                "type": field_type,
-                "name": field_object["name"],
-                "formula_field": instance,
-            },
-            rich_value=rich_value,
-        )
+        return field_type, {
+            "field": field_instance,
+            "type": field_type,
+            "name": field_object["name"],
+            "formula_field": instance,
+        }
 
     def contains_query(self, field_name, value, model_field, field: FormulaField):
         (
@@ -6723,6 +6820,7 @@ class MultipleCollaboratorsFieldType(
 ):
     type = "multiple_collaborators"
     model_class = MultipleCollaboratorsField
+    can_copy_rows_with_sql = True
     can_get_unique_values = False
     allowed_fields = ["notify_user_when_added"]
     request_serializer_field_names = ["notify_user_when_added"]
@@ -7143,6 +7241,7 @@ class UUIDFieldType(ReadOnlyFieldType):
 
     type = "uuid"
     model_class = UUIDField
+    can_copy_rows_with_sql = True
     can_be_in_form_view = False
     keep_data_on_duplication = True
     _can_have_db_index = True
@@ -7161,6 +7260,9 @@ class UUIDFieldType(ReadOnlyFieldType):
             **kwargs,
         )
 
+    def get_copy_encoder(self, instance, model_field):
+        return get_model_field_copy_encoder(model_field)
+
     def after_create(self, field, model, user, connection, before, field_kwargs):
         model.objects.all().update(**{f"{field.db_column}": RandomUUID()})
 
@@ -7241,6 +7343,7 @@ class AutonumberFieldType(ReadOnlyFieldType):
 
     type = "autonumber"
     model_class = AutonumberField
+    can_copy_rows_with_sql = True
     can_be_in_form_view = False
     keep_data_on_duplication = True
     request_serializer_field_names = ["view_id"]
@@ -7264,6 +7367,9 @@ class AutonumberFieldType(ReadOnlyFieldType):
     def get_model_field(self, instance, **kwargs):
         return IntegerFieldWithSequence(null=True, db_index=instance.db_index, **kwargs)
 
+    def get_copy_encoder(self, instance, model_field):
+        return get_model_field_copy_encoder(model_field)
+
     def after_rows_imported(
         self,
         field: FormulaField,
@@ -7457,6 +7563,7 @@ class PasswordFieldType(FieldType):
 
     type = "password"
     model_class = PasswordField
+    can_copy_rows_with_sql = True
     can_be_in_form_view = True
     keep_data_on_duplication = True
     _can_order_by_types = []
@@ -7495,6 +7602,9 @@ class PasswordFieldType(FieldType):
     def get_model_field(self, instance, **kwargs):
         return models.CharField(null=True, max_length=128)
 
+    def get_copy_encoder(self, instance, model_field):
+        return get_model_field_copy_encoder(model_field)
+
     def get_human_readable_value(self, value: Any, field_object: "FieldObject") -> str:
         # We don't want to expose the hash of the password, so we just show `True` or
         # `False` as string depending on whether the value is set.
@@ -319,10 +319,14 @@ class IntegerFieldWithSequence(models.IntegerField):
 
     db_returning = True
 
+    @property
+    def sequence_name(self) -> str:
+        return f"{self.name}_seq"
+
     def pre_save(self, model_instance, add):
         if add and not getattr(model_instance, self.name):
             return RawSQL(  # nosec
-                f"nextval('{self.name}_seq'::regclass)",
+                f"nextval('{self.sequence_name}'::regclass)",
                 (),
             )
         else:
@@ -1,7 +1,12 @@
 from collections import defaultdict
 
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from baserow.contrib.database.fields.dependencies.graph import (
+    FieldDependencyGraphChanges,
+    get_cached_database_id,
+)
 from baserow.contrib.database.fields.periodic_field_update_handler import (
     PeriodicFieldUpdateHandler,
 )
@@ -9,7 +14,7 @@ from baserow.contrib.database.fields.signals import field_updated
 from baserow.contrib.database.rows import signals as row_signals
 from baserow.contrib.database.views import signals as view_signals
 
-from .models import LinkRowField
+from .models import Field, LinkRowField
 
 
 @receiver([view_signals.view_loaded, row_signals.rows_loaded])
@@ -61,3 +66,47 @@ def clear_link_row_limit_selection_view_when_view_is_deleted(
             related_fields=link_rows[1:],
             user=None,
         )
+
+
+@receiver(post_delete, sender=Field)
+def update_field_dependency_graph_when_field_deleted(sender, instance, **kwargs):
+    """
+    The dependencies of a deleted field are deleted by the database with a cascade,
+    so they must also be removed from the cached dependency graph.
+    """
+
+    graph_changes = FieldDependencyGraphChanges(get_cached_database_id(instance))
+    graph_changes.delete_field(instance.id)
+    graph_changes.register()
+
+
+@receiver(post_delete, sender=LinkRowField)
+def update_field_dependency_graph_when_link_row_field_deleted(
+    sender, instance, **kwargs
+):
+    """
+    When a link row field is converted to another type, only the link row field
+    metadata is deleted, which deletes the dependencies via the field with a cascade.
+    """
+
+    graph_changes = FieldDependencyGraphChanges(get_cached_database_id(instance))
+    graph_changes.delete_link_row_field(instance.id)
+    graph_changes.register()
+
+
+@receiver(post_save, sender=LinkRowField)
+def update_field_dependency_graph_when_link_row_field_saved(
+    sender, instance, created, raw=False, **kwargs
+):
+    """
+    The related field of a link row field can be created or deleted, and the field
+    can be moved to another table, without changing its dependencies. The cached
+    dependency graph must know about it to find the dependants via the related field.
+    """
+
+    if created or raw:
+        return
+
+    graph_changes = FieldDependencyGraphChanges(get_cached_database_id(instance))
+    graph_changes.update_link_row_field(instance)
+    graph_changes.register()
@@ -1,6 +1,7 @@
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     List,
     NoReturn,
@@ -221,6 +222,15 @@ class FieldType(
     allows to update existing rows with imported data instead of adding them.
     """
 
+    can_copy_rows_with_sql = False
+    """
+    Set to True if the database values of this field can be copied as they are to a
+    duplicated table with an `INSERT ... SELECT` statement, instead of being
+    exported and imported. This is not the case if they reference objects that get
+    a new id when duplicated, like select options. Many to many relationships are
+    copied with a separate statement. Formula values are recalculated afterwards.
+    """
+
     def get_default_options_field_name(self):
         """
         Returns the name of the field that stores the default value for the field type.
@@ -566,6 +576,23 @@ class FieldType(
 
         raise NotImplementedError("Each must have his own get_model_field method.")
 
+    def get_copy_encoder(
+        self, instance: Field, model_field: DjangoField
+    ) -> Optional[Callable[[Any], str]]:
+        """
+        Should return a function converting a value of the model field, as returned by
+        its `pre_save` method, to the text format of `COPY ... FROM STDIN`. This is
+        used to insert many rows at once a lot faster than with INSERT statements, see
+        `baserow.contrib.database.db.copy`. If None is returned, the rows of tables
+        containing this field are inserted with INSERT statements instead.
+
+        :param instance: The field instance.
+        :param model_field: The model field of the field instance.
+        :return: The encoder function or None if the field type doesn't support COPY.
+        """
+
+        return None
+
     def has_compatible_model_fields(self, instance, instance2) -> bool:
         """
         Returns True if the provided instances have compatible model fields.
@@ -1245,6 +1272,30 @@ class FieldType(
 
         return value
 
+    def get_export_values(
+        self, values: List[Any], field_object: "FieldObject", rich_value: bool = False
+    ) -> List[Any]:
+        """
+        Converts a batch of values of this field, that are not None, to a form
+        suitable for exporting. This is called once per column for a batch of rows,
+        so field types can overwrite it to convert all values at once. By default
+        `get_export_value` is called for every value, unless the field type doesn't
+        overwrite it, in which case the values are returned as is.
+
+        :param values: The internal values to convert.
+        :param field_object: The field object for the field to extract.
+        :param rich_value: whether a rich value can be exported.
+        :return: A list containing the export value of every provided value.
+        """
+
+        if type(self).get_export_value is FieldType.get_export_value:
+            return list(values)
+
+        return [
+            self.get_export_value(value, field_object, rich_value=rich_value)
+            for value in values
+        ]
+
     def get_human_readable_value(self, value: Any, field_object: "FieldObject") -> str:
         """
         Should convert the value of the provided field to a human readable string for
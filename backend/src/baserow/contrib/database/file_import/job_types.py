@@ -1,5 +1,5 @@
 import json
-from typing import Any
+from typing import IO, Any, Iterable, Iterator, List, Optional, Tuple
 
 from django.core.files.base import ContentFile
 from django.db import transaction
@@ -30,7 +30,7 @@ from baserow.contrib.database.fields.exceptions import (
 )
 from baserow.contrib.database.rows.actions import ImportRowsActionType
 from baserow.contrib.database.rows.exceptions import ReportMaxErrorCountExceeded
-from baserow.contrib.database.rows.types import FileImportDict
+from baserow.contrib.database.rows.types import FileImportConfiguration
 from baserow.contrib.database.table.actions import CreateTableActionType
 from baserow.contrib.database.table.exceptions import (
     InitialTableDataDuplicateName,
@@ -46,6 +46,48 @@ from .serializers import ReportSerializer
 BATCH_SIZE = 1024
 
 
+def get_data_file_content(
+    data: Iterable[List[Any]], configuration: Optional[FileImportConfiguration]
+) -> bytes:
+    """
+    Serializes the data to import as JSON lines. The first line contains the
+    configuration and the number of rows, and every following line contains one row,
+    so that the rows can be read one by one when the import runs.
+
+    :param data: The rows to import.
+    :param configuration: The optional import configuration.
+    :return: The content of the data file.
+    """
+
+    data = list(data)
+    header = {"configuration": configuration, "count": len(data)}
+    return b"".join(
+        json.dumps(line, ensure_ascii=False).encode("utf8") + b"\n"
+        for line in [header, *data]
+    )
+
+
+def read_data_file(
+    fin: IO,
+) -> Tuple[Optional[FileImportConfiguration], int, Iterator[List[Any]]]:
+    """
+    Reads the data file created by `get_data_file_content`. Only the first line is
+    read immediately, the rows are lazily read from the file while iterating over
+    them, so the file must stay open until the import completes. Data files
+    containing one JSON object with all the rows are still supported.
+
+    :param fin: The opened data file.
+    :return: The configuration, the number of rows and an iterator over the rows.
+    """
+
+    header = json.loads(fin.readline())
+    if "data" in header:
+        return header.get("configuration"), len(header["data"]), iter(header["data"])
+
+    rows = (json.loads(line) for line in fin if line.strip())
+    return header["configuration"], header["count"], rows
+
+
 class FileImportJobType(JobType):
     type = "file_import"
     model_class = FileImportJob
@@ -109,10 +151,7 @@ class FileImportJobType(JobType):
         """
 
         data_file = ContentFile(
-            json.dumps(
-                {"data": values["data"], "configuration": values.get("configuration")},
-                ensure_ascii=False,
-            ).encode("utf8")
+            get_data_file_content(values["data"], values.get("configuration"))
         )
         job.data_file.save(None, data_file)
 
@@ -163,35 +202,41 @@ class FileImportJobType(JobType):
     def run(self, job, progress):
         """
         Fills the provided table with the normalized data that needs to be created upon
-        creation of the table.
+        creation of the table. When importing into an existing table, the rows are
+        streamed from the data file, so that they're never all in memory at once.
         """
 
-        with job.data_file.open("r") as fin:
-            data: FileImportDict = json.load(fin)
         try:
-            if job.table is None:
-                new_table, error_report = action_type_registry.get_by_type(
-                    CreateTableActionType
-                ).do(
-                    job.user,
-                    job.database,
-                    name=job.name,
-                    data=data["data"],
-                    first_row_header=job.first_row_header,
-                    progress=progress,
-                )
-
-                job.table = new_table
-                job.save(update_fields=("table",))
-            else:
-                _, error_report = action_type_registry.get_by_type(
-                    ImportRowsActionType
-                ).do(
-                    job.user,
-                    table=job.table,
-                    data=data,
-                    progress=progress,
-                )
+            with job.data_file.open("r") as fin:
+                configuration, count, rows = read_data_file(fin)
+                if job.table is None:
+                    # The fields of the new table depend on all the rows, so they
+                    # must be loaded. The amount can be limited with
+                    # `INITIAL_TABLE_DATA_LIMIT`.
+                    new_table, error_report = action_type_registry.get_by_type(
+                        CreateTableActionType
+                    ).do(
+                        job.user,
+                        job.database,
+                        name=job.name,
+                        data=list(rows),
+                        first_row_header=job.first_row_header,
+                        progress=progress,
+                    )
+
+                    job.table = new_table
+                    job.save(update_fields=("table",))
+                else:
+                    _, error_report = action_type_registry.get_by_type(
+                        ImportRowsActionType
+                    ).do(
+                        job.user,
+                        table=job.table,
+                        data={"data": rows, "configuration": configuration},
+                        progress=progress,
+                        total=count,
+                        return_created_rows=False,
+                    )
         # when a job handler fails, celery worker will not commit and `after_commit`
         # won't be called. That's why we need to catch this specific error and
         # perform a bit of cleanup on the job.
@@ -0,0 +1,59 @@
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+def compress_row_ids(row_ids):
+    ranges = []
+    for row_id in sorted(set(row_ids)):
+        if ranges and ranges[-1] == row_id - 1:
+            ranges[-1] = row_id
+        else:
+            ranges += [row_id, row_id]
+    return ranges
+
+
+def forward(apps, schema_editor):
+    ViewRows = apps.get_model("database", "ViewRows")
+
+    view_rows = list(ViewRows.objects.only("id", "row_ids"))
+    for view_row in view_rows:
+        view_row.row_id_ranges = compress_row_ids(view_row.row_ids)
+    ViewRows.objects.bulk_update(view_rows, ["row_id_ranges"], batch_size=100)
+
+
+def reverse(apps, schema_editor):
+    ViewRows = apps.get_model("database", "ViewRows")
+
+    view_rows = list(ViewRows.objects.only("id", "row_id_ranges"))
+    for view_row in view_rows:
+        ranges = view_row.row_id_ranges
+        view_row.row_ids = [
+            row_id
+            for start, end in zip(ranges[0::2], ranges[1::2])
+            for row_id in range(start, end + 1)
+        ]
+    ViewRows.objects.bulk_update(view_rows, ["row_ids"], batch_size=100)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0204_add_row_exists_not_trashed_function"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="viewrows",
+            name="row_id_ranges",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.PositiveIntegerField(),
+                default=list,
+                help_text="The rows that are shown in the view, compressed as a flat list of inclusive row id ranges. This can be used by webhooks to determine which rows have been changed since the last check.",
+                size=None,
+            ),
+        ),
+        migrations.RunPython(forward, reverse),
+        migrations.RemoveField(
+            model_name="viewrows",
+            name="row_ids",
+        ),
+    ]
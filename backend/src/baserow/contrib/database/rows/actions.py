@@ -346,6 +346,8 @@ class ImportRowsActionType(UndoableActionType):
         table: Table,
         data: FileImportDict,
         progress: Optional[Progress] = None,
+        total: Optional[int] = None,
+        return_created_rows: bool = True,
     ) -> Tuple[List[GeneratedTableModel], Dict[str, Any]]:
         """
         Creates rows for a given table with the provided values if the user
@@ -359,8 +361,12 @@ class ImportRowsActionType(UndoableActionType):
 
         :param user: The user of whose behalf the rows are created.
         :param table: The table for which the rows should be imported.
-        :param data: List of rows values for rows that need to be created.
+        :param data: List or iterable of rows values for rows that need to be created.
         :param progress: An optional progress object to track the task progress.
+        :param total: The number of rows in the data. Must be provided if the data
+            doesn't have a length.
+        :param return_created_rows: If False, only the ids of the created rows are
+            kept in memory and an empty list of rows is returned.
         :return: The created list of rows instances and the error report.
         """
 
@@ -369,12 +375,21 @@ class ImportRowsActionType(UndoableActionType):
                 "Can't create rows because it has a data sync."
             )
 
-        created_rows, error_report = RowHandler().import_rows(
+        created_rows, created_row_ids = [], []
+
+        def on_rows_created(rows: List[GeneratedTableModel]):
+            created_row_ids.extend(row.id for row in rows)
+            if return_created_rows:
+                created_rows.extend(rows)
+
+        _, error_report = RowHandler().import_rows(
             user,
             table,
             data=data["data"],
             configuration=data.get("configuration") or {},
             progress=progress,
+            total=total,
+            on_rows_created=on_rows_created,
         )
         if error_report:
             logger.warning(f"Errors during rows import: {error_report}")
@@ -384,7 +399,7 @@ class ImportRowsActionType(UndoableActionType):
             table.name,
             table.database.id,
             table.database.name,
-            [row.id for row in created_rows],
+            created_row_ids,
         )
         cls.register_action(
             user, params, scope=cls.scope(table.id), workspace=workspace
@@ -6,6 +6,7 @@ from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Iterable,
     List,
@@ -31,6 +32,7 @@ from django.utils.encoding import force_str
 from celery.utils import chunks
 from opentelemetry import metrics, trace
 
+from baserow.contrib.database.db.copy import bulk_copy_create
 from baserow.contrib.database.field_rules.handlers import FieldRuleHandler
 from baserow.contrib.database.fields.dependencies.handler import FieldDependencyHandler
 from baserow.contrib.database.fields.dependencies.update_collector import (
@@ -1391,7 +1393,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         try:
             with transaction.atomic():
-                inserted_rows = model.objects.bulk_create(rows)
+                inserted_rows = bulk_copy_create(model, rows)
         except Exception as exc:
             inserted_rows = []
             if is_unique_violation_error(exc):
@@ -1428,7 +1430,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         for field_name, values in many_to_many.items():
             through = getattr(model, field_name).through
-            through.objects.bulk_create(values)
+            bulk_copy_create(through, values)
 
         _, dependant_fields = self.update_dependencies_of_rows_created(
             model,
@@ -1686,6 +1688,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         table: Table,
         rows: List[Dict[str, Any]],
         progress: Optional[Progress] = None,
+        model: Optional[Type[GeneratedTableModel]] = None,
     ) -> Dict[str, Dict[str, Any]]:
         """
         Validates rows by batch and generates an error report.
@@ -1694,6 +1697,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param table: The table for which the rows should be created.
         :param rows: List of rows values for rows that need to be created.
         :param progress: Give a progress instance to track the progress of the import.
+        :param model: Optional model to prevent recomputing table model.
         :return: The error report.
         """
 
@@ -1709,7 +1713,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         if progress:
             progress.increment(state=ROW_IMPORT_VALIDATION)
 
-        model = table.get_model()
+        if model is None:
+            model = table.get_model()
         # Use serializer to validate incoming data
         validation_serializer = get_row_serializer_class(model)
         report = {}
@@ -1867,11 +1872,13 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         self,
         user: AbstractUser,
         table: Table,
-        data: list[list[Any]],
+        data: Iterable[list[Any]],
         configuration: FileImportConfiguration | None = None,
         validate: bool = True,
         progress: Optional[Progress] = None,
         send_realtime_update: bool = True,
+        total: Optional[int] = None,
+        on_rows_created: Optional[Callable[[List[GeneratedTableModel]], None]] = None,
     ) -> Tuple[List[GeneratedTableModel], Dict[str, Dict[str, Any]]]:
         """
         Creates new rows for a given table if the user belongs to the related
@@ -1881,15 +1888,25 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         stop the import. Instead an error report is created with the raised
         error for each field of each failing rows.
 
+        The data is validated and created in chunks of `BATCH_SIZE` rows, so any
+        iterable can be provided, for example one that streams the rows from a file,
+        without ever having all the rows in memory.
+
         :param user: The user of whose behalf the rows are created.
         :param table: The table for which the rows should be created.
-        :param data: List of rows values for rows that need to be created.
+        :param data: List or iterable of rows values for rows that need to be created.
         :param configuration: Optional import configuration dict.
         :param validate: If True the data are validated before the import.
         :param progress: Give a progress instance to track the progress of the
             import.
         :param send_realtime_update: The parameter passed to the rows_created
             signal indicating if a realtime update should be send.
+        :param total: The number of rows in data. Must be provided if data doesn't
+            have a length.
+        :param on_rows_created: Optional function that's called with the created rows
+            of every chunk. If provided, the created rows are not collected and an
+            empty list is returned instead, so that they can be discarded after every
+            chunk.
 
         :raises InvalidRowLength:
 
@@ -1905,7 +1922,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         )
         model = table.get_model()
 
-        error_report = RowErrorReport(data)
+        if total is None:
+            total = len(data)
+
         configuration = configuration or {}
         update_handler = UpsertRowsMappingHandler(
             table=table,
@@ -1934,84 +1953,77 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         # Sort by primary first (descending), then by order, then by id
         fields.sort(key=lambda f: (not f.primary, f.order, f.id))
-
-        for index, row in enumerate(data):
-            # Check row length
-            if len(row) > len(fields):
-                error_report.add_error(
-                    index,
-                    {"non_field_errors": ["Too many values in this line."]},
-                )
-            else:
-                new_row = list(row)
-                # Fill incomplete rows with empty values
-                new_row.extend([None] * (len(fields) - len(row)))
-
-                # Reshape data by field as expected by the import
-                error_report.update_row(
-                    index,
-                    {
-                        f"field_{fields[index].id}": value
-                        for index, value in enumerate(new_row)
-                    },
-                )
-
-        # STEP 1: pre-validate data with serializer
-        if validate:
-            (
-                valid_rows,
-                original_row_index_mapping,
-            ) = error_report.get_valid_rows_and_mapping()
-
-            validation_sub_progress = (
-                progress.create_child(50, len(valid_rows)) if progress else None
-            )
-
-            validation_report = self.validate_rows(
-                table, valid_rows, progress=validation_sub_progress
-            )
-
-            for index, error in validation_report.items():
-                error_report.add_error(original_row_index_mapping[int(index)], error)
-
-        (
-            valid_rows,
-            original_row_index_mapping,
-        ) = error_report.get_valid_rows_and_mapping()
-
-        # STEP 2: create rows in DB
-        creation_sub_progress = (
-            progress.create_child(50 if validate else 100, len(valid_rows))
-            if progress
-            else None
-        )
+        field_names = [f"field_{field.id}" for field in fields]
 
         # Make sure to exclude fields that cannot be written by the user.
-        # NOTE: all rows contain the same fields, so we can just check the first one
+        # NOTE: all rows contain the same fields, so we can just check one.
         unwritable_fields = self._check_write_fields_values_permissions(
-            user, model, valid_rows[:1], raise_if_not_permitted=False
+            user,
+            model,
+            [dict.fromkeys(field_names)],
+            raise_if_not_permitted=False,
         )
         unwritable_field_names = set(f.db_column for f in unwritable_fields)
-        valid_rows = [
-            {k: v for k, v in row.items() if k not in unwritable_field_names}
-            for row in valid_rows
-        ]
+        skipped_field_names = {field.db_column for field in skipped_fields}
 
-        # split rows to insert and update lists. If there's no upsert field selected,
-        # this will not populate rows_values_to_update.
+        # Split rows to insert and update lists. If there's no upsert field selected,
+        # this will be empty and all the rows are created.
         update_map = update_handler.process_map
 
-        rows_values_to_create = []
-        rows_values_to_update = []
-        if update_map:
-            skipped_field_names = set()
+        validation_sub_progress = (
+            progress.create_child(50, total) if progress and validate else None
+        )
+        creation_sub_progress = (
+            progress.create_child(50 if validate else 100, total) if progress else None
+        )
+
+        error_report = RowErrorReport()
+        created_rows = []
+        if on_rows_created is None:
+            on_rows_created = created_rows.extend
 
-            if skipped_fields:
-                skipped_field_names = {field.db_column for field in skipped_fields}
+        for count, chunk in enumerate(grouper(BATCH_SIZE, data)):
+            row_start_index = count * BATCH_SIZE
 
-            for current_idx, import_idx in original_row_index_mapping.items():
-                row = valid_rows[current_idx]
-                if update_idx := update_map.get(import_idx):
+            # Reshape data by field as expected by the import
+            rows = {}
+            for index, row in enumerate(chunk, start=row_start_index):
+                # Check row length
+                if len(row) > len(fields):
+                    error_report.add_error(
+                        index,
+                        {"non_field_errors": ["Too many values in this line."]},
+                    )
+                else:
+                    # Fill incomplete rows with empty values
+                    rows[index] = {
+                        name: row[field_index] if field_index < len(row) else None
+                        for field_index, name in enumerate(field_names)
+                    }
+
+            # STEP 1: pre-validate data with serializer
+            if validate:
+                if validation_sub_progress:
+                    validation_sub_progress.increment(len(chunk) - len(rows))
+
+                validation_report = self.validate_rows(
+                    table,
+                    list(rows.values()),
+                    progress=validation_sub_progress,
+                    model=model,
+                )
+                indexes = list(rows.keys())
+                for index, error in validation_report.items():
+                    error_report.add_error(indexes[int(index)], error)
+
+            # STEP 2: create rows in DB
+            rows_values_to_create, rows_values_to_create_indexes = [], []
+            rows_values_to_update, rows_values_to_update_indexes = [], []
+            for index, row in rows.items():
+                if error_report.has_error(index):
+                    continue
+                row = {k: v for k, v in row.items() if k not in unwritable_field_names}
+                if update_idx := update_map.get(index):
                     # For upsert operations, filter out skipped fields that were
                     # explicitly marked to be ignored during import. This ensures
                     # that existing values in those fields are preserved in the
@@ -2021,42 +2033,47 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
                     }
                     filtered_row["id"] = update_idx
                     rows_values_to_update.append(filtered_row)
+                    rows_values_to_update_indexes.append(index)
                 else:
                     rows_values_to_create.append(row)
-        else:
-            rows_values_to_create = valid_rows
+                    rows_values_to_create_indexes.append(index)
 
-        created_rows, creation_report = self.force_create_rows_by_batch(
-            user,
-            table,
-            rows_values_to_create,
-            progress=creation_sub_progress,
-            model=model,
-        )
+            if creation_sub_progress:
+                creation_sub_progress.increment(
+                    len(chunk) - len(rows_values_to_create) - len(rows_values_to_update)
+                )
 
-        if rows_values_to_update:
-            updated_rows, updated_report = self.force_update_rows_by_batch(
+            chunk_created_rows, creation_report = self.force_create_rows_by_batch(
                 user,
                 table,
-                rows_values_to_update,
+                rows_values_to_create,
                 progress=creation_sub_progress,
                 model=model,
             )
+            on_rows_created(chunk_created_rows)
 
-        # Add errors to global report
-        for index, error in creation_report.items():
-            error_report.add_error(
-                original_row_index_mapping[int(index)],
-                error,
-            )
-
-        if rows_values_to_update:
-            for index, error in updated_report.items():
+            # Add errors to global report
+            for index, error in creation_report.items():
                 error_report.add_error(
-                    original_row_index_mapping[int(index)],
+                    rows_values_to_create_indexes[int(index)],
                     error,
                 )
 
+            if rows_values_to_update:
+                _, updated_report = self.force_update_rows_by_batch(
+                    user,
+                    table,
+                    rows_values_to_update,
+                    progress=creation_sub_progress,
+                    model=model,
+                )
+
+                for index, error in updated_report.items():
+                    error_report.add_error(
+                        rows_values_to_update_indexes[int(index)],
+                        error,
+                    )
+
         if send_realtime_update:
             # Just send a single table_updated here as realtime update instead
             # of rows_created because we might import a lot of rows.
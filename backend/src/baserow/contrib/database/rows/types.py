@@ -24,7 +24,7 @@ class FileImportConfiguration(TypedDict):
 
 
 class FileImportDict(TypedDict):
-    data: list[list[Any]]
+    data: Iterable[list[Any]]
     configuration: FileImportConfiguration | None
 
 
@@ -36,6 +36,12 @@ class RespectSendWebhookEvents:
 
 
 class RowsEventType(RespectSendWebhookEvents, WebhookEventType):
+    merged_payload_keys = ("items", "old_items")
+    """
+    The keys of the payload containing the list of rows that are concatenated when
+    the payloads of multiple queued events are merged.
+    """
+
     def get_row_serializer(self, webhook, model):
         return get_row_serializer_class(
             model,
@@ -223,6 +229,49 @@ class RowsEventType(RespectSendWebhookEvents, WebhookEventType):
 
         return payload, remaining
 
+    def merge_payloads(
+        self,
+        payload: Dict[str, Any],
+        other_payload: Dict[str, Any],
+        max_items: int,
+    ) -> Dict[str, Any] | None:
+        """
+        Merges the rows of two events of the same table into one payload, as long as
+        the merged payload doesn't exceed `max_items` rows. Events of related tables
+        and paginated payloads are never merged because their rows are only fetched
+        when the call is made. The ids of all the merged events are added to the
+        `merged_event_ids` key of the payload.
+        """
+
+        if any(
+            key in p
+            for p in (payload, other_payload)
+            for key in ("item_ids", "batch_id")
+        ):
+            return None
+
+        list_keys = [key for key in self.merged_payload_keys if key in payload]
+        ignored_keys = {"event_id", "merged_event_ids", *list_keys}
+        other_keys = set(payload.keys()) - ignored_keys
+        if (
+            not list_keys
+            or other_keys != set(other_payload.keys()) - ignored_keys
+            or any(key not in other_payload for key in list_keys)
+            or any(payload[key] != other_payload[key] for key in other_keys)
+        ):
+            return None
+
+        if len(payload[list_keys[0]]) + len(other_payload[list_keys[0]]) > max_items:
+            return None
+
+        merged = dict(payload)
+        for key in list_keys:
+            merged[key] = payload[key] + other_payload[key]
+        merged["merged_event_ids"] = payload.get(
+            "merged_event_ids", [payload["event_id"]]
+        ) + other_payload.get("merged_event_ids", [other_payload["event_id"]])
+        return merged
+
     def _get_filters_for_webhooks_to_call(
         self, model: GeneratedTableModel, table: Table, **kwargs
     ) -> Q:
@@ -433,6 +482,7 @@ class RowsUpdatedEventType(RowsEventType):
 class RowsDeletedEventType(RowsEventType):
     type = "rows.deleted"
     signal = rows_deleted
+    merged_payload_keys = ("row_ids",)
 
     def get_default_payload(self, event_id, webhook, table, model, rows, **kwargs):
         payload = WebhookEventType.get_payload(self, event_id, webhook, **kwargs)
@@ -12,11 +12,12 @@ state should be temporary, and they will be migrated to search data tables event
 
 """
 
+import time
 from collections import defaultdict
 from datetime import datetime, timezone
 from enum import Enum
 from functools import lru_cache
-from typing import TYPE_CHECKING, Iterable, List
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Optional, Set
 from uuid import uuid4
 
 from django.conf import settings
@@ -24,10 +25,12 @@ from django.contrib.postgres.search import SearchQuery
 from django.db import IntegrityError, ProgrammingError, connection, router, transaction
 from django.db.backends.base.schema import BaseDatabaseSchemaEditor
 from django.db.models import (
+    Count,
     DateTimeField,
     Expression,
     F,
     Func,
+    Min,
     Model,
     Q,
     QuerySet,
@@ -39,7 +42,7 @@ from django.utils.encoding import force_str
 
 from django_cte import With
 from loguru import logger
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 
 from baserow.contrib.database.db.schema import safe_django_schema_editor
 from baserow.contrib.database.fields.field_filters import FILTER_TYPE_OR, FilterBuilder
@@ -58,13 +61,32 @@ from baserow.contrib.database.search.regexes import (
 from baserow.contrib.database.search.tasks import schedule_update_search_data
 from baserow.contrib.database.table.cache import invalidate_table_in_model_cache
 from baserow.core.psycopg import errors
-from baserow.core.telemetry.utils import baserow_trace_methods
+from baserow.core.telemetry.utils import add_baserow_trace_attrs, baserow_trace_methods
 from baserow.core.utils import to_camel_case
 
 if TYPE_CHECKING:
     from baserow.contrib.database.table.models import Table
 
 tracer = trace.get_tracer(__name__)
+meter = metrics.get_meter(__name__)
+pending_search_updates_histogram = meter.create_histogram(
+    "baserow.search.pending_updates",
+    unit="1",
+    description="The number of pending search data updates of a table when they "
+    "start to be processed.",
+)
+pending_search_updates_lag_histogram = meter.create_histogram(
+    "baserow.search.pending_updates_lag",
+    unit="s",
+    description="The age of the oldest pending search data update of a table when "
+    "the updates start to be processed.",
+)
+search_update_batch_duration_histogram = meter.create_histogram(
+    "baserow.search.update_batch_duration",
+    unit="ms",
+    description="The time it took to update the search data of a batch of pending "
+    "row updates.",
+)
 
 
 class SearchMode(str, Enum):
@@ -177,6 +199,38 @@ class SearchDatabaseSchemaEditor(BaseDatabaseSchemaEditor):
     sql_delete_table = "DROP TABLE IF EXISTS %(table)s CASCADE"
 
 
+class PendingSearchDataUpdates:
+    """
+    Collects the search data updates scheduled for a table during a transaction, so
+    that when it commits only one task is scheduled per set of updated fields, instead
+    of one for every change made to the rows of the table.
+    """
+
+    def __init__(self, table_id: int):
+        self.table_id = table_id
+        # None as key means all fields, and None as value means all rows.
+        self.row_ids_per_field_ids: Dict[
+            Optional[FrozenSet[int]], Optional[Set[int]]
+        ] = {}
+
+    def add(self, field_ids: List[int] | None, row_ids: List[int] | None):
+        key = frozenset(field_ids) if field_ids is not None else None
+        if row_ids is None:
+            self.row_ids_per_field_ids[key] = None
+        elif key not in self.row_ids_per_field_ids:
+            self.row_ids_per_field_ids[key] = set(row_ids)
+        elif self.row_ids_per_field_ids[key] is not None:
+            self.row_ids_per_field_ids[key].update(row_ids)
+
+    def __call__(self):
+        for field_ids, row_ids in self.row_ids_per_field_ids.items():
+            schedule_update_search_data.delay(
+                self.table_id,
+                sorted(field_ids) if field_ids is not None else None,
+                sorted(row_ids) if row_ids is not None else None,
+            )
+
+
 class SearchHandler(
     metaclass=baserow_trace_methods(
         tracer, exclude=["full_text_enabled", "search_config"]
@@ -526,9 +580,24 @@ class SearchHandler(
         if fields:
             field_ids = [f.id for f in fields]
 
-        transaction.on_commit(
-            lambda: schedule_update_search_data.delay(table.id, field_ids, row_ids)
-        )
+        # Merge the updates into the ones already scheduled for the table in this
+        # transaction, if they can't be discarded by rolling back a savepoint that
+        # doesn't contain this change.
+        connection = transaction.get_connection()
+        if connection.in_atomic_block:
+            savepoint_ids = set(connection.savepoint_ids)
+            for sids, callback, _ in reversed(connection.run_on_commit):
+                if (
+                    isinstance(callback, PendingSearchDataUpdates)
+                    and callback.table_id == table.id
+                    and sids <= savepoint_ids
+                ):
+                    callback.add(field_ids, row_ids)
+                    return
+
+        pending_updates = PendingSearchDataUpdates(table.id)
+        pending_updates.add(field_ids, row_ids)
+        transaction.on_commit(pending_updates)
 
     @classmethod
     def mark_search_data_for_deletion(
@@ -866,7 +935,8 @@ class SearchHandler(
         1. Full‐field updates (row_id=None): rebuilds the search index for an entire
            field.
         2. Row‐specific updates: groups updates for remaining fields into batches and
-           refreshes only affected cells.
+           refreshes only affected cells, oldest first. The size of the batches is
+           adapted to stay within `PG_FULLTEXT_SEARCH_UPDATE_BATCH_TARGET_MS`.
 
         :param table: The Table whose pending search updates will be handled.
         """
@@ -876,6 +946,8 @@ class SearchHandler(
             .order_by()
             .values_list("id", flat=True)
         )
+        cls._record_pending_search_updates(table, table_field_ids)
+
         full_field_updates = (
             PendingSearchValueUpdate.objects.filter(
                 field_id__in=table_field_ids, row_id=None
@@ -905,30 +977,119 @@ class SearchHandler(
                     )
 
         def _fetch_next_batch() -> QuerySet[PendingSearchValueUpdate]:
+            # The oldest updates go first, so that rows that keep changing can't
+            # delay the other updates indefinitely.
             return PendingSearchValueUpdate.objects.filter(
                 field_id__in=table_field_ids, row_id__isnull=False
-            ).order_by("-updated_on")
+            ).order_by("updated_on")
 
         # Now handle single-cells updates, grouping them for efficiency
+        count = settings.BATCH_ROWS_SIZE_LIMIT
         last = False
         while not last:
+            start = time.perf_counter()
             with transaction.atomic():
-                count = settings.BATCH_ROWS_SIZE_LIMIT
                 pending_cells_updates = _fetch_next_batch()[:count]
                 check_timestamp = datetime.now(tz=timezone.utc)
                 if len(pending_cells_updates) < count:
                     last = True
 
-                field_ids, row_ids, update_ids = set(), set(), []
+                field_ids_per_row_id, update_ids = defaultdict(set), []
                 for cell_update in pending_cells_updates:
-                    field_ids.add(cell_update.field_id)
-                    row_ids.add(cell_update.row_id)
+                    field_ids_per_row_id[cell_update.row_id].add(cell_update.field_id)
                     update_ids.append(cell_update.id)
 
                 if update_ids:
-                    cls.update_search_data(
-                        table, field_ids=list(field_ids), row_ids=list(row_ids)
-                    )
+                    for field_ids, row_ids in cls._group_pending_cells_updates(
+                        field_ids_per_row_id
+                    ):
+                        cls.update_search_data(
+                            table, field_ids=field_ids, row_ids=row_ids
+                        )
                     cls.delete_pending_updates(
                         Q(id__in=update_ids, updated_on__lte=check_timestamp)
                     )
+
+            if update_ids:
+                duration = (time.perf_counter() - start) * 1000
+                search_update_batch_duration_histogram.record(
+                    duration, {"table_id": table.id}
+                )
+                count = cls._get_next_batch_size(count, duration)
+
+    @classmethod
+    def _record_pending_search_updates(cls, table: "Table", field_ids: List[int]):
+        """
+        Records how many search data updates are pending for the table and how long
+        the oldest one has been waiting, so that it's visible when the search data
+        can't keep up with the changes made to the table.
+        """
+
+        pending = PendingSearchValueUpdate.objects.filter(
+            field_id__in=field_ids
+        ).aggregate(count=Count("id"), oldest=Min("updated_on"))
+        lag = 0.0
+        if pending["oldest"] is not None:
+            lag = (datetime.now(tz=timezone.utc) - pending["oldest"]).total_seconds()
+
+        attributes = {"table_id": table.id}
+        pending_search_updates_histogram.record(pending["count"], attributes)
+        pending_search_updates_lag_histogram.record(max(lag, 0.0), attributes)
+        add_baserow_trace_attrs(
+            table_id=table.id,
+            pending_search_updates=pending["count"],
+            pending_search_updates_lag=lag,
+        )
+
+    @classmethod
+    def _group_pending_cells_updates(
+        cls, field_ids_per_row_id: Dict[int, Set[int]]
+    ) -> List[tuple[List[int], List[int]]]:
+        """
+        Groups the pending cell updates in `(field_ids, row_ids)` pairs, so that only
+        the cells that actually changed are updated, instead of every combination of
+        the changed fields and rows. The rows are grouped by the set of fields that
+        changed, unless that results in more groups than grouping the rows per field.
+
+        :param field_ids_per_row_id: The ids of the changed fields for every row id.
+        :return: A list of field ids and row ids pairs to update.
+        """
+
+        row_ids_per_field_ids = defaultdict(list)
+        row_ids_per_field_id = defaultdict(list)
+        for row_id, field_ids in field_ids_per_row_id.items():
+            row_ids_per_field_ids[frozenset(field_ids)].append(row_id)
+            for field_id in field_ids:
+                row_ids_per_field_id[field_id].append(row_id)
+
+        if len(row_ids_per_field_ids) <= len(row_ids_per_field_id):
+            return [
+                (sorted(field_ids), sorted(row_ids))
+                for field_ids, row_ids in row_ids_per_field_ids.items()
+            ]
+        return [
+            ([field_id], sorted(row_ids))
+            for field_id, row_ids in sorted(row_ids_per_field_id.items())
+        ]
+
+    @classmethod
+    def _get_next_batch_size(cls, batch_size: int, duration: float) -> int:
+        """
+        Returns the number of pending cell updates to process in the next batch, so
+        that it takes about `PG_FULLTEXT_SEARCH_UPDATE_BATCH_TARGET_MS`. The size
+        changes by a factor of two at most, to not overreact to a single slow batch.
+
+        :param batch_size: The number of updates processed in the last batch.
+        :param duration: The time in milliseconds the last batch took.
+        :return: The size of the next batch.
+        """
+
+        target = settings.PG_FULLTEXT_SEARCH_UPDATE_BATCH_TARGET_MS
+        factor = min(max(target / max(duration, 1), 0.5), 2)
+        return min(
+            max(
+                int(batch_size * factor),
+                settings.PG_FULLTEXT_SEARCH_UPDATE_MIN_BATCH_SIZE,
+            ),
+            settings.PG_FULLTEXT_SEARCH_UPDATE_MAX_BATCH_SIZE,
+        )
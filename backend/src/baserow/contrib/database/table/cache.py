@@ -12,24 +12,56 @@ When we construct a model we:
 3. Check if the version in the cache matches the latest table version in the db.
 4. If they differ, re-query for all the fields and save them in the cache.
 5. If they are the same use the cached field attrs.
+
+On top of that, every process keeps a bounded LRU of fully generated model classes
+keyed by `(table_id, table.version, BASEROW_VERSION, ...)`. Building a model class
+out of the cached field attrs is still expensive for wide tables, so when the table
+version didn't change since the last time the model was built in this process, the
+already generated class is reused. Because a model embeds the models of the tables it's
+linked to, the versions of these tables when the model was generated are stored with it,
+and the model is only reused if they didn't change either.
 """
 
+import copy
+import threading
 import typing
 import uuid
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Type
 
 from django.conf import settings
 from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
 
+from asgiref.local import Local
+from opentelemetry import metrics
+
 from baserow.core.cache import local_cache
 from baserow.version import VERSION as BASEROW_VERSION
 
 if typing.TYPE_CHECKING:
-    from baserow.contrib.database.table.models import Table
+    from baserow.contrib.database.table.models import GeneratedTableModel, Table
 
 generated_models_cache = caches[settings.GENERATED_MODEL_CACHE_NAME]
 
+meter = metrics.get_meter(__name__)
+generated_models_lru_hits_counter = meter.create_counter(
+    "baserow.table_model_cache.hits",
+    unit="1",
+    description="The number of generated table models served from the process cache.",
+)
+generated_models_lru_misses_counter = meter.create_counter(
+    "baserow.table_model_cache.misses",
+    unit="1",
+    description="The number of generated table models that had to be built because "
+    "they were not in the process cache.",
+)
+generated_models_lru_evictions_counter = meter.create_counter(
+    "baserow.table_model_cache.evictions",
+    unit="1",
+    description="The number of generated table models evicted from the process cache.",
+)
+
 
 def table_model_cache_entry_key(table_id: int) -> str:
     return f"full_table_model_{table_id}_{BASEROW_VERSION}"
@@ -54,8 +86,299 @@ def set_cached_model_field_attrs(table: "Table", field_attrs: Dict[str, Any]):
     )
 
 
+class CachedModelTable:
+    """
+    Descriptor used as `baserow_table` attribute of the models in the process cache.
+    The model classes are shared by all the threads, so instead of pointing them to
+    the table instance of one request, every thread gets the table instance it last
+    got the model for.
+    """
+
+    def __init__(self, table: "Table"):
+        self.table = table
+        self._local = Local()
+
+    def set_current(self, table: "Table"):
+        self._local.table = table
+
+    def __get__(self, instance, owner=None) -> "Table":
+        return getattr(self._local, "table", self.table)
+
+
+class CachedModelFieldObjects:
+    """
+    Descriptor used as `_field_objects` and `_trashed_field_objects` attributes of the
+    models in the process cache. The field instances in there can be changed while
+    handling a request, so instead of sharing them between all the threads, every
+    thread gets its own copies each time it gets the model from the cache.
+    """
+
+    def __init__(self, field_objects: Dict[int, Dict[str, Any]]):
+        self.field_objects = field_objects
+        self._local = Local()
+
+    def reset(self):
+        self._local.field_objects = None
+
+    def __get__(self, instance, owner=None) -> Dict[int, Dict[str, Any]]:
+        field_objects = getattr(self._local, "field_objects", None)
+        if field_objects is None:
+            field_objects = {
+                field_id: {**field_object, "field": copy.copy(field_object["field"])}
+                for field_id, field_object in self.field_objects.items()
+            }
+            self._local.field_objects = field_objects
+        return field_objects
+
+
+class GeneratedModelLRUCache:
+    """
+    A thread-safe, process-local LRU cache of generated table model classes.
+
+    The cache is bounded both by the number of models and by the total number of
+    fields of the cached models. Wide tables produce much bigger model classes, so
+    using the number of fields as weight keeps the memory used by the cache roughly
+    bounded, no matter how wide the cached tables are.
+
+    Entries are never updated in place. A schema change bumps the `table.version`,
+    which results in a different key, so stale entries are simply never hit again and
+    eventually evicted. The versions of the linked tables embedded in the model are
+    stored with the entry and checked when it's hit, because their schema changes
+    don't change the version of the table. Entries of a table, and the ones embedding
+    it, are also dropped eagerly when the table is invalidated in this process.
+    """
+
+    def __init__(self, max_size: int, max_fields: int):
+        self.max_size = max_size
+        self.max_fields = max_fields
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[
+            Tuple, Tuple[Type["GeneratedTableModel"], int, Dict[int, str]]
+        ] = OrderedDict()
+        self._total_weight = 0
+        self._lock = threading.RLock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.max_fields > 0
+
+    @staticmethod
+    def get_key(table: "Table") -> Tuple:
+        """
+        Returns the key of the given table. Besides the version, the flags that
+        add extra columns to the model are part of the key because they're not
+        reflected by the table version.
+        """
+
+        return (
+            table.id,
+            table.version,
+            BASEROW_VERSION,
+            table.needs_background_update_column_added,
+            table.created_by_column_added,
+            table.last_modified_by_column_added,
+            table.field_rules_validity_column_added,
+        )
+
+    @staticmethod
+    def get_embedded_table_versions(
+        model: Type["GeneratedTableModel"],
+    ) -> Dict[int, str]:
+        """
+        Returns the versions of the linked tables of which the models are embedded in
+        the provided model, when it was generated.
+        """
+
+        return {
+            embedded_model.baserow_table_id: embedded_model.baserow_table.version
+            for embedded_model in GeneratedModelLRUCache.get_generated_models(model)
+            if embedded_model.baserow_table_id != model.baserow_table_id
+        }
+
+    @staticmethod
+    def get_generated_models(
+        model: Type["GeneratedTableModel"],
+    ) -> Set[Type["GeneratedTableModel"]]:
+        """
+        Returns the provided model and the generated table models embedded in it,
+        without the auto created through models.
+        """
+
+        return {model} | {
+            embedded_model
+            for embedded_model in getattr(model, "baserow_models", {}).values()
+            if getattr(embedded_model, "_generated_table_model", False)
+        }
+
+    @staticmethod
+    def have_embedded_tables_changed(embedded_table_versions: Dict[int, str]) -> bool:
+        if not embedded_table_versions:
+            return False
+
+        from baserow.contrib.database.table.models import Table
+
+        current_versions = dict(
+            Table.objects_and_trash.filter(
+                id__in=embedded_table_versions.keys()
+            ).values_list("id", "version")
+        )
+        return current_versions != embedded_table_versions
+
+    @staticmethod
+    def get_weight(model: Type["GeneratedTableModel"]) -> int:
+        return (
+            len(getattr(model, "_field_objects", {}))
+            + len(getattr(model, "_trashed_field_objects", {}))
+            + 1
+        )
+
+    def get_or_generate(
+        self,
+        table: "Table",
+        generate: Callable[[], Type["GeneratedTableModel"]],
+    ) -> Type["GeneratedTableModel"]:
+        """
+        Returns the cached model of the provided table if the table version matches,
+        otherwise the model is generated by calling `generate` and stored.
+
+        :param table: The table for which the model must be returned. The version
+            must be up-to-date.
+        :param generate: Callable generating the model if it's not cached.
+        :return: The generated model class.
+        """
+
+        key = self.get_key(table)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None and not self.have_embedded_tables_changed(entry[2]):
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                self.hits += 1
+            generated_models_lru_hits_counter.add(1)
+            model = entry[0]
+            # The model could have been generated with another instance of the same
+            # table. Point it to this one for the current thread only, so that
+            # non-schema attributes like the name are up-to-date.
+            model.__dict__["baserow_table"].set_current(table)
+            for embedded_model in self.get_generated_models(model):
+                embedded_model.__dict__["_field_objects"].reset()
+                embedded_model.__dict__["_trashed_field_objects"].reset()
+            return model
+
+        with self._lock:
+            self.misses += 1
+        generated_models_lru_misses_counter.add(1)
+
+        model = generate()
+        embedded_table_versions = self.get_embedded_table_versions(model)
+        model.baserow_table = CachedModelTable(table)
+        for embedded_model in self.get_generated_models(model):
+            embedded_model._field_objects = CachedModelFieldObjects(
+                embedded_model.__dict__["_field_objects"]
+            )
+            embedded_model._trashed_field_objects = CachedModelFieldObjects(
+                embedded_model.__dict__["_trashed_field_objects"]
+            )
+        self.set(key, model, embedded_table_versions)
+        return model
+
+    def set(
+        self,
+        key: Tuple,
+        model: Type["GeneratedTableModel"],
+        embedded_table_versions: Optional[Dict[int, str]] = None,
+    ):
+        weight = self.get_weight(model)
+        if weight > self.max_fields:
+            # This model alone doesn't fit, there is no point in evicting everything
+            # else for it.
+            return
+
+        evicted = 0
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_weight -= previous[1]
+
+            self._entries[key] = (model, weight, embedded_table_versions or {})
+            self._total_weight += weight
+
+            while len(self._entries) > self.max_size or (
+                self._total_weight > self.max_fields
+            ):
+                _, (_, evicted_weight, _) = self._entries.popitem(last=False)
+                self._total_weight -= evicted_weight
+                evicted += 1
+            self.evictions += evicted
+
+        if evicted:
+            generated_models_lru_evictions_counter.add(evicted)
+
+    def invalidate_table(self, table_id: int):
+        """
+        Removes all the cached models of the provided table, and the ones in which the
+        model of the provided table is embedded.
+        """
+
+        with self._lock:
+            for key in [
+                key
+                for key, (_, _, embedded_table_versions) in self._entries.items()
+                if key[0] == table_id or table_id in embedded_table_versions
+            ]:
+                _, weight, _ = self._entries.pop(key)
+                self._total_weight -= weight
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_weight = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "total_fields": self._total_weight,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, table: "Table") -> bool:
+        return self.get_key(table) in self._entries
+
+
+generated_models_lru_cache = GeneratedModelLRUCache(
+    max_size=settings.BASEROW_TABLE_MODEL_LRU_CACHE_SIZE,
+    max_fields=settings.BASEROW_TABLE_MODEL_LRU_CACHE_MAX_FIELDS,
+)
+
+
+def get_cached_model(
+    table: "Table", generate: Callable[[], Type["GeneratedTableModel"]]
+) -> Type["GeneratedTableModel"]:
+    """
+    Returns the model of the table out of the process cache if enabled, or generates
+    it using the `generate` callable otherwise.
+    """
+
+    if settings.BASEROW_DISABLE_MODEL_CACHE or not generated_models_lru_cache.enabled:
+        return generate()
+
+    return generated_models_lru_cache.get_or_generate(table, generate)
+
+
 def clear_generated_model_cache():
     print("Clearing Baserow's internal generated model cache...")
+    generated_models_lru_cache.clear()
     if hasattr(generated_models_cache, "delete_pattern"):
         generated_models_cache.delete_pattern("full_table_model_*")
     elif settings.TESTS:
@@ -77,11 +400,13 @@ def invalidate_table_in_model_cache(table_id: int):
 
     # Delete model local cache
     local_cache.delete(f"database_table_model_{table_id}*")
+    # The models of the linked tables embedding this one are dropped as well. The
+    # other processes notice the new version when they check the versions of the
+    # embedded tables.
+    generated_models_lru_cache.invalidate_table(table_id)
 
     if settings.BASEROW_DISABLE_MODEL_CACHE:
         return None
 
     new_version = str(uuid.uuid4())
-    # Make sure to invalidate ourselves and any directly connected tables.
-
     Table.objects_and_trash.filter(id=table_id).update(version=new_version)
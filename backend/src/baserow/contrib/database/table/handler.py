@@ -1,3 +1,4 @@
+import dataclasses
 import traceback
 from typing import Any, Dict, List, NewType, Optional, Tuple, cast
 
@@ -37,6 +38,7 @@ from baserow.contrib.database.table.expressions import (
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import View
 from baserow.contrib.database.views.view_types import GridViewType
+from baserow.core.db import specific_iterator
 from baserow.core.handler import CoreHandler
 from baserow.core.registries import ImportExportConfig, application_type_registry
 from baserow.core.telemetry.utils import baserow_trace_methods
@@ -76,9 +78,17 @@ tracer = trace.get_tracer(__name__)
 class TableUsageHandler:
     @classmethod
     def calculate_table_storage_usage(cls, table_id):
-        return UserFile.objects.filter(
-            unique__in=BaserowTableFileUniques(table_id)
-        ).aggregate(tot_MB=Coalesce(Sum("size"), 0) / USAGE_UNIT_MB)["tot_MB"]
+        # Identical uploads share the same unique and the same stored file, so only
+        # one user file per unique is counted.
+        stored_user_files = (
+            UserFile.objects.filter(unique__in=BaserowTableFileUniques(table_id))
+            .order_by("unique")
+            .distinct("unique")
+            .values("id")
+        )
+        return UserFile.objects.filter(id__in=stored_user_files).aggregate(
+            tot_MB=Coalesce(Sum("size"), 0) / USAGE_UNIT_MB
+        )["tot_MB"]
 
     @classmethod
     def mark_table_for_usage_update(
@@ -770,10 +780,22 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             is_duplicate=True,
         )
 
-        serialized_tables = database_type.export_tables_serialized([table], config)
+        # The rows don't have to be exported if they can be copied in the database
+        # directly after the new table has been created.
+        copy_rows_with_sql = self._can_copy_table_rows_with_sql(table)
+        export_config = (
+            dataclasses.replace(config, only_structure=True)
+            if copy_rows_with_sql
+            else config
+        )
+        serialized_tables = database_type.export_tables_serialized(
+            [table], export_config
+        )
 
         # Set a unique name for the table to import back as a new one.
         exported_table = serialized_tables[0]
+        if copy_rows_with_sql:
+            exported_table["_copy_rows_from_table"] = table
         exported_table["name"] = self.find_unused_table_name(database, table.name)
         exported_table["order"] = Table.get_last_order(database)
 
@@ -839,6 +861,27 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
 
         return new_table_clone
 
+    def _can_copy_table_rows_with_sql(self, table: Table) -> bool:
+        """
+        Checks if the rows of the table can be copied with `INSERT ... SELECT`
+        statements when it's duplicated, which is the case if every field type
+        supports it.
+
+        :param table: The table that's duplicated.
+        :return: Whether the rows can be copied in the database directly.
+        """
+
+        if (
+            not settings.BASEROW_DUPLICATE_TABLE_ROWS_WITH_SQL
+            or settings.BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT
+        ):
+            return False
+
+        return all(
+            field_type_registry.get_by_model(field).can_copy_rows_with_sql
+            for field in specific_iterator(table.field_set.all())
+        )
+
     def delete_table_by_id(self, user: AbstractUser, table_id: int):
         """
         Moves to the trash an existing an existing table instance if the user
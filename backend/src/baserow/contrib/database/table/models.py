@@ -42,6 +42,7 @@ from baserow.contrib.database.search.handler import (
     SearchMode,
 )
 from baserow.contrib.database.table.cache import (
+    get_cached_model,
     get_cached_model_field_attrs,
     set_cached_model_field_attrs,
 )
@@ -118,9 +119,28 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, BaserowCTEQuerySet):
         )
 
     def count(self):
+        known_count = getattr(self, "_known_count", None)
+        if known_count is not None:
+            return known_count
+
         with cachalot_enabled():
             return super().count()
 
+    def with_known_count(self, count: int) -> "TableModelQuerySet":
+        """
+        Returns a copy of the queryset whose `count` returns the provided count
+        instead of querying the database. This is useful to paginate with a count
+        that was already computed, cached or estimated. Querysets derived from the
+        returned one count their rows normally.
+
+        :param count: The count that must be returned by `count`.
+        :return: The queryset with a known count.
+        """
+
+        clone = self._chain()
+        clone._known_count = count
+        return clone
+
     def enhance_by_fields(
         self, only_field_ids: Optional[List[int]] = None, **kwargs
     ) -> QuerySet:
@@ -940,16 +960,37 @@ class Table(
     @baserow_trace(tracer)
     def get_model(self, **kwargs):
         """
-        Get model from local cache if the kwargs are the default values.
-        See `_get_model` doc for more information.
+        Get model from local cache if the kwargs are the default values. If it's not
+        in the local cache, the process wide generated model cache is checked before
+        generating the model. See `_get_model` doc for more information.
         """
 
         if are_kwargs_default(self._get_model, **kwargs):
             return local_cache.get(
-                f"database_table_model_{self.id}", lambda: self._get_model(**kwargs)
+                f"database_table_model_{self.id}", self._get_process_cached_model
             )
         return self._get_model(**kwargs)
 
+    def _get_process_cached_model(self) -> Type[GeneratedTableModel]:
+        """
+        Returns the full model of this table from the process wide generated model
+        cache, or generates it if the table version has changed since the model
+        was cached.
+        """
+
+        if not settings.BASEROW_DISABLE_MODEL_CACHE:
+            # The version must be up-to-date because it's part of the cache key.
+            self._refresh_version()
+        return get_cached_model(self, self._get_model)
+
+    def _refresh_version(self):
+        # We don't need to refresh the version if it has already been refreshed for
+        # this session.
+        local_cache.get(
+            f"database_table_model_{self.id}_refreshed",
+            lambda: self.refresh_from_db(fields=["version"]),
+        )
+
     def _get_model(
         self,
         fields=None,
@@ -1077,12 +1118,7 @@ class Table(
         )
 
         if use_cache:
-            # We don't need to refresh the version if it has already been refreshed for
-            # this session.
-            local_cache.get(
-                f"database_table_model_{self.id}_refreshed",
-                lambda: self.refresh_from_db(fields=["version"]),
-            )
+            self._refresh_version()
             field_attrs = get_cached_model_field_attrs(self)
         else:
             field_attrs = None
@@ -1,3 +1,8 @@
+from typing import Any, Dict, List, Tuple
+
+from django.db import connections
+from django.db.models import QuerySet
+from django.db.models.sql import UpdateQuery
 from django.db.models.sql.compiler import SQLUpdateCompiler
 from django.db.models.sql.constants import CURSOR, ROW_COUNT
 
@@ -77,3 +82,48 @@ class BaserowCTEQuerySet(CTEQuerySet):
     def update_returning_ids(self, **kwargs):
         self.query.returning_ids = True
         return super().update(**kwargs)
+
+    def update_returning_ids_sql(self, **kwargs) -> Tuple[str, Tuple[Any, ...]]:
+        """
+        Compiles the SQL and params of the `update_returning_ids` query with the
+        provided values, without executing it.
+
+        :raises EmptyResultSet: If the filters of the queryset can never match.
+        """
+
+        queryset = self._chain()
+        queryset.query.returning_ids = True
+        query = queryset.query.chain(UpdateQuery)
+        query.add_update_values(kwargs)
+        query.clear_ordering(force=True)
+        query.annotations = {}
+        return query.get_compiler(queryset.db).as_sql()
+
+
+def update_returning_ids_in_one_statement(
+    updates: List[Tuple[QuerySet, Dict[str, Any]]],
+) -> List[List[int]]:
+    """
+    Executes multiple `update_returning_ids` updates in one round trip, by combining
+    them as data-modifying CTEs of a single statement. All the updates see the same
+    snapshot of the database, so none of them can depend on the result of another,
+    and they must not update the same rows.
+
+    :param updates: A list of tuples containing the queryset to update and the
+        values to update.
+    :return: The list of updated row ids of every update, in the same order.
+    """
+
+    ctes, selects, params = [], [], []
+    for index, (queryset, values) in enumerate(updates):
+        sql, update_params = queryset.update_returning_ids_sql(**values)
+        ctes.append(f"update_{index} AS ({sql})")
+        selects.append(f"SELECT {index}, id FROM update_{index}")  # noqa: S608
+        params.extend(update_params)
+
+    results = [[] for _ in updates]
+    with connections[updates[0][0].db].cursor() as cursor:
+        cursor.execute(f"WITH {', '.join(ctes)} {' UNION ALL '.join(selects)}", params)
+        for index, row_id in cursor.fetchall():
+            results[index].append(row_id)
+    return results
@@ -125,6 +125,21 @@ class AggregationTypeAlreadyRegistered(InstanceTypeAlreadyRegistered):
     """Raised when trying to register an aggregation type that exists already."""
 
 
+class IncrementalAggregationNotPossible(Exception):
+    """
+    Raised when a cached aggregation value can't be updated with the values of the
+    changed rows, and must be recomputed over all the rows of the view instead.
+    """
+
+
+class RowCountModeDoesNotExist(InstanceTypeDoesNotExist):
+    """Raised when trying to get a row count mode that does not exist."""
+
+
+class RowCountModeAlreadyRegistered(InstanceTypeAlreadyRegistered):
+    """Raised when trying to register a row count mode that exists already."""
+
+
 class DecoratorValueProviderTypeDoesNotExist(InstanceTypeDoesNotExist):
     """Raised when trying to get a decorator value provider type that does not exist."""
 
@@ -12,7 +12,7 @@ from django.contrib.auth.models import AbstractUser, AnonymousUser
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist, ValidationError
-from django.db import connection
+from django.db import connection, transaction
 from django.db import models as django_models
 from django.db.models import Count, Q
 from django.db.models.expressions import OrderBy
@@ -105,6 +105,7 @@ from .exceptions import (
     CannotShareViewTypeError,
     DecoratorValueProviderTypeNotCompatible,
     FieldAggregationNotSupported,
+    IncrementalAggregationNotPossible,
     NoAuthorizationToPubliclySharedView,
     UnrelatedFieldError,
     ViewDecorationDoesNotExist,
@@ -141,6 +142,7 @@ from .models import (
 from .registries import (
     decorator_type_registry,
     decorator_value_provider_type_registry,
+    row_count_mode_registry,
     view_aggregation_type_registry,
     view_filter_type_registry,
     view_type_registry,
@@ -170,7 +172,12 @@ from .signals import (
     view_updated,
     views_reordered,
 )
-from .utils import AnnotatedAggregation, DistributionAggregation
+from .utils import (
+    AnnotatedAggregation,
+    DistributionAggregation,
+    RowCount,
+    compress_row_ids,
+)
 from .validators import value_is_empty_for_required_form_field
 
 FieldOptionsDict = Dict[int, Dict[str, Any]]
@@ -1483,6 +1490,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         if not isinstance(updated_fields, list):
             updated_fields = [updated_fields]
 
+        self.clear_row_count_cache({field.table_id for field in updated_fields})
+
         # Call each view types hook
         for view_type in view_type_registry.get_all():
             view_type.after_field_value_update(updated_fields)
@@ -1500,6 +1509,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         if not isinstance(updated_fields, list):
             updated_fields = [updated_fields]
 
+        self.clear_row_count_cache({field.table_id for field in updated_fields})
+
         # Call each view types hook
         for view_type in view_type_registry.get_all():
             view_type.after_field_update(updated_fields)
@@ -2862,6 +2873,13 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return f"aggregation_value__{view.pk}_{name}"
 
+    def _get_aggregation_state_cache_key(self, view: View, name: str):
+        """
+        Returns the aggregation state cache key for the specified view and name.
+        """
+
+        return f"aggregation_state__{view.pk}_{name}"
+
     def _get_aggregation_version_cache_key(self, view: View, name: str):
         """
         Returns the aggregation version cache key for the specified view and name.
@@ -2877,7 +2895,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         view_type = view_type_registry.get_by_model(view.specific_class)
         aggregations = view_type.get_aggregations(view)
         cached_names = [agg[0].db_column for agg in aggregations]
-        self.clear_aggregation_cache(view, cached_names)
+        # The total is included because the cached row count depends on its version.
+        self.clear_aggregation_cache(view, cached_names + ["total"])
 
     def clear_aggregation_cache(self, view: View, names: Union[List[str], str]):
         """
@@ -2895,6 +2914,101 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 # No cache key, we create one
                 cache.set(cache_key, 2)
 
+    def _get_table_rows_version_cache_key(self, table_id: int) -> str:
+        """
+        Returns the cache key of the version of the rows of the specified table.
+        """
+
+        return f"table_rows_version__{table_id}"
+
+    def _get_row_count_cache_key(self, view: View) -> str:
+        """
+        Returns the cached row count key for the specified view.
+        """
+
+        return f"row_count__{view.pk}"
+
+    def clear_row_count_cache(self, table_ids: Iterable[int]):
+        """
+        Increments the rows version of the specified tables, which invalidates the
+        cached row count of all their views.
+
+        :param table_ids: The ids of the tables whose rows have changed.
+        """
+
+        for table_id in table_ids:
+            cache_key = self._get_table_rows_version_cache_key(table_id)
+            try:
+                cache.incr(cache_key, 1)
+            except ValueError:
+                # No cache key, we create one
+                cache.set(cache_key, 2, timeout=None)
+
+    def get_cached_view_row_count(
+        self, view: View
+    ) -> Tuple[Optional[int], Tuple[int, int]]:
+        """
+        Returns the cached row count of the view, if still valid, and the current
+        version. The version is made of the `total` aggregation version of the
+        view, which changes with the filters, and the rows version of the table.
+
+        :param view: The view to get the cached row count for.
+        :return: The cached count, or None if it's not cached or outdated, and the
+            current version that must be used to cache a newly computed count.
+        """
+
+        count_key = self._get_row_count_cache_key(view)
+        view_version_key = self._get_aggregation_version_cache_key(view, "total")
+        table_version_key = self._get_table_rows_version_cache_key(view.table_id)
+        cached = cache.get_many([count_key, view_version_key, table_version_key])
+
+        version = (cached.get(view_version_key, 1), cached.get(table_version_key, 1))
+        cached_count = cached.get(count_key)
+        if cached_count is not None and cached_count["version"] == version:
+            return cached_count["value"], version
+        return None, version
+
+    def set_cached_view_row_count(
+        self, view: View, count: int, version: Tuple[int, int]
+    ):
+        """
+        Caches the row count of the view for the provided version.
+
+        :param view: The view the rows have been counted for.
+        :param count: The exact number of rows of the view.
+        :param version: The version returned by `get_cached_view_row_count` before
+            counting the rows.
+        """
+
+        cache.set(
+            self._get_row_count_cache_key(view),
+            {"value": count, "version": version},
+            timeout=settings.BASEROW_ROW_COUNT_CACHE_TTL_SECONDS,
+        )
+
+    def get_view_row_count(
+        self,
+        view: View,
+        queryset: QuerySet,
+        mode: str = "exact",
+        cacheable: bool = True,
+    ) -> RowCount:
+        """
+        Counts the rows of a view using the provided row count mode.
+
+        :param view: The view to count the rows for.
+        :param queryset: The queryset of the view rows, with all the filters applied.
+        :param mode: The type of the row count mode to use.
+        :param cacheable: Indicates whether the queryset contains only the view
+            filters, so without any adhoc filters or search. Only then the count can
+            be cached for the view.
+        :raises RowCountModeDoesNotExist: When the mode doesn't exist.
+        :return: The number of rows and whether it's exact.
+        """
+
+        row_count_mode = row_count_mode_registry.get(mode)
+        return row_count_mode.count(view, queryset, cacheable)
+
     def _get_aggregations_to_compute(
         self,
         view: View,
@@ -3054,6 +3168,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         # Do we need to compute some aggregations?
         if need_computation or with_total:
+            cacheable = not search and not adhoc_filters.has_any_filters
+            aggregation_states = {} if cacheable else None
             db_result = self.get_field_aggregations(
                 user,
                 view,
@@ -3069,9 +3185,10 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 search_mode=search_mode,
                 skip_perm_check=skip_perm_check,
                 restrict_to_field_ids=visible_field_ids,
+                aggregation_states=aggregation_states,
             )
 
-            if not search and not adhoc_filters.has_any_filters:
+            if cacheable:
                 to_cache = {}
                 for key, value in db_result.items():
                     # We don't cache total value
@@ -3080,6 +3197,13 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                             "value": value,
                             "version": need_computation[key]["version"],
                         }
+                    # The state allows to update the value incrementally when rows
+                    # change.
+                    if aggregation_states.get(key):
+                        to_cache[self._get_aggregation_state_cache_key(view, key)] = {
+                            "value": aggregation_states[key],
+                            "version": need_computation[key]["version"],
+                        }
 
                 # Let's cache the newly computed values
                 cache.set_many(to_cache)
@@ -3110,6 +3234,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         search_mode: Optional[SearchMode] = None,
         skip_perm_check: bool = False,
         restrict_to_field_ids: Optional[Set[int]] = None,
+        aggregation_states: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """
         Returns a dict of aggregation for given (field, aggregation_type) couple list.
@@ -3133,6 +3258,9 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param skip_perm_check: Skips the permission check if not necessary.
         :param restrict_to_field_ids: Restrict the aggregations only to certain
             fields, for example if the aggregation is requested for public views.
+        :param aggregation_states: If provided, the state aggregations of the
+            incremental aggregation types are computed in the same query and their
+            results are added to this dict by field name.
         :raises FieldAggregationNotSupported: When the view type doesn't support
             field aggregation.
         :raises FieldNotInTable: When one of the field doesn't belong to the specified
@@ -3183,6 +3311,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         aggregation_dict = {}
         distribution_dict = {}
+        state_names = defaultdict(list)
 
         for field_instance, aggregation_type_name in aggregations:
             field_name = field_instance.db_column
@@ -3224,14 +3353,284 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 # For any other aggregation type, we can simply execute it as is
                 aggregation_dict[field_name] = aggregation_object
 
+            if aggregation_states is not None and aggregation_type.incremental:
+                state_aggregations = aggregation_type.get_state_aggregations(
+                    field_name, model_field, field
+                )
+                for name, state_aggregation in state_aggregations.items():
+                    aggregation_dict[f"{field_name}_state_{name}"] = state_aggregation
+                    state_names[field_name].append(name)
+
         # Add total to allow further calculation on the client if required
         if with_total:
             aggregation_dict["total"] = Count("id", distinct=True)
 
         aggregations = queryset.aggregate(**aggregation_dict)
+        for field_name, names in state_names.items():
+            aggregation_states[field_name] = {
+                name: aggregations.pop(f"{field_name}_state_{name}") for name in names
+            }
         aggregations.update(distribution_dict)
         return aggregations
 
+    def _get_partial_aggregations(
+        self,
+        view: View,
+        model: GeneratedTableModel,
+        aggregations: List[Tuple[Field, str]],
+        row_ids: List[int],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Computes the incremental aggregations of the provided rows that match the
+        filters of the view.
+
+        :return: A dict of incremental aggregation results by field name.
+        """
+
+        queryset = self.apply_filters(view, model.objects.all().enhance_by_fields())
+        queryset = queryset.filter(id__in=row_ids)
+
+        aggregation_dict = {}
+        names = defaultdict(list)
+        for field_instance, aggregation_type_name in aggregations:
+            field_name = field_instance.db_column
+            field = model._field_objects[field_instance.id]["field"]
+            model_field = model._meta.get_field(field_name)
+            aggregation_type = view_aggregation_type_registry.get(aggregation_type_name)
+            incremental_aggregations = aggregation_type.get_incremental_aggregations(
+                field_name, model_field, field
+            )
+            for name, aggregation in incremental_aggregations.items():
+                if isinstance(aggregation, AnnotatedAggregation):
+                    queryset = queryset.annotate(**aggregation.annotations)
+                    aggregation = aggregation.aggregation
+                aggregation_dict[f"{field_name}_{name}"] = aggregation
+                names[field_name].append(name)
+
+        result = queryset.aggregate(**aggregation_dict)
+        return {
+            field_name: {name: result[f"{field_name}_{name}"] for name in field_names}
+            for field_name, field_names in names.items()
+        }
+
+    def get_incremental_aggregations_snapshot(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        rows: Optional[List[GeneratedTableModel]] = None,
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Collects the valid cached aggregation values of the views of the table that
+        can be updated incrementally. Must be called before the rows are created,
+        updated or deleted. If rows are provided, their incremental aggregations
+        are computed as well, so that they can be subtracted afterwards.
+
+        :param table: The table whose rows are going to change.
+        :param model: The model of the table.
+        :param rows: The rows that are going to be updated or deleted.
+        :return: The snapshot that must be passed to
+            `update_aggregations_incrementally` once the rows have changed.
+        """
+
+        if not settings.BASEROW_INCREMENTAL_VIEW_AGGREGATIONS:
+            return {}
+
+        aggregations_by_view = {}
+        for view_type in view_type_registry.get_all():
+            if view_type.can_aggregate_field:
+                aggregations_by_view.update(view_type.get_table_aggregations(table.id))
+
+        candidates = {}
+        for view, aggregations in aggregations_by_view.items():
+            candidates[view] = [
+                (field, aggregation_type_name)
+                for field, aggregation_type_name in aggregations
+                if field.id in model._field_objects
+                and view_aggregation_type_registry.get(
+                    aggregation_type_name
+                ).incremental
+            ]
+
+        cached_keys = []
+        for view, aggregations in candidates.items():
+            for field, _ in aggregations:
+                cached_keys += [
+                    self._get_aggregation_value_cache_key(view, field.db_column),
+                    self._get_aggregation_state_cache_key(view, field.db_column),
+                    self._get_aggregation_version_cache_key(view, field.db_column),
+                ]
+        cached = cache.get_many(cached_keys) if cached_keys else {}
+
+        snapshot = {}
+        for view, aggregations in candidates.items():
+            valid_aggregations = []
+            for field, aggregation_type_name in aggregations:
+                cached_value = cached.get(
+                    self._get_aggregation_value_cache_key(view, field.db_column)
+                )
+                version = cached.get(
+                    self._get_aggregation_version_cache_key(view, field.db_column), 1
+                )
+                if cached_value is None or cached_value["version"] != version:
+                    continue
+
+                cached_state = cached.get(
+                    self._get_aggregation_state_cache_key(view, field.db_column)
+                )
+                if cached_state is not None and cached_state["version"] == version:
+                    cached_value = {**cached_value, "state": cached_state["value"]}
+                valid_aggregations.append((field, aggregation_type_name, cached_value))
+
+            if valid_aggregations:
+                snapshot[view.id] = {
+                    "view": view,
+                    "aggregations": valid_aggregations,
+                    "removed": {},
+                }
+
+        # Field rules can update other rows than the changed ones, which can't be
+        # tracked here.
+        if not snapshot or table.field_rules.exists():
+            return {}
+
+        if rows:
+            row_ids = [row.id for row in rows]
+            for view_snapshot in snapshot.values():
+                view_snapshot["removed"] = self._get_partial_aggregations(
+                    view_snapshot["view"],
+                    model,
+                    [(f, t) for f, t, _ in view_snapshot["aggregations"]],
+                    row_ids,
+                )
+
+        return snapshot
+
+    def update_aggregations_incrementally(
+        self,
+        snapshot: Optional[Dict[int, Dict[str, Any]]],
+        model: GeneratedTableModel,
+        row_ids: Optional[List[int]] = None,
+        dependant_fields: Optional[List[Field]] = None,
+    ):
+        """
+        Updates the cached aggregation values of the snapshot with the incremental
+        aggregations of the changed rows, instead of leaving them invalidated. This
+        happens when the transaction commits, and a value is only updated if its
+        version has been incremented exactly once since the snapshot, meaning that
+        nothing else has changed in the meantime.
+
+        :param snapshot: The snapshot returned by
+            `get_incremental_aggregations_snapshot` before the rows changed.
+        :param model: The model of the table.
+        :param row_ids: The ids of the rows that have been created or updated. None
+            if the rows have been deleted.
+        :param dependant_fields: The fields whose values have been changed as a
+            consequence of the change of the rows.
+        """
+
+        if not snapshot:
+            return
+
+        # The values of dependant fields, like formulas, and of self referencing link
+        # row fields can also change for other rows than the changed ones.
+        unsafe_field_ids = {
+            field.id
+            for field in dependant_fields or []
+            if field.table_id == model.baserow_table_id
+        } | {
+            field_object["field"].id
+            for field_object in model._field_objects.values()
+            if isinstance(field_object["field"], LinkRowField)
+            and field_object["field"].link_row_table_id
+            == field_object["field"].table_id
+        }
+
+        transaction.on_commit(
+            lambda: self._update_aggregations_incrementally(
+                snapshot, model, row_ids, unsafe_field_ids
+            )
+        )
+
+    def _update_aggregations_incrementally(
+        self,
+        snapshot: Dict[int, Dict[str, Any]],
+        model: GeneratedTableModel,
+        row_ids: Optional[List[int]],
+        unsafe_field_ids: Set[int],
+    ):
+        views_filtered_by_unsafe_fields = set(
+            ViewFilter.objects.filter(
+                view_id__in=snapshot.keys(), field_id__in=unsafe_field_ids
+            ).values_list("view_id", flat=True)
+        )
+
+        versions = cache.get_many(
+            [
+                self._get_aggregation_version_cache_key(
+                    view_snapshot["view"], field.db_column
+                )
+                for view_snapshot in snapshot.values()
+                for field, _, _ in view_snapshot["aggregations"]
+            ]
+        )
+
+        to_cache = {}
+        for view_id, view_snapshot in snapshot.items():
+            if view_id in views_filtered_by_unsafe_fields:
+                continue
+
+            view = view_snapshot["view"]
+            aggregations = [
+                (field, aggregation_type_name, cached_value)
+                for field, aggregation_type_name, cached_value in view_snapshot[
+                    "aggregations"
+                ]
+                if field.id not in unsafe_field_ids
+                and versions.get(
+                    self._get_aggregation_version_cache_key(view, field.db_column)
+                )
+                == cached_value["version"] + 1
+            ]
+            if not aggregations:
+                continue
+
+            added = (
+                self._get_partial_aggregations(
+                    view, model, [(f, t) for f, t, _ in aggregations], row_ids
+                )
+                if row_ids
+                else {}
+            )
+
+            for field, aggregation_type_name, cached_value in aggregations:
+                aggregation_type = view_aggregation_type_registry.get(
+                    aggregation_type_name
+                )
+                try:
+                    value, state = aggregation_type.update_incrementally(
+                        cached_value["value"],
+                        cached_value.get("state", {}),
+                        view_snapshot["removed"].get(field.db_column),
+                        added.get(field.db_column),
+                    )
+                except IncrementalAggregationNotPossible:
+                    continue
+
+                version = cached_value["version"] + 1
+                name = field.db_column
+                to_cache[self._get_aggregation_value_cache_key(view, name)] = {
+                    "value": value,
+                    "version": version,
+                }
+                if state:
+                    to_cache[self._get_aggregation_state_cache_key(view, name)] = {
+                        "value": state,
+                        "version": version,
+                    }
+
+        if to_cache:
+            cache.set_many(to_cache)
+
     def rotate_view_slug(
         self, user: AbstractUser, view: View, slug_field: str = "slug"
     ) -> View:
@@ -3744,14 +4143,17 @@ class ViewSubscriptionHandler:
             row_ids = (
                 ViewHandler()
                 .get_queryset(None, view, model=model, apply_sorts=False)
+                .order_by()
                 .values_list("id", flat=True)
             )
-            view_rows.append(ViewRows(view=view, row_ids=list(row_ids)))
+            view_rows.append(
+                ViewRows(view=view, row_id_ranges=compress_row_ids(row_ids))
+            )
 
         return ViewRows.objects.bulk_create(
             view_rows,
             update_conflicts=True,
-            update_fields=["row_ids"],
+            update_fields=["row_id_ranges"],
             unique_fields=["view_id"],
         )
 
@@ -3819,7 +4221,10 @@ class ViewSubscriptionHandler:
 
     @classmethod
     def notify_table_views_updates(
-        cls, views: list[View], model: GeneratedTableModel | None = None
+        cls,
+        views: list[View],
+        model: GeneratedTableModel | None = None,
+        row_ids: list[int] | None = None,
     ):
         """
         Verify if the views have subscribers and notify them of any changes in the view
@@ -3828,17 +4233,33 @@ class ViewSubscriptionHandler:
         :param views: The views to notify subscribers of.
         :param model: The table model to use for the views. If not provided, the model
             will be generated automatically.
+        :param row_ids: The ids of the only rows that have been changed, if known.
+            This allows to check only these rows instead of all the rows of the
+            views.
         """
 
-        view_ids_with_subscribers = ViewSubscription.objects.filter(
-            view__in=views
-        ).values_list("view_id", flat=True)
-        if view_ids_with_subscribers:
-            cls.notify_table_views(view_ids_with_subscribers, model)
+        view_ids_with_subscribers = list(
+            ViewSubscription.objects.filter(view__in=views).values_list(
+                "view_id", flat=True
+            )
+        )
+        if not view_ids_with_subscribers:
+            return
+
+        # Field rules can update other rows than the changed ones, so all the rows of
+        # the views must be checked.
+        if row_ids is not None and model is not None:
+            if model.baserow_table.field_rules.exists():
+                row_ids = None
+
+        cls.notify_table_views(view_ids_with_subscribers, model, row_ids)
 
     @classmethod
     def notify_table_views(
-        cls, view_ids: list[int], model: GeneratedTableModel | None = None
+        cls,
+        view_ids: list[int],
+        model: GeneratedTableModel | None = None,
+        row_ids: list[int] | None = None,
     ):
         """
         Notify subscribers of any changes in the view results, emitting the appropriate
@@ -3847,6 +4268,9 @@ class ViewSubscriptionHandler:
         :param view_ids: The view ids to notify subscribers of.
         :param model: The table model to use for the views. If not provided, the model
             will be generated automatically
+        :param row_ids: The ids of the only rows that have been changed, if known. If
+            provided, only these rows are evaluated against the view filters instead
+            of executing the queries of the whole views.
         """
 
         view_rows = list(
@@ -3859,9 +4283,19 @@ class ViewSubscriptionHandler:
         if model is None:
             model = view_rows[0].view.table.get_model()
 
+        visible_row_ids_by_view_id = {}
+        if row_ids is not None and view_rows:
+            visible_row_ids_by_view_id = cls._get_visible_row_ids_by_view_id(
+                [view_state.view_id for view_state in view_rows], model, row_ids
+            )
+
         for view_state in view_rows:
             view = view_state.view
-            new_row_ids, row_ids_entered, row_ids_exited = view_state.get_diff(model)
+            new_row_ids, row_ids_entered, row_ids_exited = view_state.get_diff(
+                model,
+                row_ids=row_ids,
+                visible_row_ids=visible_row_ids_by_view_id.get(view.id, set()),
+            )
             changed = False
             if row_ids_entered:
                 rows_entered_view.send(
@@ -3874,5 +4308,43 @@ class ViewSubscriptionHandler:
                 )
                 changed = True
             if changed:
-                view_state.row_ids = new_row_ids
+                view_state.row_id_ranges = new_row_ids
                 view_state.save()
+
+    @classmethod
+    def _get_visible_row_ids_by_view_id(
+        cls, view_ids: list[int], model: GeneratedTableModel, row_ids: list[int]
+    ) -> dict[int, set[int]]:
+        """
+        Checks which of the provided rows currently match the filters of the views,
+        using a single query for all the views.
+
+        :param view_ids: The ids of the views to check the rows in.
+        :param model: The table model of the views.
+        :param row_ids: The ids of the rows to check.
+        :return: A dict with the visible row ids by view id.
+        """
+
+        from .row_checker import FilteredViewRowChecker, FilteredViewRows
+
+        checker = FilteredViewRowChecker(
+            model, View.objects.filter(id__in=view_ids), False
+        )
+
+        existing_row_ids = None
+        visible_row_ids_by_view_id = {}
+        for (
+            view,
+            allowed_row_ids,
+        ) in checker.get_filtered_views_where_row_ids_are_visible(row_ids):
+            if allowed_row_ids is FilteredViewRows.ALL_ROWS_ALLOWED:
+                # Deleted rows are still in the changed rows, but aren't visible.
+                if existing_row_ids is None:
+                    existing_row_ids = set(
+                        model.objects.filter(id__in=row_ids).values_list(
+                            "id", flat=True
+                        )
+                    )
+                allowed_row_ids = existing_row_ids
+            visible_row_ids_by_view_id[view.id] = allowed_row_ids
+        return visible_row_ids_by_view_id
@@ -25,6 +25,12 @@ from baserow.contrib.database.views.registries import (
     view_filter_type_registry,
     view_type_registry,
 )
+from baserow.contrib.database.views.utils import (
+    compress_row_ids,
+    decompress_row_ids,
+    get_row_ids_in_ranges,
+    update_row_id_ranges,
+)
 from baserow.core.db import specific_queryset
 from baserow.core.mixins import (
     CreatedAndUpdatedOnMixin,
@@ -970,31 +976,50 @@ class FormViewFieldOptionsCondition(HierarchicalModelMixin, models.Model):
 
 class ViewRows(CreatedAndUpdatedOnMixin, models.Model):
     view = models.OneToOneField(View, on_delete=models.CASCADE, related_name="rows")
-    row_ids = ArrayField(
+    row_id_ranges = ArrayField(
         models.PositiveIntegerField(),
         default=list,
-        help_text="The rows that are shown in the view. This list can be used by webhooks "
-        "to determine which rows have been changed since the last check.",
+        help_text="The rows that are shown in the view, compressed as a flat list of "
+        "inclusive row id ranges. This can be used by webhooks to determine which "
+        "rows have been changed since the last check.",
     )
 
-    def get_diff(self, model=None):
+    def get_diff(self, model=None, row_ids=None, visible_row_ids=None):
         """
-        Executes the view query and returns the current row IDs in the view,
-        along with the differences between the current state and the last saved state.
+        Returns the current row ID ranges of the view, along with the row IDs that
+        entered and exited the view since the last saved state.
+
+        If `row_ids` is provided, only these rows are compared, because they're the
+        only ones that have changed. `visible_row_ids` must then contain those of
+        them that currently match the view filters. Otherwise, the whole view query
+        is executed.
         """
 
+        if row_ids is not None:
+            previous_row_ids = get_row_ids_in_ranges(self.row_id_ranges, row_ids)
+            row_ids_entered = set(visible_row_ids) - previous_row_ids
+            row_ids_exited = previous_row_ids - set(visible_row_ids)
+            new_ranges = update_row_id_ranges(
+                self.row_id_ranges, row_ids_entered, row_ids_exited
+            )
+            return new_ranges, sorted(row_ids_entered), sorted(row_ids_exited)
+
         from baserow.contrib.database.views.handler import ViewHandler
 
         rows = ViewHandler().get_queryset(
             None, self.view, model=model, apply_sorts=False
         )
-        previous_row_ids = set(self.row_ids)
+        previous_row_ids = set(decompress_row_ids(self.row_id_ranges))
         new_row_ids = set(rows.order_by().values_list("id", flat=True))
 
         row_ids_entered = new_row_ids - previous_row_ids
         row_ids_exited = previous_row_ids - new_row_ids
 
-        return list(new_row_ids), list(row_ids_entered), list(row_ids_exited)
+        return (
+            compress_row_ids(new_row_ids),
+            sorted(row_ids_entered),
+            sorted(row_ids_exited),
+        )
 
 
 class ViewSubscription(models.Model):
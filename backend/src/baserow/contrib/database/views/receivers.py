@@ -1,11 +1,15 @@
 from django.dispatch import receiver
 
+from baserow.contrib.database.fields.models import LinkRowField
 from baserow.contrib.database.fields.signals import (
     field_deleted,
     field_restored,
     field_updated,
 )
 from baserow.contrib.database.rows.signals import (
+    before_rows_create,
+    before_rows_delete,
+    before_rows_update,
     rows_created,
     rows_deleted,
     rows_updated,
@@ -22,20 +26,25 @@ from baserow.contrib.database.views.signals import (
     view_updated,
 )
 
-from .handler import ViewSubscriptionHandler
+from .handler import ViewHandler, ViewSubscriptionHandler
 
 
-def _notify_table_data_updated(table: Table, model: GeneratedTableModel | None = None):
+def _notify_table_data_updated(
+    table: Table,
+    model: GeneratedTableModel | None = None,
+    row_ids: list[int] | None = None,
+):
     """
     Notifies the table views that the table data has been updated. This will result in
     the table views to be updated and the subscribers to be notified.
 
     :param table: The table for which the data has been updated.
     :param model: The model that was updated if available.
+    :param row_ids: The ids of the only rows that have been changed, if known.
     """
 
     ViewSubscriptionHandler.notify_table_views_updates(
-        table.view_set.all(), model=model
+        table.view_set.all(), model=model, row_ids=row_ids
     )
 
 
@@ -52,15 +61,76 @@ def _notify_view_results_updated(view: View):
 
 @receiver([rows_updated, rows_created, rows_deleted])
 def notify_rows_signals(sender, rows, user, table, model, dependant_fields, **kwargs):
-    _notify_table_data_updated(table, model)
-
     updated_tables = set()
     for field in dependant_fields:
         updated_tables.add(field.table)
+
+    # Only the changed rows have to be checked, unless dependant fields or self
+    # referencing link row fields changed the values of other rows of the table.
+    row_ids = [row.id for row in rows]
+    cascade_update = kwargs.get("cascade_update")
+    if cascade_update:
+        row_ids += cascade_update.row_ids
+    if table in updated_tables or any(
+        isinstance(field_object["field"], LinkRowField)
+        and field_object["field"].link_row_table_id == table.id
+        for field_object in model._field_objects.values()
+    ):
+        row_ids = None
+
+    _notify_table_data_updated(table, model, row_ids)
+
+    updated_tables.discard(table)
     for updated_table in updated_tables:
         _notify_table_data_updated(updated_table)
 
 
+@receiver(before_rows_create)
+def snapshot_aggregations_before_rows_create(sender, user, table, model, **kwargs):
+    return ViewHandler().get_incremental_aggregations_snapshot(table, model)
+
+
+@receiver([before_rows_update, before_rows_delete])
+def snapshot_aggregations_before_rows_change(
+    sender, rows, user, table, model, **kwargs
+):
+    return ViewHandler().get_incremental_aggregations_snapshot(table, model, rows)
+
+
+@receiver(rows_created)
+def update_aggregations_after_rows_created(
+    sender, rows, user, table, model, dependant_fields, before_return=None, **kwargs
+):
+    snapshot = dict(before_return or []).get(snapshot_aggregations_before_rows_create)
+    ViewHandler().update_aggregations_incrementally(
+        snapshot, model, [row.id for row in rows], dependant_fields
+    )
+
+
+@receiver(rows_updated)
+def update_aggregations_after_rows_updated(
+    sender, rows, user, table, model, dependant_fields, before_return=None, **kwargs
+):
+    cascade_update = kwargs.get("cascade_update")
+    if cascade_update and cascade_update.row_ids:
+        return
+
+    snapshot = dict(before_return or []).get(snapshot_aggregations_before_rows_change)
+    ViewHandler().update_aggregations_incrementally(
+        snapshot, model, [row.id for row in rows], dependant_fields
+    )
+
+
+@receiver(rows_deleted)
+def update_aggregations_after_rows_deleted(
+    sender, rows, user, table, model, dependant_fields, before_return=None, **kwargs
+):
+    snapshot = dict(before_return or []).get(snapshot_aggregations_before_rows_change)
+    ViewHandler().update_aggregations_incrementally(
+        snapshot, model, None, dependant_fields
+    )
+
+
 @receiver(view_updated)
 def notify_view_updated(sender, view, user, old_view, **kwargs):
     _notify_view_results_updated(view)
@@ -55,6 +55,8 @@ from .exceptions import (
     DecoratorTypeDoesNotExist,
     DecoratorValueProviderTypeAlreadyRegistered,
     DecoratorValueProviderTypeDoesNotExist,
+    RowCountModeAlreadyRegistered,
+    RowCountModeDoesNotExist,
     ViewFilterTypeAlreadyRegistered,
     ViewFilterTypeDoesNotExist,
     ViewOwnershipTypeDoesNotExist,
@@ -66,6 +68,7 @@ if TYPE_CHECKING:
     from baserow.contrib.database.fields.models import Field
     from baserow.contrib.database.table.models import FieldObject, Table
     from baserow.contrib.database.views.models import FormView, View
+    from baserow.contrib.database.views.utils import AnnotatedAggregation, RowCount
 
 
 class ViewType(
@@ -719,6 +722,20 @@ class ViewType(
             "`get_aggregations` method."
         )
 
+    def get_table_aggregations(
+        self, table_id: int
+    ) -> Dict["View", List[Tuple[django_models.Field, str]]]:
+        """
+        Returns the aggregations of all the views of this type in the specified
+        table, by view. Used to incrementally update the cached aggregation values
+        when rows change.
+
+        :param table_id: The id of the table to get the view aggregations for.
+        :return: A dict of view to a list of tuple (Field, aggregation_type).
+        """
+
+        return {}
+
     def after_field_value_update(
         self, updated_fields: Union[Iterable["Field"], "Field"]
     ):
@@ -1107,6 +1124,13 @@ class ViewAggregationType(Instance):
 
     allowed_in_view = True
 
+    incremental = False
+    """
+    Indicates whether a cached value of this aggregation can be updated with the
+    values of the created, updated or deleted rows, instead of being recomputed over
+    all the rows of the view.
+    """
+
     def get_aggregation(
         self,
         field_name: str,
@@ -1148,6 +1172,71 @@ class ViewAggregationType(Instance):
             for t in self.compatible_field_types
         )
 
+    def get_state_aggregations(
+        self,
+        field_name: str,
+        model_field: django_models.Field,
+        field: "Field",
+    ) -> Dict[str, django_models.Aggregate]:
+        """
+        Returns the additional aggregations that are computed over all the rows of
+        the view together with the aggregation itself. Their results are cached next
+        to the value and passed as state to `update_incrementally`. Only used if the
+        aggregation type is incremental.
+
+        :param field_name: The name of the field that needs to be aggregated.
+        :param model_field: The field extracted from the model.
+        :param field: The instance of the underlying baserow field.
+        :return: A dict of django aggregation objects by state name.
+        """
+
+        return {}
+
+    def get_incremental_aggregations(
+        self,
+        field_name: str,
+        model_field: django_models.Field,
+        field: "Field",
+    ) -> Dict[str, Union[django_models.Aggregate, "AnnotatedAggregation"]]:
+        """
+        Returns the partial aggregations that are computed over the changed rows
+        only, once before and once after the change. Their results are passed to
+        `update_incrementally`. Only used if the aggregation type is incremental.
+
+        :param field_name: The name of the field that needs to be aggregated.
+        :param model_field: The field extracted from the model.
+        :param field: The instance of the underlying baserow field.
+        :return: A dict of django aggregation objects by name.
+        """
+
+        return {"value": self.get_aggregation(field_name, model_field, field)}
+
+    def update_incrementally(
+        self,
+        value: Any,
+        state: Dict[str, Any],
+        removed: Optional[Dict[str, Any]],
+        added: Optional[Dict[str, Any]],
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Computes the new aggregation value based on the cached value and the partial
+        aggregations of the rows that have changed.
+
+        :param value: The cached aggregation value.
+        :param state: The cached results of the state aggregations.
+        :param removed: The results of the incremental aggregations computed over
+            the changed rows before the change, or None if the rows are new.
+        :param added: The results of the incremental aggregations computed over
+            the changed rows after the change, or None if the rows are deleted.
+        :raises IncrementalAggregationNotPossible: When the value can't be derived
+            from the changed rows and must be recomputed.
+        :return: The new value and state of the aggregation.
+        """
+
+        raise NotImplementedError(
+            "An incremental aggregation type must implement `update_incrementally`."
+        )
+
 
 class ViewAggregationTypeRegistry(Registry):
     """
@@ -1160,6 +1249,41 @@ class ViewAggregationTypeRegistry(Registry):
     already_registered_exception_class = AggregationTypeAlreadyRegistered
 
 
+class RowCountModeType(Instance):
+    """
+    A row count mode defines how the number of rows of a view is counted. Counting
+    the rows of a large filtered view requires a full scan, so other modes can for
+    example return a cached or an estimated count instead.
+    """
+
+    def count(
+        self, view: "View", queryset: django_models.QuerySet, cacheable: bool
+    ) -> "RowCount":
+        """
+        Counts the rows of the provided queryset.
+
+        :param view: The view the queryset belongs to.
+        :param queryset: The queryset containing the rows of the view, with the view
+            filters and the optional adhoc filters and search applied.
+        :param cacheable: Indicates whether the queryset only contains the view
+            filters. If not, the count can't be cached per view because it depends on
+            the adhoc filters or search of the request.
+        :return: The number of rows and whether the count is exact.
+        """
+
+        raise NotImplementedError("Each row count mode must have a count method.")
+
+
+class RowCountModeRegistry(Registry):
+    """
+    This registry contains all the available modes to count the rows of a view.
+    """
+
+    name = "row_count_mode"
+    does_not_exist_exception_class = RowCountModeDoesNotExist
+    already_registered_exception_class = RowCountModeAlreadyRegistered
+
+
 class DecoratorType(Instance):
     """
     By declaring a new `DecoratorType` you allow a new decorator type to be created.
@@ -1546,6 +1670,7 @@ class ViewOwnershipTypeRegistry(Registry):
 view_type_registry = ViewTypeRegistry()
 view_filter_type_registry = ViewFilterTypeRegistry()
 view_aggregation_type_registry = ViewAggregationTypeRegistry()
+row_count_mode_registry = RowCountModeRegistry()
 decorator_type_registry = DecoratorTypeRegistry()
 decorator_value_provider_type_registry = DecoratorValueProviderTypeRegistry()
 form_view_mode_registry = FormViewModeRegistry()
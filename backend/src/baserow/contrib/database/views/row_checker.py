@@ -159,8 +159,22 @@ class FilteredViewRowChecker:
             `_views_queryset` views.
         """
 
+        return self.get_filtered_views_where_row_ids_are_visible(
+            [row.id for row in rows]
+        )
+
+    def get_filtered_views_where_row_ids_are_visible(
+        self, input_row_ids: List[int]
+    ) -> List[FilteredViewRows]:
+        """
+        Same as `get_filtered_views_where_rows_are_visible`, but only requires the
+        ids of the rows, so it can be used without fetching the rows first.
+
+        :param input_row_ids: The ids of the rows that must be checked in all the
+            views of the provided `_views_queryset` views.
+        """
+
         result_for_views: List[FilteredViewRows] = []
-        input_row_ids: List[int] = [row.id for row in rows]
 
         # Plan which views need querying and which are already fully decided by cache.
         view_checks: List[FilterCheck] = []
@@ -0,0 +1,151 @@
+from typing import Optional
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import QuerySet
+
+from baserow.contrib.database.views.models import View
+
+from .registries import RowCountModeType, view_type_registry
+from .utils import RowCount
+
+
+def estimate_queryset_count(queryset: QuerySet) -> Optional[int]:
+    """
+    Returns the number of rows the PostgreSQL planner estimates the queryset will
+    return, without executing it.
+
+    :param queryset: The queryset to estimate the number of rows of.
+    :return: The estimated number of rows or None if the planner didn't return one.
+    """
+
+    sql, params = queryset.order_by().values("id").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)  # noqa: S608
+        plan = cursor.fetchone()[0]
+
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def estimate_table_count(db_table: str) -> Optional[int]:
+    """
+    Returns the number of rows PostgreSQL has recorded in `pg_class` for the provided
+    table during the last vacuum or analyze. This is instant, but doesn't take any
+    filter into account.
+
+    :param db_table: The name of the database table.
+    :return: The estimated number of rows or None if the table has never been
+        analyzed.
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)", [db_table]
+        )
+        row = cursor.fetchone()
+
+    if row is None or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+def view_has_active_filters(view: View) -> bool:
+    view_type = view_type_registry.get_by_model(view.specific_class)
+    if not view_type.can_filter or view.filters_disabled:
+        return False
+    return view.viewfilter_set.exists()
+
+
+class ExactRowCountModeType(RowCountModeType):
+    """
+    Counts the rows with a `COUNT(*)` query. This is always exact, but requires
+    scanning all the matching rows.
+    """
+
+    type = "exact"
+
+    def count(self, view: View, queryset: QuerySet, cacheable: bool) -> RowCount:
+        return RowCount(queryset.count(), exact=True)
+
+
+class EstimateRowCountModeType(RowCountModeType):
+    """
+    Returns the number of rows estimated by the PostgreSQL planner. If the view isn't
+    filtered, the statistics stored in `pg_class` are used, otherwise the estimate of
+    the `EXPLAIN` of the query. Falls back to an exact count if no estimate is
+    available.
+    """
+
+    type = "estimate"
+
+    def estimate(
+        self, view: View, queryset: QuerySet, cacheable: bool
+    ) -> Optional[int]:
+        if cacheable and not view_has_active_filters(view):
+            return estimate_table_count(queryset.model._meta.db_table)
+        return estimate_queryset_count(queryset)
+
+    def count(self, view: View, queryset: QuerySet, cacheable: bool) -> RowCount:
+        estimate = self.estimate(view, queryset, cacheable)
+        if estimate is None:
+            return RowCount(queryset.count(), exact=True)
+        return RowCount(estimate, exact=False)
+
+
+class CachedRowCountModeType(RowCountModeType):
+    """
+    Counts the rows exactly and caches the result per view. The cached count is
+    invalidated with the `total` aggregation version of the view, and whenever a
+    row of the table changes.
+    """
+
+    type = "cached"
+
+    def count(self, view: View, queryset: QuerySet, cacheable: bool) -> RowCount:
+        from .handler import ViewHandler
+
+        if not cacheable:
+            return RowCount(queryset.count(), exact=True)
+
+        handler = ViewHandler()
+        cached_count, version = handler.get_cached_view_row_count(view)
+        if cached_count is not None:
+            return RowCount(cached_count, exact=True)
+
+        count = queryset.count()
+        handler.set_cached_view_row_count(view, count, version)
+        return RowCount(count, exact=True)
+
+
+class FastRowCountModeType(RowCountModeType):
+    """
+    Returns the cached count if available. Otherwise, the planner estimate is used if
+    it's above the `BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD`, because counting that
+    many rows would be slow. Small views are counted exactly and cached.
+    """
+
+    type = "fast"
+
+    def count(self, view: View, queryset: QuerySet, cacheable: bool) -> RowCount:
+        from .handler import ViewHandler
+
+        handler = ViewHandler()
+        if cacheable:
+            cached_count, version = handler.get_cached_view_row_count(view)
+            if cached_count is not None:
+                return RowCount(cached_count, exact=True)
+
+        estimate = EstimateRowCountModeType().estimate(view, queryset, cacheable)
+        if (
+            estimate is not None
+            and estimate >= settings.BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD
+        ):
+            return RowCount(estimate, exact=False)
+
+        count = queryset.count()
+        if cacheable:
+            handler.set_cached_view_row_count(view, count, version)
+        return RowCount(count, exact=True)
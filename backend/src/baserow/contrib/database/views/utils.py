@@ -1,8 +1,19 @@
-from typing import Any, Dict
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Set
 
 from django.db.models.aggregates import Aggregate, Count
 
 
+class RowCount(NamedTuple):
+    """
+    The number of rows of a view and whether it's exact or an estimate made by the
+    database planner.
+    """
+
+    count: int
+    exact: bool
+
+
 class AnnotatedAggregation:
     """
     A simple wrapper class for combining multiple annotations with an aggregation.
@@ -50,3 +61,97 @@ class DistributionAggregation:
             .order_by("-count", self.group_by)
             .values_list(self.group_by, "count")[:limit]
         )
+
+
+def compress_row_ids(row_ids: Iterable[int]) -> List[int]:
+    """
+    Compresses the provided row ids into a flat list of inclusive ranges, so
+    `[1, 2, 3, 5]` becomes `[1, 3, 5, 5]`. Row ids are mostly sequential, so this is
+    much smaller than the list of row ids itself.
+
+    :param row_ids: The row ids to compress.
+    :return: A flat list of alternating range starts and ends.
+    """
+
+    ranges = []
+    for row_id in sorted(set(row_ids)):
+        if ranges and ranges[-1] == row_id - 1:
+            ranges[-1] = row_id
+        else:
+            ranges += [row_id, row_id]
+    return ranges
+
+
+def decompress_row_ids(ranges: List[int]) -> Iterator[int]:
+    """
+    Yields all the row ids of a list compressed with `compress_row_ids`.
+    """
+
+    for start, end in zip(ranges[0::2], ranges[1::2]):
+        yield from range(start, end + 1)
+
+
+def get_row_ids_in_ranges(ranges: List[int], row_ids: Iterable[int]) -> Set[int]:
+    """
+    Returns the provided row ids that are in the compressed ranges, without
+    decompressing them.
+    """
+
+    starts, ends = ranges[0::2], ranges[1::2]
+    found = set()
+    for row_id in row_ids:
+        index = bisect_right(starts, row_id) - 1
+        if index >= 0 and row_id <= ends[index]:
+            found.add(row_id)
+    return found
+
+
+def update_row_id_ranges(
+    ranges: List[int], added: Iterable[int], removed: Iterable[int]
+) -> List[int]:
+    """
+    Adds and removes row ids from the compressed ranges, splitting and merging the
+    ranges where needed, without decompressing them.
+
+    :param ranges: The ranges compressed with `compress_row_ids`.
+    :param added: The row ids to add.
+    :param removed: The row ids to remove.
+    :return: The updated compressed ranges.
+    """
+
+    starts, ends = ranges[0::2], ranges[1::2]
+
+    for row_id in sorted(set(removed)):
+        index = bisect_right(starts, row_id) - 1
+        if index < 0 or row_id > ends[index]:
+            continue
+        start, end = starts[index], ends[index]
+        if start == end:
+            del starts[index], ends[index]
+        elif row_id == start:
+            starts[index] = row_id + 1
+        elif row_id == end:
+            ends[index] = row_id - 1
+        else:
+            ends[index] = row_id - 1
+            starts.insert(index + 1, row_id + 1)
+            ends.insert(index + 1, end)
+
+    for row_id in sorted(set(added)):
+        index = bisect_right(starts, row_id) - 1
+        if index >= 0 and row_id <= ends[index]:
+            continue
+        merge_previous = index >= 0 and ends[index] == row_id - 1
+        merge_next = index + 1 < len(starts) and starts[index + 1] == row_id + 1
+        if merge_previous and merge_next:
+            ends[index] = ends[index + 1]
+            del starts[index + 1], ends[index + 1]
+        elif merge_previous:
+            ends[index] = row_id
+        elif merge_next:
+            starts[index + 1] = row_id
+        else:
+            starts.insert(index + 1, row_id)
+            ends.insert(index + 1, row_id)
+
+    return [value for pair in zip(starts, ends) for value in pair]
@@ -1,4 +1,5 @@
-from typing import Dict
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional
 
 from django.db.models import (
     Avg,
@@ -52,6 +53,7 @@ from baserow.contrib.database.formula.types.formula_types import (
     BaserowFormulaSingleFileType,
 )
 
+from .exceptions import IncrementalAggregationNotPossible
 from .registries import ViewAggregationType
 from .utils import AnnotatedAggregation, DistributionAggregation
 
@@ -71,7 +73,94 @@ def get_has_relations_annotation(field_name: str, model_field: Field) -> Dict:
     return {f"has_relations_{field_name}": Exists(subquery)}
 
 
-class CountViewAggregationType(ViewAggregationType):
+def apply_partial_aggregation_delta(
+    value: Any, removed: Optional[Any], added: Optional[Any]
+) -> Any:
+    """
+    Subtracts the removed partial aggregation result from the value and adds the
+    added one. `None` values are ignored, which is how the database aggregates
+    empty values.
+    """
+
+    if added is not None:
+        value = added if value is None else value + added
+    if removed is not None:
+        value = -removed if value is None else value - removed
+    return value
+
+
+def get_partial_result(
+    results: Optional[Dict[str, Any]], name: str = "value"
+) -> Optional[Any]:
+    """
+    Returns the named partial aggregation result or None if it has not been computed
+    because the rows have been created or deleted.
+    """
+
+    return None if results is None else results[name]
+
+
+def divide_like_postgres(dividend: Any, divisor: Any) -> Decimal:
+    """
+    Divides the two numbers and rounds the result to the same scale as PostgreSQL
+    does when it divides numerics, for example to compute an `AVG`. The scale is
+    chosen to have at least 16 significant digits, but never less than the scale
+    of one of the operands, and the result is rounded half away from zero.
+    """
+
+    dividend, divisor = Decimal(dividend), Decimal(divisor)
+
+    def get_weight_and_first_digit(value):
+        # PostgreSQL stores numerics as base 10000 digits.
+        if not value:
+            return 0, 0
+        weight = value.adjusted() // 4
+        length = value.adjusted() - weight * 4 + 1
+        digits = "".join(map(str, value.as_tuple().digits)).ljust(length, "0")
+        return weight, int(digits[:length])
+
+    def get_scale(value):
+        return max(0, -value.as_tuple().exponent)
+
+    weight1, first_digit1 = get_weight_and_first_digit(dividend)
+    weight2, first_digit2 = get_weight_and_first_digit(divisor)
+    weight = weight1 - weight2 - (1 if first_digit1 <= first_digit2 else 0)
+    scale = min(max(16 - weight * 4, get_scale(dividend), get_scale(divisor), 0), 1000)
+
+    def to_scaled_integer(value, scale):
+        sign, digits, exponent = value.as_tuple()
+        integer = int("".join(map(str, digits))) * 10 ** (exponent + scale)
+        return -integer if sign else integer
+
+    divisor_scale = get_scale(divisor)
+    numerator = to_scaled_integer(dividend, scale + divisor_scale)
+    denominator = to_scaled_integer(divisor, divisor_scale)
+    quotient, remainder = divmod(abs(numerator), abs(denominator))
+    if remainder * 2 >= abs(denominator):
+        quotient += 1
+    negative = (numerator < 0) != (denominator < 0) and quotient != 0
+    return Decimal((int(negative), tuple(map(int, str(quotient))), -scale))
+
+
+class AdditiveViewAggregationTypeMixin:
+    """
+    Mixin for aggregations, like counts, that can be updated by subtracting the
+    aggregation of the changed rows before the change and adding the aggregation of
+    the same rows after the change.
+    """
+
+    incremental = True
+
+    def update_incrementally(self, value, state, removed, added):
+        return (
+            apply_partial_aggregation_delta(
+                value, get_partial_result(removed), get_partial_result(added)
+            ),
+            state,
+        )
+
+
+class CountViewAggregationType(AdditiveViewAggregationTypeMixin, ViewAggregationType):
     """
     The count aggregation counts how many rows
     are in the table.
@@ -117,7 +206,9 @@ class CountViewAggregationType(ViewAggregationType):
         )
 
 
-class EmptyCountViewAggregationType(ViewAggregationType):
+class EmptyCountViewAggregationType(
+    AdditiveViewAggregationTypeMixin, ViewAggregationType
+):
     """
     The empty count aggregation counts how many values are considered empty for
     the given field.
@@ -242,13 +333,48 @@ class UniqueCountViewAggregationType(ViewAggregationType):
         )
 
 
-class MinViewAggregationType(ViewAggregationType):
+class ExtremeViewAggregationTypeMixin:
+    """
+    Mixin for the min and max aggregations. A new extreme can be derived from the
+    changed rows, but if the row holding the cached extreme changes to a less extreme
+    value, the aggregation must be recomputed.
+    """
+
+    incremental = True
+    is_more_extreme: Callable[[Any, Any], bool]
+
+    def update_incrementally(self, value, state, removed, added):
+        removed_value = get_partial_result(removed)
+        added_value = get_partial_result(added)
+
+        if (
+            removed_value is not None
+            and value is not None
+            and not self.is_more_extreme(value, removed_value)
+            and (added_value is None or self.is_more_extreme(value, added_value))
+        ):
+            raise IncrementalAggregationNotPossible(
+                "The cached extreme value might have been removed."
+            )
+
+        if value is None or (
+            added_value is not None and self.is_more_extreme(added_value, value)
+        ):
+            value = added_value
+        return value, state
+
+
+class MinViewAggregationType(ExtremeViewAggregationTypeMixin, ViewAggregationType):
     """
     Compute the minimum value for the given field.
     """
 
     type = "min"
 
+    @staticmethod
+    def is_more_extreme(a, b):
+        return a < b
+
     compatible_field_types = [
         DateFieldType.type,
         NumberFieldType.type,
@@ -268,13 +394,17 @@ class MinViewAggregationType(ViewAggregationType):
         return Min(field_name)
 
 
-class MaxViewAggregationType(ViewAggregationType):
+class MaxViewAggregationType(ExtremeViewAggregationTypeMixin, ViewAggregationType):
     """
     Compute the maximum value for the given field.
     """
 
     type = "max"
 
+    @staticmethod
+    def is_more_extreme(a, b):
+        return a > b
+
     compatible_field_types = [
         DateFieldType.type,
         NumberFieldType.type,
@@ -300,6 +430,7 @@ class SumViewAggregationType(ViewAggregationType):
     """
 
     type = "sum"
+    incremental = True
 
     compatible_field_types = [
         NumberFieldType.type,
@@ -313,6 +444,30 @@ class SumViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Sum(field_name)
 
+    def get_state_aggregations(self, field_name, model_field, field):
+        # The number of values is needed to know when the sum becomes empty.
+        return {"count": Count(field_name)}
+
+    def get_incremental_aggregations(self, field_name, model_field, field):
+        return {"value": Sum(field_name), "count": Count(field_name)}
+
+    def update_incrementally(self, value, state, removed, added):
+        if "count" not in state:
+            raise IncrementalAggregationNotPossible("The value count is not cached.")
+
+        count = apply_partial_aggregation_delta(
+            state["count"],
+            get_partial_result(removed, "count"),
+            get_partial_result(added, "count"),
+        )
+        if count == 0:
+            return None, {"count": 0}
+
+        value = apply_partial_aggregation_delta(
+            value, get_partial_result(removed), get_partial_result(added)
+        )
+        return value, {"count": count}
+
 
 class AverageViewAggregationType(ViewAggregationType):
     """
@@ -329,6 +484,8 @@ class AverageViewAggregationType(ViewAggregationType):
         ),
     ]
 
+    incremental = True
+
     def get_aggregation(self, field_name, model_field, field):
         field_type = field_type_registry.get_by_model(field)
 
@@ -337,6 +494,35 @@ class AverageViewAggregationType(ViewAggregationType):
             filter=~field_type.empty_query(field_name, model_field, field),
         )
 
+    def get_state_aggregations(self, field_name, model_field, field):
+        field_type = field_type_registry.get_by_model(field)
+        not_empty = ~field_type.empty_query(field_name, model_field, field)
+
+        return {
+            "sum": Sum(field_name, filter=not_empty),
+            "count": Count("id", distinct=True, filter=not_empty),
+        }
+
+    def get_incremental_aggregations(self, field_name, model_field, field):
+        return self.get_state_aggregations(field_name, model_field, field)
+
+    def update_incrementally(self, value, state, removed, added):
+        if "sum" not in state or "count" not in state:
+            raise IncrementalAggregationNotPossible("The sum and count aren't cached.")
+
+        state = {
+            name: apply_partial_aggregation_delta(
+                state[name],
+                get_partial_result(removed, name),
+                get_partial_result(added, name),
+            )
+            for name in ["sum", "count"]
+        }
+        if not state["count"]:
+            return None, state
+
+        return divide_like_postgres(state["sum"], state["count"]), state
+
 
 class StdDevViewAggregationType(ViewAggregationType):
     """
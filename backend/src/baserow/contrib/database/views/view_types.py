@@ -282,6 +282,20 @@ class GridViewType(ViewType):
         )
         return [(option.field, option.aggregation_raw_type) for option in field_options]
 
+    def get_table_aggregations(self, table_id):
+        field_options = (
+            GridViewFieldOptions.objects.filter(grid_view__table_id=table_id)
+            .exclude(aggregation_raw_type="")
+            .select_related("grid_view", "field")
+        )
+
+        aggregations = defaultdict(list)
+        for option in field_options:
+            aggregations[option.grid_view].append(
+                (option.field, option.aggregation_raw_type)
+            )
+        return aggregations
+
     def after_field_value_update(self, updated_fields):
         """
         When a field value change, we need to invalidate the aggregation cache for this
@@ -1369,7 +1383,7 @@ class FormViewType(ViewType):
 
             if isinstance(user_file, dict):
                 values[user_file_key] = UserFileHandler().get_user_file_by_name(
-                    user_file.get("name", None)
+                    user_file.get("name", None), user=user
                 )
 
             elif not isinstance(user_file, UserFile):
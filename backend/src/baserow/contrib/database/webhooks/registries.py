@@ -178,6 +178,24 @@ class WebhookEventType(Instance):
 
         return prepared_payload, remaining_payload
 
+    def merge_payloads(
+        self, payload: dict[str, any], other_payload: dict[str, any], max_items: int
+    ) -> dict[str, any] | None:
+        """
+        This method is called in the celery task when multiple calls of this event
+        type are waiting in the queue of the same webhook. It can be overwritten to
+        combine the payload of the next call into the current one, so that both
+        events are delivered with one request. The default implementation returns
+        None, meaning that the payloads can't be merged.
+
+        :param payload: The payload of the call that's about to be made.
+        :param other_payload: The payload of the next call in the queue.
+        :param max_items: The maximum number of items the merged payload can contain.
+        :return: The merged payload or None if the payloads can't be merged.
+        """
+
+        return None
+
     def listener_after_commit(self, **kwargs):
         """
         Called after the signal is triggered and the transaction commits. By default it
@@ -4,9 +4,11 @@ from datetime import datetime, timezone
 from django.conf import settings
 from django.core import cache
 from django.db import transaction
+from django.db.models import Q
 from django.db.utils import OperationalError
 
 from loguru import logger
+from redis.exceptions import LockNotOwnedError
 
 from baserow.config.celery import app
 from baserow.contrib.database.webhooks.exceptions import WebhookPayloadTooLarge
@@ -48,6 +50,232 @@ def schedule_next_task_in_queue(webhook_id):
         call_webhook.delay(*next_task["args"], **next_task["kwargs"])
 
 
+WEBHOOK_CALL_ARGS = (
+    "webhook_id",
+    "event_id",
+    "event_type",
+    "method",
+    "url",
+    "headers",
+    "payload",
+    "retries",
+)
+
+
+def get_webhook_call_kwargs(args, kwargs) -> dict:
+    """
+    Converts the args and kwargs of a `call_webhook` task, as stored in the webhook
+    queue, to only keyword arguments.
+    """
+
+    call = dict(zip(WEBHOOK_CALL_ARGS, args or ()))
+    call.update(kwargs or {})
+    call.setdefault("retries", 0)
+    return call
+
+
+def can_merge_webhook_calls(call: dict, other_call: dict) -> bool:
+    """
+    Returns whether the payload of the other queued webhook call can be sent
+    together with the provided call. Only the delivery header, which contains the
+    event id, is allowed to differ.
+    """
+
+    def comparable_headers(headers):
+        return {k: v for k, v in headers.items() if k != "X-Baserow-Delivery"}
+
+    return (
+        call["webhook_id"] == other_call["webhook_id"]
+        and call["event_type"] == other_call["event_type"]
+        and call["method"] == other_call["method"]
+        and call["url"] == other_call["url"]
+        and comparable_headers(call["headers"])
+        == comparable_headers(other_call["headers"])
+    )
+
+
+def merge_queued_webhook_calls(queue, webhook_event_type, call: dict):
+    """
+    Pops the next calls from the webhook queue and merges their payload into the
+    provided call for as long as the event type allows it. This is disabled if the
+    `BASEROW_WEBHOOKS_MERGE_EVENTS_MAX_ITEMS` setting is 0.
+
+    :param queue: The queue of the webhook.
+    :param webhook_event_type: The event type of the call.
+    :param call: The keyword arguments of the call that's about to be made.
+    :return: A tuple containing the merged call and the call that has been popped
+        from the queue, but could not be merged, if any.
+    """
+
+    max_items = settings.BASEROW_WEBHOOKS_MERGE_EVENTS_MAX_ITEMS
+    if max_items <= 0:
+        return call, None
+
+    while True:
+        next_task = queue.get_and_pop_next()
+        if not next_task:
+            return call, None
+
+        next_call = get_webhook_call_kwargs(next_task["args"], next_task["kwargs"])
+        merged_payload = None
+        if can_merge_webhook_calls(call, next_call):
+            merged_payload = webhook_event_type.merge_payloads(
+                call["payload"], next_call["payload"], max_items
+            )
+        if merged_payload is None:
+            return call, next_call
+        call = {**call, "payload": merged_payload}
+
+
+def send_webhook_call(
+    webhook, call: dict, webhook_calls: list, call_results: list
+) -> bool:
+    """
+    Paginates the payload of the call if necessary, enqueues the remaining data
+    and makes the request. The resulting `TableWebhookCall` is appended to the
+    `webhook_calls` list instead of being saved directly.
+
+    :param webhook: The webhook related to the call.
+    :param call: The keyword arguments of the call.
+    :param webhook_calls: The list the resulting webhook calls are added to.
+    :param call_results: The list the success of the request, if made, is added to.
+    :return: Whether the call was successful or doesn't have to be retried.
+    """
+
+    from .registries import webhook_event_type_registry
+
+    event_id = call["event_id"]
+    event_type = call["event_type"]
+    webhook_event_type = webhook_event_type_registry.get(event_type)
+    try:
+        payload, remaining = webhook_event_type.paginate_payload(
+            webhook, event_id, deepcopy(call["payload"])
+        )
+    except WebhookPayloadTooLarge:
+        transaction.on_commit(
+            lambda: WebhookPayloadTooLargeNotificationType.notify_admins_in_workspace(
+                webhook, event_id
+            )
+        )
+        # We don't want to retry this call, because it will fail again.
+        return True
+
+    success = make_request_and_save_result(
+        webhook,
+        event_id,
+        event_type,
+        call["method"],
+        call["url"],
+        call["headers"],
+        payload,
+        webhook_calls=webhook_calls,
+    )
+    call_results.append(success)
+    # enqueue the next call if there is still remaining payload
+    if success and remaining:
+        args = (
+            webhook.id,
+            event_id,
+            event_type,
+            call["method"],
+            call["url"],
+            call["headers"],
+            remaining,
+        )
+        kwargs = {"retries": 0}
+        enqueue_webhook_task(webhook.id, event_id, args, kwargs)
+    return success
+
+
+def save_webhook_calls(webhook, webhook_calls: list):
+    """
+    Saves the results of multiple webhook calls with a single insert. Existing
+    calls with the same event, batch and event type are replaced, just like the
+    `update_or_create` of a single call would do.
+
+    :param webhook: The webhook related to the calls.
+    :param webhook_calls: The unsaved `TableWebhookCall` objects.
+    """
+
+    from .handler import WebhookHandler
+    from .models import TableWebhookCall
+
+    if not webhook_calls:
+        return
+
+    existing_calls = Q()
+    for webhook_call in webhook_calls:
+        existing_calls |= Q(
+            event_id=webhook_call.event_id,
+            batch_id=webhook_call.batch_id,
+            event_type=webhook_call.event_type,
+        )
+    TableWebhookCall.objects.filter(existing_calls, webhook=webhook).delete()
+    TableWebhookCall.objects.bulk_create(webhook_calls)
+    WebhookHandler().clean_webhook_calls(webhook)
+
+
+def save_webhook_call_results(webhook_id: int, webhook_calls: list, call_results: list):
+    """
+    Saves the results of the calls made by a task and updates the failed triggers
+    of the webhook in one short transaction, after all the requests have been made.
+
+    :param webhook_id: The id of the webhook related to the calls.
+    :param webhook_calls: The unsaved `TableWebhookCall` objects.
+    :param call_results: Whether each of the requests was successful, in the order
+        they have been made.
+    """
+
+    from .models import TableWebhook
+
+    with transaction.atomic():
+        webhook = (
+            TableWebhook.objects.select_for_update(of=("self",))
+            .filter(id=webhook_id)
+            .first()
+        )
+        if webhook is None:
+            # The webhook has been deleted while the requests were made.
+            return
+
+        save_webhook_calls(webhook, webhook_calls)
+        for success in call_results:
+            update_webhook_after_call(webhook, success)
+
+
+def get_webhook_delivery_lock(webhook_id: int):
+    """
+    Returns the lock that makes sure that only one task at a time makes the calls
+    of a webhook, or None if the cache backend doesn't support locks. Contrary to
+    the row lock of the webhook, it can be held while the requests are made without
+    keeping a database transaction open.
+    """
+
+    if not hasattr(cache.cache, "lock"):
+        return None
+
+    # The lock expires if the worker dies, but only after every call of the task
+    # had the time to reach the request timeout.
+    timeout = (
+        settings.BASEROW_WEBHOOKS_MAX_CALLS_PER_TASK
+        * settings.BASEROW_WEBHOOKS_REQUEST_TIMEOUT_SECONDS
+        * 2
+        + 60
+    )
+    return cache.cache.lock(f"webhook_{webhook_id}_delivery_lock", timeout=timeout)
+
+
+def release_webhook_delivery_lock(delivery_lock):
+    if delivery_lock is None:
+        return
+    try:
+        delivery_lock.release()
+    except LockNotOwnedError:
+        # The lock has expired, which means that another task might already be
+        # making the calls of the webhook.
+        pass
+
+
 @app.task(
     bind=True,
     max_retries=settings.BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL,
@@ -74,6 +302,14 @@ def call_webhook(
     more are triggered, then they're added to the queue, and delayed when current one
     completes.
 
+    While holding the delivery lock of the webhook, the task continues with the next
+    calls in the queue, up to `BASEROW_WEBHOOKS_MAX_CALLS_PER_TASK` calls, so that a
+    burst of events doesn't need a celery task per call. The requests are made
+    outside of a database transaction and their results are saved afterwards in one
+    short transaction. Consecutive queued row events can be merged into one request
+    if `BASEROW_WEBHOOKS_MERGE_EVENTS_MAX_ITEMS` is set. Calls of different webhooks
+    are still made concurrently by the celery workers.
+
     :param webhook_id: The id of the webhook related to the call.
     :param event_id: A unique event id that can used as id for the table webhook call
         model.
@@ -94,96 +330,144 @@ def call_webhook(
     if self.request.retries > retries:
         retries = self.request.retries
 
+    call = {
+        "webhook_id": webhook_id,
+        "event_id": event_id,
+        "event_type": event_type,
+        "method": method,
+        "url": url,
+        "headers": headers,
+        "payload": payload,
+        "retries": retries,
+    }
+
+    delivery_lock = get_webhook_delivery_lock(webhook_id)
+    if delivery_lock is not None and not delivery_lock.acquire(blocking=False):
+        # Another task is making the calls of this webhook at the moment. The call
+        # is enqueued, so that it's made after the calls of the other task.
+        enqueue_webhook_task(
+            webhook_id, event_id, self.request.args, self.request.kwargs
+        )
+        return
+
     try:
         with transaction.atomic():
-            try:
-                webhook = TableWebhook.objects.select_for_update(
-                    of=("self",), nowait=True
-                ).get(id=webhook_id, active=True)
-            except TableWebhook.DoesNotExist:
-                # If the webhook has been deleted or disabled while executing, we don't
-                # want to continue making calls the URL because we can't update the
-                # state of the webhook. We're also clearing the queue because the
-                # other calls don't have to be executed anymore.
-                transaction.on_commit(lambda: clear_webhook_queue(webhook_id))
-                return
-            except OperationalError as e:
-                if "could not obtain lock" in e.args[0]:
-                    # If a lock could not be obtained, it means that another call for
-                    # this webhook is being made at the moment. In that case,
-                    # we'll enqueue the webhook call, so that it's executed later.
-                    # This makes sure that only a maximum one webhook call is
-                    # triggered concurrently.
-                    args = self.request.args
-                    kwargs = self.request.kwargs
-                    enqueue_webhook_task(webhook_id, event_id, args, kwargs)
-                    return
-                else:
-                    raise e
-
-            # Paginate the payload if necessary and enqueue the remaining data.
-            webhook_event_type = webhook_event_type_registry.get(event_type)
-            try:
-                payload, remaining = webhook_event_type.paginate_payload(
-                    webhook, event_id, deepcopy(payload)
-                )
-            except WebhookPayloadTooLarge:
-                success = True  # We don't want to retry this call, because it will fail again.
-                transaction.on_commit(
-                    lambda: WebhookPayloadTooLargeNotificationType.notify_admins_in_workspace(
-                        webhook, event_id
-                    )
-                )
-            else:
-                success = make_request_and_save_result(
-                    webhook, event_id, event_type, method, url, headers, payload
-                )
-                # enqueue the next call if there is still remaining payload
-                if success and remaining:
-                    args = (
-                        webhook_id,
-                        event_id,
-                        event_type,
-                        method,
-                        url,
-                        headers,
-                        remaining,
-                    )
-                    kwargs = {"retries": 0}
-                    enqueue_webhook_task(webhook_id, event_id, args, kwargs)
-
-            # After the transaction successfully commits we can delay the next call
-            # in the queue, so that only one call is triggered concurrently.
-            transaction.on_commit(lambda: schedule_next_task_in_queue(webhook_id))
-    except Exception as e:
-        # If something else fails, then we don't want to block the webhook call
-        # queue, so we'll delay the next task.
-        schedule_next_task_in_queue(webhook_id)
-        raise e
+            webhook = TableWebhook.objects.select_for_update(
+                of=("self",), nowait=True
+            ).get(id=webhook_id, active=True)
+    except TableWebhook.DoesNotExist:
+        # If the webhook has been deleted or disabled while executing, we don't
+        # want to continue making calls the URL because we can't update the
+        # state of the webhook. We're also clearing the queue because the
+        # other calls don't have to be executed anymore.
+        release_webhook_delivery_lock(delivery_lock)
+        clear_webhook_queue(webhook_id)
+        return
+    except OperationalError as e:
+        release_webhook_delivery_lock(delivery_lock)
+        if "could not obtain lock" in e.args[0]:
+            # If a lock could not be obtained, it means that the webhook is being
+            # changed at the moment. In that case, we'll enqueue the
+            # webhook call, so that it's executed later.
+            args = self.request.args
+            kwargs = self.request.kwargs
+            enqueue_webhook_task(webhook_id, event_id, args, kwargs)
+            return
+        else:
+            raise e
+
+    # A call that has already been popped from the queue, but not made yet.
+    next_call = None
+    failed_call = None
+    calls_made = 0
 
-    # This part must be outside of the transaction block, otherwise it could cause
+    try:
+        # The requests are made outside of a transaction, so that no database
+        # connection is kept busy and no row is locked while waiting for the
+        # responses. The delivery lock makes sure that the calls of the webhook are
+        # still made one by one.
+        queue = get_queue(webhook_id)
+        webhook_calls = []
+        call_results = []
+        while call is not None:
+            webhook_event_type = webhook_event_type_registry.get(call["event_type"])
+            call, next_call = merge_queued_webhook_calls(
+                queue, webhook_event_type, call
+            )
+            success = send_webhook_call(webhook, call, webhook_calls, call_results)
+            calls_made += 1
+
+            if not success:
+                failed_call = call
+                break
+            if calls_made >= settings.BASEROW_WEBHOOKS_MAX_CALLS_PER_TASK:
+                break
+            if next_call is None:
+                next_task = queue.get_and_pop_next()
+                if next_task:
+                    next_call = get_webhook_call_kwargs(
+                        next_task["args"], next_task["kwargs"]
+                    )
+            call, next_call = next_call, None
+
+        save_webhook_call_results(webhook_id, webhook_calls, call_results)
+    finally:
+        # The lock must be released before the next call is delayed, otherwise the
+        # next task could start before it's released and be enqueued again. If
+        # something failed, then we don't want to block the webhook call queue, so
+        # we'll delay the next task anyway.
+        release_webhook_delivery_lock(delivery_lock)
+        schedule_next_webhook_call(webhook_id, next_call)
+
+    # This part must be outside of the transaction blocks, otherwise it could cause
     # the transaction to rollback when the retry exception is raised, and we don't want
     # that to happen.
-    if not success and retries < settings.BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL:
+    if (
+        failed_call is not None
+        and failed_call["retries"] < settings.BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL
+    ):
         # If the task is still operating within the max retries per call limit, then we
         # want to retry the task with an exponential backoff. If there are other
         # webhook calls in the webhook task queue (not the Celery queue), it could be
         # that the task is placed at the end of the queue.
-        kwargs = self.request.kwargs or {}
-        kwargs["retries"] = retries + 1
-        self.retry(countdown=2**retries, kwargs=kwargs)
+        countdown = 2 ** failed_call["retries"]
+        kwargs = {**failed_call, "retries": failed_call["retries"] + 1}
+        if calls_made == 1:
+            self.retry(countdown=countdown, args=(), kwargs=kwargs)
+        else:
+            # The call that failed was taken from the queue, so it has its own retry
+            # counter and is retried in a new task.
+            call_webhook.apply_async(kwargs=kwargs, countdown=countdown)
+
+
+def schedule_next_webhook_call(webhook_id, next_call=None):
+    """
+    Delays the call that has already been popped from the webhook queue if provided,
+    otherwise the next call in the queue.
+    """
+
+    if next_call is not None:
+        call_webhook.delay(**next_call)
+    else:
+        schedule_next_task_in_queue(webhook_id)
 
 
 def make_request_and_save_result(
-    webhook, event_id, event_type, method, url, headers, payload
+    webhook, event_id, event_type, method, url, headers, payload, webhook_calls=None
 ):
+    """
+    Makes the request and saves the result as `TableWebhookCall`. If a
+    `webhook_calls` list is provided, the unsaved call is appended to it instead
+    and the webhook isn't updated, so that the request can be made outside of a
+    transaction and multiple results can be saved with `save_webhook_call_results`.
+    """
+
     from requests import RequestException
 
     from advocate import UnacceptableAddressException
 
     from .handler import WebhookHandler
     from .models import TableWebhookCall
-    from .notification_types import WebhookDeactivatedNotificationType
 
     handler = WebhookHandler()
 
@@ -202,23 +486,49 @@ def make_request_and_save_result(
     except UnacceptableAddressException as exception:
         error = f"UnacceptableAddressException: {exception}"
 
-    TableWebhookCall.objects.update_or_create(
-        event_id=event_id,
-        batch_id=payload.get("batch_id", None),
-        event_type=event_type,
-        webhook=webhook,
-        defaults={
-            "called_time": datetime.now(tz=timezone.utc),
-            "called_url": url,
-            "request": handler.format_request(request) if request is not None else None,
-            "response": handler.format_response(response)
-            if response is not None
-            else None,
-            "response_status": response.status_code if response is not None else None,
-            "error": error,
-        },
-    )
-    handler.clean_webhook_calls(webhook)
+    call_values = {
+        "called_time": datetime.now(tz=timezone.utc),
+        "called_url": url,
+        "request": handler.format_request(request) if request is not None else None,
+        "response": handler.format_response(response) if response is not None else None,
+        "response_status": response.status_code if response is not None else None,
+        "error": error,
+    }
+    if webhook_calls is not None:
+        webhook_calls.append(
+            TableWebhookCall(
+                event_id=event_id,
+                batch_id=payload.get("batch_id", None),
+                event_type=event_type,
+                webhook=webhook,
+                **call_values,
+            )
+        )
+    else:
+        TableWebhookCall.objects.update_or_create(
+            event_id=event_id,
+            batch_id=payload.get("batch_id", None),
+            event_type=event_type,
+            webhook=webhook,
+            defaults=call_values,
+        )
+        handler.clean_webhook_calls(webhook)
+        update_webhook_after_call(webhook, success)
+
+    return success
+
+
+def update_webhook_after_call(webhook, success: bool):
+    """
+    Resets the failed triggers of the webhook after a successful call, or increases
+    them after a failed call and deactivates the webhook if the maximum has been
+    reached.
+
+    :param webhook: The webhook related to the call.
+    :param success: Whether the call was successful.
+    """
+
+    from .notification_types import WebhookDeactivatedNotificationType
 
     if success:
         if webhook.failed_triggers != 0:
@@ -252,5 +562,3 @@ def make_request_and_save_result(
                 webhook
             )
         )
-
-    return success
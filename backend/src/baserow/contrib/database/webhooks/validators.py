@@ -1,4 +1,6 @@
+import threading
 from http.client import _is_illegal_header_value, _is_legal_header_name
+from http.cookiejar import DefaultCookiePolicy
 from socket import gaierror, timeout
 from typing import Callable
 from urllib.parse import urlparse
@@ -7,6 +9,9 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
 
+from requests import Session
+from requests.adapters import HTTPAdapter
+
 from advocate import AddrValidator, RequestsAPIWrapper
 from advocate.connection import (
     UnacceptableAddressException,
@@ -15,6 +20,8 @@ from advocate.connection import (
 
 INVALID_URL_CODE = "invalid_url"
 
+_webhook_sessions = threading.local()
+
 
 def get_webhook_request_function() -> Callable:
     """
@@ -23,19 +30,61 @@ def get_webhook_request_function() -> Callable:
     In production mode, the advocate library is used so that the internal
     network can't be reached. This can be disabled by changing the Django
     setting BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS.
+
+    The request function of a session shared by the current thread is returned, so
+    that the connections to the webhook hosts are pooled and kept alive between
+    calls.
     """
 
-    if settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True:
-        from requests import request
+    return get_webhook_session().request
 
-        return request
-    else:
-        from advocate import request
 
+def get_webhook_session() -> Session:
+    """
+    Returns the `requests` session that's reused by all the webhook calls made in the
+    current thread. The session keeps a connection pool per host, so that consecutive
+    calls to the same host don't have to open a new connection every time. A new
+    session is created if the settings related to the address validation or the
+    connection pool change. Cookies are never stored because the session is shared
+    between the webhooks of different users.
+    """
+
+    allow_private_address = settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True
+    session_key = (
+        allow_private_address,
+        tuple(str(ip) for ip in settings.BASEROW_WEBHOOKS_IP_BLACKLIST),
+        tuple(str(ip) for ip in settings.BASEROW_WEBHOOKS_IP_WHITELIST),
+        tuple(
+            url_regex.pattern
+            for url_regex in settings.BASEROW_WEBHOOKS_URL_REGEX_BLACKLIST
+        ),
+        settings.BASEROW_WEBHOOKS_POOL_CONNECTIONS,
+        settings.BASEROW_WEBHOOKS_POOL_MAXSIZE,
+    )
+
+    cached = getattr(_webhook_sessions, "session", None)
+    if cached is not None and cached[0] == session_key:
+        return cached[1]
+    elif cached is not None:
+        cached[1].close()
+
+    adapter_kwargs = {
+        "pool_connections": settings.BASEROW_WEBHOOKS_POOL_CONNECTIONS,
+        "pool_maxsize": settings.BASEROW_WEBHOOKS_POOL_MAXSIZE,
+    }
+    if allow_private_address:
+        session = Session()
+        adapter = HTTPAdapter(**adapter_kwargs)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+    else:
         addr_validator = get_advocate_address_validator()
         baserow_advocate = RequestsAPIWrapper(addr_validator)
+        session = baserow_advocate.Session(_adapter_kwargs=adapter_kwargs)
 
-        return baserow_advocate.request
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    _webhook_sessions.session = (session_key, session)
+    return session
 
 
 def get_advocate_address_validator() -> AddrValidator:
@@ -13,14 +13,18 @@ from baserow.contrib.database.views.exceptions import (
 )
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.contrib.database.ws.rows.signals import RealtimeRowMessages
 from baserow.core.exceptions import PermissionDenied, UserNotInWorkspace
 from baserow.core.handler import CoreHandler
 from baserow.ws.registries import PageType
 
+DELTA_UPDATE_FORMAT = "delta"
+
 
 class TablePageType(PageType):
     type = "table"
     parameters = ["table_id"]
+    update_formats = [DELTA_UPDATE_FORMAT]
 
     def can_add(self, user, web_socket_id, table_id, **kwargs):
         """
@@ -48,6 +52,14 @@ class TablePageType(PageType):
     def get_group_name(self, table_id, **kwargs):
         return f"table-{table_id}"
 
+    def merge_payloads(self, payload, other_payload):
+        return RealtimeRowMessages.merge(payload, other_payload)
+
+    def transform_payload(self, payload, update_format):
+        if update_format == DELTA_UPDATE_FORMAT and payload["type"] == "rows_updated":
+            return RealtimeRowMessages.rows_updated_delta(payload)
+        return payload
+
     def get_permission_channel_group_name(self, table_id, **kwargs):
         return f"permissions-table-{table_id}"
 
@@ -55,6 +67,7 @@ class TablePageType(PageType):
 class PublicViewPageType(PageType):
     type = "view"
     parameters = ["slug", "token"]
+    update_formats = [DELTA_UPDATE_FORMAT]
 
     def can_add(self, user, web_socket_id, slug, token=None, **kwargs):
         """
@@ -87,6 +100,14 @@ class PublicViewPageType(PageType):
     def get_group_name(self, slug, **kwargs):
         return f"view-{slug}"
 
+    def merge_payloads(self, payload, other_payload):
+        return RealtimeRowMessages.merge(payload, other_payload)
+
+    def transform_payload(self, payload, update_format):
+        if update_format == DELTA_UPDATE_FORMAT and payload["type"] == "rows_updated":
+            return RealtimeRowMessages.rows_updated_delta(payload)
+        return payload
+
 
 class RowPageType(PageType):
     type = "row"
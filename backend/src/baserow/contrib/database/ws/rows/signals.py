@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
 from django.db import transaction
 from django.dispatch import receiver
@@ -12,12 +12,40 @@ from baserow.contrib.database.api.rows.serializers import (
 from baserow.contrib.database.rows import signals as row_signals
 from baserow.contrib.database.rows.registries import row_metadata_registry
 from baserow.contrib.database.table.models import GeneratedTableModel
+from baserow.ws.broadcast import PendingBroadcasts
 from baserow.ws.registries import PageType, page_registry
 
 if TYPE_CHECKING:
     from baserow.contrib.database.rows.models import RowHistory
 
 
+def get_serialized_rows(
+    rows: List[GeneratedTableModel],
+    model: GeneratedTableModel,
+    field_ids: Optional[Iterable[int]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Serializes the rows for the realtime messages. When the messages of a
+    transaction are broadcast on commit, the rows are only serialized once for all
+    of them, e.g. for the table and all its public views.
+
+    :param rows: The rows to serialize.
+    :param model: The model of the rows.
+    :param field_ids: If provided, only these fields are serialized.
+    :return: The serialized rows.
+    """
+
+    return PendingBroadcasts.get_or_set(
+        (
+            "serialized_rows",
+            id(rows),
+            model,
+            tuple(sorted(field_ids)) if field_ids is not None else None,
+        ),
+        lambda: serialize_rows_for_response(rows, model, field_ids=field_ids),
+    )
+
+
 @receiver(row_signals.before_rows_update)
 def serialize_rows_values(
     sender,
@@ -52,13 +80,11 @@ def rows_created(
         return
 
     table_page_type = page_registry.get("table")
-    transaction.on_commit(
+    PendingBroadcasts.on_commit(
         lambda: table_page_type.broadcast(
             RealtimeRowMessages.rows_created(
                 table_id=table.id,
-                serialized_rows=get_row_serializer_class(
-                    model, RowSerializer, is_response=True
-                )(rows, many=True).data,
+                serialized_rows=get_serialized_rows(rows, model),
                 metadata=row_metadata_registry.generate_and_merge_metadata_for_rows(
                     user, table, [row.id for row in rows]
                 ),
@@ -88,22 +114,21 @@ def rows_updated(
 
     table_page_type = page_registry.get("table")
     before_rows_values = dict(before_return)[serialize_rows_values]
-    transaction.on_commit(
+    PendingBroadcasts.on_commit(
         lambda: table_page_type.broadcast(
             RealtimeRowMessages.rows_updated(
                 table_id=table.id,
                 serialized_rows_before_update=before_rows_values,
-                serialized_rows=get_row_serializer_class(
+                serialized_rows=get_serialized_rows(
+                    rows,
                     model,
-                    RowSerializer,
-                    is_response=True,
                     # in some cases the caller may want to serialize just the fields
                     # that were provided in updated_field_ids list (i.e. field rules).
                     # Otherwise, we need to serialize all fields (i.e. in webhooks).
                     field_ids=updated_field_ids
                     if serialize_only_updated_fields
                     else None,
-                )(rows, many=True).data,
+                ),
                 # Broadcast a list of updated fields so that the listener can take
                 # action even if the value didn't change.
                 updated_field_ids=list(updated_field_ids),
@@ -152,7 +177,7 @@ def rows_deleted(
         return
 
     table_page_type = page_registry.get("table")
-    transaction.on_commit(
+    PendingBroadcasts.on_commit(
         lambda: table_page_type.broadcast(
             RealtimeRowMessages.rows_deleted(
                 table_id=table.id,
@@ -260,6 +285,116 @@ class RealtimeRowMessages:
             "updated_field_ids": updated_field_ids,
         }
 
+    @staticmethod
+    def rows_updated_delta(payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Converts a `rows_updated` payload into a `rows_updated_delta` one, which only
+        contains the values that have changed keyed by row id. The values before the
+        update are only provided for those fields. If the values before the update
+        of a row are not known, all its values are included.
+
+        :param payload: The `rows_updated` payload to convert.
+        :return: The compact payload.
+        """
+
+        rows_before_update = {row["id"]: row for row in payload["rows_before_update"]}
+        rows = {}
+        rows_before_update_delta = {}
+        for row in payload["rows"]:
+            row_before_update = rows_before_update.get(row["id"])
+            if row_before_update is None:
+                rows[str(row["id"])] = {
+                    key: value for key, value in row.items() if key != "id"
+                }
+                continue
+
+            changed_keys = [
+                key
+                for key, value in row.items()
+                if key != "id"
+                and (key not in row_before_update or row_before_update[key] != value)
+            ]
+            rows[str(row["id"])] = {key: row[key] for key in changed_keys}
+            rows_before_update_delta[str(row["id"])] = {
+                key: row_before_update[key]
+                for key in changed_keys
+                if key in row_before_update
+            }
+
+        return {
+            "type": "rows_updated_delta",
+            "table_id": payload["table_id"],
+            "rows_before_update": rows_before_update_delta,
+            "rows": rows,
+            "metadata": payload["metadata"],
+            "updated_field_ids": payload["updated_field_ids"],
+        }
+
+    @staticmethod
+    def merge(
+        payload: Dict[str, Any], other_payload: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Merges two consecutive `rows_created`, `rows_updated` or `rows_deleted`
+        payloads of the same table into one.
+
+        :param payload: The payload sent first.
+        :param other_payload: The payload sent afterwards.
+        :return: The merged payload or None if they can't be merged.
+        """
+
+        if (
+            payload["type"] != other_payload["type"]
+            or payload.get("table_id") != other_payload.get("table_id")
+            or payload["type"] not in ("rows_created", "rows_updated", "rows_deleted")
+        ):
+            return None
+
+        if payload["type"] == "rows_deleted":
+            return {
+                **payload,
+                "row_ids": payload["row_ids"] + other_payload["row_ids"],
+                "rows": payload["rows"] + other_payload["rows"],
+            }
+
+        metadata = {**payload["metadata"], **other_payload["metadata"]}
+        if payload["type"] == "rows_created":
+            # Rows created before the same row end up in the same order when they're
+            # created at once.
+            if payload["before_row_id"] != other_payload["before_row_id"]:
+                return None
+            return {
+                **payload,
+                "rows": payload["rows"] + other_payload["rows"],
+                "metadata": metadata,
+            }
+
+        # When a row is updated twice, the values from before the first update and
+        # after the last one are kept.
+        rows_before_update = {
+            row["id"]: dict(row) for row in payload["rows_before_update"]
+        }
+        for row in other_payload["rows_before_update"]:
+            rows_before_update[row["id"]] = {
+                **row,
+                **rows_before_update.get(row["id"], {}),
+            }
+        rows = {row["id"]: dict(row) for row in payload["rows"]}
+        for row in other_payload["rows"]:
+            rows.setdefault(row["id"], {}).update(row)
+        updated_field_ids = list(payload["updated_field_ids"])
+        for field_id in other_payload["updated_field_ids"]:
+            if field_id not in updated_field_ids:
+                updated_field_ids.append(field_id)
+
+        return {
+            **payload,
+            "rows_before_update": list(rows_before_update.values()),
+            "rows": list(rows.values()),
+            "metadata": metadata,
+            "updated_field_ids": updated_field_ids,
+        }
+
     @staticmethod
     def row_orders_recalculated(table_id: int) -> Dict[str, Any]:
         return {
@@ -1,21 +1,22 @@
 from typing import Any, Dict, List, Optional
 
-from django.db import transaction
 from django.dispatch import receiver
 
 from opentelemetry import trace
 
-from baserow.contrib.database.api.rows.serializers import serialize_rows_for_response
 from baserow.contrib.database.rows import signals as row_signals
 from baserow.contrib.database.table.models import GeneratedTableModel
 from baserow.contrib.database.views.registries import view_type_registry
 from baserow.contrib.database.views.row_checker import FilteredViewRows, ViewHandler
 from baserow.contrib.database.ws.rows.signals import (
     RealtimeRowMessages,
+    before_rows_delete,
+    get_serialized_rows,
     serialize_rows_values,
 )
 from baserow.contrib.database.ws.views.rows.handler import ViewRealtimeRowsHandler
 from baserow.core.telemetry.utils import baserow_trace
+from baserow.ws.broadcast import PendingBroadcasts
 
 tracer = trace.get_tracer(__name__)
 
@@ -88,9 +89,9 @@ def views_rows_created(
     row_checker = ViewRealtimeRowsHandler().get_views_row_checker(
         table, model, only_include_views_which_want_realtime_events=True
     )
-    transaction.on_commit(
+    PendingBroadcasts.on_commit(
         lambda: _send_rows_created_event_to_views(
-            serialize_rows_for_response(rows, model),
+            get_serialized_rows(rows, model),
             before,
             row_checker.get_filtered_views_where_rows_are_visible(rows),
         ),
@@ -107,7 +108,6 @@ def views_before_rows_delete(sender, rows, user, table, model, **kwargs):
         "deleted_rows_views": (
             row_checker.get_filtered_views_where_rows_are_visible(rows)
         ),
-        "deleted_rows": serialize_rows_for_response(rows, model),
     }
 
 
@@ -120,10 +120,9 @@ def views_rows_deleted(
         return
 
     views = dict(before_return)[views_before_rows_delete]["deleted_rows_views"]
-    serialized_deleted_rows = dict(before_return)[views_before_rows_delete][
-        "deleted_rows"
-    ]
-    transaction.on_commit(
+    # The rows have already been serialized for the table's realtime message.
+    serialized_deleted_rows = dict(before_return)[before_rows_delete]
+    PendingBroadcasts.on_commit(
         lambda: _send_rows_deleted_event_to_views(serialized_deleted_rows, views)
     )
 
@@ -163,7 +162,6 @@ def views_rows_updated(
 
     before_return_dict = dict(before_return)[views_before_rows_update]
     serialized_old_rows = dict(before_return)[serialize_rows_values]
-    serialized_updated_rows = serialize_rows_for_response(rows, model)
 
     old_row_views: List[FilteredViewRows] = before_return_dict["old_rows_views"]
     existing_checker = before_return_dict["caching_row_checker"]
@@ -234,6 +232,7 @@ def views_rows_updated(
 
     @baserow_trace(tracer)
     def _send_created_updated_deleted_row_signals_to_views():
+        serialized_updated_rows = get_serialized_rows(rows, model)
         _send_rows_deleted_event_to_views(
             serialized_old_rows, views_where_rows_were_deleted
         )
@@ -262,4 +261,4 @@ def views_rows_updated(
             )
             view_realtime_rows_handler.broadcast_to_types(view, payload)
 
-    transaction.on_commit(_send_created_updated_deleted_row_signals_to_views)
+    PendingBroadcasts.on_commit(_send_created_updated_deleted_row_signals_to_views)
@@ -1,7 +1,9 @@
 import json
 import socket
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from smtplib import SMTPAuthenticationError, SMTPConnectError, SMTPNotSupportedError
 from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
 
@@ -9,7 +11,14 @@ from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.mail import EmailMultiAlternatives, get_connection
 from django.db import router
-from django.db.models import DurationField, ExpressionWrapper, F, Q, Value
+from django.db.models import (
+    DurationField,
+    ExpressionWrapper,
+    F,
+    Q,
+    Value,
+    prefetch_related_objects,
+)
 from django.db.models.functions import Coalesce, NullIf
 from django.urls import path
 from django.utils import timezone
@@ -66,6 +75,8 @@ from baserow.core.registries import ImportExportConfig
 from baserow.core.registry import Instance
 from baserow.core.services.dispatch_context import DispatchContext
 from baserow.core.services.exceptions import (
+    DispatchBatchException,
+    DispatchException,
     InvalidContextContentDispatchException,
     ServiceImproperlyConfiguredDispatchException,
     UnexpectedDispatchException,
@@ -92,6 +103,7 @@ class CoreHTTPRequestServiceType(CoreServiceType):
     type = "http_request"
     model_class = CoreHTTPRequestService
     dispatch_types = [DispatchTypes.ACTION]
+    supports_batch_dispatch = True
 
     allowed_fields = [
         "http_method",
@@ -536,14 +548,14 @@ class CoreHTTPRequestServiceType(CoreServiceType):
 
         return formulas
 
-    def dispatch_data(
+    def _get_request_kwargs(
         self,
         service: CoreHTTPRequestService,
         resolved_values: Dict[str, Any],
-        dispatch_context: DispatchContext,
-    ) -> Any:
+    ) -> Dict[str, Any]:
         """
-        Sends the request to the endpoint using the given data.
+        Builds the keyword arguments of the HTTP request function from the resolved
+        values of the service formulas.
         """
 
         body_content = resolved_values["body_content"]
@@ -571,19 +583,26 @@ class CoreHTTPRequestServiceType(CoreServiceType):
             q.key: resolved_values[f"param_{q.id}"] for q in service.query_params.all()
         }
 
-        try:
-            response = get_http_request_function()(
-                method=service.http_method,
-                url=resolved_values["url"],
-                headers=headers,
-                params=query_params,
-                timeout=service.timeout,
-                **body_dict,
-            )
+        return {
+            "method": service.http_method,
+            "url": resolved_values["url"],
+            "headers": headers,
+            "params": query_params,
+            "timeout": service.timeout,
+            **body_dict,
+        }
+
+    def _send_request(self, request_kwargs: Dict[str, Any]) -> Any:
+        """
+        Sends the request and returns the response data. It doesn't access the
+        database, so it can be called from another thread.
+        """
 
+        try:
+            response = get_http_request_function()(**request_kwargs)
         except (UnacceptableAddressException, ConnectionError) as e:
             raise UnexpectedDispatchException(
-                f"Invalid URL: {resolved_values['url']}"
+                f"Invalid URL: {request_kwargs['url']}"
             ) from e
         except request_exceptions.RequestException as e:
             raise UnexpectedDispatchException(str(e)) from e
@@ -611,6 +630,87 @@ class CoreHTTPRequestServiceType(CoreServiceType):
 
         return {"data": data}
 
+    def dispatch_data(
+        self,
+        service: CoreHTTPRequestService,
+        resolved_values: Dict[str, Any],
+        dispatch_context: DispatchContext,
+    ) -> Any:
+        """
+        Sends the request to the endpoint using the given data.
+        """
+
+        return self._send_request(self._get_request_kwargs(service, resolved_values))
+
+    def dispatch_batch(
+        self,
+        service: CoreHTTPRequestService,
+        dispatch_contexts: List[DispatchContext],
+    ) -> List[DispatchResult]:
+        """
+        Sends the request of every dispatch, at most as many at the same time as
+        allowed by the dispatch context, e.g. the workflow. The formulas of
+        all the dispatches are resolved first, then only the requests are sent in
+        threads, so that the database is never accessed outside the current
+        connection and transaction. If several requests fail, the error of the first
+        one is raised once all of them are done, with the responses of the requests
+        before it. If the formulas of a dispatch can't be resolved, only the requests
+        before it are sent.
+
+        :param service: the HTTP request service.
+        :param dispatch_contexts: the contexts used for formula resolution.
+        :return: The response of every dispatch.
+        :raises DispatchBatchException: When one of the requests fails.
+        """
+
+        if not dispatch_contexts:
+            return []
+
+        prefetch_related_objects([service], "form_data", "headers", "query_params")
+        requests_kwargs = []
+        resolve_error = None
+        for dispatch_context in dispatch_contexts:
+            try:
+                resolved_values = self.resolve_service_formulas(
+                    service, dispatch_context
+                )
+                requests_kwargs.append(
+                    self._get_request_kwargs(service, resolved_values)
+                )
+            except DispatchException as exc:
+                resolve_error = exc
+                break
+
+        workers = min(
+            dispatch_contexts[0].get_max_parallel_nodes(), len(requests_kwargs)
+        )
+        if workers <= 1:
+            # The requests are sent one by one, so that the ones after a failing
+            # request are not sent.
+            responses = [
+                partial(self._send_request, request_kwargs)
+                for request_kwargs in requests_kwargs
+            ]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="http-request-service"
+            ) as executor:
+                responses = [
+                    executor.submit(self._send_request, request_kwargs).result
+                    for request_kwargs in requests_kwargs
+                ]
+
+        results = []
+        for get_response in responses:
+            try:
+                results.append(self.dispatch_transform(get_response()))
+            except DispatchException as exc:
+                raise DispatchBatchException(results, exc) from exc
+
+        if resolve_error is not None:
+            raise DispatchBatchException(results, resolve_error) from resolve_error
+        return results
+
     def dispatch_transform(
         self,
         data: Any,
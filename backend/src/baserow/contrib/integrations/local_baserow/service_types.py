@@ -109,6 +109,7 @@ from baserow.core.handler import CoreHandler
 from baserow.core.registry import Instance
 from baserow.core.services.dispatch_context import DispatchContext
 from baserow.core.services.exceptions import (
+    DispatchException,
     DoesNotExist,
     InvalidContextContentDispatchException,
     ServiceImproperlyConfiguredDispatchException,
@@ -127,6 +128,7 @@ from baserow.core.services.types import (
 )
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.types import PermissionCheck
+from baserow.core.utils import grouper
 
 if TYPE_CHECKING:
     from baserow.contrib.database.table.models import GeneratedTableModel, Table
@@ -1733,6 +1735,7 @@ class LocalBaserowUpsertRowServiceType(
     type = "local_baserow_upsert_row"
     model_class = LocalBaserowUpsertRow
     dispatch_types = [DispatchTypes.ACTION]
+    supports_batch_dispatch = True
 
     @property
     def allowed_fields(self):
@@ -2004,30 +2007,17 @@ class LocalBaserowUpsertRowServiceType(
                     return str(errors)
         return str(detail)
 
-    def dispatch_data(
-        self,
-        service: LocalBaserowUpsertRow,
-        resolved_values: Dict[str, Any],
-        dispatch_context: DispatchContext,
-    ) -> Dict[str, Any]:
+    def _get_writable_field_mappings(
+        self, service: LocalBaserowUpsertRow
+    ) -> List[LocalBaserowTableServiceFieldMapping]:
         """
-        Responsible for creating a new row, or updating an existing row if a row ID has
-        been provided, in this `LocalBaserowUpsertRow` service's table.
+        Returns the enabled field mappings of the service whose field values the
+        authorized user of the integration is allowed to write.
 
         :param service: the local baserow upsert row service.
-        :param resolved_values: If the service has any formulas, this dictionary will
-            contain their resolved values.
-        :param dispatch_context: the context used for formula resolution.
-        :return: The created or updated rows.
+        :return: The writable field mappings.
         """
 
-        table = service.table
-        used_field_names = self.get_used_field_names(service, dispatch_context)
-
-        service.integration = service.integration.specific
-        row_id: Optional[int] = resolved_values.get("row_id", None)
-
-        row_values = {}
         field_mappings = (
             service.field_mappings.select_related("field")
             .filter(enabled=True)
@@ -2053,13 +2043,30 @@ class LocalBaserowUpsertRowServiceType(
         # Only iterate over field mappings which we know our authorized user is
         # allowed to write values to. Writable doesn't refer to the field type being
         # writable, but rather if the authorized user has the correct permission.
-        authorized_user_writable_field_mappings = [
+        return [
             context_map[check.context]
             for check, check_result in permission_check_results.items()
             if check_result
         ]
 
-        for field_mapping in authorized_user_writable_field_mappings:
+    def _get_row_values(
+        self,
+        service: LocalBaserowUpsertRow,
+        field_mappings: List[LocalBaserowTableServiceFieldMapping],
+        resolved_values: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Casts and validates the resolved values of the given field mappings.
+
+        :param service: the local baserow upsert row service.
+        :param field_mappings: the field mappings the values can be written to.
+        :param resolved_values: the resolved formulas of the service.
+        :raises InvalidContextContentDispatchException: If a value isn't valid.
+        :return: The row values keyed by field db column.
+        """
+
+        row_values = {}
+        for field_mapping in field_mappings:
             if field_mapping.id not in resolved_values:
                 continue
 
@@ -2105,33 +2112,76 @@ class LocalBaserowUpsertRowServiceType(
                     f'Value error for field "{field.name}": {exc.message}'
                 ) from exc
 
-        model = table.get_model()
+        return row_values
+
+    def _update_rows(
+        self,
+        service: LocalBaserowUpsertRow,
+        rows_values: List[Dict[str, Any]],
+        model: "GeneratedTableModel",
+    ) -> List["GeneratedTableModel"]:
+        try:
+            return UpdateRowsActionType.do(
+                service.integration.authorized_user,
+                service.table,
+                rows_values=rows_values,
+                model=model,
+            ).updated_rows
+        except RowDoesNotExist as exc:
+            raise ServiceImproperlyConfiguredDispatchException(
+                f"The row with id {exc.ids[0]} does not exist."
+            ) from exc
+
+    def _create_rows(
+        self,
+        service: LocalBaserowUpsertRow,
+        rows_values: List[Dict[str, Any]],
+        model: "GeneratedTableModel",
+    ) -> List["GeneratedTableModel"]:
+        try:
+            return CreateRowsActionType.do(
+                user=service.integration.authorized_user,
+                table=service.table,
+                rows_values=rows_values,
+                model=model,
+            )
+        except CannotCreateRowsInTable as exc:
+            raise ServiceImproperlyConfiguredDispatchException(
+                f"Cannot create rows in table {service.table_id} because "
+                "it has a data sync."
+            ) from exc
+
+    def dispatch_data(
+        self,
+        service: LocalBaserowUpsertRow,
+        resolved_values: Dict[str, Any],
+        dispatch_context: DispatchContext,
+    ) -> Dict[str, Any]:
+        """
+        Responsible for creating a new row, or updating an existing row if a row ID has
+        been provided, in this `LocalBaserowUpsertRow` service's table.
+
+        :param service: the local baserow upsert row service.
+        :param resolved_values: If the service has any formulas, this dictionary will
+            contain their resolved values.
+        :param dispatch_context: the context used for formula resolution.
+        :return: The created or updated rows.
+        """
+
+        used_field_names = self.get_used_field_names(service, dispatch_context)
+
+        service.integration = service.integration.specific
+        row_id: Optional[int] = resolved_values.get("row_id", None)
+        row_values = self._get_row_values(
+            service, self._get_writable_field_mappings(service), resolved_values
+        )
+
+        model = service.table.get_model()
 
         if row_id:
-            try:
-                (row,) = UpdateRowsActionType.do(
-                    service.integration.authorized_user,
-                    table,
-                    rows_values=[{**row_values, "id": row_id}],
-                    model=model,
-                ).updated_rows
-            except RowDoesNotExist as exc:
-                raise ServiceImproperlyConfiguredDispatchException(
-                    f"The row with id {row_id} does not exist."
-                ) from exc
+            (row,) = self._update_rows(service, [{**row_values, "id": row_id}], model)
         else:
-            try:
-                (row,) = CreateRowsActionType.do(
-                    user=service.integration.authorized_user,
-                    table=table,
-                    rows_values=[row_values],
-                    model=model,
-                )
-            except CannotCreateRowsInTable as exc:
-                raise ServiceImproperlyConfiguredDispatchException(
-                    f"Cannot create rows in table {table.id} because "
-                    "it has a data sync."
-                ) from exc
+            (row,) = self._create_rows(service, [row_values], model)
 
         return {
             "data": row,
@@ -2139,6 +2189,104 @@ class LocalBaserowUpsertRowServiceType(
             "public_formula_fields": used_field_names,
         }
 
+    def dispatch_batch(
+        self,
+        service: LocalBaserowUpsertRow,
+        dispatch_contexts: List[DispatchContext],
+    ) -> List[DispatchResult]:
+        """
+        Creates or updates the row of every dispatch with as few create and update
+        rows actions as possible, so that the signals, the dependant fields and the
+        webhooks are handled per batch of `BATCH_ROWS_SIZE_LIMIT` rows instead of per
+        row.
+
+        If one of the dispatches fails, all the rows written by the batch are rolled
+        back and the service is dispatched one by one instead, so that the error is
+        reported for the failing dispatch and the previous ones are kept.
+
+        :param service: the local baserow upsert row service.
+        :param dispatch_contexts: the contexts used for formula resolution.
+        :return: The serialized created or updated row of every dispatch.
+        :raises DispatchBatchException: When one of the dispatches fails.
+        """
+
+        if not dispatch_contexts:
+            return []
+
+        try:
+            with transaction.atomic():
+                return self._dispatch_rows_batch(service, dispatch_contexts)
+        except (DispatchException, DoesNotExist):
+            return super().dispatch_batch(service, dispatch_contexts)
+
+    def _dispatch_rows_batch(
+        self,
+        service: LocalBaserowUpsertRow,
+        dispatch_contexts: List[DispatchContext],
+    ) -> List[DispatchResult]:
+        """
+        Creates or updates the rows of all the dispatches at once. The values of all
+        the dispatches are validated before any row is written.
+        """
+
+        service.integration = service.integration.specific
+        field_mappings = self._get_writable_field_mappings(service)
+        model = service.table.get_model()
+
+        rows_to_create = []
+        rows_to_update = []
+        for index, dispatch_context in enumerate(dispatch_contexts):
+            resolved_values = self.resolve_service_formulas(service, dispatch_context)
+            row_id = resolved_values.get("row_id", None)
+            row_values = self._get_row_values(service, field_mappings, resolved_values)
+            if row_id:
+                rows_to_update.append((index, {**row_values, "id": row_id}))
+            else:
+                rows_to_create.append((index, row_values))
+
+        rows = [None] * len(dispatch_contexts)
+        for batch in grouper(settings.BATCH_ROWS_SIZE_LIMIT, rows_to_create):
+            indexes, rows_values = zip(*batch)
+            created_rows = self._create_rows(service, list(rows_values), model)
+            for index, row in zip(indexes, created_rows):
+                rows[index] = row
+
+        # A row can only be updated once per action, so a new batch is started when
+        # the same row must be updated again.
+        update_batches = [{}]
+        for index, row_values in rows_to_update:
+            batch = update_batches[-1]
+            if (
+                len(batch) >= settings.BATCH_ROWS_SIZE_LIMIT
+                or row_values["id"] in batch
+            ):
+                batch = {}
+                update_batches.append(batch)
+            batch[row_values["id"]] = index, row_values
+
+        for batch in update_batches:
+            if not batch:
+                continue
+            updated_rows = self._update_rows(
+                service, [row_values for index, row_values in batch.values()], model
+            )
+            for row in updated_rows:
+                index, row_values = batch[row.id]
+                rows[index] = row
+
+        return [
+            self.dispatch_transform(
+                {
+                    "data": row,
+                    "baserow_table_model": model,
+                    "public_formula_fields": self.get_used_field_names(
+                        service, dispatch_context
+                    ),
+                }
+            )
+            for row, dispatch_context in zip(rows, dispatch_contexts)
+        ]
+
     def dispatch_transform(self, dispatch_data: Dict[str, Any]) -> DispatchResult:
         """
         Responsible for serializing the `dispatch_data` row.
@@ -2207,6 +2355,7 @@ class LocalBaserowDeleteRowServiceType(
     type = "local_baserow_delete_row"
     model_class = LocalBaserowDeleteRow
     dispatch_types = [DispatchTypes.ACTION]
+    supports_batch_dispatch = True
 
     @property
     def simple_formula_fields(self):
@@ -2279,6 +2428,75 @@ class LocalBaserowDeleteRowServiceType(
 
         return {"data": {}, "baserow_table_model": model}
 
+    def dispatch_batch(
+        self,
+        service: LocalBaserowDeleteRow,
+        dispatch_contexts: List[DispatchContext],
+    ) -> List[DispatchResult]:
+        """
+        Deletes the rows of all the dispatches with one delete rows action per
+        batch of `BATCH_ROWS_SIZE_LIMIT` rows instead of one action per row. A row
+        that must be deleted by several dispatches is only deleted once.
+
+        If one of the dispatches fails, all the rows deleted by the batch are
+        restored and the service is dispatched one by one instead, so that the error
+        is reported for the failing dispatch and the previous ones are kept.
+
+        :param service: the local baserow delete row service.
+        :param dispatch_contexts: the contexts used for formula resolution.
+        :return: The dispatch result of every dispatch.
+        :raises DispatchBatchException: When one of the dispatches fails.
+        """
+
+        if not dispatch_contexts:
+            return []
+
+        try:
+            with transaction.atomic():
+                return self._delete_rows_batch(service, dispatch_contexts)
+        except (DispatchException, DoesNotExist):
+            return super().dispatch_batch(service, dispatch_contexts)
+
+    def _delete_rows_batch(
+        self,
+        service: LocalBaserowDeleteRow,
+        dispatch_contexts: List[DispatchContext],
+    ) -> List[DispatchResult]:
+        """
+        Deletes the rows of all the dispatches at once.
+        """
+
+        table = service.table
+        integration = service.integration.specific
+        model = table.get_model()
+
+        row_ids = {}
+        for dispatch_context in dispatch_contexts:
+            resolved_values = self.resolve_service_formulas(service, dispatch_context)
+            row_id: Optional[int] = resolved_values.get("row_id", None)
+            if row_id:
+                row_ids.setdefault(row_id, None)
+
+        for batch in grouper(settings.BATCH_ROWS_SIZE_LIMIT, row_ids):
+            try:
+                DeleteRowsActionType.do(
+                    integration.authorized_user, table, list(batch), model=model
+                )
+            except RowDoesNotExist as exc:
+                raise DoesNotExist(
+                    f"The row with id {exc.ids[0]} does not exist."
+                ) from exc
+            except CannotDeleteRowsInTable as exc:
+                raise ServiceImproperlyConfiguredDispatchException(
+                    f"Cannot delete rows in table {table.id} because "
+                    "it has a data sync."
+                ) from exc
+
+        return [
+            self.dispatch_transform({"data": {}, "baserow_table_model": model})
+            for dispatch_context in dispatch_contexts
+        ]
+
     def dispatch_transform(self, dispatch_data: Dict[str, Any]) -> DispatchResult:
         """
         The delete row action's `dispatch_data` will contain an empty
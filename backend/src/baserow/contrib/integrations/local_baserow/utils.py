@@ -135,7 +135,7 @@ def _handle_file(file_obj: dict, user: AbstractUser) -> dict:
 
         if UserFileHandler().is_user_file_name(last_segment):
             # it's a user file that was already uploaded, we can get it from the DB
-            user_file = UserFileHandler().get_user_file_by_name(last_segment)
+            user_file = UserFileHandler().get_user_file_by_name(last_segment, user=user)
         else:
             # It's a random URL let's try to upload it as new user file
             user_file = UserFileHandler().upload_user_file_by_url(
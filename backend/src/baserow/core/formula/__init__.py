@@ -24,7 +24,10 @@ __all__ = [
     BaserowFormulaSyntaxError,
 ]
 
-from baserow.core.formula.parser.parser import get_parse_tree_for_formula
+from baserow.core.formula.parser.parser import (  # noqa: F401
+    get_cached_parse_tree_for_formula,
+    get_parse_tree_for_formula,
+)
 from baserow.core.formula.parser.python_executor import BaserowPythonExecutor
 
 
@@ -50,5 +53,5 @@ def resolve_formula(
     if formula["mode"] == BASEROW_FORMULA_MODE_RAW:
         return formula["formula"]
 
-    tree = get_parse_tree_for_formula(formula["formula"])
+    tree = get_cached_parse_tree_for_formula(formula["formula"])
     return BaserowPythonExecutor(functions, formula_context).visit(tree)
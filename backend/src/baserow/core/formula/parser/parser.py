@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from antlr4 import CommonTokenStream, InputStream
 from antlr4.BufferedTokenStream import BufferedTokenStream
 from antlr4.error.ErrorListener import ErrorListener
@@ -8,6 +10,9 @@ from baserow.core.formula.parser.generated.BaserowFormulaLexer import (
     BaserowFormulaLexer,
 )
 
+# The number of parse trees kept in memory by `get_cached_parse_tree_for_formula`.
+PARSE_TREE_CACHE_SIZE = 4096
+
 
 class BaserowFormulaErrorListener(ErrorListener):
     """
@@ -44,6 +49,18 @@ def get_parse_tree_for_formula(formula: str):
     return parser.root()
 
 
+@lru_cache(maxsize=PARSE_TREE_CACHE_SIZE)
+def get_cached_parse_tree_for_formula(formula: str):
+    """
+    Same as `get_parse_tree_for_formula`, but the parse trees of the most recently
+    used formulas are kept in a process wide LRU cache because parsing is slow and the
+    same formulas are parsed again for every dispatch. The returned tree is shared, so
+    it must only be visited and never modified.
+    """
+
+    return get_parse_tree_for_formula(formula)
+
+
 # noinspection DuplicatedCode
 def convert_string_literal_token_to_string(string_literal, is_single_q):
     literal_without_outer_quotes = string_literal[1:-1]
@@ -316,6 +316,46 @@ class CoreHandler(metaclass=baserow_trace_methods(tracer)):
 
         return [actor for (actor, _, _), result in checked.items() if result is True]
 
+    def check_permissions_for_multiple_contexts(
+        self,
+        actor: Actor,
+        operations_and_contexts: List[Tuple[str, ContextObject]],
+        workspace: Optional[Workspace] = None,
+        include_trash: bool = False,
+    ) -> List[bool]:
+        """
+        Helper method for listing endpoints that must know which of many objects the
+        actor can access. All the (operation_name, context) pairs are checked at once,
+        so that the permission managers compute what they need, like the roles of the
+        actor per scope, only once instead of once per object. Listings that are
+        querysets should use `filter_queryset` instead, which filters them in the
+        database.
+
+        :param actor: The actor who wants to execute the operations. Generally a
+            `User`, but can be a `Token`.
+        :param operations_and_contexts: The pairs of operation name and context object
+            to check.
+        :param workspace: The optional workspace in which the operations take place.
+        :param include_trash: If true then also checks if the given workspace has been
+            trashed instead of raising a DoesNotExist exception.
+        :return: A list with, for each given pair and in the same order, whether the
+            operation is permitted on the context.
+        """
+
+        if settings.DEBUG or settings.TESTS:
+            for operation_name, context in operations_and_contexts:
+                self._ensure_context_matches_operation(context, operation_name)
+
+        checks = [
+            PermissionCheck(actor, operation_name, context)
+            for operation_name, context in operations_and_contexts
+        ]
+        checked = self.check_multiple_permissions(
+            checks, workspace, include_trash=include_trash
+        )
+
+        return [checked[check] is True for check in checks]
+
     def check_permissions(
         self,
         actor: Actor,
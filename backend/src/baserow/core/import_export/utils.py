@@ -1,7 +1,17 @@
+import hashlib
+import json
+import queue
+import tempfile
+import threading
+from typing import Any, Iterable, Iterator, Tuple
+from zipfile import ZipFile
+
 from django.core.files.base import File
 from django.core.files.storage import Storage
 from django.utils.encoding import force_bytes
 
+from baserow.core.storage import ExportZipFile
+
 DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
 
 
@@ -51,3 +61,110 @@ def chunk_generator(data: str | bytes, chunk_size: int = DEFAULT_CHUNK_SIZE):
 
     for i in range(0, len(data), chunk_size):
         yield force_bytes(data[i : i + chunk_size])
+
+
+def write_json_lines_to_zip(
+    files_zip: ExportZipFile,
+    name_prefix: str,
+    items: Iterable[Any],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Tuple[str, int]:
+    """
+    Writes every item as a JSON line to a temporary file while it's generated, and
+    adds that file to the zip. Only one item is kept in memory at a time, the zip
+    reads the file in chunks when it's written and closes it afterwards. The sha256
+    checksum of the content is added to the file name, so that it can be validated
+    when the zip is imported.
+
+    :param files_zip: The zip stream where the file must be added to.
+    :param name_prefix: The prefix of the file name in the zip.
+    :param items: The JSON serializable items that must be written.
+    :param chunk_size: The size of the chunks read from the file by the zip.
+    :return: The name of the file in the zip and the number of written items.
+    """
+
+    sha256 = hashlib.sha256()
+    count = 0
+    temporary_file = tempfile.TemporaryFile()
+    for item in items:
+        line = force_bytes(json.dumps(item)) + b"\n"
+        sha256.update(line)
+        temporary_file.write(line)
+        count += 1
+
+    def generate_chunks():
+        with temporary_file:
+            temporary_file.seek(0)
+            yield from chunk_iterator(temporary_file, chunk_size)
+
+    file_name = f"{name_prefix}_{sha256.hexdigest()}.jsonl"
+    files_zip.add(generate_chunks(), file_name)
+    return file_name, count
+
+
+def read_json_lines_from_zip(files_zip: ZipFile, file_name: str) -> Iterator[Any]:
+    """
+    Lazily reads the items of a file written by `write_json_lines_to_zip`.
+
+    :param files_zip: The zip file containing the file.
+    :param file_name: The name of the file in the zip.
+    :return: An iterator over the deserialized items.
+    """
+
+    with files_zip.open(file_name) as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_ahead(items: Iterable[Any], buffer_size: int) -> Iterator[Any]:
+    """
+    Iterates over the items in a separate thread, which stays at most `buffer_size`
+    items ahead of the caller. This is useful when reading the items, e.g. from a
+    zip file, can happen while the caller is processing the previous ones. The
+    items must not be produced with database queries, because the thread doesn't
+    use the connection and the transaction of the caller.
+
+    :param items: The items to iterate over.
+    :param buffer_size: The maximum number of items read ahead.
+    :return: An iterator over the items, in the same order.
+    """
+
+    buffer = queue.Queue(maxsize=max(buffer_size, 1))
+    stopped = threading.Event()
+    end = object()
+
+    def put(entry) -> bool:
+        # The caller can stop iterating at any time, in which case the thread must
+        # not wait forever for space in the buffer.
+        while not stopped.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def read():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            put((end, e))
+        else:
+            put((end, None))
+
+    thread = threading.Thread(target=read, name="read-ahead", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is end:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stopped.set()
+        thread.join()
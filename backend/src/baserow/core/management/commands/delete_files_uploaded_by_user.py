@@ -62,6 +62,22 @@ class Command(BaseCommand):
         deleted_count = 0
         for user_file in user_files:
             try:
+                # Identical uploads of other users share the same stored file, so it
+                # must be kept for them.
+                if (
+                    UserFile.objects.name(user_file.name)
+                    .filter(deleted_at__isnull=True)
+                    .exclude(uploaded_by_id=user_id)
+                    .exists()
+                ):
+                    user_file.deleted_at = now()
+                    user_file.save(update_fields=["deleted_at"])
+                    deleted_count += 1
+                    self.stdout.write(
+                        f"Kept {user_file.name} because it's shared with other users."
+                    )
+                    continue
+
                 file_path = handler.user_file_path(user_file)
                 if storage.exists(file_path):
                     storage.delete(file_path)
@@ -1,10 +1,13 @@
-from django.core.management.base import BaseCommand
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-from PIL import Image
+from django.core.management.base import BaseCommand
 
 from baserow.core.storage import get_default_storage
 from baserow.core.user_files.handler import UserFileHandler
 from baserow.core.user_files.models import UserFile
+from baserow.core.utils import grouper
 
 
 class Command(BaseCommand):
@@ -21,6 +24,12 @@ class Command(BaseCommand):
             help="The name of the thumbnails to regenerate (tiny, small or card_cover).",
             default=None,
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="The number of threads generating the thumbnails in parallel.",
+        )
 
     def handle(self, *args, **options):
         """
@@ -31,30 +40,29 @@ class Command(BaseCommand):
         i = 0
         handler = UserFileHandler()
         buffer_size = 100
-        queryset = UserFile.objects.filter(is_image=True)
-        count = queryset.count()
+        workers = max(options["workers"], 1)
         storage = get_default_storage()
 
-        while i < count:
-            user_files = queryset[i : min(count, i + buffer_size)]
-            for user_file in user_files:
-                i += 1
-
-                full_path = handler.user_file_path(user_file)
-                stream = storage.open(full_path)
-
-                try:
-                    image = Image.open(stream)
-                    handler.generate_and_save_image_thumbnails(
-                        image,
-                        user_file,
-                        storage=storage,
-                        only_with_name=options["name"],
-                    )
-                    image.close()
-                except IOError:
-                    pass
-
-                stream.close()
+        # Identical uploads share the same name, so their thumbnails are only
+        # generated once.
+        names = (
+            UserFile(unique=unique, sha256_hash=sha256_hash, original_extension=ext)
+            for unique, sha256_hash, ext in UserFile.objects.filter(is_image=True)
+            .order_by()
+            .values_list("unique", "sha256_hash", "original_extension")
+            .distinct()
+            .iterator(chunk_size=buffer_size * workers)
+        )
+        generate = partial(
+            handler.generate_user_file_thumbnails,
+            storage=storage,
+            only_with_name=options["name"],
+        )
+
+        # Pillow releases the GIL while resizing, so the thumbnails of several images
+        # are generated at the same time.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for user_files in grouper(buffer_size * workers, names):
+                i += len(list(executor.map(generate, user_files)))
 
         self.stdout.write(self.style.SUCCESS(f"{i} thumbnails have been regenerated."))
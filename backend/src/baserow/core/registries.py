@@ -114,6 +114,14 @@ class ImportExportConfig:
     ensures that sensitive data are excluded from the exported workspace file.
     """
 
+    stream_table_rows: bool = False
+    """
+    When True, the rows of the database tables are written to separate JSON lines
+    files in the export zip while they're fetched, instead of being included in the
+    serialized structure. This keeps the memory usage of exporting and importing
+    big tables low, but requires a zip file to write to.
+    """
+
 
 class Plugin(APIUrlsInstanceMixin, Instance):
     """
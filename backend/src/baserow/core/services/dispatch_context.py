@@ -80,6 +80,16 @@ class DispatchContext(RuntimeFormulaContext, ABC):
 
         return new_context
 
+    def get_max_parallel_nodes(self) -> int:
+        """
+        Returns how many dispatches of a batch can run at the same time, for the
+        service types sending the requests of a batch in parallel.
+
+        Defaults to `1`.
+        """
+
+        return 1
+
     @property
     @abstractmethod
     def is_publicly_searchable(self) -> bool:
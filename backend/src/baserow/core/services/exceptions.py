@@ -1,3 +1,9 @@
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    from baserow.core.services.types import DispatchResult
+
+
 class ServiceDoesNotExist(Exception):
     """Raised when trying to get a service that doesn't exist."""
 
@@ -35,6 +41,19 @@ class DoesNotExist(Exception):
     """Raised when calling a service dispatch method and nothing is found."""
 
 
+class DispatchBatchException(DispatchException):
+    """
+    Raised when one of the dispatches of a batch fails. Contains the results of the
+    dispatches before the failing one, which have been executed, and the error of
+    the failing one.
+    """
+
+    def __init__(self, results: List["DispatchResult"], error: Exception):
+        super().__init__(str(error))
+        self.results = results
+        self.error = error
+
+
 class InvalidServiceTypeDispatchSource(Exception):
     """
     Raised when a `DataSource` or `BuilderWorkflowAction` is created or updated,
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union, cast
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union, cast
 from zipfile import ZipFile
 
 from django.core.files.storage import Storage
@@ -230,6 +230,29 @@ class ServiceHandler:
 
         return service.get_type().dispatch(service, dispatch_context)
 
+    def dispatch_service_batch(
+        self,
+        service: Service,
+        dispatch_contexts: List[DispatchContext],
+    ) -> List[DispatchResult]:
+        """
+        Dispatch the given service once for every context.
+
+        :param service: The service to be dispatched.
+        :param dispatch_contexts: The contexts used for the dispatches.
+        :return: The results of the dispatches, in the order of the contexts.
+        """
+
+        if (
+            service.integration_id is None
+            and service.get_type().integration_type is not None
+        ):
+            raise ServiceImproperlyConfiguredDispatchException(
+                "No integration selected"
+            )
+
+        return service.get_type().dispatch_batch(service, dispatch_contexts)
+
     def export_service(
         self,
         service,
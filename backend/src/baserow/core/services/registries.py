@@ -35,7 +35,9 @@ from baserow.core.services.dispatch_context import DispatchContext
 from baserow.core.services.types import DispatchResult, FormulaToResolve
 
 from .exceptions import (
+    DispatchBatchException,
     DispatchException,
+    DoesNotExist,
     InvalidContextContentDispatchException,
     InvalidContextDispatchException,
     ServiceImproperlyConfiguredDispatchException,
@@ -81,6 +83,10 @@ class ServiceType(
     # Does this service return a list of record?
     returns_list = False
 
+    # Can the service be dispatched for several contexts at once with
+    # `dispatch_batch` more efficiently than one by one?
+    supports_batch_dispatch = False
+
     # What parent object is responsible for dispatching this `ServiceType`?
     # It could be via a `DataSource`, in which case `DATA` should be
     # chosen, or via a `WorkflowAction`, in which case `ACTION`
@@ -398,6 +404,35 @@ class ServiceType(
                 service.save()
             return serialized_data
 
+    def dispatch_batch(
+        self,
+        service: ServiceSubClass,
+        dispatch_contexts: List[DispatchContext],
+    ) -> List[DispatchResult]:
+        """
+        Dispatches the service once for every given context. Service types
+        supporting it, see `supports_batch_dispatch`, override this method to
+        execute the task of all the dispatches at once. Sample data are never used
+        nor updated.
+
+        If a dispatch fails, the next ones are not executed and a
+        `DispatchBatchException` is raised with the results of the previous ones,
+        like if the service had been dispatched one by one.
+
+        :param service: The service instance to dispatch with.
+        :param dispatch_contexts: The contexts of the dispatches.
+        :return: The dispatch result of every context, in the same order.
+        :raises DispatchBatchException: When one of the dispatches fails.
+        """
+
+        results = []
+        for dispatch_context in dispatch_contexts:
+            try:
+                results.append(self.dispatch(service, dispatch_context))
+            except (DispatchException, DoesNotExist) as exc:
+                raise DispatchBatchException(results, exc) from exc
+        return results
+
     def remove_unused_field_names(
         self,
         row: Dict[str, Any],
@@ -1,3 +1,4 @@
+import threading
 from io import BytesIO
 from typing import BinaryIO
 
@@ -21,6 +22,31 @@ def get_default_storage() -> Storage:
     return default_storage
 
 
+class LockedExportZipFile:
+    """
+    Wraps an `ExportZipFile` so that files can safely be added to it from multiple
+    threads. A file that's already in the zip is not added again, because another
+    thread could have added it after the caller checked the `info_list`.
+    """
+
+    def __init__(self, files_zip: ExportZipFile):
+        self._files_zip = files_zip
+        self._lock = threading.Lock()
+
+    def add(self, data, arcname, **kwargs):
+        with self._lock:
+            if any(item["name"] == arcname for item in self._files_zip.info_list()):
+                return
+            return self._files_zip.add(data, arcname, **kwargs)
+
+    def info_list(self):
+        with self._lock:
+            return self._files_zip.info_list()
+
+    def __getattr__(self, name):
+        return getattr(self._files_zip, name)
+
+
 class OverwritingStorageHandler:
     def __init__(self, storage=None):
         self.storage = storage or get_default_storage()
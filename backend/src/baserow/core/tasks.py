@@ -17,6 +17,7 @@ from .user.tasks import (
     check_pending_account_deletion,
     share_onboarding_details_with_baserow,
 )
+from .user_files.tasks import generate_user_file_thumbnails
 
 
 @app.task(
@@ -45,4 +46,5 @@ __all__ = [
     "delete_expired_snapshots",
     "initialize_otel",
     "share_onboarding_details_with_baserow",
+    "generate_user_file_thumbnails",
 ]
@@ -642,19 +642,22 @@ def _get_applications_excluding_perm_deleted(
         .exclude(id__in=perm_deleted_apps)
         .order_by("order", "id")
     )
-    filtered_applications = []
-    for application in applications:
-        can_view_application = CoreHandler().check_permissions(
-            user,
-            ReadApplicationTrashOperationType.type,
-            workspace=workspace,
-            context=application,
-            raise_permission_exceptions=False,
-            include_trash=True,
+    can_view_applications = CoreHandler().check_permissions_for_multiple_contexts(
+        user,
+        [
+            (ReadApplicationTrashOperationType.type, application)
+            for application in applications
+        ],
+        workspace=workspace,
+        include_trash=True,
+    )
+    return [
+        application
+        for application, can_view_application in zip(
+            applications, can_view_applications
         )
-        if can_view_application:
-            filtered_applications.append(application)
-    return filtered_applications
+        if can_view_application
+    ]
 
 
 def _get_trash_entry(
@@ -4,16 +4,21 @@ import os
 import pathlib
 import re
 import secrets
+from collections import defaultdict
+from datetime import datetime, timedelta
 from io import BytesIO
 from os.path import join
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 from urllib.parse import urlparse
 from zipfile import ZipFile
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.storage import Storage
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db.models import QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.utils.http import parse_header_parameters
 
 from loguru import logger
@@ -38,11 +43,18 @@ from .exceptions import (
     MaximumUniqueTriesError,
 )
 from .models import deconstruct_user_file_regex
+from .tasks import generate_user_file_thumbnails
 
 if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractUser
+
     from PIL import Image
 
 MIME_TYPE_UNKNOWN = "application/octet-stream"
+THUMBNAILS_PENDING_CACHE_KEY_PREFIX = "user_file_thumbnails_pending"
+
+# The EXIF orientations that rotate the image by 90 or 270 degrees.
+EXIF_TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
 
 
 class UserFileHandler:
@@ -64,13 +76,19 @@ class UserFileHandler:
         return url
 
     def get_user_file_by_name(
-        self, user_file_name: str, base_queryset: Optional[QuerySet] = None
+        self,
+        user_file_name: str,
+        base_queryset: Optional[QuerySet] = None,
+        user: Optional["AbstractUser"] = None,
     ) -> UserFile:
         """
-        Returns the user file with the provided id.
+        Returns the user file with the provided name. Identical uploads share the
+        same name, so the newest user file uploaded by the provided user is returned
+        if there is one, otherwise the first uploaded one.
 
         :param user_file_name: The name of the user file.
         :param base_queryset: The base queryset that will be used to get the user file.
+        :param user: The user on whose behalf the user file is looked up.
         :raises UserFile.DoesNotExist: If the user file does not exist.
         :return: The user file.
         """
@@ -78,7 +96,59 @@ class UserFileHandler:
         if base_queryset is None:
             base_queryset = UserFile.objects.all()
 
-        return base_queryset.name(user_file_name).get()
+        user_files = list(base_queryset.name(user_file_name).order_by("id"))
+        if not user_files:
+            raise UserFile.DoesNotExist(
+                f"The user file {user_file_name} does not exist."
+            )
+
+        own_user_files = [
+            user_file
+            for user_file in user_files
+            if user is not None and user_file.uploaded_by_id == user.id
+        ]
+        return (own_user_files or user_files[:1])[-1]
+
+    def get_user_files_by_name(self, *user_file_names: str) -> Dict[str, UserFile]:
+        """
+        Returns a user file for every provided name that exists. Identical uploads
+        share the same name, so a name can match the user files of several uploads,
+        possibly made by other users. In that case an unsaved user file with the
+        content of the first upload is returned, with the current time as upload time
+        and only the original name if all the uploads have the same, so that the
+        details of another user's upload are never exposed. It must therefore only be
+        used to serialize the file.
+
+        :param user_file_names: The names of the user files.
+        :return: A dict where the key is the name and the value the user file.
+        """
+
+        user_files_by_name = defaultdict(list)
+        for user_file in UserFile.objects.name(*user_file_names).order_by("id"):
+            user_files_by_name[user_file.name].append(user_file)
+
+        now = timezone.now()
+        result = {}
+        for name, user_files in user_files_by_name.items():
+            first = user_files[0]
+            if len(user_files) > 1:
+                original_names = {user_file.original_name for user_file in user_files}
+                first = UserFile(
+                    original_name=(
+                        first.original_name if len(original_names) == 1 else ""
+                    ),
+                    original_extension=first.original_extension,
+                    size=first.size,
+                    mime_type=first.mime_type,
+                    is_image=first.is_image,
+                    image_width=first.image_width,
+                    image_height=first.image_height,
+                    uploaded_at=now,
+                    unique=first.unique,
+                    sha256_hash=first.sha256_hash,
+                )
+            result[name] = first
+        return result
 
     def user_file_path(self, user_file_name):
         """
@@ -167,6 +237,62 @@ class UserFileHandler:
             ).exists():
                 return unique
 
+    def get_thumbnails_pending_cache_key(self, user_file_name: str) -> str:
+        return f"{THUMBNAILS_PENDING_CACHE_KEY_PREFIX}_{user_file_name}"
+
+    def are_thumbnails_pending(
+        self, user_file_name: str, uploaded_at: datetime | str | None
+    ) -> bool:
+        """
+        Checks if the thumbnails of the user file are still being generated in the
+        background. Only recently uploaded files can have pending thumbnails, so the
+        cache isn't hit for the others.
+
+        :param user_file_name: The name of the user file.
+        :param uploaded_at: When the user file has been uploaded, as a datetime or in
+            the ISO format of a serialized user file.
+        :return: Whether the thumbnails are pending.
+        """
+
+        if isinstance(uploaded_at, str):
+            uploaded_at = parse_datetime(uploaded_at)
+
+        if uploaded_at is None or uploaded_at < timezone.now() - timedelta(
+            seconds=settings.BASEROW_THUMBNAILS_PENDING_TIMEOUT_SECONDS
+        ):
+            return False
+
+        return bool(cache.get(self.get_thumbnails_pending_cache_key(user_file_name)))
+
+    def can_save_thumbnails(self, image: "Image") -> bool:
+        """
+        Checks, without decoding the image, if Pillow is able to save thumbnails in
+        the format of the image. That's for example not the case for PSD files.
+        """
+
+        from PIL import Image
+
+        Image.init()
+        return image.format is not None and image.format.upper() in Image.SAVE
+
+    def get_transposed_image_size(self, image: "Image") -> Tuple[int, int]:
+        """
+        Returns the size of the image once it has been transposed according to its
+        EXIF orientation, like `generate_and_save_image_thumbnails` does, but
+        without decoding the image.
+        """
+
+        from PIL import ExifTags
+
+        try:
+            orientation = image.getexif().get(ExifTags.Base.Orientation)
+        except Exception:
+            orientation = None
+
+        if orientation in EXIF_TRANSPOSED_ORIENTATIONS:
+            return image.height, image.width
+        return image.width, image.height
+
     def generate_and_save_image_thumbnails(
         self,
         image: "Image",
@@ -230,6 +356,125 @@ class UserFileHandler:
                 del thumbnail
                 del thumbnail_stream
 
+    def generate_user_file_thumbnails(
+        self,
+        user_file_name: str | UserFile,
+        storage: Storage | None = None,
+        only_with_name: str | None = None,
+    ) -> bool:
+        """
+        Opens the stored user file and generates its thumbnails. This is used to
+        generate them in the background after the upload, and to regenerate them.
+
+        :param user_file_name: The name of the user file.
+        :param storage: The storage where the user file is saved and where the
+            thumbnails must be saved to.
+        :param only_with_name: If provided, then only thumbnail types with that name
+            will be regenerated.
+        :return: Whether the thumbnails have been generated.
+        """
+
+        from PIL import Image
+
+        if isinstance(user_file_name, UserFile):
+            user_file_name = user_file_name.name
+
+        storage = storage or get_default_storage()
+
+        try:
+            with storage.open(self.user_file_path(user_file_name)) as stream:
+                with Image.open(stream) as image:
+                    self.generate_and_save_image_thumbnails(
+                        image,
+                        user_file_name,
+                        storage=storage,
+                        only_with_name=only_with_name,
+                    )
+            return True
+        except IOError:
+            return False  # Not an image or not stored anymore.
+        except Exception as exc:
+            logger.warning(
+                f"Failed to generate thumbnails for user file {user_file_name}: {exc}"
+            )
+            return False
+
+    def generate_pending_user_file_thumbnails(self, user_file_name: str):
+        """
+        Generates the thumbnails that have been marked as pending after the upload.
+        The user files, and the cells referencing them, already present the file as
+        an image. So if the thumbnails can't be generated, the original image is
+        saved as thumbnail instead, to keep serving it like while they were pending.
+        If that's not possible either, the user files are not considered as images
+        anymore.
+
+        :param user_file_name: The name of the user file.
+        """
+
+        storage = get_default_storage()
+        if not self.generate_user_file_thumbnails(user_file_name, storage=storage):
+            try:
+                with storage.open(self.user_file_path(user_file_name)) as stream:
+                    original = BytesIO(stream.read())
+                handler = OverwritingStorageHandler(storage)
+                for name in settings.USER_THUMBNAILS.keys():
+                    original.seek(0)
+                    handler.save(
+                        self.user_file_thumbnail_path(user_file_name, name), original
+                    )
+            except Exception as exc:
+                logger.warning(
+                    f"Failed to save the original of user file {user_file_name} as "
+                    f"thumbnail: {exc}"
+                )
+                UserFile.objects.all().name(user_file_name).update(
+                    is_image=False, image_width=None, image_height=None
+                )
+        cache.delete(self.get_thumbnails_pending_cache_key(user_file_name))
+
+    def generate_user_file_thumbnails_in_background(self, user_file_name: str):
+        """
+        Generates the thumbnails of a user file saved in the default storage in a
+        celery task, so that the CPU heavy resizing doesn't block the request. They're
+        marked as pending until then.
+
+        :param user_file_name: The name of the user file.
+        """
+
+        cache.set(
+            self.get_thumbnails_pending_cache_key(user_file_name),
+            True,
+            timeout=settings.BASEROW_THUMBNAILS_PENDING_TIMEOUT_SECONDS,
+        )
+        generate_user_file_thumbnails.delay(user_file_name)
+
+    def get_stored_user_file_with_same_content(
+        self, sha256_hash: str, extension: str, storage: Storage
+    ) -> Optional[UserFile]:
+        """
+        Returns an existing user file with exactly the same content and extension, if
+        its file is saved in the provided storage. A new upload of the same content
+        can share its name, so that the content is never stored or thumbnailed twice.
+        The first uploaded one is always returned, and only its stored content is
+        reused, the new upload keeps its own original name, uploader and upload time.
+
+        :param sha256_hash: The sha256 hash of the uploaded content.
+        :param extension: The extension of the uploaded file.
+        :param storage: The storage where the file must be saved to.
+        :return: The existing user file or None.
+        """
+
+        user_file = UserFile.objects.filter(
+            sha256_hash=sha256_hash,
+            original_extension=extension,
+            deleted_at__isnull=True,
+        ).order_by("id").first()
+
+        if user_file is None or not storage.exists(self.user_file_path(user_file)):
+            return None
+
+        return user_file
+
     def upload_user_file(self, user, file_name, stream, storage=None):
         """
         Saves the provided uploaded file in the provided storage. If no storage is
@@ -263,6 +508,11 @@ class UserFileHandler:
                 "The provided file is too large.",
             )
 
+        # The thumbnails can only be generated in the background if the celery task
+        # can find the file back in the storage.
+        in_background = settings.BASEROW_GENERATE_THUMBNAILS_IN_BACKGROUND and (
+            storage is None or storage is get_default_storage()
+        )
         storage = storage or get_default_storage()
         stream_hash = sha256_hash(stream)
         file_name = truncate_middle(file_name, 64)
@@ -282,6 +532,25 @@ class UserFileHandler:
             or getattr(stream, "content_type", None)
             or MIME_TYPE_UNKNOWN
         )
+
+        stored_user_file = self.get_stored_user_file_with_same_content(
+            stream_hash, extension, storage
+        )
+        if stored_user_file is not None:
+            stream.close()
+            return UserFile.objects.create(
+                original_name=file_name,
+                original_extension=extension,
+                size=size,
+                mime_type=stored_user_file.mime_type,
+                is_image=stored_user_file.is_image,
+                image_width=stored_user_file.image_width,
+                image_height=stored_user_file.image_height,
+                unique=stored_user_file.unique,
+                uploaded_by=user,
+                sha256_hash=stream_hash,
+            )
+
         unique = self.generate_unique(stream_hash, extension)
         user_file = UserFile(
             original_name=file_name,
@@ -294,16 +563,24 @@ class UserFileHandler:
         )
 
         image = None
+        thumbnails_pending = False
         try:
             image = Image.open(stream)
             user_file.mime_type = f"image/{image.format}".lower()
-            self.generate_and_save_image_thumbnails(
-                image, user_file.name, storage=storage
-            )
+            if in_background:
+                if not self.can_save_thumbnails(image):
+                    raise ValueError(f"Thumbnails can't be saved as {image.format}.")
+                image_width, image_height = self.get_transposed_image_size(image)
+                thumbnails_pending = True
+            else:
+                self.generate_and_save_image_thumbnails(
+                    image, user_file.name, storage=storage
+                )
+                image_width, image_height = image.width, image.height
             # Skip marking as images if thumbnails cannot be generated (i.e. PSD files).
             user_file.is_image = True
-            user_file.image_width = image.width
-            user_file.image_height = image.height
+            user_file.image_width = image_width
+            user_file.image_height = image_height
         except IOError:
             pass  # Not an image
         except Exception as exc:
@@ -324,6 +601,9 @@ class UserFileHandler:
         # Close the stream because we don't need it anymore.
         stream.close()
 
+        if thumbnails_pending:
+            self.generate_user_file_thumbnails_in_background(user_file.name)
+
         return user_file
 
     def upload_user_file_by_url(self, user, url, file_name=None, storage=None):
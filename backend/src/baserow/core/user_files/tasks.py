@@ -0,0 +1,18 @@
+from baserow.config.celery import app
+
+
+@app.task(
+    bind=True,
+    queue="export",
+)
+def generate_user_file_thumbnails(self, user_file_name: str):
+    """
+    Generates the thumbnails of an image user file that has been saved in the default
+    storage.
+
+    :param user_file_name: The name of the user file.
+    """
+
+    from baserow.core.user_files.handler import UserFileHandler
+
+    UserFileHandler().generate_pending_user_file_thumbnails(user_file_name)
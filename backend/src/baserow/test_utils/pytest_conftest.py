@@ -906,6 +906,7 @@ class FakeDispatchContext(DispatchContext):
         "_searchable_fields",
         "_search_query",
         "_count",
+        "_max_parallel_nodes",
     ]
 
     def __init__(self, **kwargs):
@@ -915,6 +916,7 @@ class FakeDispatchContext(DispatchContext):
         self._searchable_fields = kwargs.pop("searchable_fields", [])
         self._search_query = kwargs.pop("search_query", None)
         self._count = kwargs.pop("count", 100)
+        self._max_parallel_nodes = kwargs.pop("max_parallel_nodes", 1)
 
         for key, value in kwargs.items():
             setattr(self, key, value)
@@ -946,6 +948,9 @@ class FakeDispatchContext(DispatchContext):
     def range(self, service):
         return [0, self._count]
 
+    def get_max_parallel_nodes(self) -> int:
+        return self._max_parallel_nodes
+
     def __getitem__(self, key: str) -> Any:
         if key == "test":
             return 2
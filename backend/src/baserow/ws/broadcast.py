@@ -0,0 +1,178 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from asgiref.local import Local
+from loguru import logger
+
+if TYPE_CHECKING:
+    from baserow.ws.registries import PageType
+
+_flushing = Local()
+
+
+class PendingBroadcast:
+    def __init__(
+        self,
+        page_type: "PageType",
+        channel_group_name: str,
+        payload: Dict[str, Any],
+        ignore_web_socket_id: Optional[str] = None,
+        exclude_user_ids: Optional[List[int]] = None,
+    ):
+        self.page_type = page_type
+        self.channel_group_name = channel_group_name
+        self.payload = payload
+        self.ignore_web_socket_id = ignore_web_socket_id
+        self.exclude_user_ids = exclude_user_ids
+
+    def merge(self, other: "PendingBroadcast") -> bool:
+        """
+        Merges the payload of the other broadcast into this one if they are sent to
+        the same recipients and the page type knows how to merge them.
+
+        :return: Whether the other broadcast has been merged.
+        """
+
+        if (
+            self.channel_group_name != other.channel_group_name
+            or self.ignore_web_socket_id != other.ignore_web_socket_id
+            or self.exclude_user_ids != other.exclude_user_ids
+        ):
+            return False
+
+        payload = self.page_type.merge_payloads(self.payload, other.payload)
+        if payload is None:
+            return False
+
+        self.payload = payload
+        return True
+
+
+class PendingBroadcasts:
+    """
+    Collects the callbacks broadcasting the realtime updates of a transaction, so
+    that when it commits they're executed at once. The values needed by several of
+    them, like the serialized rows, are computed once with `get_or_set`, and the
+    consecutive payloads sent to the same channel group are merged into one message
+    when the page type allows it.
+    """
+
+    def __init__(self):
+        self.callbacks: List[Callable[[], None]] = []
+        self.broadcasts: List[PendingBroadcast] = []
+        self.cache: Dict[Any, Any] = {}
+
+    @classmethod
+    def on_commit(cls, callback: Callable[[], None]):
+        """
+        Executes the callback when the current transaction commits, together with
+        the other callbacks registered in the same savepoint, so that they're
+        discarded together if it's rolled back.
+
+        :param callback: The function broadcasting the realtime updates.
+        """
+
+        connection = transaction.get_connection()
+        if connection.in_atomic_block:
+            savepoint_ids = set(connection.savepoint_ids)
+            for sids, on_commit_callback, _ in reversed(connection.run_on_commit):
+                if isinstance(on_commit_callback, cls) and sids == savepoint_ids:
+                    on_commit_callback.callbacks.append(callback)
+                    return
+
+        pending_broadcasts = cls()
+        pending_broadcasts.callbacks.append(callback)
+        transaction.on_commit(pending_broadcasts)
+
+    @classmethod
+    def get_flushing(cls) -> Optional["PendingBroadcasts"]:
+        """
+        Returns the pending broadcasts of which the callbacks are being executed.
+        """
+
+        return getattr(_flushing, "pending_broadcasts", None)
+
+    @classmethod
+    def get_or_set(cls, key: Any, default: Callable[[], Any]) -> Any:
+        """
+        Returns the value computed by `default` the first time it's called with the
+        key while the callbacks are executed, so that the value is shared by all of
+        them. Outside the callbacks, the value is always computed.
+
+        :param key: The key of the value. The objects it refers to must be kept
+            alive by the callbacks, so that their ids can't be reused.
+        :param default: The function computing the value.
+        """
+
+        pending_broadcasts = cls.get_flushing()
+        if pending_broadcasts is None:
+            return default()
+
+        if key not in pending_broadcasts.cache:
+            pending_broadcasts.cache[key] = default()
+        return pending_broadcasts.cache[key]
+
+    def add(self, broadcast: PendingBroadcast):
+        for pending_broadcast in reversed(self.broadcasts):
+            if pending_broadcast.channel_group_name == broadcast.channel_group_name:
+                # Only the last message of the channel group can be merged, otherwise
+                # the messages would be received in a different order.
+                if pending_broadcast.merge(broadcast):
+                    return
+                break
+        self.broadcasts.append(broadcast)
+
+    def __call__(self):
+        _flushing.pending_broadcasts = self
+        try:
+            for callback in self.callbacks:
+                callback()
+        finally:
+            _flushing.pending_broadcasts = None
+
+        if settings.BASEROW_WS_BROADCAST_ROWS_DIRECTLY:
+            # The transaction is already committed, so a failure must not fail the
+            # request.
+            try:
+                self.send_to_channel_layer()
+            except Exception:
+                logger.exception("Could not publish the realtime messages.")
+            return
+
+        for broadcast in self.broadcasts:
+            broadcast.page_type.send_broadcast(
+                broadcast.channel_group_name,
+                broadcast.payload,
+                broadcast.ignore_web_socket_id,
+                broadcast.exclude_user_ids,
+            )
+
+    def send_to_channel_layer(self):
+        """
+        Publishes all the messages to the channel layer in one go, without passing
+        by celery.
+        """
+
+        from asgiref.sync import async_to_sync
+        from channels.layers import get_channel_layer
+
+        from baserow.ws.tasks import send_messages_to_channel_groups
+
+        async_to_sync(send_messages_to_channel_groups)(
+            get_channel_layer(),
+            [
+                (
+                    broadcast.channel_group_name,
+                    {
+                        "type": "broadcast_to_group",
+                        "channel_group_name": broadcast.channel_group_name,
+                        "payload": broadcast.payload,
+                        "ignore_web_socket_id": broadcast.ignore_web_socket_id,
+                        "exclude_user_ids": broadcast.exclude_user_ids,
+                    },
+                )
+                for broadcast in self.broadcasts
+            ],
+        )
@@ -7,9 +7,17 @@ from channels.generic.websocket import AsyncJsonWebsocketConsumer
 
 from baserow.ws.registries import PageType, page_registry
 
+try:
+    import msgpack
+except ImportError:
+    # The `msgpack` subprotocol is only offered if `msgpack` is installed.
+    msgpack = None
+
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
 
+MSGPACK_SUBPROTOCOL = "msgpack"
+
 
 @dataclass
 class PageContext:
@@ -128,8 +136,18 @@ class SubscribedPages:
 
 
 class CoreConsumer(AsyncJsonWebsocketConsumer):
+    use_msgpack = False
+    """
+    Indicates whether the messages are sent as msgpack encoded binary frames instead
+    of JSON text frames. Clients opt in by requesting the `msgpack` subprotocol.
+    """
+
     async def connect(self):
-        await self.accept()
+        self.use_msgpack = (
+            msgpack is not None
+            and MSGPACK_SUBPROTOCOL in self.scope.get("subprotocols", [])
+        )
+        await self.accept(MSGPACK_SUBPROTOCOL if self.use_msgpack else None)
 
         user = self.scope["user"]
         web_socket_id = self.scope["web_socket_id"]
@@ -147,12 +165,25 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
             return
 
         self.scope["pages"] = SubscribedPages()
+        self.scope["update_formats"] = {}
         await self.channel_layer.group_add("users", self.channel_name)
 
     async def disconnect(self, message):
         await self._remove_all_page_scopes(send_confirmation=False)
         await self.channel_layer.group_discard("users", self.channel_name)
 
+    async def send_json(self, content, close=False):
+        if self.use_msgpack:
+            await self.send(bytes_data=msgpack.packb(content), close=close)
+        else:
+            await super().send_json(content, close=close)
+
+    async def receive(self, text_data=None, bytes_data=None, **kwargs):
+        if self.use_msgpack and bytes_data is not None:
+            await self.receive_json(msgpack.unpackb(bytes_data), **kwargs)
+        else:
+            await super().receive(text_data=text_data, bytes_data=bytes_data, **kwargs)
+
     async def receive_json(self, content, **parameters):
         """
         Processes incoming messages.
@@ -208,7 +239,9 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
         receive real time updates for.
 
         :param content: The provided payload by the user. This should contain the page
-            type and additional parameters.
+            type and additional parameters. It can optionally contain the
+            `update_format` in which the broadcast payloads must be sent, if the page
+            type supports it.
         """
 
         context = await self._get_page_context(content, "page")
@@ -239,9 +272,19 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
         page_scope = PageScope(page_type=page_type.type, page_parameters=parameters)
         self.scope["pages"].add(page_scope)
 
-        await self.send_json(
-            {"type": "page_add", "page": page_type.type, "parameters": parameters}
-        )
+        confirmation = {
+            "type": "page_add",
+            "page": page_type.type,
+            "parameters": parameters,
+        }
+        update_format = content.get("update_format")
+        if update_format in page_type.update_formats:
+            self.scope["update_formats"][group_name] = (page_type, update_format)
+            confirmation["update_format"] = update_format
+        else:
+            self.scope["update_formats"].pop(group_name, None)
+
+        await self.send_json(confirmation)
 
     async def _remove_page_scope(self, content: dict, send_confirmation=True):
         """
@@ -266,6 +309,7 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
 
         group_name = page_type.get_group_name(**parameters)
         await self.channel_layer.group_discard(group_name, self.channel_name)
+        self.scope.get("update_formats", {}).pop(group_name, None)
 
         page_scope = PageScope(page_type=page_type.type, page_parameters=parameters)
 
@@ -421,6 +465,13 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
             return
 
         if not ignore_web_socket_id or ignore_web_socket_id != web_socket_id:
+            # Convert the payload if the page has been subscribed to with another
+            # update format.
+            page_type, update_format = self.scope.get("update_formats", {}).get(
+                event.get("channel_group_name"), (None, None)
+            )
+            if page_type is not None:
+                payload = page_type.transform_payload(payload, update_format)
             await self.send_json(payload)
 
     async def users_removed_from_permission_group(self, event):
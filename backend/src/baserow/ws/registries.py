@@ -1,6 +1,7 @@
 from typing import Optional
 
 from baserow.core.registry import Instance, Registry
+from baserow.ws.broadcast import PendingBroadcast, PendingBroadcasts
 from baserow.ws.tasks import broadcast_many_to_channel_group, broadcast_to_channel_group
 
 
@@ -26,6 +27,14 @@ class PageType(Instance):
     dynamic groups.
     """
 
+    update_formats = []
+    """
+    The alternative payload formats that a client can ask for when subscribing to
+    the page by providing the `update_format` parameter. The payloads broadcast to
+    the page are then converted by the `transform_payload` method before they're
+    sent to that client.
+    """
+
     def can_add(self, user, web_socket_id, **kwargs):
         """
         Indicates whether the user can be added to the page group. Here can for
@@ -97,13 +106,67 @@ class PageType(Instance):
         :type kwargs: dict
         """
 
+        channel_group_name = self.get_group_name(**kwargs)
+        pending_broadcasts = PendingBroadcasts.get_flushing()
+        if pending_broadcasts is not None:
+            pending_broadcasts.add(
+                PendingBroadcast(
+                    self,
+                    channel_group_name,
+                    payload,
+                    ignore_web_socket_id,
+                    exclude_user_ids,
+                )
+            )
+        else:
+            self.send_broadcast(
+                channel_group_name, payload, ignore_web_socket_id, exclude_user_ids
+            )
+
+    def send_broadcast(
+        self,
+        channel_group_name: str,
+        payload: dict,
+        ignore_web_socket_id: Optional[str] = None,
+        exclude_user_ids: Optional[list] = None,
+    ):
+        """
+        Sends the payload to everyone within the channel group by a celery task.
+        """
+
         broadcast_to_channel_group.delay(
-            self.get_group_name(**kwargs),
+            channel_group_name,
             payload,
             ignore_web_socket_id,
             exclude_user_ids,
         )
 
+    def merge_payloads(self, payload: dict, other_payload: dict) -> Optional[dict]:
+        """
+        Called when two payloads are consecutively broadcast to the same group on
+        commit of a transaction, see `PendingBroadcasts`. Can return one payload
+        replacing both of them, so that only one message is sent.
+
+        :param payload: The payload broadcast first.
+        :param other_payload: The payload broadcast afterwards.
+        :return: The merged payload or None if they can't be merged.
+        """
+
+        return None
+
+    def transform_payload(self, payload: dict, update_format: str) -> dict:
+        """
+        Converts a payload broadcast to the page to the update format the client has
+        subscribed with. The payload must not be modified in place because it's
+        shared by all the clients.
+
+        :param payload: The payload broadcast to the page.
+        :param update_format: One of the `update_formats` of the page type.
+        :return: The payload that must be sent to the client.
+        """
+
+        return payload
+
     def broadcast_many(
         self,
         payloads_with_groups: list[tuple[dict, dict]],
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from baserow.config.celery import app
 
@@ -53,6 +53,24 @@ async def send_message_to_channel_group(
         await channel_layer.close_pools()
 
 
+async def send_messages_to_channel_groups(
+    channel_layer, messages: List[Tuple[str, dict]]
+):
+    """
+    Sends the messages to their channel group one after the other, so that they're
+    received in the same order, and closes the pools only once afterwards.
+
+    :param channel_layer: The channel layer instance to use.
+    :param messages: The channel group names and the messages to send to them.
+    """
+
+    for channel_group_name, message in messages:
+        await channel_layer.group_send(channel_group_name, message)
+    if hasattr(channel_layer, "close_pools"):
+        # The inmemory channel layer in tests does not have this function.
+        await channel_layer.close_pools()
+
+
 @app.task(bind=True)
 def broadcast_to_users(
     self,
@@ -223,6 +241,7 @@ def broadcast_many_to_channel_group(
             channel_group_name,
             {
                 "type": "broadcast_to_group",
+                "channel_group_name": channel_group_name,
                 "payload": payload,
                 "ignore_web_socket_id": ignore_web_socket_id,
                 "exclude_user_ids": exclude_user_ids,
@@ -265,6 +284,7 @@ def broadcast_to_channel_group(
         channel_group_name,
         {
             "type": "broadcast_to_group",
+            "channel_group_name": channel_group_name,
             "payload": payload,
             "ignore_web_socket_id": ignore_web_socket_id,
             "exclude_user_ids": exclude_user_ids,
@@ -52,6 +52,7 @@ def test_get_automation_application(api_client, data_fixture):
                 "state": "draft",
                 "published_on": None,
                 "graph": {"0": trigger.id, str(trigger.id): {}},
+                "max_parallel_nodes": None,
             }
         ],
     }
@@ -106,6 +107,7 @@ def test_list_automation_applications(api_client, data_fixture):
                     "state": "draft",
                     "published_on": None,
                     "graph": {"0": trigger.id, str(trigger.id): {}},
+                    "max_parallel_nodes": None,
                 }
             ],
         }
@@ -35,6 +35,7 @@ def test_automation_workflow_serializer_fields(workflow_fixture):
         "automation_id",
         "graph",
         "id",
+        "max_parallel_nodes",
         "name",
         "order",
         "published_on",
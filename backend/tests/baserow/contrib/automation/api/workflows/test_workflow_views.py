@@ -56,6 +56,7 @@ def test_create_workflow(api_client, data_fixture):
         "published_on": None,
         "simulate_until_node_id": None,
         "graph": {},
+        "max_parallel_nodes": None,
     }
 
     workflow = automation.workflows.get(id=response_json["id"])
@@ -143,6 +144,7 @@ def test_read_workflow(api_client, data_fixture):
         "state": "draft",
         "published_on": None,
         "graph": {"0": trigger.id, str(trigger.id): {}},
+        "max_parallel_nodes": None,
     }
 
 
@@ -367,6 +369,7 @@ def test_duplicate_workflow(api_client, data_fixture):
             "published_on": None,
             "simulate_until_node_id": None,
             "graph": {"0": trigger.id, str(trigger.id): {}},
+            "max_parallel_nodes": None,
         },
         "progress_percentage": 0,
         "state": "pending",
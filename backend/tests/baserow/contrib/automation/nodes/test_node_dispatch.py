@@ -1,11 +1,18 @@
+import threading
+from unittest.mock import MagicMock, patch
+
 import pytest
+from requests import exceptions as request_exceptions
 
 from baserow.contrib.automation.automation_dispatch_context import (
     AutomationDispatchContext,
 )
 from baserow.contrib.automation.nodes.handler import AutomationNodeHandler
 from baserow.contrib.automation.workflows.constants import WorkflowState
+from baserow.contrib.automation.workflows.tasks import start_workflow_celery_task
+from baserow.contrib.database.rows.actions import CreateRowsActionType
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.core.services.exceptions import InvalidContextContentDispatchException
 
 
 @pytest.mark.django_db
@@ -435,6 +442,260 @@ def test_run_workflow_with_iterator_action(iterator_graph_fixture):
     assert getattr(rows3[1], action3_table_fields[0].db_column) == "other 2"
 
 
+@pytest.mark.django_db
+def test_run_workflow_with_iterator_action_dispatches_body_iteration_by_iteration(
+    iterator_graph_fixture,
+):
+    workflow = iterator_graph_fixture["workflow"]
+    action_table = iterator_graph_fixture["action_table"]
+    action2_table = iterator_graph_fixture["action2_table"]
+    action3_table = iterator_graph_fixture["action3_table"]
+
+    dispatch_context = AutomationDispatchContext(
+        workflow,
+        {
+            "results": [
+                {"field_1": "value 1", "field_2": "other 1"},
+                {"field_1": "value 2", "field_2": "other 2"},
+                {"field_1": "value 3", "field_2": "other 3"},
+            ]
+        },
+    )
+    with patch(
+        "baserow.contrib.integrations.local_baserow.service_types"
+        ".CreateRowsActionType.do",
+        wraps=CreateRowsActionType.do,
+    ) as create_rows:
+        AutomationNodeHandler().dispatch_node(workflow.get_trigger(), dispatch_context)
+
+    # The body of the iterator has two nodes, so they're both dispatched for an
+    # iteration before the next iteration starts.
+    assert [call.kwargs["table"].id for call in create_rows.call_args_list] == [
+        action_table.id,
+        action3_table.id,
+        action_table.id,
+        action3_table.id,
+        action_table.id,
+        action3_table.id,
+        action2_table.id,
+    ]
+    assert all(
+        len(call.kwargs["rows_values"]) == 1 for call in create_rows.call_args_list
+    )
+
+
+@pytest.mark.django_db
+def test_run_workflow_with_iterator_action_dispatches_single_node_body_in_batch(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    trigger_table = data_fixture.create_database_table(user=user)
+    action_table, action_table_fields, _ = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[],
+    )
+    integration = data_fixture.create_local_baserow_integration(user=user)
+    workflow = data_fixture.create_automation_workflow(
+        user=user,
+        state=WorkflowState.LIVE,
+        trigger_type="local_baserow_rows_created",
+        trigger_service_kwargs={"table": trigger_table, "integration": integration},
+    )
+    trigger = workflow.get_trigger()
+    iterator_node = data_fixture.create_core_iterator_action_node(
+        workflow=workflow,
+        reference_node=trigger,
+        position="south",
+        output="",
+        service_kwargs={
+            "source": f'get("previous_node.{trigger.id}")',
+            "integration": integration,
+        },
+    )
+    action_node = data_fixture.create_local_baserow_create_row_action_node(
+        workflow=workflow,
+        reference_node=iterator_node,
+        position="child",
+        output="",
+        service_kwargs={"table": action_table, "integration": integration},
+    )
+    action_node.service.specific.field_mappings.create(
+        field=action_table_fields[0],
+        value=f'get("current_iteration.{iterator_node.id}.item.field_1")',
+    )
+
+    dispatch_context = AutomationDispatchContext(
+        workflow,
+        {
+            "results": [
+                {"field_1": "value 1"},
+                {"field_1": "value 2"},
+                {"field_1": "value 3"},
+            ]
+        },
+    )
+    with patch(
+        "baserow.contrib.integrations.local_baserow.service_types"
+        ".CreateRowsActionType.do",
+        wraps=CreateRowsActionType.do,
+    ) as create_rows:
+        AutomationNodeHandler().dispatch_node(trigger, dispatch_context)
+
+    # The body of the iterator is a single node, so the rows of all the iterations
+    # are created at once.
+    assert create_rows.call_count == 1
+    assert len(create_rows.call_args_list[0].kwargs["rows_values"]) == 3
+
+    rows = action_table.get_model().objects.order_by("id")
+    assert [getattr(row, action_table_fields[0].db_column) for row in rows] == [
+        "value 1",
+        "value 2",
+        "value 3",
+    ]
+
+
+@pytest.mark.django_db
+def test_run_workflow_with_iterator_action_partially_failing_batch(data_fixture):
+    user = data_fixture.create_user()
+    trigger_table = data_fixture.create_database_table(user=user)
+    action_table, action_table_fields, _ = data_fixture.build_table(
+        user=user,
+        columns=[("Number", "number")],
+        rows=[],
+    )
+    integration = data_fixture.create_local_baserow_integration(user=user)
+    workflow = data_fixture.create_automation_workflow(
+        user=user,
+        state=WorkflowState.LIVE,
+        trigger_type="local_baserow_rows_created",
+        trigger_service_kwargs={"table": trigger_table, "integration": integration},
+    )
+    trigger = workflow.get_trigger()
+    iterator_node = data_fixture.create_core_iterator_action_node(
+        workflow=workflow,
+        reference_node=trigger,
+        position="south",
+        output="",
+        service_kwargs={
+            "source": f'get("previous_node.{trigger.id}")',
+            "integration": integration,
+        },
+    )
+    action_node = data_fixture.create_local_baserow_create_row_action_node(
+        workflow=workflow,
+        reference_node=iterator_node,
+        position="child",
+        output="",
+        service_kwargs={"table": action_table, "integration": integration},
+    )
+    action_node.service.specific.field_mappings.create(
+        field=action_table_fields[0],
+        value=f'get("current_iteration.{iterator_node.id}.item.number")',
+    )
+
+    dispatch_context = AutomationDispatchContext(
+        workflow,
+        {
+            "results": [
+                {"number": "1"},
+                {"number": "not a number"},
+                {"number": "3"},
+            ]
+        },
+    )
+    with pytest.raises(InvalidContextContentDispatchException):
+        AutomationNodeHandler().dispatch_node(trigger, dispatch_context)
+
+    # Like without batching, the iteration before the failing one is dispatched and
+    # the one after it isn't.
+    model = action_table.get_model()
+    assert list(
+        model.objects.values_list(action_table_fields[0].db_column, flat=True)
+    ) == [1]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_run_workflow_with_iterator_action_sends_http_requests_concurrently(
+    data_fixture, settings
+):
+    settings.AUTOMATION_WORKFLOW_MAX_PARALLEL_NODES = 1
+
+    user = data_fixture.create_user()
+    trigger_table = data_fixture.create_database_table(user=user)
+    action_table, action_table_fields, _ = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[],
+    )
+    integration = data_fixture.create_local_baserow_integration(user=user)
+    workflow = data_fixture.create_automation_workflow(
+        user=user,
+        state=WorkflowState.LIVE,
+        trigger_type="local_baserow_rows_created",
+        trigger_service_kwargs={"table": trigger_table, "integration": integration},
+    )
+    # The limit of the workflow takes precedence over the setting.
+    workflow.max_parallel_nodes = 2
+    workflow.save()
+    trigger = workflow.get_trigger()
+    iterator_node = data_fixture.create_core_iterator_action_node(
+        workflow=workflow,
+        reference_node=trigger,
+        position="south",
+        output="",
+        service_kwargs={
+            "source": f'get("previous_node.{trigger.id}")',
+            "integration": integration,
+        },
+    )
+    http_request_node = data_fixture.create_automation_node(
+        workflow=workflow,
+        type="http_request",
+        reference_node=iterator_node,
+        position="child",
+        output="",
+        service_kwargs={
+            "url": f'get("current_iteration.{iterator_node.id}.item.url")',
+        },
+    )
+    action_node = data_fixture.create_local_baserow_create_row_action_node(
+        workflow=workflow,
+        reference_node=iterator_node,
+        position="south",
+        output="",
+        service_kwargs={"table": action_table, "integration": integration},
+    )
+    action_node.service.specific.field_mappings.create(
+        field=action_table_fields[0],
+        value=f'get("previous_node.{iterator_node.id}.*.url")',
+    )
+
+    thread_names = []
+    response = MagicMock(headers={}, status_code=200, text="ok")
+    response.json.side_effect = request_exceptions.JSONDecodeError("", "", 0)
+
+    def request(**kwargs):
+        thread_names.append(threading.current_thread().name)
+        return response
+
+    items = [{"url": f"https://example.notexist/{index}"} for index in range(3)]
+    with patch("advocate.request", side_effect=request) as mock_request:
+        start_workflow_celery_task(workflow.id, {"results": items}, None)
+
+    assert sorted(call.kwargs["url"] for call in mock_request.call_args_list) == [
+        item["url"] for item in items
+    ]
+    assert all(name.startswith("http-request-service") for name in thread_names)
+
+    # The row is created with the connection of the task, so it's committed with
+    # its transaction.
+    rows = action_table.get_model().objects.order_by("id")
+    assert [getattr(row, action_table_fields[0].db_column) for row in rows] == [
+        ",".join(item["url"] for item in items)
+    ]
+
+
 @pytest.mark.django_db
 def test_run_workflow_with_iterator_action_simulate(iterator_graph_fixture):
     workflow = iterator_graph_fixture["workflow"]
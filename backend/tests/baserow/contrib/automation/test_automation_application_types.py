@@ -144,6 +144,7 @@ def test_automation_export_serialized(data_fixture):
                     str(trigger.id): {"next": {"": [first_action.id]}},
                     str(first_action.id): {},
                 },
+                "max_parallel_nodes": None,
             }
         ],
     }
@@ -9,3 +9,15 @@ def test_automation_workflow_get_parent(data_fixture):
     result = workflow.get_parent()
 
     assert result == workflow.automation
+
+
+@pytest.mark.django_db
+def test_automation_workflow_get_max_parallel_nodes(data_fixture, settings):
+    settings.AUTOMATION_WORKFLOW_MAX_PARALLEL_NODES = 3
+    workflow = data_fixture.create_automation_workflow()
+
+    assert workflow.get_max_parallel_nodes() == 3
+
+    workflow.max_parallel_nodes = 5
+
+    assert workflow.get_max_parallel_nodes() == 5
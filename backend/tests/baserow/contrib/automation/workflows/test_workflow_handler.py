@@ -332,6 +332,7 @@ def test_export_prepared_values(data_fixture):
         "name": "test",
         "allow_test_run_until": None,
         "state": WorkflowState.DRAFT,
+        "max_parallel_nodes": None,
     }
 
 
@@ -463,12 +464,14 @@ def test_update_workflow_correctly_pauses_published_workflow(data_fixture):
         "name": "foo",
         "allow_test_run_until": None,
         "state": WorkflowState.DRAFT,
+        "max_parallel_nodes": None,
     }
     assert updated.new_values == {
         "name": "foo",
         "allow_test_run_until": None,
         # The original workflow should indeed be unaffected
         "state": WorkflowState.DRAFT,
+        "max_parallel_nodes": None,
     }
 
     published_workflow.refresh_from_db()
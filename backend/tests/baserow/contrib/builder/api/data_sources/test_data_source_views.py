@@ -1706,6 +1706,62 @@ def test_dispatch_data_sources(api_client, data_fixture):
     }
 
 
+@pytest.mark.django_db
+def test_dispatch_only_some_data_sources(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["BMW"], ["Audi"], ["2Cv"]],
+    )
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_sources = [
+        data_fixture.create_builder_local_baserow_get_row_data_source(
+            user=user,
+            page=page,
+            integration=integration,
+            table=table,
+            row_id=str(row.id),
+        )
+        for row in rows
+    ]
+
+    url = reverse("api:builder:data_source:dispatch-all", kwargs={"page_id": page.id})
+    response = api_client.post(
+        f"{url}?data_source_ids={data_sources[0].id},{data_sources[2].id}",
+        {},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == {
+        str(data_sources[0].id): {
+            fields[0].name: "BMW",
+            "id": rows[0].id,
+            "order": AnyStr(),
+        },
+        str(data_sources[2].id): {
+            fields[0].name: "2Cv",
+            "id": rows[2].id,
+            "order": AnyStr(),
+        },
+    }
+
+    response = api_client.post(
+        f"{url}?data_source_ids=invalid",
+        {},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+
+
 @pytest.mark.django_db
 def test_dispatch_data_sources_with_formula_using_datasource_calling_an_other(
     data_fixture, api_client
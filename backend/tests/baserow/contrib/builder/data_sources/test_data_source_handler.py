@@ -1,10 +1,12 @@
+import threading
 from decimal import Decimal
 from unittest import mock
 from unittest.mock import patch
 
-from django.db import connection
+from django.db import connection, transaction
 from django.http import HttpRequest
 from django.shortcuts import reverse
+from django.utils import translation
 
 import pytest
 
@@ -14,11 +16,13 @@ from baserow.contrib.builder.data_sources.builder_dispatch_context import (
 from baserow.contrib.builder.data_sources.exceptions import DataSourceDoesNotExist
 from baserow.contrib.builder.data_sources.handler import DataSourceHandler
 from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.integrations.local_baserow.models import (
     LocalBaserowGetRow,
     LocalBaserowListRows,
 )
 from baserow.core.exceptions import CannotCalculateIntermediateOrder
+from baserow.core.services.handler import ServiceHandler
 from baserow.core.services.registries import service_type_registry
 from baserow.core.user_sources.user_source_user import UserSourceUser
 from baserow.test_utils.helpers import AnyStr
@@ -287,6 +291,194 @@ def test_dispatch_data_source(data_fixture):
     }
 
 
+@pytest.mark.django_db(transaction=True)
+def test_dispatch_data_sources_concurrently(data_fixture, settings):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["BMW"], ["Audi"], ["2Cv"]],
+    )
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_source1 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        table=table,
+        row_id=str(rows[0].id),
+    )
+    data_source2 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        table=table,
+        row_id=str(rows[1].id),
+    )
+    data_source3 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        table=table,
+        row_id=f"get('data_source.{data_source1.id}.id')",
+    )
+    data_sources = [data_source1, data_source2, data_source3]
+
+    def dispatch():
+        dispatch_context = BuilderDispatchContext(
+            HttpRequest(), page, only_expose_public_allowed_properties=False
+        )
+        with transaction.atomic():
+            return DataSourceHandler().dispatch_data_sources(
+                data_sources, dispatch_context
+            )
+
+    settings.BUILDER_DATA_SOURCES_DISPATCH_WORKERS = 1
+    sequentially_dispatched = dispatch()
+
+    settings.BUILDER_DATA_SOURCES_DISPATCH_WORKERS = 3
+    thread_names = {}
+    original_dispatch_data_source = DataSourceHandler.dispatch_data_source
+
+    def dispatch_data_source(self, data_source, dispatch_context):
+        thread_names.setdefault(data_source.id, threading.current_thread().name)
+        return original_dispatch_data_source(self, data_source, dispatch_context)
+
+    with patch.object(
+        DataSourceHandler, "dispatch_data_source", autospec=True
+    ) as dispatch_data_source_mock:
+        dispatch_data_source_mock.side_effect = dispatch_data_source
+        concurrently_dispatched = dispatch()
+
+    assert thread_names[data_source1.id].startswith("dispatch-data-sources")
+    assert thread_names[data_source2.id].startswith("dispatch-data-sources")
+    # The data source using another one is dispatched afterward.
+    assert thread_names[data_source3.id] == threading.current_thread().name
+
+    assert concurrently_dispatched == sequentially_dispatched
+    assert list(concurrently_dispatched) == [d.id for d in data_sources]
+    assert [result[fields[0].name] for result in concurrently_dispatched.values()] == [
+        "BMW",
+        "Audi",
+        "BMW",
+    ]
+
+
+@pytest.mark.django_db
+def test_dispatch_data_source_of_published_builder_is_cached(
+    data_fixture, settings, django_capture_on_commit_callbacks
+):
+    settings.BUILDER_DATA_SOURCE_DISPATCH_CACHE_TTL_SECONDS = 60
+
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["BMW"], ["Audi"]],
+    )
+    builder = data_fixture.create_builder_application(workspace=None)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, integration=integration, table=table, row_id="2"
+    )
+
+    def dispatch():
+        dispatch_context = BuilderDispatchContext(
+            HttpRequest(), page, only_expose_public_allowed_properties=False
+        )
+        return DataSourceHandler().dispatch_data_source(data_source, dispatch_context)
+
+    with patch.object(
+        ServiceHandler,
+        "dispatch_service",
+        autospec=True,
+        side_effect=ServiceHandler.dispatch_service,
+    ) as dispatch_service:
+        assert dispatch()[fields[0].name] == "Audi"
+        assert dispatch()[fields[0].name] == "Audi"
+        assert dispatch_service.call_count == 1
+
+        # Changing the rows of the table invalidates the cached results.
+        with django_capture_on_commit_callbacks(execute=True):
+            RowHandler().update_row_by_id(
+                user, table, rows[1].id, {fields[0].id: "Mercedes"}
+            )
+
+        assert dispatch()[fields[0].name] == "Mercedes"
+        assert dispatch_service.call_count == 2
+
+
+@pytest.mark.django_db
+def test_dispatch_data_source_of_unpublished_builder_is_not_cached(
+    data_fixture, settings
+):
+    settings.BUILDER_DATA_SOURCE_DISPATCH_CACHE_TTL_SECONDS = 60
+
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user, columns=[("Name", "text")], rows=[["BMW"]]
+    )
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user, page=page, integration=integration, table=table, row_id="1"
+    )
+
+    with patch.object(
+        ServiceHandler,
+        "dispatch_service",
+        autospec=True,
+        side_effect=ServiceHandler.dispatch_service,
+    ) as dispatch_service:
+        for _ in range(2):
+            dispatch_context = BuilderDispatchContext(
+                HttpRequest(), page, only_expose_public_allowed_properties=False
+            )
+            DataSourceHandler().dispatch_data_source(data_source, dispatch_context)
+
+    assert dispatch_service.call_count == 2
+
+
+def test_get_dispatch_cache_key_depends_on_the_request():
+    data_source = DataSource(id=1)
+    page = mock.Mock()
+
+    def get_key(query=None, user=None, metadata=None):
+        request = HttpRequest()
+        request.GET.update(query or {})
+        request.data = {"metadata": metadata or {}}
+        request.user_source_user = user or mock.Mock(is_authenticated=False)
+        dispatch_context = mock.Mock(
+            request=request,
+            page=page,
+            offset=None,
+            count=None,
+            only_expose_public_allowed_properties=True,
+        )
+        return DataSourceHandler().get_dispatch_cache_key(data_source, dispatch_context)
+
+    user = mock.Mock(is_authenticated=True, user_source_id=1, id=2, role="admin")
+    assert get_key() == get_key()
+    assert get_key() == get_key(query={"unrelated": "1"})
+    assert get_key() != get_key(query={"offset": "10"})
+    assert get_key() != get_key(metadata={"page_parameter": {"id": 1}})
+    assert get_key() != get_key(user=user)
+
+    with translation.override("fr"):
+        french_key = get_key()
+    with translation.override("en"):
+        assert get_key() != french_key
+
+
 @pytest.mark.django_db
 def test_dispatch_data_sources(data_fixture):
     user = data_fixture.create_user()
@@ -0,0 +1,112 @@
+from time import perf_counter
+
+from django.http import HttpRequest
+
+import pytest
+from pyinstrument import Profiler
+
+from baserow.contrib.builder.data_sources.builder_dispatch_context import (
+    BuilderDispatchContext,
+)
+from baserow.contrib.builder.formula_property_extractor import (
+    get_builder_used_property_names,
+)
+from baserow.core.formula import resolve_formula
+from baserow.core.formula.parser.parser import get_cached_parse_tree_for_formula
+from baserow.core.formula.registries import formula_runtime_function_registry
+from baserow.core.formula.types import BaserowFormulaObject
+
+
+def _create_large_page(data_fixture, element_count=300, row_count=100):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[(f"Field {index}", "text") for index in range(10)],
+        rows=[[f"Row {i} {index}" for index in range(10)] for i in range(row_count)],
+    )
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_list_rows_data_source(
+        user=user, page=page, integration=integration, table=table
+    )
+
+    formulas = []
+    for index in range(element_count):
+        field = fields[index % len(fields)]
+        formula = (
+            f"concat('Heading {index % 20}: ', "
+            f"get('data_source.{data_source.id}.{index % 20}.{field.db_column}'))"
+        )
+        formulas.append(formula)
+        data_fixture.create_builder_heading_element(user=user, page=page, value=formula)
+
+    collection_fields = [
+        {
+            "name": field.name,
+            "type": "text",
+            "config": {"value": f"get('current_record.{field.db_column}')"},
+        }
+        for field in fields
+    ]
+    for _ in range(2):
+        data_fixture.create_builder_table_element(
+            user=user, page=page, data_source=data_source, fields=collection_fields
+        )
+    repeat = data_fixture.create_builder_repeat_element(
+        user=user, page=page, data_source=data_source
+    )
+    for field in fields:
+        data_fixture.create_builder_heading_element(
+            user=user,
+            page=page,
+            parent_element_id=repeat.id,
+            value=f"get('current_record.{field.db_column}')",
+        )
+
+    return user, page, formulas
+
+
+def _resolve_formulas(page, formulas):
+    dispatch_context = BuilderDispatchContext(
+        HttpRequest(), page, only_expose_public_allowed_properties=False
+    )
+    for formula in formulas:
+        resolve_formula(
+            BaserowFormulaObject.create(formula),
+            formula_runtime_function_registry,
+            dispatch_context,
+        )
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_large_page_formulas_performance(data_fixture):
+    user, page, formulas = _create_large_page(data_fixture)
+
+    def measure(label, clear_cache):
+        durations = []
+        for _ in range(5):
+            if clear_cache:
+                get_cached_parse_tree_for_formula.cache_clear()
+            start = perf_counter()
+            get_builder_used_property_names(user, page.builder)
+            _resolve_formulas(page, formulas)
+            durations.append(perf_counter() - start)
+        print(f"{label}: {min(durations) * 1000:.1f}ms (best of {len(durations)})")
+
+    measure("Without parse tree cache", clear_cache=True)
+    measure("With parse tree cache", clear_cache=False)
+
+    profiler = Profiler()
+    profiler.start()
+    get_builder_used_property_names(user, page.builder)
+    _resolve_formulas(page, formulas)
+    profiler.stop()
+
+    print(profiler.output_text(unicode=True, color=True))
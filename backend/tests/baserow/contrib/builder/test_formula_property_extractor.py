@@ -188,7 +188,7 @@ def test_extract_properties_returns_none():
     assert TestDataProviderType().extract_properties([]) == {}
 
 
-@patch("baserow.contrib.builder.mixins.get_parse_tree_for_formula")
+@patch("baserow.contrib.builder.mixins.get_cached_parse_tree_for_formula")
 def test_get_element_property_names_returns_empty_if_no_elements(mock_parse_tree):
     """
     Ensure the get_element_property_names() function returns an empty dict if
@@ -202,7 +202,7 @@ def test_get_element_property_names_returns_empty_if_no_elements(mock_parse_tree
 
 
 @pytest.mark.django_db
-@patch("baserow.contrib.builder.mixins.get_parse_tree_for_formula")
+@patch("baserow.contrib.builder.mixins.get_cached_parse_tree_for_formula")
 def test_get_element_property_names_returns_empty_if_no_formulas(
     mock_parse_tree, data_fixture
 ):
@@ -225,7 +225,7 @@ def test_get_element_property_names_returns_empty_if_no_formulas(
 
 
 @pytest.mark.django_db
-@patch("baserow.contrib.builder.mixins.get_parse_tree_for_formula")
+@patch("baserow.contrib.builder.mixins.get_cached_parse_tree_for_formula")
 def test_get_element_property_names_returns_empty_if_invalid_formula(
     mock_parse_tree, data_fixture
 ):
@@ -324,7 +324,7 @@ def test_get_element_property_names_returns_property_names(data_fixture):
 
 
 @pytest.mark.django_db
-@patch("baserow.contrib.builder.mixins.get_parse_tree_for_formula")
+@patch("baserow.contrib.builder.mixins.get_cached_parse_tree_for_formula")
 def test_get_workflow_action_property_names_returns_empty_if_no_workflow_actions(
     mock_parse_tree, data_fixture
 ):
@@ -341,7 +341,7 @@ def test_get_workflow_action_property_names_returns_empty_if_no_workflow_actions
 
 
 @pytest.mark.django_db
-@patch("baserow.contrib.builder.mixins.get_parse_tree_for_formula")
+@patch("baserow.contrib.builder.mixins.get_cached_parse_tree_for_formula")
 def test_get_workflow_action_property_names_returns_empty_if_no_formulas(
     mock_parse_tree, data_fixture
 ):
@@ -375,7 +375,7 @@ def test_get_workflow_action_property_names_returns_empty_if_no_formulas(
 
 
 @pytest.mark.django_db
-@patch("baserow.contrib.builder.mixins.get_parse_tree_for_formula")
+@patch("baserow.contrib.builder.mixins.get_cached_parse_tree_for_formula")
 def test_get_workflow_action_property_names_returns_empty_if_invalid_formula(
     mock_parse_tree, data_fixture
 ):
@@ -620,7 +620,7 @@ def test_get_workflow_action_property_names_returns_internal_property_names(
 
 
 @pytest.mark.django_db
-@patch("baserow.contrib.builder.mixins.get_parse_tree_for_formula")
+@patch("baserow.contrib.builder.mixins.get_cached_parse_tree_for_formula")
 def test_get_data_source_property_names_returns_empty_if_no_data_sources(
     mock_parse_tree, data_fixture
 ):
@@ -640,7 +640,7 @@ def test_get_data_source_property_names_returns_empty_if_no_data_sources(
 
 
 @pytest.mark.django_db
-@patch("baserow.contrib.builder.mixins.get_parse_tree_for_formula")
+@patch("baserow.contrib.builder.mixins.get_cached_parse_tree_for_formula")
 def test_get_data_source_property_names_returns_empty_if_invalid_formula(
     mock_parse_tree, data_fixture
 ):
@@ -802,7 +802,7 @@ def test_get_data_source_property_names_get_row_returns_property_names(data_fixt
 
 
 @pytest.mark.django_db
-@patch("baserow.contrib.builder.mixins.get_parse_tree_for_formula")
+@patch("baserow.contrib.builder.mixins.get_cached_parse_tree_for_formula")
 def test_get_data_source_property_names_skips_if_no_service(
     mock_parse_tree, data_fixture
 ):
@@ -4770,3 +4770,47 @@ def test_update_single_field_does_not_affect_others(api_client, data_fixture):
 
         # Update original_values for next iteration
         original_values[field_id] = updated_data[f"field_{field_id}"]
+
+
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(name="Name", table=table, primary=True)
+    data_fixture.create_number_field(name="Price", table=table)
+
+    model = table.get_model(attribute_names=True)
+    prices = [50, 100, None, 100, 25, None, 75]
+    for index, price in enumerate(prices):
+        model.objects.create(name=f"Product {index}", price=price)
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    for order_by in ["", "-Price", "Price,-Name"]:
+        params = {"user_field_names": "true", "size": 100}
+        if order_by:
+            params["order_by"] = order_by
+        response = api_client.get(url, params, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+        expected = [row["id"] for row in response.json()["results"]]
+
+        received = []
+        cursor = ""
+        while cursor is not None:
+            response = api_client.get(
+                url,
+                {**params, "size": 3, "cursor": cursor},
+                HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+            )
+            assert response.status_code == HTTP_200_OK
+            response_json = response.json()
+            received += [row["id"] for row in response_json["results"]]
+            cursor = response_json["next_cursor"]
+
+        assert received == expected
+
+    response = api_client.get(
+        url,
+        {"cursor": "", "size": 201},
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_PAGE_SIZE_LIMIT"
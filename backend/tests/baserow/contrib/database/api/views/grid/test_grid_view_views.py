@@ -5325,3 +5325,110 @@ def test_list_rows_with_page_and_invalid_numbers(api_client, data_fixture):
         assert response_json["results"][0][f"field_{text_field.id}"] == "0"
         assert response_json["results"][99][f"field_{text_field.id}"] == "99"
         assert count_calls == 0  # count is not called again
+
+
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name")
+    number_field = data_fixture.create_number_field(table=table, name="Number")
+    grid = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=grid, field=number_field, order="DESC")
+    data_fixture.create_view_filter(
+        view=grid, field=text_field, type="not_equal", value="hidden"
+    )
+
+    model = table.get_model()
+    values = [(1, "a"), (None, "b"), (3, "c"), (3, "d"), (None, "e"), (2, "f")]
+    for number, text in values:
+        model.objects.create(
+            **{f"field_{number_field.id}": number, f"field_{text_field.id}": text}
+        )
+    model.objects.create(
+        **{f"field_{number_field.id}": 10, f"field_{text_field.id}": "hidden"}
+    )
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(url, {"size": 100}, HTTP_AUTHORIZATION=f"JWT {token}")
+    expected = [row["id"] for row in response.json()["results"]]
+    assert len(expected) == 6
+
+    received = []
+    cursor = ""
+    while cursor is not None:
+        response = api_client.get(
+            url, {"size": 4, "cursor": cursor}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        assert response.status_code == HTTP_200_OK
+        response_json = response.json()
+        assert "count" not in response_json
+        assert len(response_json["results"]) <= 4
+        received += [row["id"] for row in response_json["results"]]
+        cursor = response_json["next_cursor"]
+
+    assert received == expected
+
+    # A cursor of another ordering can't be used.
+    response = api_client.get(
+        url, {"size": 4, "cursor": ""}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    response = api_client.get(
+        url,
+        {
+            "size": 4,
+            "cursor": response.json()["next_cursor"],
+            "order_by": f"field_{text_field.id}",
+        },
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+    response = api_client.get(
+        url, {"cursor": "not-a-cursor"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+
+@pytest.mark.django_db
+def test_list_rows_with_count_mode(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    RowHandler().create_rows(user, table, [{}, {}, {}])
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(
+        url, {"count_mode": "fast", "size": 2}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert response_json["count"] == 3
+    assert response_json["count_is_exact"] is True
+    assert len(response_json["results"]) == 2
+
+    response = api_client.get(
+        url, {"count_mode": "cached", "count": ""}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == {"count": 3, "count_is_exact": True}
+
+    with patch(
+        "baserow.contrib.database.views.row_count_modes.estimate_table_count",
+        return_value=1000000,
+    ):
+        response = api_client.get(
+            url,
+            {"count_mode": "estimate", "count": ""},
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+    assert response.json() == {"count": 1000000, "count_is_exact": False}
+
+    response = api_client.get(
+        url, {"count_mode": "unknown"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_ROW_COUNT_MODE_DOES_NOT_EXIST"
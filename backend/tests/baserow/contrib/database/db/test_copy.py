@@ -0,0 +1,215 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+
+from baserow.contrib.database.db.copy import (
+    COPY_NULL,
+    CannotCopyValue,
+    bulk_copy_create,
+    encode_copy_value,
+    get_copy_columns,
+)
+from baserow.contrib.database.rows.handler import RowHandler
+
+
+def test_encode_copy_value():
+    assert encode_copy_value(None) == COPY_NULL
+    assert encode_copy_value(True) == "t"
+    assert encode_copy_value(False) == "f"
+    assert encode_copy_value(10) == "10"
+    assert encode_copy_value(Decimal("1.50")) == "1.50"
+    assert (
+        encode_copy_value(UUID("e1b6fbb1-9e2c-4b5f-8e0b-3e5c7e3f0a1d"))
+        == "e1b6fbb1-9e2c-4b5f-8e0b-3e5c7e3f0a1d"
+    )
+    assert encode_copy_value("a\\b\tc\nd\re") == "a\\\\b\\tc\\nd\\re"
+    assert encode_copy_value(date(2023, 1, 2)) == "2023-01-02"
+    assert (
+        encode_copy_value(datetime(2023, 1, 2, 3, 4, tzinfo=timezone.utc))
+        == "2023-01-02T03:04:00+00:00"
+    )
+    assert (
+        encode_copy_value(timedelta(days=1, seconds=2, microseconds=3))
+        == "1 days 2 seconds 3 microseconds"
+    )
+
+    with pytest.raises(CannotCopyValue):
+        encode_copy_value(object())
+
+
+@pytest.mark.django_db
+def test_bulk_copy_create_copies_rows(data_fixture, settings):
+    settings.BASEROW_COPY_INSERT_MIN_ROWS = 2
+
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(
+        table=table, number_decimal_places=2
+    )
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    model = table.get_model()
+
+    assert get_copy_columns(model) is not None
+
+    rows = [
+        model(
+            **{
+                f"field_{text_field.id}": f"a\tb\n{index}",
+                f"field_{number_field.id}": Decimal(f"{index}.25"),
+                f"field_{boolean_field.id}": index % 2 == 0,
+            },
+            order=Decimal(index),
+        )
+        for index in range(3)
+    ]
+    with patch.object(
+        model.objects, "bulk_create", wraps=model.objects.bulk_create
+    ) as bulk_create:
+        bulk_copy_create(model, rows)
+
+    bulk_create.assert_not_called()
+    assert all(row.id is not None for row in rows)
+    assert all(not row._state.adding for row in rows)
+
+    saved = list(model.objects.order_by("id"))
+    assert [row.id for row in saved] == [row.id for row in rows]
+    assert [getattr(row, f"field_{text_field.id}") for row in saved] == [
+        "a\tb\n0",
+        "a\tb\n1",
+        "a\tb\n2",
+    ]
+    assert [getattr(row, f"field_{number_field.id}") for row in saved] == [
+        Decimal("0.25"),
+        Decimal("1.25"),
+        Decimal("2.25"),
+    ]
+    assert [getattr(row, f"field_{boolean_field.id}") for row in saved] == [
+        True,
+        False,
+        True,
+    ]
+    assert all(row.created_on is not None for row in saved)
+
+    # The sequence must be in sync, so that rows created afterwards get a new id.
+    row = model.objects.create()
+    assert row.id > rows[-1].id
+
+
+@pytest.mark.django_db
+def test_bulk_copy_create_numbers_autonumber_fields(data_fixture, settings):
+    settings.BASEROW_COPY_INSERT_MIN_ROWS = 2
+
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, primary=True)
+    autonumber_field = data_fixture.create_autonumber_field(user=user, table=table)
+    model = table.get_model()
+    existing_row = model.objects.create()
+
+    assert get_copy_columns(model) is not None
+
+    rows = [model() for _ in range(3)]
+    with patch.object(
+        model.objects, "bulk_create", wraps=model.objects.bulk_create
+    ) as bulk_create:
+        bulk_copy_create(model, rows)
+
+    bulk_create.assert_not_called()
+    existing_number = getattr(existing_row, f"field_{autonumber_field.id}")
+    expected_numbers = [existing_number + 1, existing_number + 2, existing_number + 3]
+    assert [getattr(row, f"field_{autonumber_field.id}") for row in rows] == (
+        expected_numbers
+    )
+    assert [
+        getattr(row, f"field_{autonumber_field.id}")
+        for row in model.objects.exclude(id=existing_row.id).order_by("id")
+    ] == expected_numbers
+
+    # The sequence is in sync, so that rows created afterwards get the next number.
+    row = model.objects.create()
+    row.refresh_from_db()
+    assert getattr(row, f"field_{autonumber_field.id}") == existing_number + 4
+
+
+@pytest.mark.django_db
+def test_bulk_copy_create_below_min_rows_uses_bulk_create(data_fixture, settings):
+    settings.BASEROW_COPY_INSERT_MIN_ROWS = 10
+
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, primary=True)
+    model = table.get_model()
+
+    with patch.object(
+        model.objects, "bulk_create", wraps=model.objects.bulk_create
+    ) as bulk_create:
+        bulk_copy_create(model, [model(), model()])
+
+    bulk_create.assert_called_once()
+    assert model.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_bulk_copy_create_falls_back_for_unsupported_field_types(
+    data_fixture, settings
+):
+    settings.BASEROW_COPY_INSERT_MIN_ROWS = 1
+
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, primary=True)
+    data_fixture.create_formula_field(table=table, formula="1 + 1")
+    model = table.get_model()
+
+    assert get_copy_columns(model) is None
+
+    with patch.object(
+        model.objects, "bulk_create", wraps=model.objects.bulk_create
+    ) as bulk_create:
+        bulk_copy_create(model, [model(), model()])
+
+    bulk_create.assert_called_once()
+    assert model.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_force_create_rows_copies_rows_and_relations(data_fixture, settings):
+    settings.BASEROW_COPY_INSERT_MIN_ROWS = 2
+
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    other_table = data_fixture.create_database_table(database=database)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    data_fixture.create_text_field(table=other_table, primary=True)
+    link_field = data_fixture.create_link_row_field(
+        table=table, link_row_table=other_table
+    )
+    other_model = other_table.get_model()
+    other_rows = [other_model.objects.create(), other_model.objects.create()]
+
+    result = RowHandler().force_create_rows(
+        user,
+        table,
+        [
+            {
+                f"field_{text_field.id}": "a",
+                f"field_{link_field.id}": [other_rows[0].id, other_rows[1].id],
+            },
+            {
+                f"field_{text_field.id}": "b",
+                f"field_{link_field.id}": [other_rows[1].id],
+            },
+        ],
+    )
+
+    assert [row.id is not None for row in result.created_rows] == [True, True]
+    model = table.get_model()
+    rows = list(model.objects.order_by("id"))
+    assert [getattr(row, f"field_{text_field.id}") for row in rows] == ["a", "b"]
+    assert [
+        sorted(r.id for r in getattr(row, f"field_{link_field.id}").all())
+        for row in rows
+    ] == [sorted([other_rows[0].id, other_rows[1].id]), [other_rows[1].id]]
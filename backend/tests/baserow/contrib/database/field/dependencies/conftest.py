@@ -0,0 +1,16 @@
+import pytest
+
+
+@pytest.fixture(
+    autouse=True,
+    params=[False, True],
+    ids=["without_graph_cache", "with_graph_cache"],
+)
+def field_dependency_graph_cache_enabled(request, settings):
+    """
+    Runs every dependency test with and without the cached field dependency graph,
+    because both must find exactly the same dependencies.
+    """
+
+    settings.BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_ENABLED = request.param
+    return request.param
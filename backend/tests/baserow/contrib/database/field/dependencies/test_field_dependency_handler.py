@@ -1,13 +1,22 @@
+from unittest.mock import patch
+
 from django.contrib.contenttypes.models import ContentType
 
 import pytest
 from pytest_unordered import unordered
 
 from baserow.contrib.database.application_types import DatabaseApplicationType
+from baserow.contrib.database.fields.dependencies.circular_reference_checker import (
+    get_all_field_dependencies,
+)
 from baserow.contrib.database.fields.dependencies.exceptions import (
     CircularFieldDependencyError,
     SelfReferenceFieldDependencyError,
 )
+from baserow.contrib.database.fields.dependencies.graph import (
+    FieldDependencyGraph,
+    field_dependency_graph_cache,
+)
 from baserow.contrib.database.fields.dependencies.handler import FieldDependencyHandler
 from baserow.contrib.database.fields.dependencies.models import FieldDependency
 from baserow.contrib.database.fields.field_cache import FieldCache
@@ -818,3 +827,169 @@ def test_can_import_database_with_formula_dependencies(data_fixture):
 
     assert r2.lookup == [{"id": 1, "value": "A"}]
     assert r2.lookup2 == [{"id": 1, "value": "A"}]
+
+
+def _group_dependants(dependencies):
+    grouped = {}
+    for dependency in dependencies:
+        depth, dependency_ids = grouped.get(
+            (dependency.id, tuple(dependency.via_ids)), (0, set())
+        )
+        grouped[(dependency.id, tuple(dependency.via_ids))] = (
+            max(depth, dependency.depth),
+            dependency_ids | set(dependency.dependency_ids),
+        )
+    return grouped
+
+
+@pytest.mark.django_db
+def test_dependency_graph_finds_the_same_dependants_as_the_query(
+    data_fixture, django_capture_on_commit_callbacks, settings
+):
+    settings.BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_ENABLED = True
+    user = data_fixture.create_user()
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables(user=user)
+    related_link_field = link_field.link_row_related_field
+    table_a_primary = table_a.field_set.get(primary=True)
+    table_b_primary = table_b.field_set.get(primary=True)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        FieldHandler().create_field(
+            user,
+            table_a,
+            "formula",
+            name="lookup",
+            formula=f"lookup('{link_field.name}', '{table_b_primary.name}')",
+        )
+        FieldHandler().create_field(
+            user, table_a, "formula", name="count", formula="count(field('lookup'))"
+        )
+        FieldHandler().create_field(
+            user,
+            table_b,
+            "formula",
+            name="links",
+            formula=f"count(field('{related_link_field.name}'))",
+        )
+
+    database_id = table_a.database_id
+    for table_id, field_ids, associated_relations_changed in [
+        (table_b.id, [table_b_primary.id], False),
+        (table_a.id, [table_a_primary.id], True),
+        (table_a.id, [link_field.id], True),
+        (table_b.id, [related_link_field.id], True),
+    ]:
+        from_graph = FieldDependencyHandler._get_all_dependent_fields_from_graph(
+            table_id, field_ids, associated_relations_changed, database_id
+        )
+        from_database = FieldDependencyHandler._get_all_dependent_fields_from_database(
+            table_id, field_ids, associated_relations_changed, database_id
+        )
+        assert from_graph is not None
+        assert _group_dependants(from_graph) == _group_dependants(from_database)
+
+
+@pytest.mark.django_db
+def test_dependency_graph_is_updated_when_the_transaction_commits(
+    data_fixture, django_capture_on_commit_callbacks, settings
+):
+    settings.BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_ENABLED = True
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    database_id = table.database_id
+    assert field_dependency_graph_cache.get(database_id).edges == set()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        formula_field = FieldHandler().create_field(
+            user, table, "formula", name="formula", formula="field('text')"
+        )
+        # The changes of the current transaction are not in the graph yet.
+        assert field_dependency_graph_cache.get(database_id) is None
+
+    with patch.object(FieldDependencyGraph, "load") as load:
+        graph = field_dependency_graph_cache.get(database_id)
+        load.assert_not_called()
+    assert graph.edges == {(formula_field.id, text_field.id, None, None)}
+    assert get_all_field_dependencies(formula_field) == {text_field.id}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        FieldHandler().delete_field(user, text_field)
+
+    graph = field_dependency_graph_cache.get(database_id)
+    assert graph.edges == {(formula_field.id, None, None, "text")}
+
+
+@pytest.mark.django_db
+def test_dependency_graph_changes_are_applied_to_a_copy_of_the_graph(
+    data_fixture, django_capture_on_commit_callbacks, settings
+):
+    settings.BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_ENABLED = True
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    database_id = table.database_id
+    graph = field_dependency_graph_cache.get(database_id)
+    version = graph.version
+
+    with django_capture_on_commit_callbacks(execute=True):
+        formula_field = FieldHandler().create_field(
+            user, table, "formula", name="formula", formula="field('text')"
+        )
+
+    new_graph = field_dependency_graph_cache.get(database_id)
+    assert new_graph is not graph
+    assert new_graph.edges == {(formula_field.id, text_field.id, None, None)}
+    # Other threads can still be reading the previous graph, so it's unchanged.
+    assert graph.edges == set()
+    assert graph.version == version
+
+
+@pytest.mark.django_db
+def test_dependency_graph_is_updated_when_the_related_field_is_created(
+    data_fixture, django_capture_on_commit_callbacks, settings
+):
+    settings.BASEROW_FIELD_DEPENDENCY_GRAPH_CACHE_ENABLED = True
+    user = data_fixture.create_user()
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables(
+        user=user, has_related_field=False
+    )
+    table_b_primary = table_b.field_set.get(primary=True)
+    database_id = table_a.database_id
+
+    with django_capture_on_commit_callbacks(execute=True):
+        FieldHandler().create_field(
+            user,
+            table_a,
+            "formula",
+            name="lookup",
+            formula=f"lookup('{link_field.name}', '{table_b_primary.name}')",
+        )
+    assert field_dependency_graph_cache.get(database_id).link_row_related_field_ids == {
+        link_field.id: None
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        link_field = FieldHandler().update_field(
+            user, link_field, has_related_field=True
+        )
+    related_field = link_field.link_row_related_field
+
+    graph = field_dependency_graph_cache.get(database_id)
+    assert graph.link_row_related_field_ids == {link_field.id: related_field.id}
+    from_graph = FieldDependencyHandler._get_all_dependent_fields_from_graph(
+        table_b.id, [related_field.id], True, database_id
+    )
+    from_database = FieldDependencyHandler._get_all_dependent_fields_from_database(
+        table_b.id, [related_field.id], True, database_id
+    )
+    assert len(from_graph) == 1
+    assert _group_dependants(from_graph) == _group_dependants(from_database)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        link_field = FieldHandler().update_field(
+            user, link_field, has_related_field=False
+        )
+
+    graph = field_dependency_graph_cache.get(database_id)
+    assert graph.link_row_related_field_ids == {link_field.id: None}
@@ -480,3 +480,79 @@ def test_apply_updates_returns_only_last_updated_fields_but_update_collector_tra
         assert mock.call_args_list[0][1]["table"].id == table_1.id
         assert mock.call_args_list[1][1]["table"].id == table_2.id
         assert mock.call_args_list[2][1]["table"].id == table_3.id
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("combine,expected_queries", [(True, 1), (False, 2)])
+def test_update_statements_of_different_tables_at_the_same_level_are_combined(
+    data_fixture, django_assert_num_queries, settings, combine, expected_queries
+):
+    settings.BASEROW_COMBINE_DEPENDENT_FIELD_UPDATES = combine
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    starting_table = data_fixture.create_database_table(database=database)
+    first_table = data_fixture.create_database_table(database=database)
+    second_table = data_fixture.create_database_table(database=database)
+    data_fixture.create_text_field(name="primary", primary=True, table=starting_table)
+    first_table_field = data_fixture.create_text_field(
+        name="primary", primary=True, table=first_table
+    )
+    second_table_field = data_fixture.create_text_field(
+        name="primary", primary=True, table=second_table
+    )
+    first_link_field = FieldHandler().create_field(
+        user=user,
+        table=first_table,
+        type_name="link_row",
+        link_row_table=starting_table,
+        name="link",
+    )
+    second_link_field = FieldHandler().create_field(
+        user=user,
+        table=second_table,
+        type_name="link_row",
+        link_row_table=starting_table,
+        name="link",
+    )
+    starting_model = starting_table.get_model(attribute_names=True)
+    first_model = first_table.get_model(attribute_names=True)
+    second_model = second_table.get_model(attribute_names=True)
+
+    starting_row = starting_model.objects.create(primary="start")
+    other_starting_row = starting_model.objects.create(primary="other")
+    first_row = first_model.objects.create(primary="a")
+    first_row.link.add(starting_row.id)
+    first_unlinked_row = first_model.objects.create(primary="a")
+    first_unlinked_row.link.add(other_starting_row.id)
+    second_row = second_model.objects.create(primary="b")
+    second_row.link.add(starting_row.id)
+
+    field_cache = FieldCache()
+    update_collector = FieldUpdateCollector(
+        starting_table, starting_row_ids=[starting_row.id]
+    )
+    update_collector.add_field_with_pending_update_statement(
+        first_table_field,
+        Value("updated a"),
+        via_path_to_starting_table=[first_link_field],
+    )
+    update_collector.add_field_with_pending_update_statement(
+        second_table_field,
+        Value("updated b"),
+        via_path_to_starting_table=[second_link_field],
+    )
+    field_cache.cache_model(starting_table.get_model())
+    field_cache.cache_model(first_table.get_model())
+    field_cache.cache_model(second_table.get_model())
+
+    with django_assert_num_queries(expected_queries):
+        updated_rows = update_collector.apply_updates(field_cache)
+
+    assert updated_rows[first_table.id] == {first_row.id}
+    assert updated_rows[second_table.id] == {second_row.id}
+    first_row.refresh_from_db()
+    first_unlinked_row.refresh_from_db()
+    second_row.refresh_from_db()
+    assert first_row.primary == "updated a"
+    assert first_unlinked_row.primary == "a"
+    assert second_row.primary == "updated b"
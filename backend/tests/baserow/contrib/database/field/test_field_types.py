@@ -852,6 +852,30 @@ def test_phone_number_field_type(data_fixture):
     assert len(PhoneNumberField.objects.all()) == 3
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize("rich_value", [True, False])
+def test_export_values_match_export_value(data_fixture, rich_value):
+    table, user, row, blank_row, context = setup_interesting_test_table(data_fixture)
+    model = table.get_model()
+    rows = model.objects.all().enhance_by_fields().order_by("id")
+
+    for field_object in model._field_objects.values():
+        field_type = field_object["type"]
+        values = [
+            value
+            for value in (getattr(row, field_object["name"]) for row in rows)
+            if value is not None
+        ]
+        expected = [
+            field_type.get_export_value(value, field_object, rich_value=rich_value)
+            for value in values
+        ]
+        assert (
+            field_type.get_export_values(values, field_object, rich_value=rich_value)
+            == expected
+        ), field_object["field"].name
+
+
 @pytest.mark.django_db
 def test_human_readable_values(data_fixture):
     table, user, row, blank_row, context = setup_interesting_test_table(data_fixture)
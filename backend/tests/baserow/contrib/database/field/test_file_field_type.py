@@ -206,6 +206,50 @@ def test_file_field_type(data_fixture):
     assert results[2].text is None
 
 
+@pytest.mark.django_db
+@pytest.mark.field_file
+def test_file_field_type_with_identical_uploads_of_other_users(data_fixture, tmpdir):
+    user = data_fixture.create_user()
+    user_2 = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user_2)
+    field = data_fixture.create_file_field(table=table)
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+
+    with freeze_time("2020-01-01 12:00"):
+        user_file = handler.upload_user_file(
+            user, "secret.txt", ContentFile(b"Hello"), storage=storage
+        )
+    with freeze_time("2021-01-01 12:00"):
+        user_file_2 = handler.upload_user_file(
+            user_2, "mine.txt", ContentFile(b"Hello"), storage=storage
+        )
+
+    assert user_file_2.name == user_file.name
+    assert handler.get_user_file_by_name(user_file.name, user=user_2) == user_file_2
+    assert handler.get_user_file_by_name(user_file.name, user=user) == user_file
+
+    with freeze_time("2022-01-01 12:00"):
+        row = RowHandler().create_row(
+            user_2, table, {f"field_{field.id}": [{"name": user_file_2.name}]}
+        )
+        rows = (
+            RowHandler()
+            .create_rows(
+                user_2, table, [{f"field_{field.id}": [{"name": user_file_2.name}]}]
+            )
+            .created_rows
+        )
+
+    for value in [
+        getattr(row, f"field_{field.id}"),
+        getattr(rows[0], f"field_{field.id}"),
+    ]:
+        assert value[0]["name"] == user_file.name
+        assert value[0]["visible_name"] == user_file.name
+        assert value[0]["uploaded_at"] == "2022-01-01T12:00:00+00:00"
+
+
 @pytest.mark.django_db(transaction=True)
 @pytest.mark.field_file
 def test_import_export_file_field(data_fixture, tmpdir):
@@ -1,6 +1,7 @@
 import json
 from datetime import date, datetime, timedelta, timezone
 from typing import NamedTuple
+from unittest.mock import patch
 
 from django.conf import settings
 from django.test.utils import override_settings
@@ -17,7 +18,12 @@ from baserow.contrib.database.fields.field_constraints import (
 )
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import SelectOption, TextField
+from baserow.contrib.database.file_import.job_types import (
+    FileImportJobType,
+    read_data_file,
+)
 from baserow.contrib.database.rows.exceptions import InvalidRowLength
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.table.models import GeneratedTableModel
 from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.jobs.constants import (
@@ -528,6 +534,65 @@ def test_run_file_import_test_chunk(data_fixture, patch_filefield_storage):
     assert job.progress_percentage == 100
 
 
+@pytest.mark.django_db(transaction=True)
+def test_run_file_import_streams_the_rows_from_the_data_file(
+    data_fixture, patch_filefield_storage
+):
+    row_count = 1024 * 2 + 5
+
+    user = data_fixture.create_user()
+    table, _, _ = data_fixture.build_table(
+        columns=[("col1", "text"), ("col2", "number")], rows=[], user=user
+    )
+
+    data = [[f"row {index}", index] for index in range(row_count)]
+    data[10] = ["row 10", "bad"]
+    data[1030] = ["row 1030", "bad", "too many values"]
+    data[2050] = ["row 2050", "bad"]
+
+    loaded_rows, loaded_rows_per_batch = [], []
+
+    def _read_data_file(fin):
+        configuration, count, rows = read_data_file(fin)
+
+        def _rows():
+            for row in rows:
+                loaded_rows.append(row)
+                yield row
+
+        return configuration, count, _rows()
+
+    force_create_rows_by_batch = RowHandler().force_create_rows_by_batch
+
+    def _force_create_rows_by_batch(user, table, rows_values, **kwargs):
+        loaded_rows_per_batch.append((len(loaded_rows), len(rows_values)))
+        return force_create_rows_by_batch(user, table, rows_values, **kwargs)
+
+    with (
+        patch_filefield_storage(),
+        patch(
+            "baserow.contrib.database.file_import.job_types.read_data_file",
+            side_effect=_read_data_file,
+        ),
+        patch(
+            "baserow.contrib.database.rows.handler.RowHandler.force_create_rows_by_batch",
+            side_effect=_force_create_rows_by_batch,
+        ),
+    ):
+        job = data_fixture.create_file_import_job(table=table, user=user)
+        FileImportJobType().after_job_creation(job, {"data": data})
+        run_async_job(job.id)
+
+    job.refresh_from_db()
+    assert job.state == JOB_FINISHED
+    assert job.progress_percentage == 100
+    assert sorted(job.report["failing_rows"].keys()) == ["10", "1030", "2050"]
+    assert table.get_model().objects.count() == row_count - 3
+
+    # The rows are created chunk by chunk, while they're read from the file.
+    assert loaded_rows_per_batch == [(1024, 1023), (2048, 1023), (2053, 4)]
+
+
 @pytest.mark.django_db()
 def test_run_file_import_limit(data_fixture, patch_filefield_storage):
     row_count = 2000
@@ -784,6 +784,31 @@ def test_can_export_csv_without_header(get_storage_mock, data_fixture):
     assert expected == contents
 
 
+@pytest.mark.django_db
+@patch("baserow.core.storage.get_default_storage")
+@patch(
+    "baserow.contrib.database.export.file_writer.PaginatedExportJobFileWriter."
+    "EXPORT_BATCH_SIZE",
+    1,
+)
+def test_can_export_csv_in_multiple_batches(get_storage_mock, data_fixture):
+    storage_mock = MagicMock()
+    get_storage_mock.return_value = storage_mock
+
+    job, contents = setup_table_and_run_export_decoding_result(
+        data_fixture,
+        storage_mock,
+        options={"exporter_type": "csv", "csv_include_header": False},
+    )
+    expected = (
+        "\ufeff"
+        f"2,atest,A,02/01/2020 01:23,,-10.20,linked_row_1\r\n"
+        f'1,test,B,02/01/2020 01:23,,10.20,"linked_row_1,linked_row_2"\r\n'
+    )
+    assert expected == contents
+    assert job.progress_percentage == 100
+
+
 @pytest.mark.django_db
 @pytest.mark.once_per_day_in_ci
 @patch("baserow.core.storage.get_default_storage")
@@ -406,6 +406,77 @@ def test_rows_deleted_event_type(data_fixture):
     }
 
 
+def test_rows_event_types_merge_payloads():
+    created = webhook_event_type_registry.get("rows.created")
+    base = {"table_id": 1, "event_type": "rows.created"}
+
+    merged = created.merge_payloads(
+        {**base, "event_id": "1", "items": [{"id": 1}]},
+        {**base, "event_id": "2", "items": [{"id": 2}]},
+        max_items=2,
+    )
+    assert merged == {
+        **base,
+        "event_id": "1",
+        "items": [{"id": 1}, {"id": 2}],
+        "merged_event_ids": ["1", "2"],
+    }
+    merged = created.merge_payloads(
+        merged, {**base, "event_id": "3", "items": [{"id": 3}]}, max_items=3
+    )
+    assert merged["items"] == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert merged["merged_event_ids"] == ["1", "2", "3"]
+
+    # Too many items.
+    assert (
+        created.merge_payloads(
+            {**base, "event_id": "1", "items": [{"id": 1}]},
+            {**base, "event_id": "2", "items": [{"id": 2}]},
+            max_items=1,
+        )
+        is None
+    )
+    # Different table.
+    assert (
+        created.merge_payloads(
+            {**base, "event_id": "1", "items": [{"id": 1}]},
+            {**base, "table_id": 2, "event_id": "2", "items": [{"id": 2}]},
+            max_items=10,
+        )
+        is None
+    )
+    # Rows of related tables are only fetched when the call is made.
+    assert (
+        created.merge_payloads(
+            {**base, "event_id": "1", "item_ids": [1], "total_count": 1},
+            {**base, "event_id": "2", "item_ids": [2], "total_count": 1},
+            max_items=10,
+        )
+        is None
+    )
+
+    updated = webhook_event_type_registry.get("rows.updated")
+    merged = updated.merge_payloads(
+        {"event_id": "1", "items": [{"id": 1}], "old_items": [{"id": 1, "a": 1}]},
+        {"event_id": "2", "items": [{"id": 2}], "old_items": [{"id": 2, "a": 2}]},
+        max_items=10,
+    )
+    assert merged["items"] == [{"id": 1}, {"id": 2}]
+    assert merged["old_items"] == [{"id": 1, "a": 1}, {"id": 2, "a": 2}]
+
+    deleted = webhook_event_type_registry.get("rows.deleted")
+    merged = deleted.merge_payloads(
+        {"event_id": "1", "row_ids": [1]},
+        {"event_id": "2", "row_ids": [2, 3]},
+        max_items=10,
+    )
+    assert merged == {
+        "event_id": "1",
+        "row_ids": [1, 2, 3],
+        "merged_event_ids": ["1", "2"],
+    }
+
+
 @pytest.mark.django_db(transaction=True)
 @patch("baserow.contrib.database.webhooks.registries.call_webhook")
 def test_rows_deleted_event_type_without_webhook_event(mock_call_webhook, data_fixture):
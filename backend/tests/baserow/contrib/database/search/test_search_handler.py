@@ -609,3 +609,94 @@ def test_search_data_updates_dont_clear_concurrent_updates(mock, data_fixture):
         # If the updates are processed again, the pending updates are cleared.
         SearchHandler.process_search_data_updates(table)
         assert PendingSearchValueUpdate.objects.count() == 0
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.search.handler.schedule_update_search_data")
+def test_search_data_updates_are_coalesced_per_transaction(
+    mock, data_fixture, django_capture_on_commit_callbacks
+):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            SearchHandler.schedule_update_search_data(
+                table, fields=[text_field], row_ids=[1, 2]
+            )
+            SearchHandler.schedule_update_search_data(
+                table, fields=[text_field], row_ids=[2, 3]
+            )
+            SearchHandler.schedule_update_search_data(
+                table, fields=[number_field, text_field], row_ids=[4]
+            )
+            SearchHandler.schedule_update_search_data(
+                table, fields=[text_field, number_field], row_ids=[5]
+            )
+            SearchHandler.schedule_update_search_data(table, fields=[number_field])
+            SearchHandler.schedule_update_search_data(
+                table, fields=[number_field], row_ids=[6]
+            )
+
+    assert sorted(call.args for call in mock.delay.call_args_list) == sorted(
+        [
+            (table.id, [text_field.id], [1, 2, 3]),
+            (table.id, sorted([text_field.id, number_field.id]), [4, 5]),
+            (table.id, [number_field.id], None),
+        ]
+    )
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.search.handler.schedule_update_search_data")
+def test_search_data_updates_are_not_lost_when_a_savepoint_is_rolled_back(
+    mock, data_fixture, django_capture_on_commit_callbacks
+):
+    table = data_fixture.create_database_table()
+    field = data_fixture.create_text_field(table=table)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            try:
+                with transaction.atomic():
+                    SearchHandler.schedule_update_search_data(
+                        table, fields=[field], row_ids=[1]
+                    )
+                    raise ValueError()
+            except ValueError:
+                pass
+            SearchHandler.schedule_update_search_data(
+                table, fields=[field], row_ids=[2]
+            )
+
+    assert [call.args for call in mock.delay.call_args_list] == [
+        (table.id, [field.id], [2])
+    ]
+
+
+def test_pending_cells_updates_are_grouped_without_updating_unchanged_cells():
+    # Rows sharing the same set of changed fields are updated together.
+    assert sorted(
+        SearchHandler._group_pending_cells_updates({1: {10, 11}, 2: {10, 11}, 3: {12}})
+    ) == [([10, 11], [1, 2]), ([12], [3])]
+
+    # Grouping the rows per field results in less groups here.
+    assert sorted(
+        SearchHandler._group_pending_cells_updates(
+            {1: {10}, 2: {10, 11}, 3: {11, 12}, 4: {10, 12}}
+        )
+    ) == [([10], [1, 2, 4]), ([11], [2, 3]), ([12], [3, 4])]
+
+
+def test_search_update_batch_size_adapts_to_the_target_duration(settings):
+    settings.PG_FULLTEXT_SEARCH_UPDATE_BATCH_TARGET_MS = 1000
+    settings.PG_FULLTEXT_SEARCH_UPDATE_MIN_BATCH_SIZE = 20
+    settings.PG_FULLTEXT_SEARCH_UPDATE_MAX_BATCH_SIZE = 5000
+
+    assert SearchHandler._get_next_batch_size(200, 1000) == 200
+    assert SearchHandler._get_next_batch_size(200, 800) == 250
+    assert SearchHandler._get_next_batch_size(200, 10) == 400
+    assert SearchHandler._get_next_batch_size(200, 4000) == 100
+    assert SearchHandler._get_next_batch_size(30, 4000) == 20
+    assert SearchHandler._get_next_batch_size(4000, 0) == 5000
@@ -1,9 +1,17 @@
+import threading
+
 from django.test.utils import override_settings
 
 import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.table.cache import get_cached_model_field_attrs
+from baserow.contrib.database.table.cache import (
+    GeneratedModelLRUCache,
+    generated_models_lru_cache,
+    get_cached_model_field_attrs,
+)
+from baserow.contrib.database.table.models import Table
+from baserow.core.cache import local_cache
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -204,3 +212,223 @@ def test_deleting_field_invalidates_tables_model_cache(data_fixture):
 
     table.refresh_from_db()
     assert get_cached_model_field_attrs(table) is None
+
+
+@pytest.mark.django_db
+def test_generated_model_is_reused_from_process_cache(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table)
+    table.refresh_from_db()
+
+    with local_cache.context():
+        model = table.get_model()
+
+    assert table in generated_models_lru_cache
+    hits = generated_models_lru_cache.hits
+
+    with local_cache.context():
+        assert table.get_model() is model
+
+    assert generated_models_lru_cache.hits == hits + 1
+
+
+@pytest.mark.django_db
+def test_generated_model_process_cache_is_invalidated_on_schema_change(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table)
+
+    with local_cache.context():
+        model = table.get_model()
+
+    assert table in generated_models_lru_cache
+
+    field = data_fixture.create_text_field(table=table)
+
+    assert table not in generated_models_lru_cache
+
+    with local_cache.context():
+        new_model = table.get_model()
+
+    assert new_model is not model
+    assert field.id in new_model._field_objects
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_DISABLE_MODEL_CACHE=True)
+def test_generated_model_process_cache_can_be_disabled(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table)
+
+    with local_cache.context():
+        model = table.get_model()
+
+    assert table not in generated_models_lru_cache
+
+    with local_cache.context():
+        assert table.get_model() is not model
+
+
+def test_generated_model_lru_cache_evicts_least_recently_used():
+    cache = GeneratedModelLRUCache(max_size=2, max_fields=100)
+
+    def model_with_fields(count):
+        return type("Model", (), {"_field_objects": dict.fromkeys(range(count))})
+
+    cache.set((1, "v"), model_with_fields(1))
+    cache.set((2, "v"), model_with_fields(1))
+    cache.set((3, "v"), model_with_fields(1))
+
+    assert [key[0] for key in cache._entries] == [2, 3]
+    assert cache.evictions == 1
+
+    # A model that's too wide is not cached at all.
+    cache.set((4, "v"), model_with_fields(100))
+    assert [key[0] for key in cache._entries] == [2, 3]
+
+    # Wide models evict others until the total number of fields fits.
+    cache.set((5, "v"), model_with_fields(90))
+    assert [key[0] for key in cache._entries] == [5]
+    assert cache.get_stats()["total_fields"] == 91
+
+    cache.invalidate_table(5)
+    assert len(cache) == 0
+    assert cache.get_stats()["total_fields"] == 0
+
+
+@pytest.mark.django_db
+def test_generated_model_process_cache_is_invalidated_when_linked_table_changes(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    linked_table = data_fixture.create_database_table(
+        user=user, database=table.database
+    )
+    other_table = data_fixture.create_database_table(user=user, database=table.database)
+    unrelated_table = data_fixture.create_database_table(
+        user=user, database=table.database
+    )
+    FieldHandler().create_field(
+        user, table, "link_row", link_row_table=linked_table, name="link"
+    )
+    # The other table is only connected through the linked table.
+    FieldHandler().create_field(
+        user, linked_table, "link_row", link_row_table=other_table, name="link"
+    )
+    table.refresh_from_db()
+    unrelated_table.refresh_from_db()
+    old_unrelated_table_version = unrelated_table.version
+
+    with local_cache.context():
+        model = table.get_model()
+
+    assert table in generated_models_lru_cache
+
+    field = data_fixture.create_text_field(table=other_table)
+    old_table_version = table.version
+    table.refresh_from_db()
+    unrelated_table.refresh_from_db()
+
+    assert table not in generated_models_lru_cache
+    assert table.version == old_table_version
+    assert unrelated_table.version == old_unrelated_table_version
+
+    with local_cache.context():
+        new_model = table.get_model()
+
+    assert new_model is not model
+    other_model_name = Table.get_table_model_name(other_table.id).lower()
+    assert field.id in new_model.baserow_models[other_model_name]._field_objects
+
+
+@pytest.mark.django_db
+def test_generated_model_in_process_cache_points_to_the_table_of_the_thread(
+    data_fixture,
+):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table)
+    table.refresh_from_db()
+
+    with local_cache.context():
+        model = table.get_model()
+
+    other_table = Table.objects.get(id=table.id)
+    other_table.name = "Renamed"
+    results = {}
+
+    def get_model_in_other_thread():
+        # The cache is accessed directly because the thread doesn't share the
+        # database connection of the test.
+        other_model = generated_models_lru_cache.get_or_generate(
+            other_table, other_table._get_model
+        )
+        results["model"] = other_model
+        results["table"] = other_model.baserow_table
+
+    thread = threading.Thread(target=get_model_in_other_thread)
+    thread.start()
+    thread.join()
+
+    assert results["model"] is model
+    assert results["table"] is other_table
+    assert model.baserow_table is table
+
+
+@pytest.mark.django_db
+def test_generated_model_process_cache_checks_the_versions_of_linked_tables(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    linked_table = data_fixture.create_database_table(
+        user=user, database=table.database
+    )
+    FieldHandler().create_field(
+        user, table, "link_row", link_row_table=linked_table, name="link"
+    )
+    table.refresh_from_db()
+
+    with local_cache.context():
+        model = table.get_model()
+
+    with local_cache.context():
+        assert table.get_model() is model
+
+    # Another process changed the schema of the linked table, so the entry isn't
+    # evicted from the cache of this one.
+    Table.objects.filter(id=linked_table.id).update(version="changed")
+
+    assert table in generated_models_lru_cache
+    with local_cache.context():
+        assert table.get_model() is not model
+
+
+@pytest.mark.django_db
+def test_generated_model_in_process_cache_has_field_objects_per_thread(
+    data_fixture,
+):
+    table = data_fixture.create_database_table()
+    field = data_fixture.create_text_field(table=table, name="Name")
+    table.refresh_from_db()
+
+    with local_cache.context():
+        model = table.get_model()
+
+    model._field_objects[field.id]["field"].name = "Changed"
+    results = {}
+
+    def get_model_in_other_thread():
+        other_model = generated_models_lru_cache.get_or_generate(
+            table, table._get_model
+        )
+        results["model"] = other_model
+        results["field"] = other_model._field_objects[field.id]["field"]
+
+    thread = threading.Thread(target=get_model_in_other_thread)
+    thread.start()
+    thread.join()
+
+    assert results["model"] is model
+    assert results["field"] is not model._field_objects[field.id]["field"]
+    assert results["field"].name == "Name"
+    assert model._field_objects[field.id]["field"].name == "Changed"
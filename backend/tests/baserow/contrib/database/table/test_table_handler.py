@@ -15,6 +15,7 @@ from freezegun import freeze_time
 from pyinstrument import Profiler
 from pytest_unordered import unordered
 
+from baserow.contrib.database.application_types import DatabaseApplicationType
 from baserow.contrib.database.fields.exceptions import (
     MaxFieldLimitExceeded,
     MaxFieldNameLengthExceeded,
@@ -750,6 +751,107 @@ def test_duplicate_table_after_link_row_field_moved_to_another_table(data_fixtur
         pytest.fail("Duplicating table failed: %s" % exc)
 
 
+@pytest.mark.django_db
+def test_duplicate_table_copies_rows_with_sql(data_fixture, settings):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(user=user, database=database)
+    related_table = data_fixture.create_database_table(user=user, database=database)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(table=table)
+    data_fixture.create_text_field(table=related_table, primary=True)
+    link_field = data_fixture.create_link_row_field(
+        table=table, link_row_table=related_table
+    )
+    formula_field = data_fixture.create_formula_field(
+        table=table, formula=f"field('{text_field.name}')", formula_type="text"
+    )
+    related_model = related_table.get_model()
+    related_rows = [related_model.objects.create() for _ in range(2)]
+    rows = (
+        RowHandler()
+        .force_create_rows(
+            user,
+            table,
+            [
+                {
+                    f"field_{text_field.id}": "a",
+                    f"field_{number_field.id}": 1,
+                    f"field_{link_field.id}": [related_rows[0].id],
+                },
+                {
+                    f"field_{text_field.id}": "b",
+                    f"field_{number_field.id}": 2,
+                    f"field_{link_field.id}": [r.id for r in related_rows],
+                },
+                {f"field_{text_field.id}": "trashed"},
+            ],
+        )
+        .created_rows
+    )
+    model = table.get_model()
+    model.objects.filter(id=rows[2].id).update(trashed=True)
+
+    with patch(
+        "baserow.contrib.database.application_types.DatabaseApplicationType."
+        "_copy_table_rows_with_sql",
+        wraps=DatabaseApplicationType()._copy_table_rows_with_sql,
+    ) as copy_table_rows_with_sql:
+        duplicated_table = TableHandler().duplicate_table(user, table)
+
+    copy_table_rows_with_sql.assert_called_once()
+
+    fields = {field.name: field for field in duplicated_table.field_set.all()}
+    duplicated_link_field = fields[link_field.name].specific
+    duplicated_rows = list(duplicated_table.get_model().objects.order_by("id"))
+    assert [row.id for row in duplicated_rows] == [rows[0].id, rows[1].id]
+    assert [
+        getattr(row, f"field_{fields[text_field.name].id}") for row in duplicated_rows
+    ] == ["a", "b"]
+    assert [
+        getattr(row, f"field_{fields[number_field.name].id}") for row in duplicated_rows
+    ] == [1, 2]
+    assert [
+        getattr(row, f"field_{fields[formula_field.name].id}")
+        for row in duplicated_rows
+    ] == ["a", "b"]
+    assert [
+        [r.id for r in getattr(row, f"field_{duplicated_link_field.id}").all()]
+        for row in duplicated_rows
+    ] == [[related_rows[0].id], [r.id for r in related_rows]]
+
+    # The related field in the other table must see the copied relationships.
+    related_link_field = duplicated_link_field.link_row_related_field
+    related_row = related_table.get_model().objects.get(id=related_rows[1].id)
+    assert [
+        r.id for r in getattr(related_row, f"field_{related_link_field.id}").all()
+    ] == [rows[1].id]
+
+    # New rows must get a new id.
+    new_row = RowHandler().create_row(user, duplicated_table)
+    assert new_row.id > rows[2].id
+
+
+@pytest.mark.django_db
+def test_duplicate_table_does_not_copy_rows_with_sql_if_not_supported(
+    data_fixture, settings
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, primary=True)
+    data_fixture.create_single_select_field(table=table)
+
+    with patch(
+        "baserow.contrib.database.application_types.DatabaseApplicationType."
+        "_copy_table_rows_with_sql",
+    ) as copy_table_rows_with_sql:
+        TableHandler().duplicate_table(user, table)
+        settings.BASEROW_DUPLICATE_TABLE_ROWS_WITH_SQL = False
+        TableHandler().duplicate_table(user, data_fixture.create_database_table(user))
+
+    copy_table_rows_with_sql.assert_not_called()
+
+
 @pytest.mark.django_db()
 def test_create_last_modified_by_field(data_fixture):
     user = data_fixture.create_user()
@@ -1029,6 +1131,30 @@ def test_get_database_table_storage_usage(data_fixture):
     assert TableUsageHandler.calculate_table_storage_usage(table.id) == 10
 
 
+@pytest.mark.django_db
+def test_get_database_table_storage_usage_with_deduplicated_files(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_file_field(table=table)
+
+    file_1 = data_fixture.create_user_file(size=2 * USAGE_UNIT_MB)
+    # The same content uploaded again shares the unique and the stored file.
+    data_fixture.create_user_file(
+        size=file_1.size,
+        unique=file_1.unique,
+        sha256_hash=file_1.sha256_hash,
+        original_extension=file_1.original_extension,
+    )
+
+    RowHandler().create_rows(
+        user,
+        table,
+        [{field.db_column: [{"name": file_1.name, "visible_name": "new name"}]}],
+    )
+
+    assert TableUsageHandler.calculate_table_storage_usage(table.id) == 2
+
+
 @pytest.mark.django_db
 def test_usage_is_calculated_correctly_when_rows_are_deleted(data_fixture):
     database = data_fixture.create_database_application()
@@ -1,6 +1,9 @@
 import os
+import threading
 from datetime import datetime, timezone
+from io import BytesIO
 from unittest.mock import patch
+from zipfile import ZipFile
 
 from django.core.files.storage import FileSystemStorage
 
@@ -19,6 +22,7 @@ from baserow.core.handler import CoreHandler
 from baserow.core.models import Template
 from baserow.core.registries import ImportExportConfig, application_type_registry
 from baserow.core.snapshots.handler import SnapshotHandler
+from baserow.core.storage import ExportZipFile
 from baserow.core.utils import Progress
 from baserow.test_utils.helpers import setup_interesting_test_database
 
@@ -145,6 +149,199 @@ def test_import_export_database(data_fixture):
     assert row_3.id == 3
 
 
+@pytest.mark.django_db
+def test_import_export_database_with_streamed_table_rows(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    data_fixture.create_link_row_field(table=table, link_row_table=table)
+    RowHandler().force_create_rows(
+        user,
+        table,
+        [{f"field_{text_field.id}": f"Row {index}"} for index in range(3)],
+    )
+
+    database_type = application_type_registry.get("database")
+    config = ImportExportConfig(include_permission_data=False, stream_table_rows=True)
+    zip_stream = ExportZipFile()
+    serialized = database_type.export_serialized(database, config, zip_stream)
+
+    serialized_table = serialized["tables"][0]
+    assert serialized_table["rows"] == []
+    assert serialized_table["rows_count"] == 3
+    assert serialized_table["rows_file"].startswith(f"database_table_{table.id}_rows_")
+
+    files_buffer = BytesIO()
+    for chunk in zip_stream:
+        files_buffer.write(chunk)
+
+    imported_workspace = data_fixture.create_workspace(user=user)
+    with ZipFile(files_buffer, "r") as files_zip:
+        assert files_zip.namelist() == [serialized_table["rows_file"]]
+        imported_database = database_type.import_serialized(
+            imported_workspace, serialized, config, {}, files_zip, None
+        )
+
+    imported_table = imported_database.table_set.get()
+    imported_text_field = imported_table.field_set.get(name="text")
+    imported_rows = imported_table.get_model().objects.order_by("id")
+    assert [
+        getattr(row, f"field_{imported_text_field.id}") for row in imported_rows
+    ] == ["Row 0", "Row 1", "Row 2"]
+
+
+@pytest.mark.django_db
+def test_import_database_reads_streamed_table_rows_ahead(data_fixture, settings):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    RowHandler().force_create_rows(
+        user,
+        table,
+        [{f"field_{text_field.id}": f"Row {index}"} for index in range(5)],
+    )
+
+    database_type = application_type_registry.get("database")
+    config = ImportExportConfig(include_permission_data=False, stream_table_rows=True)
+    zip_stream = ExportZipFile()
+    serialized = database_type.export_serialized(database, config, zip_stream)
+
+    files_buffer = BytesIO()
+    for chunk in zip_stream:
+        files_buffer.write(chunk)
+
+    settings.BASEROW_IMPORT_EXPORT_TABLE_ROWS_WORKERS = 2
+    thread_names = []
+    original_get_serialized_table_rows = (
+        DatabaseApplicationType._get_serialized_table_rows
+    )
+
+    def get_serialized_table_rows(*args, **kwargs):
+        for serialized_row in original_get_serialized_table_rows(*args, **kwargs):
+            thread_names.append(threading.current_thread().name)
+            yield serialized_row
+
+    imported_workspace = data_fixture.create_workspace(user=user)
+    with (
+        ZipFile(files_buffer, "r") as files_zip,
+        patch.object(
+            DatabaseApplicationType, "_get_serialized_table_rows", autospec=True
+        ) as get_serialized_table_rows_mock,
+        patch("baserow.contrib.database.application_types.COPY_BATCH_SIZE", 2),
+    ):
+        get_serialized_table_rows_mock.side_effect = get_serialized_table_rows
+        imported_database = database_type.import_serialized(
+            imported_workspace, serialized, config, {}, files_zip, None
+        )
+
+    assert thread_names == ["read-ahead"] * 5
+
+    imported_table = imported_database.table_set.get()
+    imported_text_field = imported_table.field_set.get(name="text")
+    imported_rows = imported_table.get_model().objects.order_by("id")
+    assert [
+        getattr(row, f"field_{imported_text_field.id}") for row in imported_rows
+    ] == [f"Row {index}" for index in range(5)]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_export_database_table_rows_concurrently(data_fixture, settings):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    tables = []
+    for index in range(3):
+        table = data_fixture.create_database_table(database=database)
+        text_field = data_fixture.create_text_field(table=table, name="text")
+        RowHandler().force_create_rows(
+            user,
+            table,
+            [{f"field_{text_field.id}": f"Table {index} row {i}"} for i in range(5)],
+        )
+        tables.append(table)
+
+    database_type = application_type_registry.get("database")
+    config = ImportExportConfig(include_permission_data=False)
+
+    def export():
+        with database_type.export_safe_transaction_context(database):
+            return database_type.export_serialized(database, config)
+
+    settings.BASEROW_IMPORT_EXPORT_TABLE_ROWS_WORKERS = 1
+    sequentially_serialized = export()
+
+    settings.BASEROW_IMPORT_EXPORT_TABLE_ROWS_WORKERS = 3
+    thread_names = []
+    original_export_table_rows = DatabaseApplicationType._export_table_rows
+
+    def export_table_rows(*args, **kwargs):
+        thread_names.append(threading.current_thread().name)
+        return original_export_table_rows(*args, **kwargs)
+
+    with patch.object(
+        DatabaseApplicationType, "_export_table_rows", autospec=True
+    ) as export_table_rows_mock:
+        export_table_rows_mock.side_effect = export_table_rows
+        concurrently_serialized = export()
+
+    assert len(thread_names) == 3
+    assert all(name.startswith("export-table-rows") for name in thread_names)
+    assert concurrently_serialized == sequentially_serialized
+    assert [len(table["rows"]) for table in concurrently_serialized["tables"]] == [
+        5,
+        5,
+        5,
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_export_database_table_rows_concurrently_stops_threads_on_error(
+    data_fixture, settings
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    for index in range(3):
+        table = data_fixture.create_database_table(database=database)
+        data_fixture.create_text_field(table=table, name="text")
+
+    database_type = application_type_registry.get("database")
+    config = ImportExportConfig(include_permission_data=False)
+    settings.BASEROW_IMPORT_EXPORT_TABLE_ROWS_WORKERS = 3
+
+    finished_exports = []
+    original_export_table_rows = DatabaseApplicationType._export_table_rows
+
+    def export_table_rows(*args, **kwargs):
+        result = original_export_table_rows(*args, **kwargs)
+        finished_exports.append(threading.current_thread().name)
+        return result
+
+    with (
+        patch.object(
+            DatabaseApplicationType, "_export_table_rows", autospec=True
+        ) as export_table_rows_mock,
+        patch(
+            "baserow.contrib.database.fields.field_types.TextFieldType.export_serialized",
+            side_effect=ValueError("Failed"),
+        ),
+    ):
+        export_table_rows_mock.side_effect = export_table_rows
+        with pytest.raises(ValueError):
+            with database_type.export_safe_transaction_context(database):
+                database_type.export_serialized(database, config)
+
+        # All the threads are done before the error reaches the caller.
+        finished_count = len(finished_exports)
+        assert not any(
+            thread.name.startswith("export-table-rows")
+            for thread in threading.enumerate()
+        )
+        assert len(finished_exports) == finished_count
+
+
 @pytest.mark.django_db
 def test_create_application_and_init_with_data(data_fixture):
     core_handler = CoreHandler()
@@ -1,5 +1,6 @@
 import random
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 from faker import Faker
@@ -7,7 +8,11 @@ from faker import Faker
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.field_types import SingleSelectFieldType
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.views.exceptions import FieldAggregationNotSupported
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.views.exceptions import (
+    FieldAggregationNotSupported,
+    IncrementalAggregationNotPossible,
+)
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
 from baserow.core.trash.handler import TrashHandler
@@ -627,3 +632,196 @@ class TestViewDistributionAggregation:
         # the boolean field distribution:
         for value, count in result[f"field_{boolean_formula_field.id}"]:
             assert self.expected_distributions[boolean_field].get(value) == count
+
+
+def test_incremental_view_aggregation_types():
+    count = view_aggregation_type_registry.get("empty_count")
+    assert count.update_incrementally(2, {}, None, {"value": 3}) == (5, {})
+    assert count.update_incrementally(5, {}, {"value": 2}, None) == (3, {})
+
+    sum_type = view_aggregation_type_registry.get("sum")
+    assert sum_type.update_incrementally(
+        Decimal("10"), {"count": 2}, {"value": Decimal("4"), "count": 1}, None
+    ) == (Decimal("6"), {"count": 1})
+    assert sum_type.update_incrementally(
+        Decimal("6"), {"count": 1}, {"value": Decimal("6"), "count": 1}, None
+    ) == (None, {"count": 0})
+    assert sum_type.update_incrementally(
+        None, {"count": 0}, None, {"value": Decimal("1"), "count": 1}
+    ) == (Decimal("1"), {"count": 1})
+    with pytest.raises(IncrementalAggregationNotPossible):
+        sum_type.update_incrementally(Decimal("6"), {}, None, None)
+
+    average = view_aggregation_type_registry.get("average")
+    assert average.update_incrementally(
+        Decimal("2"),
+        {"sum": Decimal("4"), "count": 2},
+        None,
+        {"sum": Decimal("5"), "count": 1},
+    ) == (Decimal("3"), {"sum": Decimal("9"), "count": 3})
+    value, state = average.update_incrementally(
+        Decimal("2"),
+        {"sum": Decimal("4.0"), "count": 2},
+        None,
+        {"sum": Decimal("6.0"), "count": 1},
+    )
+    assert str(value) == "3.3333333333333333"
+    assert state == {"sum": Decimal("10.0"), "count": 3}
+
+    min_type = view_aggregation_type_registry.get("min")
+    assert min_type.update_incrementally(2, {}, None, {"value": 1}) == (1, {})
+    assert min_type.update_incrementally(2, {}, {"value": 3}, {"value": 4}) == (2, {})
+    assert min_type.update_incrementally(2, {}, {"value": 2}, {"value": 1}) == (1, {})
+    with pytest.raises(IncrementalAggregationNotPossible):
+        min_type.update_incrementally(2, {}, {"value": 2}, {"value": 3})
+    with pytest.raises(IncrementalAggregationNotPossible):
+        min_type.update_incrementally(2, {}, {"value": 2}, None)
+
+    max_type = view_aggregation_type_registry.get("max")
+    assert max_type.update_incrementally(2, {}, None, {"value": 5}) == (5, {})
+    with pytest.raises(IncrementalAggregationNotPossible):
+        max_type.update_incrementally(5, {}, {"value": 5}, {"value": 1})
+
+    assert not view_aggregation_type_registry.get("median").incremental
+
+
+@pytest.mark.django_db(transaction=True)
+def test_view_aggregations_are_updated_incrementally(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    sum_field = data_fixture.create_number_field(table=table)
+    min_field = data_fixture.create_number_field(table=table)
+    average_field = data_fixture.create_number_field(table=table)
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="not_equal", value="hidden"
+    )
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            sum_field.id: {"aggregation_type": "sum", "aggregation_raw_type": "sum"},
+            min_field.id: {"aggregation_type": "min", "aggregation_raw_type": "min"},
+            average_field.id: {
+                "aggregation_type": "average",
+                "aggregation_raw_type": "average",
+            },
+            text_field.id: {
+                "aggregation_type": "empty_count",
+                "aggregation_raw_type": "empty_count",
+            },
+        },
+    )
+
+    row_handler = RowHandler()
+    rows = row_handler.create_rows(
+        user,
+        table,
+        [
+            {
+                sum_field.db_column: 1,
+                min_field.db_column: 5,
+                average_field.db_column: 2,
+            },
+            {sum_field.db_column: 2, min_field.db_column: 3, text_field.db_column: "a"},
+        ],
+    ).created_rows
+
+    def get_aggregations():
+        return view_handler.get_view_field_aggregations(user, grid_view)
+
+    def assert_aggregations_equal_to_computed(aggregations):
+        computed = view_handler.get_field_aggregations(
+            user, grid_view, view_handler.get_aggregations(grid_view)
+        )
+        for name, value in aggregations.items():
+            assert str(value) == str(computed[name])
+
+    assert get_aggregations() == {
+        sum_field.db_column: Decimal("3"),
+        min_field.db_column: Decimal("3"),
+        average_field.db_column: Decimal("2"),
+        text_field.db_column: 1,
+    }
+
+    with patch.object(
+        ViewHandler, "get_field_aggregations", wraps=view_handler.get_field_aggregations
+    ) as get_field_aggregations:
+        row_handler.create_rows(
+            user,
+            table,
+            [
+                {sum_field.db_column: 4, min_field.db_column: 1},
+                {sum_field.db_column: 100, text_field.db_column: "hidden"},
+            ],
+        )
+        aggregations = get_aggregations()
+        assert aggregations == {
+            sum_field.db_column: Decimal("7"),
+            min_field.db_column: Decimal("1"),
+            average_field.db_column: Decimal("2"),
+            text_field.db_column: 2,
+        }
+
+        row_handler.update_rows(
+            user,
+            table,
+            [{"id": rows[0].id, average_field.db_column: 4, text_field.db_column: "b"}],
+        )
+        aggregations = get_aggregations()
+        assert aggregations[average_field.db_column] == Decimal("4")
+        assert aggregations[text_field.db_column] == 1
+
+        row_handler.update_rows(
+            user,
+            table,
+            [{"id": rows[1].id, average_field.db_column: 1}],
+        )
+        aggregations = get_aggregations()
+        assert str(aggregations[average_field.db_column]) == "2.5000000000000000"
+
+        row_handler.delete_rows(user, table, [rows[1].id])
+        aggregations = get_aggregations()
+        assert aggregations[sum_field.db_column] == Decimal("5")
+
+        get_field_aggregations.assert_not_called()
+
+    assert_aggregations_equal_to_computed(aggregations)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_view_aggregation_is_recomputed_when_the_extreme_is_removed(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {"aggregation_type": "max", "aggregation_raw_type": "max"},
+        },
+    )
+
+    row_handler = RowHandler()
+    rows = row_handler.create_rows(
+        user,
+        table,
+        [{number_field.db_column: 1}, {number_field.db_column: 10}],
+    ).created_rows
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: Decimal("10")
+    }
+
+    row_handler.delete_rows(user, table, [rows[1].id])
+
+    with patch.object(
+        ViewHandler, "get_field_aggregations", wraps=view_handler.get_field_aggregations
+    ) as get_field_aggregations:
+        assert view_handler.get_view_field_aggregations(user, grid_view) == {
+            number_field.db_column: Decimal("1")
+        }
+        get_field_aggregations.assert_called_once()
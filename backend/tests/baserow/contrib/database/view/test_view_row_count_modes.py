@@ -0,0 +1,110 @@
+from unittest.mock import patch
+
+from django.test.utils import override_settings
+
+import pytest
+
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.views.exceptions import RowCountModeDoesNotExist
+from baserow.contrib.database.views.handler import ViewHandler
+from baserow.contrib.database.views.utils import RowCount
+
+
+@pytest.mark.django_db
+def test_get_view_row_count_exact(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    RowHandler().create_rows(user, table, [{}, {}, {}])
+
+    handler = ViewHandler()
+    queryset = handler.get_queryset(user, grid)
+
+    assert handler.get_view_row_count(grid, queryset) == RowCount(3, exact=True)
+
+    with pytest.raises(RowCountModeDoesNotExist):
+        handler.get_view_row_count(grid, queryset, "unknown")
+
+
+@pytest.mark.django_db
+def test_get_view_row_count_cached_is_invalidated(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    RowHandler().create_rows(
+        user, table, [{field.db_column: "a"}, {field.db_column: "b"}]
+    )
+
+    handler = ViewHandler()
+    queryset = handler.get_queryset(user, grid)
+
+    assert handler.get_view_row_count(grid, queryset, "cached") == RowCount(2, True)
+
+    with patch.object(type(queryset), "count") as mock_count:
+        assert handler.get_view_row_count(grid, queryset, "cached") == RowCount(2, True)
+        mock_count.assert_not_called()
+
+    # Not cacheable counts are never read from the cache.
+    assert handler.get_view_row_count(
+        grid, queryset.filter(**{field.db_column: "a"}), "cached", cacheable=False
+    ) == RowCount(1, True)
+
+    # Creating a row invalidates the cached count.
+    RowHandler().create_rows(user, table, [{field.db_column: "c"}])
+    assert handler.get_view_row_count(
+        grid, handler.get_queryset(user, grid), "cached"
+    ) == RowCount(3, True)
+
+    # Changing the filters invalidates the cached count.
+    handler.create_filter(user, grid, field, "equal", "a")
+    assert handler.get_view_row_count(
+        grid, handler.get_queryset(user, grid), "cached"
+    ) == RowCount(1, True)
+
+
+@pytest.mark.django_db
+def test_get_view_row_count_fast(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    RowHandler().create_rows(user, table, [{}, {}])
+
+    handler = ViewHandler()
+    queryset = handler.get_queryset(user, grid)
+
+    with patch(
+        "baserow.contrib.database.views.row_count_modes.estimate_table_count",
+        return_value=50000,
+    ):
+        assert handler.get_view_row_count(grid, queryset, "fast") == RowCount(
+            50000, exact=False
+        )
+
+        with override_settings(BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD=100000):
+            assert handler.get_view_row_count(grid, queryset, "fast") == RowCount(
+                2, exact=True
+            )
+
+        # The exact count is now cached and takes precedence over the estimate.
+        assert handler.get_view_row_count(grid, queryset, "fast") == RowCount(
+            2, exact=True
+        )
+
+
+@pytest.mark.django_db
+def test_get_view_row_count_estimate(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    RowHandler().create_rows(user, table, [{}, {}])
+
+    handler = ViewHandler()
+    queryset = handler.get_queryset(user, grid).filter(**{field.db_column: "a"})
+
+    row_count = handler.get_view_row_count(grid, queryset, "estimate", False)
+    assert row_count.exact is False
+    assert row_count.count >= 0
@@ -9,6 +9,7 @@ from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.tasks import run_periodic_fields_updates
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.handler import ViewHandler, ViewSubscriptionHandler
+from baserow.contrib.database.views.models import ViewRows
 from baserow.contrib.database.views.signals import (
     view_loaded_create_indexes_and_columns,
 )
@@ -218,6 +219,62 @@ def test_rows_enter_and_exit_view_are_called_when_rows_created_or_deleted(
         p.assert_not_called()
 
 
+@pytest.mark.django_db
+def test_rows_enter_and_exit_view_only_check_the_changed_rows(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=view, field=number_field, type="higher_than", value="10"
+    )
+
+    row_handler = RowHandler()
+    rows = row_handler.force_create_rows(
+        user, table, [{number_field.db_column: 20} for _ in range(5)]
+    ).created_rows
+    ViewSubscriptionHandler.subscribe_to_views(user, [view])
+    assert ViewRows.objects.get(view=view).row_id_ranges == [rows[0].id, rows[4].id]
+
+    with (
+        patch.object(
+            ViewHandler, "get_queryset", wraps=ViewHandler().get_queryset
+        ) as get_queryset,
+        patch("baserow.contrib.database.views.signals.rows_exited_view.send") as exited,
+    ):
+        row_handler.force_update_rows(
+            user, table, [{"id": rows[2].id, number_field.db_column: 1}]
+        )
+        exited.assert_called_once()
+        assert exited.call_args[1]["row_ids"] == [rows[2].id]
+        get_queryset.assert_not_called()
+
+    assert ViewRows.objects.get(view=view).row_id_ranges == [
+        rows[0].id,
+        rows[1].id,
+        rows[3].id,
+        rows[4].id,
+    ]
+
+    with patch(
+        "baserow.contrib.database.views.signals.rows_entered_view.send"
+    ) as entered:
+        (new_row,) = row_handler.force_create_rows(
+            user, table, [{number_field.db_column: 30}]
+        ).created_rows
+        entered.assert_called_once()
+        assert entered.call_args[1]["row_ids"] == [new_row.id]
+
+    with patch(
+        "baserow.contrib.database.views.signals.rows_exited_view.send"
+    ) as exited:
+        row_handler.force_delete_rows(user, table, [rows[0].id, rows[1].id])
+        exited.assert_called_once()
+        assert exited.call_args[1]["row_ids"] == [rows[0].id, rows[1].id]
+
+    assert ViewRows.objects.get(view=view).row_id_ranges == [rows[3].id, new_row.id]
+
+
 @pytest.mark.django_db
 def test_rows_enter_and_exit_view_are_called_when_view_filters_change(
     data_fixture,
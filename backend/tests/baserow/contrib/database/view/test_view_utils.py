@@ -0,0 +1,31 @@
+from baserow.contrib.database.views.utils import (
+    compress_row_ids,
+    decompress_row_ids,
+    get_row_ids_in_ranges,
+    update_row_id_ranges,
+)
+
+
+def test_compress_and_decompress_row_ids():
+    assert compress_row_ids([]) == []
+    assert compress_row_ids([5, 1, 2, 3, 3, 9, 10]) == [1, 3, 5, 5, 9, 10]
+    assert list(decompress_row_ids([1, 3, 5, 5, 9, 10])) == [1, 2, 3, 5, 9, 10]
+
+
+def test_get_row_ids_in_ranges():
+    ranges = compress_row_ids([1, 2, 3, 5, 9, 10])
+    assert get_row_ids_in_ranges(ranges, [0, 1, 3, 4, 5, 8, 10, 11]) == {1, 3, 5, 10}
+    assert get_row_ids_in_ranges([], [1]) == set()
+
+
+def test_update_row_id_ranges():
+    ranges = compress_row_ids([1, 2, 3, 5, 9, 10])
+
+    # Removing a row in the middle of a range splits it.
+    assert update_row_id_ranges(ranges, [], [2]) == [1, 1, 3, 3, 5, 5, 9, 10]
+    # Removing the only row of a range removes the range.
+    assert update_row_id_ranges(ranges, [], [5, 7]) == [1, 3, 9, 10]
+    # Adding a row between two ranges merges them.
+    assert update_row_id_ranges(ranges, [4], []) == [1, 5, 9, 10]
+    assert update_row_id_ranges(ranges, [11, 20], [1]) == [2, 3, 5, 5, 9, 11, 20, 20]
+    assert update_row_id_ranges([], [3, 2], []) == [2, 3]
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import MagicMock, patch
 
 from django.db import transaction
@@ -263,6 +264,79 @@ def test_call_webhook_concurrent_task_moved_to_queue(data_fixture):
         assert len(queue.queues[f"webhook_{webhook.id}_queue"]) == 1
 
 
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+@patch("baserow.contrib.database.webhooks.tasks.RedisQueue", WebhookRedisQueue)
+@patch("baserow.contrib.database.webhooks.tasks.cache", MagicMock())
+@patch("baserow.contrib.database.webhooks.tasks.get_webhook_delivery_lock")
+def test_call_webhook_moved_to_queue_while_other_task_makes_calls(
+    mock_get_webhook_delivery_lock, data_fixture
+):
+    from baserow.contrib.database.webhooks.tasks import get_queue
+
+    webhook = data_fixture.create_table_webhook()
+    mock_get_webhook_delivery_lock.return_value.acquire.return_value = False
+
+    call_webhook(
+        webhook_id=webhook.id,
+        event_id="00000000-0000-0000-0000-000000000002",
+        event_type="rows.created",
+        method="POST",
+        url="http://localhost/",
+        headers={"Baserow-header-1": "Value 1"},
+        payload={"type": "rows.created"},
+    )
+
+    assert len(responses.calls) == 0
+    queue = get_queue(webhook.id)
+    assert len(queue.queues[f"webhook_{webhook.id}_queue"]) == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+@override_settings(BASEROW_WEBHOOKS_MAX_CALLS_PER_TASK=2)
+@patch("baserow.contrib.database.webhooks.tasks.RedisQueue", WebhookRedisQueue)
+@patch("baserow.contrib.database.webhooks.tasks.cache", MagicMock())
+def test_call_webhook_makes_requests_outside_of_a_transaction(data_fixture):
+    webhook = data_fixture.create_table_webhook(failed_triggers=1)
+    in_atomic_block = []
+
+    def callback(request):
+        in_atomic_block.append(transaction.get_connection().in_atomic_block)
+        return 200, {}, "{}"
+
+    responses.add_callback(responses.POST, "http://localhost/", callback=callback)
+
+    enqueue_webhook_task(
+        webhook.id,
+        "00000000-0000-0000-0000-000000000003",
+        (),
+        {
+            "webhook_id": webhook.id,
+            "event_id": "00000000-0000-0000-0000-000000000003",
+            "event_type": "rows.created",
+            "method": "POST",
+            "url": "http://localhost/",
+            "headers": {},
+            "payload": {"type": "rows.created"},
+        },
+    )
+    call_webhook(
+        webhook_id=webhook.id,
+        event_id="00000000-0000-0000-0000-000000000002",
+        event_type="rows.created",
+        method="POST",
+        url="http://localhost/",
+        headers={},
+        payload={"type": "rows.created"},
+    )
+
+    assert in_atomic_block == [False, False]
+    assert TableWebhookCall.objects.count() == 2
+    webhook.refresh_from_db()
+    assert webhook.failed_triggers == 0
+
+
 @pytest.mark.django_db(transaction=True, databases=["default"])
 @responses.activate
 @patch("baserow.contrib.database.webhooks.tasks.RedisQueue", WebhookRedisQueue)
@@ -603,3 +677,105 @@ def test_call_webhook_payload_too_large_send_notification(
         mock.assert_not_called()  # nothing else has been scheduled.
 
     assert TableWebhookCall.objects.all().count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+@override_settings(BASEROW_WEBHOOKS_MAX_CALLS_PER_TASK=2)
+@patch("baserow.contrib.database.webhooks.tasks.RedisQueue", WebhookRedisQueue)
+@patch("baserow.contrib.database.webhooks.tasks.cache", MagicMock())
+def test_call_webhook_makes_queued_calls_in_the_same_task(data_fixture):
+    from baserow.contrib.database.webhooks.tasks import get_queue
+
+    webhook = data_fixture.create_table_webhook()
+    responses.add(responses.POST, "http://localhost/", json={}, status=200)
+
+    for i in range(3, 5):
+        enqueue_webhook_task(
+            webhook.id,
+            f"00000000-0000-0000-0000-00000000000{i}",
+            (),
+            {
+                "webhook_id": webhook.id,
+                "event_id": f"00000000-0000-0000-0000-00000000000{i}",
+                "event_type": "rows.created",
+                "method": "POST",
+                "url": "http://localhost/",
+                "headers": {},
+                "payload": {"type": "rows.created"},
+            },
+        )
+
+    with patch(
+        "baserow.contrib.database.webhooks.tasks.call_webhook.delay"
+    ) as mock_delay:
+        call_webhook(
+            webhook_id=webhook.id,
+            event_id="00000000-0000-0000-0000-000000000002",
+            event_type="rows.created",
+            method="POST",
+            url="http://localhost/",
+            headers={},
+            payload={"type": "rows.created"},
+        )
+
+        # The first queued call is made by the same task, the second one is
+        # scheduled in a new task because the limit of calls per task is reached.
+        assert len(responses.calls) == 2
+        assert mock_delay.call_count == 1
+        assert (
+            mock_delay.call_args[1]["event_id"]
+            == "00000000-0000-0000-0000-000000000004"
+        )
+
+    assert list(
+        TableWebhookCall.objects.order_by("event_id").values_list("event_id", flat=True)
+    ) == [
+        "00000000-0000-0000-0000-000000000002",
+        "00000000-0000-0000-0000-000000000003",
+    ]
+    assert len(get_queue(webhook.id).queues[f"webhook_{webhook.id}_queue"]) == 0
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+@override_settings(BASEROW_WEBHOOKS_MERGE_EVENTS_MAX_ITEMS=3)
+@patch("baserow.contrib.database.webhooks.tasks.RedisQueue", WebhookRedisQueue)
+@patch("baserow.contrib.database.webhooks.tasks.cache", MagicMock())
+def test_call_webhook_merges_queued_row_events(data_fixture):
+    webhook = data_fixture.create_table_webhook()
+    responses.add(responses.POST, "http://localhost/", json={}, status=200)
+
+    def create_call(event_id, items):
+        return {
+            "webhook_id": webhook.id,
+            "event_id": event_id,
+            "event_type": "rows.created",
+            "method": "POST",
+            "url": "http://localhost/",
+            "headers": {"X-Baserow-Delivery": event_id},
+            "payload": {"event_id": event_id, "items": items},
+        }
+
+    enqueue_webhook_task(webhook.id, "2", (), create_call("2", [{"id": 2}]))
+    # Doesn't fit in the same call anymore because of the max items.
+    enqueue_webhook_task(webhook.id, "3", (), create_call("3", [{"id": 3}, {"id": 4}]))
+
+    with patch(
+        "baserow.contrib.database.webhooks.tasks.call_webhook.delay"
+    ) as mock_delay:
+        call_webhook(**create_call("1", [{"id": 1}]))
+        mock_delay.assert_not_called()
+
+    assert len(responses.calls) == 2
+    assert json.loads(responses.calls[0].request.body) == {
+        "event_id": "1",
+        "items": [{"id": 1}, {"id": 2}],
+        "merged_event_ids": ["1", "2"],
+    }
+    assert responses.calls[0].request.headers["X-Baserow-Delivery"] == "1"
+    assert json.loads(responses.calls[1].request.body) == {
+        "event_id": "3",
+        "items": [{"id": 3}, {"id": 4}],
+    }
+    assert TableWebhookCall.objects.count() == 2
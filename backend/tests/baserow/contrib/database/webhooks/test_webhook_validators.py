@@ -7,7 +7,10 @@ from django.test import override_settings
 import pytest
 
 import advocate.connection as advocate_connection
-from baserow.contrib.database.webhooks.validators import url_validator
+from baserow.contrib.database.webhooks.validators import (
+    get_webhook_session,
+    url_validator,
+)
 
 URL_BLACKLIST_ONLY_ALLOWING_GOOGLE_WEBHOOKS = re.compile(r"(?!(www\.)?google\.com).*")
 
@@ -150,3 +153,13 @@ def test_advocate_hostname_blacklist_overrides_ip_lists():
 
     # This request should still go through
     url_validator("https://www.google.com/")
+
+
+def test_webhook_session_is_reused():
+    session = get_webhook_session()
+    assert get_webhook_session() is session
+
+    with override_settings(BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=True):
+        private_session = get_webhook_session()
+        assert private_session is not session
+        assert get_webhook_session() is private_session
@@ -1,6 +1,6 @@
 from collections import OrderedDict
 from typing import Any, Dict, List
-from unittest.mock import call, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 from django.db import transaction
 
@@ -9,6 +9,7 @@ from freezegun import freeze_time
 from rest_framework import serializers
 from rest_framework.fields import Field
 
+from baserow.contrib.database.api.rows.serializers import serialize_rows_for_response
 from baserow.contrib.database.rows import signals as row_signals
 from baserow.contrib.database.rows.actions import UpdateRowsActionType
 from baserow.contrib.database.rows.handler import RowHandler
@@ -16,6 +17,7 @@ from baserow.contrib.database.rows.registries import (
     RowMetadataType,
     row_metadata_registry,
 )
+from baserow.contrib.database.ws.rows.signals import RealtimeRowMessages
 from baserow.test_utils.helpers import AnyInt, register_instance_temporarily
 
 
@@ -443,3 +445,153 @@ def test_rows_ai_values_generation_error_with_empty_rows(
     assert args[0][1]["row_ids"] == []
     assert args[0][1]["error"] == "Model not available"
     assert args[0][2] is None
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_rows_updated_in_the_same_transaction_are_merged(
+    mock_broadcast_to_channel_group, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    field_2 = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    row_1 = model.objects.create()
+    row_2 = model.objects.create()
+
+    with transaction.atomic():
+        RowHandler().update_rows(
+            user, table, [{"id": row_1.id, f"field_{field.id}": "First"}]
+        )
+        RowHandler().update_rows(
+            user,
+            table,
+            [
+                {"id": row_1.id, f"field_{field_2.id}": "Second"},
+                {"id": row_2.id, f"field_{field.id}": "Third"},
+            ],
+        )
+
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][0] == f"table-{table.id}"
+    assert args[0][1]["type"] == "rows_updated"
+    assert [
+        (row["id"], row[f"field_{field.id}"], row[f"field_{field_2.id}"])
+        for row in args[0][1]["rows_before_update"]
+    ] == [(row_1.id, None, None), (row_2.id, None, None)]
+    assert [
+        (row["id"], row[f"field_{field.id}"], row[f"field_{field_2.id}"])
+        for row in args[0][1]["rows"]
+    ] == [(row_1.id, "First", "Second"), (row_2.id, "Third", None)]
+    assert sorted(args[0][1]["updated_field_ids"]) == [field.id, field_2.id]
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_rows_created_and_deleted_in_the_same_transaction_are_not_merged(
+    mock_broadcast_to_channel_group, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table)
+
+    with transaction.atomic():
+        row = RowHandler().create_row(user=user, table=table)
+        RowHandler().create_row(user=user, table=table)
+        RowHandler().delete_row_by_id(user, table, row.id)
+
+    assert [
+        delay_call[0][1]["type"]
+        for delay_call in mock_broadcast_to_channel_group.delay.call_args_list
+    ] == ["rows_created", "rows_deleted"]
+    assert (
+        len(mock_broadcast_to_channel_group.delay.call_args_list[0][0][1]["rows"]) == 2
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_rows_are_serialized_once_for_the_table_and_public_views(
+    mock_broadcast_to_channel_group, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    for _ in range(2):
+        view = data_fixture.create_grid_view(
+            user, table=table, public=True, create_options=False
+        )
+        data_fixture.create_grid_view_field_option(view, field, hidden=False)
+
+    with patch(
+        "baserow.contrib.database.ws.rows.signals.serialize_rows_for_response",
+        wraps=serialize_rows_for_response,
+    ) as serialize_rows:
+        RowHandler().create_row(
+            user=user, table=table, values={f"field_{field.id}": "Test"}
+        )
+
+    serialize_rows.assert_called_once()
+    assert mock_broadcast_to_channel_group.delay.call_count == 3
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("channels.layers.get_channel_layer")
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_rows_broadcast_directly_to_the_channel_layer(
+    mock_broadcast_to_channel_group,
+    mock_get_channel_layer,
+    data_fixture,
+    settings,
+):
+    settings.BASEROW_WS_BROADCAST_ROWS_DIRECTLY = True
+    channel_layer = MagicMock()
+    channel_layer.group_send = AsyncMock()
+    channel_layer.close_pools = AsyncMock()
+    mock_get_channel_layer.return_value = channel_layer
+
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table)
+    row = RowHandler().create_row(user=user, table=table)
+
+    mock_broadcast_to_channel_group.delay.assert_not_called()
+    channel_layer.group_send.assert_awaited_once()
+    channel_group_name, message = channel_layer.group_send.call_args[0]
+    assert channel_group_name == f"table-{table.id}"
+    assert message["type"] == "broadcast_to_group"
+    assert message["payload"]["type"] == "rows_created"
+    assert message["payload"]["rows"][0]["id"] == row.id
+    channel_layer.close_pools.assert_awaited_once()
+
+
+def test_rows_updated_delta_only_contains_changed_values():
+    payload = RealtimeRowMessages.rows_updated(
+        1,
+        [
+            {"id": 1, "order": "1.00", "field_1": "a", "field_2": "b"},
+            {"id": 2, "order": "2.00", "field_1": "c", "field_2": "d"},
+        ],
+        [
+            {"id": 1, "order": "1.00", "field_1": "a", "field_2": "changed"},
+            {"id": 2, "order": "2.00", "field_1": "c", "field_2": "d"},
+            {"id": 3, "order": "3.00", "field_1": "e", "field_2": "f"},
+        ],
+        {1: {"row_comment_count": 1}},
+        [2],
+    )
+
+    assert RealtimeRowMessages.rows_updated_delta(payload) == {
+        "type": "rows_updated_delta",
+        "table_id": 1,
+        "rows_before_update": {"1": {"field_2": "b"}, "2": {}},
+        "rows": {
+            "1": {"field_2": "changed"},
+            "2": {},
+            "3": {"order": "3.00", "field_1": "e", "field_2": "f"},
+        },
+        "metadata": {1: {"row_comment_count": 1}},
+        "updated_field_ids": [2],
+    }
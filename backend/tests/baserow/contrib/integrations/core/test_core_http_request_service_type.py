@@ -7,7 +7,10 @@ from requests import exceptions as request_exceptions
 
 from baserow.contrib.integrations.core.models import BODY_TYPE, HTTP_METHOD
 from baserow.contrib.integrations.core.service_types import CoreHTTPRequestServiceType
-from baserow.core.services.exceptions import UnexpectedDispatchException
+from baserow.core.services.exceptions import (
+    DispatchBatchException,
+    UnexpectedDispatchException,
+)
 from baserow.core.services.handler import ServiceHandler
 from baserow.test_utils.helpers import AnyInt, AnyStr
 from baserow.test_utils.pytest_conftest import FakeDispatchContext
@@ -106,6 +109,59 @@ def test_core_http_request_request_error(
             service_type.dispatch(service, dispatch_context)
 
 
+@pytest.mark.django_db
+def test_core_http_request_dispatch_batch(data_fixture):
+    service = data_fixture.create_core_http_request_service(
+        url="concat('http://example.notexist/', get('page_parameter.id'))",
+    )
+    service_type = service.get_type()
+
+    dispatch_contexts = [
+        FakeDispatchContext(
+            context={"page_parameter": {"id": page_id}}, max_parallel_nodes=2
+        )
+        for page_id in range(3)
+    ]
+
+    with mock_advocate_request({"foo": "bar"}) as mock_request:
+        results = service_type.dispatch_batch(service, dispatch_contexts)
+
+    assert sorted(call.kwargs["url"] for call in mock_request.call_args_list) == [
+        "http://example.notexist/0",
+        "http://example.notexist/1",
+        "http://example.notexist/2",
+    ]
+    assert [result.data["body"] for result in results] == [{"foo": "bar"}] * 3
+
+
+@pytest.mark.django_db
+def test_core_http_request_dispatch_batch_raises_first_error(data_fixture):
+    service = data_fixture.create_core_http_request_service(
+        url="concat('http://example.notexist/', get('page_parameter.id'))",
+    )
+    service_type = service.get_type()
+
+    dispatch_contexts = [
+        FakeDispatchContext(
+            context={"page_parameter": {"id": page_id}}, max_parallel_nodes=2
+        )
+        for page_id in range(3)
+    ]
+
+    def request(**kwargs):
+        raise request_exceptions.RequestException(kwargs["url"])
+
+    with patch("advocate.request", side_effect=request) as mock_request:
+        with pytest.raises(DispatchBatchException) as exc_info:
+            service_type.dispatch_batch(service, dispatch_contexts)
+
+    # All the requests are sent, even if the first one fails.
+    assert mock_request.call_count == 3
+    assert isinstance(exc_info.value.error, UnexpectedDispatchException)
+    assert str(exc_info.value.error) == "http://example.notexist/0"
+    assert exc_info.value.results == []
+
+
 @pytest.mark.django_db
 def test_core_http_request_basic_body_raw(
     data_fixture,
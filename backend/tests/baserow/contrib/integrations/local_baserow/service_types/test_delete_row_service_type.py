@@ -1,13 +1,14 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
+from baserow.contrib.database.rows.actions import DeleteRowsActionType
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.integrations.local_baserow.models import LocalBaserowDeleteRow
 from baserow.contrib.integrations.local_baserow.service_types import (
     LocalBaserowDeleteRowServiceType,
 )
-from baserow.core.services.exceptions import DoesNotExist
+from baserow.core.services.exceptions import DispatchBatchException, DoesNotExist
 from baserow.core.services.handler import ServiceHandler
 from baserow.test_utils.pytest_conftest import FakeDispatchContext
 
@@ -158,3 +159,70 @@ def test_local_baserow_delete_row_service_dispatch_transform(data_fixture):
     dispatch_data = {"data": {}, "baserow_table_model": Mock()}
     result = service_type.dispatch_transform(dispatch_data)
     assert result.status == 204
+
+
+@pytest.mark.django_db
+def test_local_baserow_delete_row_service_dispatch_batch(data_fixture):
+    user = data_fixture.create_user()
+    page = data_fixture.create_builder_page(user=user)
+    table = data_fixture.create_database_table(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        application=page.builder, user=user
+    )
+    row_1, row_2, row_3 = (
+        RowHandler().create_rows(user, table, rows_values=[{}, {}, {}]).created_rows
+    )
+
+    service = data_fixture.create_local_baserow_delete_row_service(
+        integration=integration, table=table, row_id='get("page_parameter.id")'
+    )
+    service_type = service.get_type()
+
+    dispatch_contexts = [
+        FakeDispatchContext(context={"page_parameter": {"id": row_id}})
+        for row_id in [row_1.id, row_3.id, row_1.id]
+    ]
+    with patch(
+        "baserow.contrib.integrations.local_baserow.service_types"
+        ".DeleteRowsActionType.do",
+        wraps=DeleteRowsActionType.do,
+    ) as delete_rows:
+        results = service_type.dispatch_batch(service, dispatch_contexts)
+
+    # Every row is deleted once, with a single action.
+    delete_rows.assert_called_once()
+    assert delete_rows.call_args.args[2] == [row_1.id, row_3.id]
+    assert [result.status for result in results] == [204, 204, 204]
+    assert list(table.get_model().objects.values_list("id", flat=True)) == [row_2.id]
+
+
+@pytest.mark.django_db
+def test_local_baserow_delete_row_service_dispatch_batch_row_not_exist(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    page = data_fixture.create_builder_page(user=user)
+    table = data_fixture.create_database_table(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        application=page.builder, user=user
+    )
+    (row,) = RowHandler().create_rows(user, table, rows_values=[{}]).created_rows
+
+    service = data_fixture.create_local_baserow_delete_row_service(
+        integration=integration, table=table, row_id='get("page_parameter.id")'
+    )
+    service_type = service.get_type()
+
+    dispatch_contexts = [
+        FakeDispatchContext(context={"page_parameter": {"id": row_id}})
+        for row_id in [row.id, row.id + 100]
+    ]
+    with pytest.raises(DispatchBatchException) as exc:
+        service_type.dispatch_batch(service, dispatch_contexts)
+
+    # The service is dispatched one by one after the batch failed, so the row of the
+    # first dispatch is still deleted.
+    assert isinstance(exc.value.error, DoesNotExist)
+    assert exc.value.error.args[0] == f"The row with id {row.id + 100} does not exist."
+    assert len(exc.value.results) == 1
+    assert table.get_model().objects.count() == 0
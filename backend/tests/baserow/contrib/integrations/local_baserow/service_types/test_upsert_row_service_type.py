@@ -10,6 +10,10 @@ from baserow.contrib.builder.data_sources.service import DataSourceService
 from baserow.contrib.builder.workflow_actions.models import EventTypes
 from baserow.contrib.database.api.rows.serializers import RowSerializer
 from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.actions import (
+    CreateRowsActionType,
+    UpdateRowsActionType,
+)
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.integrations.local_baserow.models import (
@@ -25,6 +29,7 @@ from baserow.core.formula.types import BASEROW_FORMULA_MODE_SIMPLE
 from baserow.core.handler import CoreHandler
 from baserow.core.registries import ImportExportConfig
 from baserow.core.services.exceptions import (
+    DispatchBatchException,
     InvalidContextContentDispatchException,
     ServiceImproperlyConfiguredDispatchException,
 )
@@ -873,3 +878,126 @@ def test_local_baserow_upsert_row_service_dispatch_data_with_collaborators(
 
     collaborators = getattr(dispatch_data["data"], collaborator_field.db_column).all()
     assert list(collaborators.values_list("id", flat=True)) == [user.id]
+
+
+@pytest.mark.django_db
+def test_local_baserow_upsert_row_service_dispatch_batch_creates_rows_at_once(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    page = data_fixture.create_builder_page(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        application=page.builder, user=user
+    )
+    table = data_fixture.create_database_table(user=user)
+    name = data_fixture.create_text_field(table=table, name="Name")
+
+    service = data_fixture.create_local_baserow_upsert_row_service(
+        table=table,
+        integration=integration,
+    )
+    service_type = service.get_type()
+    service.field_mappings.create(field=name, value='get("page_parameter.name")')
+
+    dispatch_contexts = [
+        FakeDispatchContext(context={"page_parameter": {"name": value}})
+        for value in ["Dog", "Badger", "Horse"]
+    ]
+    with patch(
+        "baserow.contrib.integrations.local_baserow.service_types"
+        ".CreateRowsActionType.do",
+        wraps=CreateRowsActionType.do,
+    ) as create_rows:
+        results = service_type.dispatch_batch(service, dispatch_contexts)
+
+    create_rows.assert_called_once()
+    assert [result.data["Name"] for result in results] == ["Dog", "Badger", "Horse"]
+    assert [
+        getattr(row, name.db_column) for row in table.get_model().objects.order_by("id")
+    ] == ["Dog", "Badger", "Horse"]
+
+
+@pytest.mark.django_db
+def test_local_baserow_upsert_row_service_dispatch_batch_updates_rows(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    page = data_fixture.create_builder_page(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        application=page.builder, user=user
+    )
+    table = data_fixture.create_database_table(user=user)
+    name = data_fixture.create_text_field(table=table, name="Name")
+    row_1, row_2 = (
+        RowHandler().create_rows(user, table, rows_values=[{}, {}]).created_rows
+    )
+
+    service = data_fixture.create_local_baserow_upsert_row_service(
+        table=table,
+        row_id='get("page_parameter.id")',
+        integration=integration,
+    )
+    service_type = service.get_type()
+    service.field_mappings.create(field=name, value='get("page_parameter.name")')
+
+    dispatch_contexts = [
+        FakeDispatchContext(context={"page_parameter": {"id": row_id, "name": value}})
+        for row_id, value in [
+            (row_1.id, "Dog"),
+            (row_2.id, "Badger"),
+            (row_1.id, "Cat"),
+        ]
+    ]
+    with patch(
+        "baserow.contrib.integrations.local_baserow.service_types"
+        ".UpdateRowsActionType.do",
+        wraps=UpdateRowsActionType.do,
+    ) as update_rows:
+        results = service_type.dispatch_batch(service, dispatch_contexts)
+
+    # The first row is updated twice, so it can't be updated by a single action.
+    assert update_rows.call_count == 2
+    assert [(result.data["id"], result.data["Name"]) for result in results] == [
+        (row_1.id, "Dog"),
+        (row_2.id, "Badger"),
+        (row_1.id, "Cat"),
+    ]
+    row_1.refresh_from_db()
+    row_2.refresh_from_db()
+    assert getattr(row_1, name.db_column) == "Cat"
+    assert getattr(row_2, name.db_column) == "Badger"
+
+
+@pytest.mark.django_db
+def test_local_baserow_upsert_row_service_dispatch_batch_with_an_invalid_value(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    page = data_fixture.create_builder_page(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        application=page.builder, user=user
+    )
+    table = data_fixture.create_database_table(user=user)
+    number = data_fixture.create_number_field(table=table, name="Number")
+
+    service = data_fixture.create_local_baserow_upsert_row_service(
+        table=table,
+        integration=integration,
+    )
+    service_type = service.get_type()
+    service.field_mappings.create(field=number, value='get("page_parameter.number")')
+
+    dispatch_contexts = [
+        FakeDispatchContext(context={"page_parameter": {"number": value}})
+        for value in ["1", "not a number", "3"]
+    ]
+    with pytest.raises(DispatchBatchException) as exc:
+        service_type.dispatch_batch(service, dispatch_contexts)
+
+    # The service is dispatched one by one after the batch failed, so the row of the
+    # dispatch before the invalid one is created, and not the one after it.
+    assert isinstance(exc.value.error, InvalidContextContentDispatchException)
+    assert len(exc.value.results) == 1
+    assert list(table.get_model().objects.values_list(number.db_column, flat=True)) == [
+        1
+    ]
@@ -0,0 +1,43 @@
+import pytest
+
+from baserow.core.formula import BaserowFormulaSyntaxError, resolve_formula
+from baserow.core.formula.parser.parser import (
+    get_cached_parse_tree_for_formula,
+    get_parse_tree_for_formula,
+)
+from baserow.core.formula.registries import formula_runtime_function_registry
+from baserow.core.formula.types import BaserowFormulaObject
+
+
+def test_get_cached_parse_tree_for_formula():
+    get_cached_parse_tree_for_formula.cache_clear()
+
+    tree = get_cached_parse_tree_for_formula("concat('a', 'b')")
+
+    assert get_cached_parse_tree_for_formula("concat('a', 'b')") is tree
+    assert get_cached_parse_tree_for_formula("concat('a', 'c')") is not tree
+    assert tree.toStringTree() == (
+        get_parse_tree_for_formula("concat('a', 'b')").toStringTree()
+    )
+    assert get_cached_parse_tree_for_formula.cache_info().hits == 1
+
+
+def test_get_cached_parse_tree_for_formula_invalid_formula():
+    get_cached_parse_tree_for_formula.cache_clear()
+
+    for _ in range(2):
+        with pytest.raises(BaserowFormulaSyntaxError):
+            get_cached_parse_tree_for_formula("concat('a'")
+
+    assert get_cached_parse_tree_for_formula.cache_info().currsize == 0
+
+
+def test_resolve_formula_reuses_parse_tree():
+    get_cached_parse_tree_for_formula.cache_clear()
+    formula = BaserowFormulaObject.create("concat('a', 'b')")
+
+    for _ in range(3):
+        assert resolve_formula(formula, formula_runtime_function_registry, {}) == "ab"
+
+    assert get_cached_parse_tree_for_formula.cache_info().misses == 1
+    assert get_cached_parse_tree_for_formula.cache_info().hits == 2
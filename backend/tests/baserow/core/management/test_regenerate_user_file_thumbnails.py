@@ -0,0 +1,53 @@
+from io import BytesIO, StringIO
+from unittest.mock import patch
+
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+
+import pytest
+from PIL import Image
+
+from baserow.core.user_files.handler import UserFileHandler
+
+
+@pytest.mark.django_db
+def test_regenerate_user_file_thumbnails(data_fixture, tmpdir, settings):
+    user = data_fixture.create_user()
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+
+    user_files = []
+    for index, color in enumerate(["red", "green", "blue"]):
+        image = Image.new("RGB", (100, 140), color=color)
+        image_bytes = BytesIO()
+        image.save(image_bytes, format="PNG")
+        user_files.append(
+            handler.upload_user_file(
+                user, f"image_{index}.png", image_bytes, storage=storage
+            )
+        )
+    # Shares the stored file of the first image.
+    image_bytes = BytesIO()
+    Image.new("RGB", (100, 140), color="red").save(image_bytes, format="PNG")
+    handler.upload_user_file(user, "copy.png", image_bytes, storage=storage)
+    handler.upload_user_file(user, "test.txt", BytesIO(b"Hello"), storage=storage)
+
+    settings.USER_THUMBNAILS = {"tiny": [21, 21], "small": [48, 48]}
+
+    out = StringIO()
+    with patch(
+        "baserow.core.management.commands.regenerate_user_file_thumbnails."
+        "get_default_storage",
+        new=lambda: storage,
+    ):
+        call_command(
+            "regenerate_user_file_thumbnails", "small", "--workers", "2", stdout=out
+        )
+
+    assert "3 thumbnails have been regenerated." in out.getvalue()
+    for user_file in user_files:
+        file_path = tmpdir.join("thumbnails", "small", user_file.name)
+        assert file_path.isfile()
+        thumbnail = Image.open(file_path.open("rb"))
+        assert thumbnail.width == 48
+        assert thumbnail.height == 48
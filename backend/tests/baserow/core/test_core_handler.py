@@ -52,7 +52,11 @@ from baserow.core.models import (
     WorkspaceInvitation,
     WorkspaceUser,
 )
-from baserow.core.operations import ReadWorkspaceOperationType
+from baserow.core.operations import (
+    ReadApplicationOperationType,
+    ReadWorkspaceOperationType,
+    UpdateWorkspaceOperationType,
+)
 from baserow.core.registries import ImportExportConfig, plugin_registry
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.user_files.models import UserFile
@@ -1463,6 +1467,38 @@ def test_check_permission_for_multiple_actors(data_fixture):
     ) == [user]
 
 
+@pytest.mark.django_db
+def test_check_permissions_for_multiple_contexts(data_fixture):
+    user = data_fixture.create_user()
+    member = data_fixture.create_user()
+    user_of_another_workspace = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    data_fixture.create_user_workspace(
+        user=member, workspace=workspace, permissions="MEMBER"
+    )
+    database_1 = data_fixture.create_database_application(workspace=workspace)
+    database_2 = data_fixture.create_database_application(workspace=workspace)
+
+    operations_and_contexts = [
+        (ReadApplicationOperationType.type, database_1),
+        (UpdateWorkspaceOperationType.type, workspace),
+        (ReadApplicationOperationType.type, database_2),
+    ]
+
+    assert CoreHandler().check_permissions_for_multiple_contexts(
+        user, operations_and_contexts, workspace
+    ) == [True, True, True]
+    assert CoreHandler().check_permissions_for_multiple_contexts(
+        member, operations_and_contexts, workspace
+    ) == [True, False, True]
+    assert CoreHandler().check_permissions_for_multiple_contexts(
+        user_of_another_workspace, operations_and_contexts, workspace
+    ) == [False, False, False]
+    assert (
+        CoreHandler().check_permissions_for_multiple_contexts(user, [], workspace) == []
+    )
+
+
 @pytest.mark.django_db
 def test_duplicate_application_export_serialized_raises_operationalerror(
     data_fixture,
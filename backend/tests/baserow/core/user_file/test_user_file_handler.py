@@ -1,7 +1,7 @@
 import re
 import string
 from io import BytesIO
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from zipfile import ZIP_DEFLATED, ZipFile
 
 from django.conf import settings
@@ -15,6 +15,7 @@ import zipstream
 from freezegun import freeze_time
 from PIL import Image
 
+from baserow.api.user_files.serializers import UserFileSerializer
 from baserow.core.models import UserFile
 from baserow.core.storage import ExportZipFile
 from baserow.core.user_files.exceptions import (
@@ -147,12 +148,13 @@ def test_upload_user_file(data_fixture, tmpdir):
         ).id
         == user_file.id
     )
-    assert (
-        handler.upload_user_file(
-            user, "another_name.txt", ContentFile(b"Hello"), storage=storage
-        ).id
-        != user_file.id
+    user_file_with_same_content = handler.upload_user_file(
+        user, "another_name.txt", ContentFile(b"Hello"), storage=storage
     )
+    assert user_file_with_same_content.id != user_file.id
+    assert user_file_with_same_content.original_name == "another_name.txt"
+    # The same content is only stored once.
+    assert user_file_with_same_content.name == user_file.name
 
     image = Image.new("RGB", (100, 140), color="red")
     image_bytes = BytesIO()
@@ -217,7 +219,7 @@ def test_upload_user_file(data_fixture, tmpdir):
     )
 
     assert len(storage.listdir(tmpdir / "thumbnails/tiny")[1]) == 4
-    assert len(storage.listdir(tmpdir / "user_files")[1]) == 7
+    assert len(storage.listdir(tmpdir / "user_files")[1]) == 6
 
     assert UserFile.objects.all().count() == 7
 
@@ -238,6 +240,190 @@ def test_upload_user_file(data_fixture, tmpdir):
     )
 
 
+@pytest.mark.django_db
+def test_upload_user_file_with_same_content_shares_the_stored_file(
+    data_fixture, tmpdir
+):
+    user = data_fixture.create_user()
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+
+    image = Image.new("RGB", (100, 140), color="red")
+    image_bytes = BytesIO()
+    image.save(image_bytes, format="PNG")
+
+    user_file = handler.upload_user_file(
+        user, "image.png", BytesIO(image_bytes.getvalue()), storage=storage
+    )
+    with patch.object(
+        handler, "generate_and_save_image_thumbnails"
+    ) as generate_thumbnails:
+        user_file_2 = handler.upload_user_file(
+            user, "copy.png", BytesIO(image_bytes.getvalue()), storage=storage
+        )
+    # Another extension is stored separately.
+    user_file_3 = handler.upload_user_file(
+        user, "copy.png2", BytesIO(image_bytes.getvalue()), storage=storage
+    )
+
+    generate_thumbnails.assert_not_called()
+    assert user_file_2.id != user_file.id
+    assert user_file_2.name == user_file.name
+    assert user_file_2.original_name == "copy.png"
+    assert user_file_2.is_image is True
+    assert user_file_2.image_width == 100
+    assert user_file_2.image_height == 140
+    assert user_file_2.mime_type == "image/png"
+    assert user_file_3.name != user_file.name
+    assert len(storage.listdir(tmpdir / "user_files")[1]) == 2
+    assert handler.get_user_file_by_name(user_file.name).id == user_file.id
+
+    # Deleted files are not reused.
+    UserFile.objects.filter(sha256_hash=user_file.sha256_hash).update(
+        deleted_at="2020-01-01T00:00:00Z"
+    )
+    user_file_4 = handler.upload_user_file(
+        user, "again.png", BytesIO(image_bytes.getvalue()), storage=storage
+    )
+    assert user_file_4.name != user_file.name
+
+
+@pytest.mark.django_db
+def test_upload_user_file_generates_thumbnails_in_background(data_fixture, tmpdir):
+    user = data_fixture.create_user()
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+
+    image = Image.new("RGB", (100, 140), color="red")
+    image_bytes = BytesIO()
+    image.save(image_bytes, format="PNG")
+
+    with (
+        patch(
+            "baserow.core.user_files.handler.get_default_storage", new=lambda: storage
+        ),
+        patch(
+            "baserow.core.user_files.handler.generate_user_file_thumbnails.delay"
+        ) as delay,
+    ):
+        user_file = handler.upload_user_file(user, "image.png", image_bytes)
+
+        delay.assert_called_once_with(user_file.name)
+        assert user_file.is_image is True
+        assert user_file.image_width == 100
+        assert user_file.image_height == 140
+        assert not tmpdir.join("thumbnails", "tiny", user_file.name).isfile()
+        assert handler.are_thumbnails_pending(user_file.name, user_file.uploaded_at)
+        assert handler.are_thumbnails_pending(
+            user_file.name, user_file.serialize()["uploaded_at"]
+        )
+
+        # The original image is served until the thumbnails are generated.
+        with patch(
+            "baserow.api.user_files.serializers.get_default_storage",
+            new=lambda: storage,
+        ):
+            thumbnails = UserFileSerializer(user_file).data["thumbnails"]
+        assert thumbnails["tiny"]["url"] == storage.url(
+            handler.user_file_path(user_file)
+        )
+
+        handler.generate_pending_user_file_thumbnails(user_file.name)
+
+    assert not handler.are_thumbnails_pending(user_file.name, user_file.uploaded_at)
+    file_path = tmpdir.join("thumbnails", "tiny", user_file.name)
+    assert file_path.isfile()
+    thumbnail = Image.open(file_path.open("rb"))
+    assert thumbnail.height == 21
+    assert thumbnail.width == 21
+
+
+@pytest.mark.django_db
+def test_failed_background_thumbnails_keep_serving_the_original(data_fixture, tmpdir):
+    user = data_fixture.create_user()
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+
+    image = Image.new("RGB", (100, 140), color="red")
+    image_bytes = BytesIO()
+    image.save(image_bytes, format="PNG")
+
+    with (
+        patch(
+            "baserow.core.user_files.handler.get_default_storage", new=lambda: storage
+        ),
+        patch("baserow.core.user_files.handler.generate_user_file_thumbnails.delay"),
+    ):
+        user_file = handler.upload_user_file(user, "image.png", image_bytes)
+        with patch.object(
+            UserFileHandler,
+            "generate_and_save_image_thumbnails",
+            side_effect=ValueError("Failed"),
+        ):
+            handler.generate_pending_user_file_thumbnails(user_file.name)
+
+    assert not handler.are_thumbnails_pending(user_file.name, user_file.uploaded_at)
+    user_file.refresh_from_db()
+    assert user_file.is_image is True
+    assert (
+        tmpdir.join("thumbnails", "tiny", user_file.name).read_binary()
+        == image_bytes.getvalue()
+    )
+
+
+@pytest.mark.django_db
+def test_failed_background_thumbnails_of_a_missing_file(data_fixture, tmpdir):
+    user = data_fixture.create_user()
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+
+    image = Image.new("RGB", (100, 140), color="red")
+    image_bytes = BytesIO()
+    image.save(image_bytes, format="PNG")
+
+    with (
+        patch(
+            "baserow.core.user_files.handler.get_default_storage", new=lambda: storage
+        ),
+        patch("baserow.core.user_files.handler.generate_user_file_thumbnails.delay"),
+    ):
+        user_file = handler.upload_user_file(user, "image.png", image_bytes)
+        storage.delete(handler.user_file_path(user_file))
+        handler.generate_pending_user_file_thumbnails(user_file.name)
+
+    assert not handler.are_thumbnails_pending(user_file.name, user_file.uploaded_at)
+    user_file.refresh_from_db()
+    assert user_file.is_image is False
+    assert user_file.image_width is None
+    assert not tmpdir.join("thumbnails", "tiny", user_file.name).isfile()
+
+
+@pytest.mark.django_db
+def test_upload_user_file_with_unsupported_image_format_in_background(
+    data_fixture, tmpdir, open_test_file
+):
+    user = data_fixture.create_user()
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+
+    image_bytes = open_test_file("baserow/core/user_file/baserow.logo.psd")
+
+    with (
+        patch(
+            "baserow.core.user_files.handler.get_default_storage", new=lambda: storage
+        ),
+        patch(
+            "baserow.core.user_files.handler.generate_user_file_thumbnails.delay"
+        ) as delay,
+    ):
+        user_file = handler.upload_user_file(user, "image.psd", image_bytes)
+
+    delay.assert_not_called()
+    assert user_file.mime_type == "image/psd"
+    assert user_file.is_image is False
+    assert not handler.are_thumbnails_pending(user_file.name, user_file.uploaded_at)
+
+
 @pytest.mark.django_db
 def test_upload_user_file_with_truncated_image(data_fixture, tmpdir):
     user = data_fixture.create_user()
@@ -1,5 +1,6 @@
 from unittest.mock import AsyncMock, Mock
 
+import msgpack
 import pytest
 from channels.testing import WebsocketCommunicator
 
@@ -30,6 +31,17 @@ class NotAcceptingTestPageType(AcceptingTestPageType):
         return False
 
 
+class UpdateFormatTestPageType(AcceptingTestPageType):
+    type = "test_page_type_update_format"
+    update_formats = ["uppercase"]
+
+    def get_group_name(self, test_param, **kwargs):
+        return f"test-page-update-format-{test_param}"
+
+    def transform_payload(self, payload, update_format):
+        return {**payload, "message": payload["message"].upper()}
+
+
 class DifferentPermissionsGroupTestPageType(PageType):
     type = "diff_perm_page_type"
     parameters = ["test_param"]
@@ -47,14 +59,17 @@ def test_page_types():
         AcceptingTestPageType(),
         NotAcceptingTestPageType(),
         DifferentPermissionsGroupTestPageType(),
+        UpdateFormatTestPageType(),
     )
     page_registry.register(page_types[0])
     page_registry.register(page_types[1])
     page_registry.register(page_types[2])
+    page_registry.register(page_types[3])
     yield page_types
     page_registry.unregister(AcceptingTestPageType.type)
     page_registry.unregister(NotAcceptingTestPageType.type)
     page_registry.unregister(DifferentPermissionsGroupTestPageType.type)
+    page_registry.unregister(UpdateFormatTestPageType.type)
 
 
 # Core consumer
@@ -149,6 +164,68 @@ async def test_core_consumer_add_to_page_success(data_fixture, test_page_types):
     await communicator.disconnect()
 
 
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.websockets
+async def test_core_consumer_connect_msgpack_subprotocol(data_fixture):
+    user_1, token_1 = data_fixture.create_user_and_token()
+    communicator = WebsocketCommunicator(
+        application,
+        f"ws/core/?jwt_token={token_1}",
+        headers=[(b"origin", b"http://localhost")],
+        subprotocols=["msgpack"],
+    )
+    connected, subprotocol = await communicator.connect()
+    assert connected is True
+    assert subprotocol == "msgpack"
+
+    response = msgpack.unpackb(await communicator.receive_from())
+    assert response["type"] == "authentication"
+    assert response["success"] is True
+
+    await communicator.send_to(bytes_data=msgpack.packb({"page": "not_existing"}))
+    assert await communicator.receive_nothing(timeout=0.1)
+
+    await communicator.disconnect()
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.websockets
+async def test_core_consumer_add_to_page_with_update_format(
+    data_fixture, test_page_types
+):
+    user_1, token_1 = data_fixture.create_user_and_token()
+    communicator = WebsocketCommunicator(
+        application,
+        f"ws/core/?jwt_token={token_1}",
+        headers=[(b"origin", b"http://localhost")],
+    )
+    await communicator.connect()
+    await communicator.receive_json_from()
+
+    await communicator.send_json_to(
+        {
+            "page": "test_page_type_update_format",
+            "test_param": 1,
+            "update_format": "uppercase",
+        }
+    )
+    response = await communicator.receive_json_from(timeout=0.1)
+    assert response["type"] == "page_add"
+    assert response["update_format"] == "uppercase"
+
+    # Formats that are not supported by the page type are ignored.
+    await communicator.send_json_to(
+        {"page": "test_page_type", "test_param": 1, "update_format": "uppercase"}
+    )
+    response = await communicator.receive_json_from(timeout=0.1)
+    assert response["type"] == "page_add"
+    assert "update_format" not in response
+
+    await communicator.disconnect()
+
+
 @pytest.mark.asyncio
 @pytest.mark.django_db(transaction=True)
 @pytest.mark.websockets
@@ -457,3 +534,32 @@ async def test_core_consumer_broadcast_to_group(
         mock_send_json.assert_called_once_with(event["payload"])
     else:
         mock_send_json.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.websockets
+async def test_core_consumer_broadcast_to_group_transforms_payload(test_page_types):
+    consumer = CoreConsumer()
+    consumer.scope = {
+        "web_socket_id": "some_web_socket_id",
+        "user": Mock(id=1),
+        "update_formats": {
+            "test-page-update-format-1": (test_page_types[3], "uppercase"),
+        },
+    }
+    consumer.send_json = AsyncMock()
+
+    event = {
+        "channel_group_name": "test-page-update-format-1",
+        "payload": {"message": "test message"},
+        "ignore_web_socket_id": None,
+    }
+    await consumer.broadcast_to_group(event)
+    consumer.send_json.assert_called_once_with({"message": "TEST MESSAGE"})
+    assert event["payload"] == {"message": "test message"}
+
+    consumer.send_json.reset_mock()
+    await consumer.broadcast_to_group(
+        {**event, "channel_group_name": "test-page-update-format-2"}
+    )
+    consumer.send_json.assert_called_once_with({"message": "test message"})
@@ -34,6 +34,13 @@ def setup(settings):
         os.getenv("BASEROW_ENTERPRISE_AUDIT_LOG_RETENTION_DAYS", "") or 365
     )
 
+    # The number of seconds the computed roles of an actor are cached across requests.
+    # They're invalidated when the role assignments of the workspace change, so this
+    # only bounds how long unused entries are kept. Set to 0 to disable the cache.
+    settings.BASEROW_ENTERPRISE_COMPUTED_ROLES_CACHE_TTL_SECONDS = int(
+        os.getenv("BASEROW_ENTERPRISE_COMPUTED_ROLES_CACHE_TTL_SECONDS", "") or 300
+    )
+
     # Set this to True to enable users to login with auth providers different than
     # the one they were originally created with.
     settings.BASEROW_ALLOW_MULTIPLE_SSO_PROVIDERS_FOR_SAME_ACCOUNT = bool(
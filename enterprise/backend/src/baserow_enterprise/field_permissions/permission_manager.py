@@ -133,21 +133,33 @@ class FieldPermissionManagerType(PermissionManagerType):
 
         role_handler = RoleAssignmentHandler()
         roles_per_scope_by_actor = {}
-        for actor_subject_type, actors in actors_by_subject_type.items():
-            roles_per_scope_by_actor.update(
-                role_handler.get_roles_per_scope_for_actors(
-                    workspace, actor_subject_type, actors, include_trash=include_trash
-                )
-            )
+
+        def get_roles_per_scope(actor):
+            if not roles_per_scope_by_actor:
+                for actor_subject_type, actors in actors_by_subject_type.items():
+                    roles_per_scope_by_actor.update(
+                        role_handler.get_roles_per_scope_for_actors(
+                            workspace,
+                            actor_subject_type,
+                            actors,
+                            include_trash=include_trash,
+                        )
+                    )
+            return roles_per_scope_by_actor[actor]
 
         scope_includes_cache = {}
         for actor, table_checks in checks_by_actor_and_context.items():
+            computed_roles_per_table = role_handler.get_cached_computed_roles(
+                workspace,
+                actor,
+                list(table_checks.keys()),
+                partial(get_roles_per_scope, actor),
+                include_trash=include_trash,
+                cache=scope_includes_cache,
+            )
             for table, checks in table_checks.items():
-                computed_roles = role_handler.get_computed_roles(
-                    roles_per_scope_by_actor[actor], table, scope_includes_cache
-                )
                 checks_results = self._get_checks_results(
-                    checks, computed_roles, field_permissions_map
+                    checks, computed_roles_per_table[table], field_permissions_map
                 )
                 result.update(checks_results)
 
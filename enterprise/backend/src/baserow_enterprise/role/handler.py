@@ -1,12 +1,16 @@
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.db.models import Case, IntegerField, Q, QuerySet, Value, When
 
-from baserow.core.cache import local_cache
+from opentelemetry import metrics
+
+from baserow.core.cache import global_cache, local_cache
 from baserow.core.exceptions import PermissionDenied
 from baserow.core.handler import CoreHandler
 from baserow.core.mixins import TrashableModelMixin
@@ -46,6 +50,21 @@ from .types import NewRoleAssignment
 
 User = get_user_model()
 ROLE_ASSIGNMENT_CACHE_KEY_PREFIX = "role_assignments"
+COMPUTED_ROLES_CACHE_KEY_PREFIX = "computed_roles"
+
+meter = metrics.get_meter(__name__)
+computed_roles_cache_hits_counter = meter.create_counter(
+    "baserow.computed_roles_cache.hits",
+    unit="1",
+    description="The number of times the computed roles of an actor on a context "
+    "were found in the global cache.",
+)
+computed_roles_cache_misses_counter = meter.create_counter(
+    "baserow.computed_roles_cache.misses",
+    unit="1",
+    description="The number of times the computed roles of an actor on a context "
+    "had to be computed because they were not in the global cache.",
+)
 
 
 def _clear_role_assignments_from_local_cache():
@@ -75,6 +94,46 @@ def clear_roles_from_local_cache():
     return decorator
 
 
+def get_computed_roles_cache_invalidate_key(workspace_id: int) -> str:
+    return f"{COMPUTED_ROLES_CACHE_KEY_PREFIX}_workspace_{workspace_id}"
+
+
+class InvalidateComputedRolesCache:
+    """
+    Invalidates the computed roles cached for a workspace when the transaction
+    commits. As long as it's pending, the cache of the workspace is bypassed, so that
+    roles computed from uncommitted changes are never shared with other requests.
+    """
+
+    def __init__(self, workspace_id: int):
+        self.workspace_id = workspace_id
+
+    def __call__(self):
+        global_cache.invalidate(
+            invalidate_key=get_computed_roles_cache_invalidate_key(self.workspace_id)
+        )
+
+    @classmethod
+    def is_pending(cls, workspace_id: int) -> bool:
+        return any(
+            isinstance(func, cls) and func.workspace_id == workspace_id
+            for _, func, _ in transaction.get_connection().run_on_commit
+        )
+
+
+def invalidate_computed_roles_cache(workspace_id: int):
+    """
+    Invalidates the computed roles cached for all the actors of the workspace. Must be
+    called whenever something the roles are computed from changes: the role
+    assignments, the workspace users, the team subjects or the scopes.
+
+    :param workspace_id: The id of the workspace to invalidate the cache for.
+    """
+
+    if not InvalidateComputedRolesCache.is_pending(workspace_id):
+        transaction.on_commit(InvalidateComputedRolesCache(workspace_id))
+
+
 class RoleAssignmentHandler:
     def _get_role_assignments_for_valid_subjects_qs(self) -> QuerySet:
         """
@@ -599,6 +658,103 @@ class RoleAssignmentHandler:
 
         return most_precise_roles
 
+    def get_cached_computed_roles(
+        self,
+        workspace: Workspace,
+        actor: Subject,
+        contexts: List[Any],
+        get_roles_per_scope: Callable[[], List[Tuple[ScopeObject, List[Role]]]],
+        include_trash: bool = False,
+        cache: Optional[Dict] = None,
+    ) -> Dict[Any, List[Role]]:
+        """
+        Returns the computed roles of the actor for each of the given contexts, like
+        `get_computed_roles` does. The ids of the roles are cached in the global cache
+        for `BASEROW_ENTERPRISE_COMPUTED_ROLES_CACHE_TTL_SECONDS`, so that they don't
+        have to be computed again by the next requests until the workspace is
+        invalidated with `invalidate_computed_roles_cache`.
+
+        :param workspace: The workspace the contexts belong to.
+        :param actor: The actor for whom we want the roles.
+        :param contexts: The contexts on which we want to know the roles.
+        :param get_roles_per_scope: A function returning the roles per scope of the
+            actor. It's only called if the roles of a context are not cached.
+        :param include_trash: Whether the roles per scope include the trash.
+        :param cache: A cache dict to temporarily store reusable values in.
+        :return: A dict with the contexts as keys and their computed roles as values.
+        """
+
+        keys_by_context = {
+            context: (
+                f"{object_scope_type_registry.get_by_model(context).type}_{context.id}"
+            )
+            for context in contexts
+        }
+        contexts_by_key = {key: context for context, key in keys_by_context.items()}
+
+        def compute_role_ids(keys):
+            roles_per_scope = get_roles_per_scope()
+            return {
+                key: [
+                    role.id
+                    for role in self.get_computed_roles(
+                        roles_per_scope, contexts_by_key[key], cache
+                    )
+                ]
+                for key in keys
+            }
+
+        timeout = settings.BASEROW_ENTERPRISE_COMPUTED_ROLES_CACHE_TTL_SECONDS
+        if not timeout or InvalidateComputedRolesCache.is_pending(workspace.id):
+            role_ids_by_key = compute_role_ids(contexts_by_key.keys())
+        else:
+            actor_subject_type = subject_type_registry.get_by_model(actor)
+            cache_key = (
+                f"{COMPUTED_ROLES_CACHE_KEY_PREFIX}_{actor_subject_type.type}_"
+                f"{actor.id}_{workspace.id}_{include_trash}"
+            )
+            invalidate_key = get_computed_roles_cache_invalidate_key(workspace.id)
+            role_ids_by_key = global_cache.get(
+                cache_key, default=dict, invalidate_key=invalidate_key, timeout=timeout
+            )
+            missing_keys = [
+                key for key in contexts_by_key if key not in role_ids_by_key
+            ]
+            computed_roles_cache_hits_counter.add(
+                len(contexts_by_key) - len(missing_keys)
+            )
+
+            if missing_keys:
+                computed_roles_cache_misses_counter.add(len(missing_keys))
+
+                def add_missing_role_ids(cached_role_ids_by_key):
+                    # Computed after the version of the cache key has been resolved,
+                    # so that roles computed before an invalidation are never stored
+                    # in the new version.
+                    return {
+                        **cached_role_ids_by_key,
+                        **compute_role_ids(
+                            [
+                                key
+                                for key in missing_keys
+                                if key not in cached_role_ids_by_key
+                            ]
+                        ),
+                    }
+
+                role_ids_by_key = global_cache.update(
+                    cache_key,
+                    add_missing_role_ids,
+                    default_value=dict,
+                    invalidate_key=invalidate_key,
+                    timeout=timeout,
+                )
+
+        return {
+            context: [self.get_role_by_id(role_id) for role_id in role_ids_by_key[key]]
+            for context, key in keys_by_context.items()
+        }
+
     @clear_roles_from_local_cache()
     def assign_role(
         self, subject, workspace, role=None, scope=None, send_signals: bool = True
@@ -627,6 +783,8 @@ class RoleAssignmentHandler:
             self.remove_role(subject, workspace, scope=scope)
             return
 
+        invalidate_computed_roles_cache(workspace.id)
+
         content_types = ContentType.objects.get_for_models(scope, subject)
 
         # Workspace level permissions are not stored as RoleAssignment records but
@@ -691,6 +849,8 @@ class RoleAssignmentHandler:
         if scope is None:
             scope = workspace
 
+        invalidate_computed_roles_cache(workspace.id)
+
         if RoleAssignmentHandler.is_workspace_level_assignment(
             workspace, scope, subject
         ):
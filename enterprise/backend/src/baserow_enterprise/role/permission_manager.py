@@ -93,26 +93,49 @@ class RolePermissionManagerType(PermissionManagerType):
 
         result = {}
         roles_per_scope_by_actor = {}
-        for actor_subject_type, actors in actors_by_subject_type.items():
-            roles_per_scope_by_actor.update(
-                RoleAssignmentHandler().get_roles_per_scope_for_actors(
-                    workspace, actor_subject_type, actors, include_trash=include_trash
-                )
-            )
+
+        def get_roles_per_scope(actor):
+            # The roles of all the actors are fetched at once, but only if the
+            # computed roles of one of them aren't cached.
+            if not roles_per_scope_by_actor:
+                for actor_subject_type, actors in actors_by_subject_type.items():
+                    roles_per_scope_by_actor.update(
+                        RoleAssignmentHandler().get_roles_per_scope_for_actors(
+                            workspace,
+                            actor_subject_type,
+                            actors,
+                            include_trash=include_trash,
+                        )
+                    )
+            return roles_per_scope_by_actor[actor]
 
         scope_includes_cache = {}
+        permitted_operations_by_roles = {}
         for actor, context_and_checks in checks_by_actor_and_context.items():
-            for context, checks in context_and_checks.items():
-                computed_roles = RoleAssignmentHandler().get_computed_roles(
-                    roles_per_scope_by_actor[actor], context, scope_includes_cache
-                )
-                permitted_operations = set(
-                    [
-                        operation_name
-                        for r in computed_roles
-                        for operation_name in self.get_role_operations(r)
-                    ]
+            computed_roles_per_context = (
+                RoleAssignmentHandler().get_cached_computed_roles(
+                    workspace,
+                    actor,
+                    list(context_and_checks.keys()),
+                    partial(get_roles_per_scope, actor),
+                    include_trash=include_trash,
+                    cache=scope_includes_cache,
                 )
+            )
+            for context, checks in context_and_checks.items():
+                roles = computed_roles_per_context[context]
+                # Many contexts, like the rows of a listing, share the same roles, so
+                # their permitted operations are only computed once.
+                roles_key = tuple(sorted(r.id for r in roles))
+                if roles_key not in permitted_operations_by_roles:
+                    permitted_operations_by_roles[roles_key] = set(
+                        [
+                            operation_name
+                            for r in roles
+                            for operation_name in self.get_role_operations(r)
+                        ]
+                    )
+                permitted_operations = permitted_operations_by_roles[roles_key]
                 check_results = {
                     check: (
                         True
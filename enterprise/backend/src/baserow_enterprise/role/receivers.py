@@ -5,18 +5,32 @@ from django.db.models.signals import post_delete
 from django.dispatch import receiver
 
 from baserow.core.models import Workspace, WorkspaceUser
-from baserow.core.registries import subject_type_registry
-from baserow.core.signals import permissions_updated, workspace_user_updated
+from baserow.core.object_scopes import WorkspaceObjectScopeType
+from baserow.core.registries import object_scope_type_registry, subject_type_registry
+from baserow.core.signals import (
+    permissions_updated,
+    workspace_user_added,
+    workspace_user_deleted,
+    workspace_user_updated,
+)
+from baserow.core.trash.signals import before_permanently_deleted
 from baserow.core.types import Subject
 from baserow.ws.tasks import broadcast_to_users
+from baserow_enterprise.role.constants import ROLE_ASSIGNABLE_OBJECT_MAP
+from baserow_enterprise.role.handler import invalidate_computed_roles_cache
 from baserow_enterprise.signals import (
     role_assignment_created,
     role_assignment_deleted,
     role_assignment_updated,
+    team_created,
     team_deleted,
     team_restored,
+    team_subject_created,
+    team_subject_deleted,
+    team_subject_restored,
+    team_updated,
 )
-from baserow_enterprise.teams.models import Team
+from baserow_enterprise.teams.models import Team, TeamSubject
 
 User = get_user_model()
 
@@ -65,6 +79,57 @@ def notify_users_about_updated_permissions(
     )
 
 
+@receiver(workspace_user_added)
+@receiver(workspace_user_updated)
+@receiver(workspace_user_deleted)
+def invalidate_computed_roles_cache_when_workspace_user_changed(
+    sender, workspace_user: WorkspaceUser, **kwargs
+):
+    invalidate_computed_roles_cache(workspace_user.workspace_id)
+
+
+@receiver(team_created)
+@receiver(team_updated)
+@receiver(team_deleted)
+@receiver(team_restored)
+def invalidate_computed_roles_cache_when_team_changed(sender, team: Team, **kwargs):
+    invalidate_computed_roles_cache(team.workspace_id)
+
+
+@receiver(team_subject_created)
+@receiver(team_subject_deleted)
+@receiver(team_subject_restored)
+def invalidate_computed_roles_cache_when_team_subject_changed(
+    sender, subject: TeamSubject, **kwargs
+):
+    invalidate_computed_roles_cache(subject.team.workspace_id)
+
+
+@receiver(before_permanently_deleted)
+def invalidate_computed_roles_cache_when_scope_permanently_deleted(
+    sender, trash_item, **kwargs
+):
+    """
+    The role assignments of a scope are deleted with it. Trashed scopes don't need to
+    be handled because their role assignments are still taken into account.
+    """
+
+    try:
+        scope_type = object_scope_type_registry.get_by_model(trash_item)
+    except object_scope_type_registry.does_not_exist_exception_class:
+        return
+
+    if scope_type.type not in ROLE_ASSIGNABLE_OBJECT_MAP:
+        return
+
+    workspace = object_scope_type_registry.get_parent(
+        trash_item,
+        at_scope_type=object_scope_type_registry.get(WorkspaceObjectScopeType.type),
+    )
+    if workspace is not None:
+        invalidate_computed_roles_cache(workspace.id)
+
+
 def cascade_subject_delete(sender, instance, **kwargs):
     """
     Delete role assignments linked to deleted subjects.
@@ -91,6 +156,7 @@ def cascade_workspace_user_delete(sender, instance, **kwargs):
     RoleAssignment.objects.filter(
         subject_id=user_id, subject_type=user_ct, workspace_id=workspace_id
     ).delete()
+    invalidate_computed_roles_cache(workspace_id)
 
 
 def cascade_scope_delete(sender, instance, **kwargs):
@@ -1,4 +1,6 @@
-from django.db import IntegrityError, connection, reset_queries
+from unittest.mock import patch
+
+from django.db import IntegrityError, connection, reset_queries, transaction
 from django.test import override_settings
 from django.test.utils import CaptureQueriesContext
 
@@ -58,6 +60,7 @@ from baserow_enterprise.role.default_roles import default_roles
 from baserow_enterprise.role.handler import RoleAssignmentHandler
 from baserow_enterprise.role.models import Role
 from baserow_enterprise.role.permission_manager import RolePermissionManagerType
+from baserow_enterprise.teams.handler import TeamHandler
 
 
 @pytest.fixture(autouse=True)
@@ -1854,3 +1857,158 @@ def test_fetching_permissions_does_not_extra_queries_per_snapshot(
         CoreHandler().get_permissions(viewer, workspace=workspace)
 
     assert len(captured_1.captured_queries) == len(captured_2.captured_queries)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_check_permissions_caches_computed_roles_across_requests(
+    data_fixture, enterprise_data_fixture, settings
+):
+    settings.BASEROW_ENTERPRISE_COMPUTED_ROLES_CACHE_TTL_SECONDS = 300
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[user])
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+
+    viewer_role = Role.objects.get(uid="VIEWER")
+    editor_role = Role.objects.get(uid="EDITOR")
+    RoleAssignmentHandler().assign_role(user, workspace, role=viewer_role)
+
+    def can_update_table():
+        with local_cache.context():
+            return CoreHandler().check_permissions(
+                user,
+                CreateRowDatabaseTableOperationType.type,
+                workspace=workspace,
+                context=table,
+                raise_permission_exceptions=False,
+            )
+
+    assert can_update_table() is False
+
+    with patch.object(
+        RoleAssignmentHandler,
+        "get_roles_per_scope_for_actors",
+        wraps=RoleAssignmentHandler().get_roles_per_scope_for_actors,
+    ) as get_roles_per_scope_for_actors:
+        assert can_update_table() is False
+        get_roles_per_scope_for_actors.assert_not_called()
+
+        RoleAssignmentHandler().assign_role(
+            user, workspace, role=editor_role, scope=table
+        )
+        assert can_update_table() is True
+        get_roles_per_scope_for_actors.assert_called_once()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_computed_roles_cache_is_bypassed_until_the_transaction_commits(
+    data_fixture, enterprise_data_fixture, settings
+):
+    settings.BASEROW_ENTERPRISE_COMPUTED_ROLES_CACHE_TTL_SECONDS = 300
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[user])
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=Role.objects.get(uid="VIEWER")
+    )
+
+    def can_update_table():
+        with local_cache.context():
+            return CoreHandler().check_permissions(
+                user,
+                CreateRowDatabaseTableOperationType.type,
+                workspace=workspace,
+                context=table,
+                raise_permission_exceptions=False,
+            )
+
+    assert can_update_table() is False
+
+    with pytest.raises(ValueError):
+        with transaction.atomic():
+            RoleAssignmentHandler().assign_role(
+                user, workspace, role=Role.objects.get(uid="EDITOR")
+            )
+            assert can_update_table() is True
+            raise ValueError("Rollback")
+
+    # The role computed in the rolled back transaction must not have been cached.
+    assert can_update_table() is False
+
+
+@pytest.mark.django_db(transaction=True)
+def test_computed_roles_cache_is_invalidated_when_team_subject_deleted(
+    data_fixture, enterprise_data_fixture, settings
+):
+    settings.BASEROW_ENTERPRISE_COMPUTED_ROLES_CACHE_TTL_SECONDS = 300
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[user])
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    team = enterprise_data_fixture.create_team(workspace=workspace)
+    subject = enterprise_data_fixture.create_subject(team=team, subject=user)
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=Role.objects.get(uid="NO_ROLE_LOW_PRIORITY")
+    )
+    RoleAssignmentHandler().assign_role(
+        team, workspace, role=Role.objects.get(uid="EDITOR"), scope=table
+    )
+
+    def can_update_table():
+        with local_cache.context():
+            return CoreHandler().check_permissions(
+                user,
+                CreateRowDatabaseTableOperationType.type,
+                workspace=workspace,
+                context=table,
+                raise_permission_exceptions=False,
+            )
+
+    assert can_update_table() is True
+
+    TeamHandler().delete_subject(admin, subject)
+
+    assert can_update_table() is False
+
+
+@pytest.mark.django_db
+def test_check_permissions_for_multiple_contexts_computes_operations_per_roles(
+    data_fixture, enterprise_data_fixture
+):
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[user])
+    database = data_fixture.create_database_application(workspace=workspace)
+    table_1 = data_fixture.create_database_table(database=database)
+    table_2 = data_fixture.create_database_table(database=database)
+    table_3 = data_fixture.create_database_table(database=database)
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=Role.objects.get(uid="VIEWER")
+    )
+    RoleAssignmentHandler().assign_role(
+        user, workspace, role=Role.objects.get(uid="EDITOR"), scope=table_1
+    )
+
+    get_role_operations = RolePermissionManagerType.get_role_operations
+    with patch.object(
+        RolePermissionManagerType,
+        "get_role_operations",
+        autospec=True,
+        side_effect=get_role_operations,
+    ) as get_role_operations_mock:
+        result = CoreHandler().check_permissions_for_multiple_contexts(
+            user,
+            [
+                (CreateRowDatabaseTableOperationType.type, table)
+                for table in [table_1, table_2, table_3]
+            ],
+            workspace,
+        )
+
+    assert result == [True, False, False]
+    # The tables without a role of their own share the operations of the viewer role.
+    assert get_role_operations_mock.call_count == 2
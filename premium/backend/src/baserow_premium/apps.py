@@ -70,6 +70,8 @@ class BaserowPremiumConfig(AppConfig):
             ExcelTableExporter,
             FileTableExporter,
             JSONTableExporter,
+            NDJSONTableExporter,
+            ParquetTableExporter,
             XMLTableExporter,
         )
         from .plugins import PremiumPlugin
@@ -88,6 +90,9 @@ class BaserowPremiumConfig(AppConfig):
         plugin_registry.register(PremiumPlugin())
 
         table_exporter_registry.register(JSONTableExporter())
+        table_exporter_registry.register(NDJSONTableExporter())
+        if ParquetTableExporter.is_available():
+            table_exporter_registry.register(ParquetTableExporter())
         table_exporter_registry.register(XMLTableExporter())
         table_exporter_registry.register(ExcelTableExporter())
         table_exporter_registry.register(FileTableExporter())
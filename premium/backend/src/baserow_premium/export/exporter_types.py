@@ -4,6 +4,14 @@ from typing import List, Optional, Type
 
 import zipstream
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    # The parquet exporter is only available if `pyarrow` is installed.
+    pa = None
+    pq = None
+
 from baserow.config.settings.base import BASEROW_DEFAULT_ZIP_COMPRESS_LEVEL
 from baserow.contrib.database.api.export.serializers import (
     BaseExporterOptionsSerializer,
@@ -100,6 +108,124 @@ class JSONTableExporter(PremiumTableExporter):
         return ".json"
 
 
+class NDJSONQuerysetSerializer(QuerysetSerializer):
+    can_handle_rich_value = True
+
+    def write_to_file(self, file_writer: FileWriter, export_charset="utf-8"):
+        """
+        Writes the queryset to the provided file as newline delimited json, with one
+        json object per row. Contrary to the json export, the file can be processed
+        line by line without loading it entirely. The rows are serialized per column
+        for every batch of rows.
+
+        :param file_writer: The file writer to use to do the writing.
+        :param export_charset: The charset to write to the file using.
+        """
+
+        column_names = None
+
+        def write_batch(rows, _):
+            nonlocal column_names
+
+            columns = self.serialize_columns(rows)
+            if column_names is None:
+                column_names = {}
+                for _, field_name, _ in columns:
+                    field_name = get_unique_name(
+                        column_names, field_name, separator=" "
+                    )
+                    column_names[field_name] = None
+                column_names = list(column_names)
+
+            lines = [
+                json.dumps(dict(zip(column_names, row_values)))
+                for row_values in zip(*[values for _, _, values in columns])
+            ]
+            file_writer.write("\n".join(lines) + "\n", encoding=export_charset)
+
+        file_writer.write_row_batches(self.queryset, write_batch)
+
+
+class NDJSONTableExporter(JSONTableExporter):
+    type = "ndjson"
+
+    @property
+    def queryset_serializer_class(self):
+        return NDJSONQuerysetSerializer
+
+    @property
+    def file_extension(self) -> str:
+        return ".ndjson"
+
+
+class ParquetQuerysetSerializer(QuerysetSerializer):
+    def get_schema(self) -> "pa.Schema":
+        """
+        Returns the schema of the parquet file. The id is stored as an integer and the
+        export value of every field as a string.
+        """
+
+        column_names = {}
+        for name in ["id"] + [
+            field_object["field"].name for field_object in self.ordered_field_objects
+        ]:
+            column_names[get_unique_name(column_names, name, separator=" ")] = None
+        id_name, *field_names = column_names
+
+        return pa.schema(
+            [pa.field(id_name, pa.int64(), nullable=False)]
+            + [pa.field(field_name, pa.string()) for field_name in field_names]
+        )
+
+    def write_to_file(self, file_writer: FileWriter, export_charset="utf-8"):
+        """
+        Writes the queryset to the provided file in the columnar Apache Parquet
+        format. Every batch of rows is serialized per column and written as a
+        separate row group.
+
+        :param file_writer: The file writer to use to do the writing.
+        :param export_charset: Ignored because strings are always stored as utf-8 in
+            parquet files.
+        """
+
+        schema = self.get_schema()
+        parquet_writer = pq.ParquetWriter(file_writer._file, schema)
+
+        def write_batch(rows, _):
+            (_, _, ids), *columns = self.serialize_columns(rows)
+            arrays = [pa.array(ids, type=pa.int64())] + [
+                pa.array([str(value) for value in values], type=pa.string())
+                for _, _, values in columns
+            ]
+            parquet_writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+        try:
+            file_writer.write_row_batches(self.queryset, write_batch)
+        finally:
+            parquet_writer.close()
+
+
+class ParquetTableExporter(JSONTableExporter):
+    """
+    Exports to the columnar Apache Parquet format. Only registered if the optional
+    `pyarrow` package is installed.
+    """
+
+    type = "parquet"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return pa is not None
+
+    @property
+    def queryset_serializer_class(self):
+        return ParquetQuerysetSerializer
+
+    @property
+    def file_extension(self) -> str:
+        return ".parquet"
+
+
 class XMLQuerysetSerializer(QuerysetSerializer):
     can_handle_rich_value = True
 
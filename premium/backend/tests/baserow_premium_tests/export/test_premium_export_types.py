@@ -1,3 +1,4 @@
+import json
 import zipfile
 from io import BytesIO
 from unittest.mock import MagicMock, patch
@@ -339,6 +340,111 @@ def test_if_duplicate_field_names_json_export(get_storage_mock, premium_data_fix
     )
 
 
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+@patch("baserow.core.storage.get_default_storage")
+def test_can_export_to_ndjson(get_storage_mock, premium_data_fixture):
+    storage_mock = MagicMock()
+    get_storage_mock.return_value = storage_mock
+    user = premium_data_fixture.create_user(has_active_premium_license=True)
+    database = premium_data_fixture.create_database_application(user=user)
+    table = premium_data_fixture.create_database_table(database=database)
+    text_field = premium_data_fixture.create_text_field(
+        table=table, name="name", order=1
+    )
+    premium_data_fixture.create_text_field(table=table, name="name", order=2)
+    number_field = premium_data_fixture.create_number_field(
+        table=table, name="Price", order=3, number_decimal_places=2
+    )
+    row_handler = RowHandler()
+    row_handler.create_row(
+        user=user,
+        table=table,
+        values={f"field_{text_field.id}": "a", f"field_{number_field.id}": "1.5"},
+    )
+    row_handler.create_row(user=user, table=table)
+
+    job, contents = run_export_job_with_mock_storage(
+        table, None, storage_mock, user, {"exporter_type": "ndjson"}
+    )
+
+    lines = [json.loads(line) for line in contents.splitlines()]
+    assert lines == [
+        {"id": 1, "name": "a", "name 2": "", "Price": "1.50"},
+        {"id": 2, "name": "", "name 2": "", "Price": ""},
+    ]
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+@patch("baserow.core.storage.get_default_storage")
+def test_cannot_export_ndjson_without_premium_license(
+    get_storage_mock, premium_data_fixture
+):
+    storage_mock = MagicMock()
+    get_storage_mock.return_value = storage_mock
+    with pytest.raises(FeaturesNotAvailableError):
+        run_export_over_interesting_test_table(
+            premium_data_fixture, storage_mock, {"exporter_type": "ndjson"}
+        )
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+@patch("baserow.core.storage.get_default_storage")
+def test_can_export_to_parquet(get_storage_mock, premium_data_fixture):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    storage_mock = MagicMock()
+    get_storage_mock.return_value = storage_mock
+    user = premium_data_fixture.create_user(has_active_premium_license=True)
+    database = premium_data_fixture.create_database_application(user=user)
+    table = premium_data_fixture.create_database_table(database=database)
+    text_field = premium_data_fixture.create_text_field(
+        table=table, name="name", order=1
+    )
+    premium_data_fixture.create_text_field(table=table, name="name", order=2)
+    number_field = premium_data_fixture.create_number_field(
+        table=table, name="Price", order=3, number_decimal_places=2
+    )
+    row_handler = RowHandler()
+    row_handler.create_row(
+        user=user,
+        table=table,
+        values={f"field_{text_field.id}": "a", f"field_{number_field.id}": "1.5"},
+    )
+    row_handler.create_row(user=user, table=table)
+
+    job, contents = run_export_job_with_mock_storage(
+        table,
+        None,
+        storage_mock,
+        user,
+        {"exporter_type": "parquet", "export_charset": None},
+    )
+
+    assert pq.read_table(BytesIO(contents)).to_pylist() == [
+        {"id": 1, "name": "a", "name 2": "", "Price": "1.50"},
+        {"id": 2, "name": "", "name 2": "", "Price": ""},
+    ]
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+@patch("baserow.core.storage.get_default_storage")
+def test_cannot_export_parquet_without_premium_license(
+    get_storage_mock, premium_data_fixture
+):
+    pytest.importorskip("pyarrow")
+
+    storage_mock = MagicMock()
+    get_storage_mock.return_value = storage_mock
+    with pytest.raises(FeaturesNotAvailableError):
+        run_export_over_interesting_test_table(
+            premium_data_fixture, storage_mock, {"exporter_type": "parquet"}
+        )
+
+
 @pytest.mark.django_db
 @override_settings(DEBUG=True)
 @patch("baserow.core.storage.get_default_storage")